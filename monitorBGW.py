@@ -36,30 +36,39 @@ os.nice(19)
 
 import argparse
 import asyncio
+import atexit
 import base64
 import _curses, curses, curses.ascii, curses.panel, curses.textpad
+import heapq
 import json
 import locale
 import logging
 import re
 import resource
 import socket
+import subprocess
 import sys
+import tempfile
 import termios
 import time
 import zlib
 
 from abc import ABC, abstractmethod
+from array import array
 from asyncio import Queue, Semaphore
-from bisect import insort_left
+from bisect import bisect_left, insort_left
 from contextlib import contextmanager
+from collections import deque
 from collections.abc import MutableMapping, ItemsView
 from datetime import datetime
-from functools import partial
+from functools import lru_cache, partial, wraps
+from operator import itemgetter
+from types import MappingProxyType
+from weakref import WeakKeyDictionary
 from urllib.parse import unquote
 from typing import AbstractSet, Any, Callable, Coroutine, Dict, FrozenSet
 from typing import Generator, Generic, Iterable, Iterator, ItemsView
-from typing import List, Mapping, MutableMapping, Optional, Set, Sequence
+from typing import List, Mapping, MutableMapping, NamedTuple, Optional, Set, Sequence
 from typing import Tuple, TypeVar, Union
 from typing import TYPE_CHECKING
 
@@ -81,6 +90,8 @@ CONFIG = {
     "http_server": "0.0.0.0",
     "http_port": 8080,
     "upload_dir": "/tmp",
+    "ssh_control_dir": None,
+    "ssh_control_persist": "600s",
     "nok_rtp_only": False,
     "discovery_commands": [
         "set utilization cpu",
@@ -132,6 +143,8 @@ V = TypeVar("V")
 class AbstractRepository(ABC, Generic[K, V]):
     """Abstract key/value repository interface."""
 
+    __slots__ = ()
+
     @abstractmethod
     def put(self, items: Dict[K, V]) -> None:
         """Insert or update multiple items."""
@@ -159,6 +172,11 @@ class SlicableOrderedDict(MutableMapping, Generic[K, V]):
           * key -> V
     """
 
+    __slots__ = (
+        "_items", "_keys", "_version", "_values_cache",
+        "_values_cache_version", "maxlen", "name",
+    )
+
     def __init__(
         self,
         items: Optional[Dict[K, V]] = None,
@@ -166,24 +184,30 @@ class SlicableOrderedDict(MutableMapping, Generic[K, V]):
         name: Optional[str] = None,
     ) -> None:
         self._items = dict(items) if items else {}  # type: Dict[K, V]
-        self._keys = sorted(self._items.keys()) if items else []  # type: List[K]
+        self._keys = sorted(self._items)  # type: List[K]
+        self._version = 0
+        self._values_cache = []  # type: List[V]
+        self._values_cache_version = -1
         self.maxlen = maxlen
         self.name = name
 
     def __iter__(self) -> Iterator[K]:
-        yield from self._keys
+        return iter(self._keys)
 
     def __getitem__(
         self,
         key: Union[int, slice, Tuple[int, int], K],
     ) -> Union[V, List[V]]:
-        if isinstance(key, slice):
-            idxs = range(len(self._items)).__getitem__(key)
-            return [self._items[self._keys[i]] for i in idxs]
-
+        # Slicing the sorted key list yields the visible keys directly,
+        # without building index ranges and indexing _keys once per row.
         if isinstance(key, tuple):
-            idxs = range(len(self._items)).__getitem__(slice(*key))
-            return [self._items[self._keys[i]] for i in idxs]
+            key = slice(*key)
+
+        if isinstance(key, slice):
+            if key.indices(len(self._keys)) == (0, len(self._keys), 1):
+                return self.values_list()
+            items = self._items
+            return [items[k] for k in self._keys[key]]
 
         if isinstance(key, int):
             if 0 <= key < len(self._items):
@@ -193,30 +217,52 @@ class SlicableOrderedDict(MutableMapping, Generic[K, V]):
         return self._items[key]
 
     def __setitem__(self, key: K, item: V) -> None:
-        if key in self._items:
-            self._items[key] = item
+        items = self._items
+        self._version += 1
+        if key in items:
+            items[key] = item
             return
 
-        if self.maxlen and len(self._items) == self.maxlen:
-            first_key = self._keys.pop(0)
-            del self._items[first_key]
+        maxlen = self.maxlen
+        if maxlen:
+            # A loop rather than a single eviction also trims the storage
+            # down when maxlen was lowered after items were stored.
+            keys = self._keys
+            while len(items) >= maxlen:
+                del items[keys.pop(0)]
 
         insort_left(self._keys, key)
-        self._items[key] = item
+        items[key] = item
 
     def __delitem__(self, key: K) -> None:
         if key not in self._items:
             raise KeyError(key)
         del self._items[key]
-        self._keys.remove(key)
+        del self._keys[bisect_left(self._keys, key)]
+        self._version += 1
 
     def __contains__(self, key: Any) -> bool:
         return key in self._items
 
     def index(self, key: K) -> int:
-        if key in self._keys:
-            return self._keys.index(key)
-        raise ValueError(key)
+        # Misses are answered by the hashed dict without touching _keys,
+        # hits are located by bisecting the sorted key list.
+        if key not in self._items:
+            raise ValueError(key)
+        return bisect_left(self._keys, key)
+
+    def values_list(self) -> List[V]:
+        """
+        Return all values in key order.
+
+        The list is rebuilt only after a mutation, repeated full range
+        reads in between share it, so callers must not modify it.
+        """
+        if self._values_cache_version != self._version:
+            items = self._items
+            self._values_cache = [items[k] for k in self._keys]
+            self._values_cache_version = self._version
+        return self._values_cache
 
     def keys(self) -> AbstractSet[K]:
         return self._items.keys()
@@ -230,6 +276,7 @@ class SlicableOrderedDict(MutableMapping, Generic[K, V]):
     def clear(self) -> None:
         self._items.clear()
         self._keys[:] = []
+        self._version += 1
 
     def __len__(self) -> int:
         return len(self._items)
@@ -247,15 +294,15 @@ class MemoryStorage(SlicableOrderedDict[K, V], AbstractRepository[K, V]):
     - Use `select(...)` for range/index/slice retrieval.
     """
 
+    __slots__ = ()
+
     def put(self, items: Dict[K, V]) -> None:
+        setitem = self.__setitem__
         for k, v in items.items():
-            self[k] = v
+            setitem(k, v)
 
     def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
-        try:
-            return self._items[key]
-        except KeyError:
-            return default
+        return self._items.get(key, default)
 
     def select(
         self,
@@ -269,7 +316,52 @@ class MemoryStorage(SlicableOrderedDict[K, V], AbstractRepository[K, V]):
             key = slice(None, None)
         return self[key]
 
-GWs = {}
+class VersionedDict(dict):
+    """
+    Dict counting its mutations in `version`.
+
+    Caches of values derived from the contents keep the version they were
+    built at and are stale once it moved on.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self.version += 1
+        return super().setdefault(key, default)
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self.version += 1
+        return value
+
+    def popitem(self) -> Tuple[Any, Any]:
+        item = super().popitem()
+        self.version += 1
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+GWs = VersionedDict()
 BGWs = MemoryStorage(name="BGWs")
 RTPs = MemoryStorage(maxlen=36, name="RTPs")
 PCAPs = MemoryStorage(name="PCAPs")
@@ -278,47 +370,49 @@ PCAPs = MemoryStorage(name="PCAPs")
 ############################## BEGIN SCRIPT ###################################
 
 COMPRESSED_EXPECT_SCRIPT = '''\
-eJzVWXtz27gR/1+fAqHpO/lBW3KbztRt2t4l6aWX5jF2rjMZidFAJCSxoUAaAK34NPruXbxIgKRsp+
-2kU43HooDdxeKHfYIHT84rzs7nGT0nX0qSiMEBejcXOKMcJcV6jWmKikqUlUALVqzRD7f4DqMfGabJ
-Cv2EBdngO2C5IqJiwPLz9bu3aJOJFVrqOZTRRXHaEsWRfL768B5xgUXGRZZwEPLmbx/Q37OEUE7g1y
-1hPCsoGp2N0QuSoIvRxe8GB/d90AeyLnNYF/0DswzPc8LRvQyDAScC5ZjOshJt9fdOjVWcMLSV//Xv
-EnO+SdFWf+sxJsqZ1J+jbf1oqBm5neWYixknXG5ilknenlGHHiciuyXOHDcs3QnNZTAFMvukx1Myr5
-Zoq752g/shO0Av1ak/FjEDWVEKUIWjSQ6Hh6ICXQuWJeJVwcVrcvd8RZLPGV0+o4Wc+wVQfE2LDZXT
-/K9ZTp6dp+T2nFZ5HitxIlsTsAw0Hhk4inUpUDA9OkCBOSIfy0APswSNBpgxMDMXkJke2m53O2dWnZ
-EW4VHkxXKmjns0GGQLGAs1cjt4HCD4KAWAaAGao0B7yUzRzEJtM2cwHShaJWCiKMkXwIaj0LLGjUT5
-UTQpyQmYa02jZkEnu2w6X6JJURLakCAcq2nQY5ZRQRjFOYoWDsFosHvw2OXJv2dFQtKKPXjm6tjhUB
-L0Tw74E57gksBeuGA+SjCAJvAPzh6tceluN5hOA/kPvpyxQI8F7hhVY9QdYmqIuUNCDYnAIIZCWFYD
-w1QoUgMKCKW4KGZSd3XiVq1lXswBO+P+y82M4jVR39V6DvZgjA7Ab5vftFYEPi2r65pZDY/SINhutd
-K4hHNNzeA00GpMg0s0DSYuzsbG4mlwino5jeZ9rGbqfl61233canI/f41Rv+Jm8kF+i+w9UizJfln2
-IKQQC7KEfZExCFJj9XtRMIIhc223n8kdusV5RcAgJvrolp0YErsmrHz7SajEKSvy1geljOP2qObvCJ
-aO+3aq1Ildb2jUH7mhwZO+252CJNfs/iMAuvb7/wHCbhd47i/HG/9PcgJeZAqZ7VY/NKGAkSWv5ijC
-eS7DzZRGkbgDbW4gcKCbKoOMxxAvcUKQhA0Gk4KKjFYkihDQTz6haXz8OvAjQ2jWgyinn7prvS0g/I
-sVljskeXp2HDyG60VByZNH0srdGP2mKqHuZVK42fAN/9csW66EJY8dMNdQzdiioxNPdfauja9ezIzA
-kQWh4Q1sJpMViJssjlVuAiMETTAtxArCsS0hSzhKTtAGw6mcnUkUHE4ljzE4raAR8YOW8Nxd1DEkvW
-JaoLuiArFUuOeLhh/P3x79ubuKKjgqxggV1q5CUxvAz+G8WiwIO/JYjMVaap+7JVzC9NHNggapmVWs
-bxehqZy+laoegI5H/C/A+lqsgmPnlM++rcYP6/aNFeI5IaXJEI9V0hbt/d6n24oPmqbjck6JC+VnlQ
-s08SJ0HXMkVU9kyskCiAyrjSY6Qh2g57BJhvPsV5LWQYN8IUklexbdnGolVzCT6xCTygp/Cc86wkny
-meWtQ50qeSF/Wi1HMuu0op9uvmTdDs2JX0wosqZLaLcZ8qN641ByBy9e/vjLT5fQnknFCfre7vL7Bs
-xFXvGVIndBdapxLCro0RIsVMJ3ovFEhvA6DIPryOYEQFnzZexoaCQ8eSa36uppmq+Lp7/xVeciBSkg
-WctCm5XuhBT4AHTfLvaC0QLk5dXVu6tL9DWie0BqGbGxrSDoIGgRcM77u+/q3EmhEwy6mPgHPrQqHV
-m+ziq2WjHT2oDtmWOk2utiUcs9NZ03ZHZoakVRlnLrYNW6PlJm3bVgLk14nc6UNGXD5UxWXMoJ9Mnu
-t2tbMFofCB1J9d49EKyNeU4U1g/uUnHLCgwruZHFiYTb07VrHga+8Z74YqZHTekCFW7vRcvWb2R7SN
-RVR9wua/xNBnxVbGQFHUnPQbaMNuKCuG1d7nb9zRnN1QWF2ZB3GhC2CETEMs9EU89JP+7U6hOoBiGU
-w9On4WQU/T4+OZryE9kxKxkzBC1VF9jc5I4eIMIsvR/usMvkH0DnZqyF/ldhK4Wh8b+BbePzDZcFK1
-LYdCEzQntAs3s34PiIwFIeAJRs9ppfXUX3XCG2fteAteUZW3XQ6BW3H5tJv5/EXcTa7fnXGDN0fBT1
-qxYcpoHGIEtnKUmyNc4dnl5yNdgmB3RgHkypZDUODQ06QePdTm9LJxSgAfo/PjNrNKT+lqx/dJAHB1
-2DeQaHo6egEshyQhxNmFRm3OczLUGNvawJWxIVcKWdyO+xSgsXvs+Am8zBZmGrULNBxpfuLUnV10UT
-t2y5lfOCCRRVNLuBJie07P4VmiZ+3HWivFF8gzP68F2iuk48QNcl3lB0ff1KVuEUikXY+oCrQQ4ZO7
-qB7R3vdqG9aw7lJe1fzG2YFPBKlm9ESYDiLaMDv5EM3su7+oKll6ofMZ2nvsCHSGnw76liVc0RUeix
-NyoM2KLGL2n/IC94BZRAv3WPkxSL/4Yo+Gtt5vg9YetM2QfUmDQjqd+S7lupYXuhuJrFnrp6N52jXl
-1VIVBFgwb2RY66HZWR2FyPqtdBptmXlmUvUANYwv7WlBD+6iQ0nHyacgio0XCanhxNpkMZR3saGVkA
-dK5kldk0rwMIdV8OEKozBkrlG6Dg5PBjdLiODtPTw1eXh28uD68hR+gLfjB+ghlk0UgG27o04ShIiv
-IOJbgE8yeRvEw/howK5W80brzNun7DpTJTVeYFTm3RPR4F7WIuzxsWCaOqg+wLsYFfrzUqjSBcyJ6m
-yHNpDv47MxmCGQEH5oKk5uVF8yrKf4HRipiTnkQc708oPVnLybiSRcWp1OeqrdMNYu1QZzJAT9EgOb
-0s1rOGStNuvWr1KbGQL0dg+FpgJiLpbJeQxofT65OjU6cFsCWVA07fQj3t+GPqlJQIDHYk695aWBB7
-orwfDxUv9gOOAKVxu/RvU81ha5+9UWfjnbXVMcpmkcDZ2UoooyqehBbPsF2511pPwETpErrr0AiJ0Z
-/QuF99058ymYkympIvNRMax73Uui5SplvnWH6q/gLZJ0hZzRsLF+5+ed177mFYr+E3bD3YNZWM9vJ3
-+sB0wgS/pPpNuNZ0oILzxLyDigcqAIcs+RfT8sbS
+eJzVWvtz27gR/l1/BULTd37JltymM3XrtrkkvfTSPMbOdSYjKRqIhCQ2FEgDoBWfRv97d/EgwYdsp7
+1J5zQZUwJ3F4sPi8W3QPaenBVSnM0Sfsa+5CxSvT3ybqZowiWJstWK8phkhcoLReYiW5Fnt/SOkh8E
+5dGS/EgVW9M7ULliqhCg8tP1u7dknaglWZh3JOHz7KRhShL8fvXhPZGKqkSqJJJg5M0/PpB/JhHjks
+GvWyZkknEyOB2SFywi54PzP/T27vuQD2yVp9Av+RcVCZ2lTJJ7FXo9yRRJKZ8mOdmY51a3FZIJssG/
+5ndOpVzHZGOepk2ofIr+S7Ipv1ppwW6nKZVqKpnEQUwT1O1o9eRppJJb5r2TVqX9wmhZTEHMfXPtXI
+ksneYUpmHj/2q8R4Cl8kRMg5GK2axYkI1+bHv3A79HXurYeSzuFvgsVzAgSUYputHPyLUSSaReZVK9
+ZnfPlyz6nPDFJc/w3c8wF695tub4Wv49SdnlWcxuz3iRppNeMiebTVgbOWckCLZbaO8R+KQ0zxlGoO
+0UTD434m9gSpi4pIXKvNb3YOOybnGsDTU/norBz9MyDb2tgVQlKwYLgAwHdtazVa5IMD7cI4GNxHrI
+BKZZRGTQo0LAavLnfWqaNhswX73VoWhM1CTSbDHVUT3oWbTM1JYAaQdAaA7QksAkg6mWmYZmaZzC60
+DLagMjLcm+wAglCZ3qpLKIHy0Ts5TBqixl9FvwyXUbzxZklMH0VCKETvRr8GOacJgfTlPSn3sCA4T1
+gbjE0HwvsojFhXgwKHVcwqRE5N8S8GcyojmDsUgl6ihBAxnBHwhOsqK5P9xgPA7wDzy8tsC0BX4b12
+3cbxK6SfhNSjepwCJGQujWACN0xtUNGgjtuMqm6LuecefWIs1mgJ3Ncov1lNMV089iNYN4sEEH4DfD
+rxbvjahrh1kJj/Yg2GyM03bZmcZxYNwYBxdkHIx8nG2MTcbBCenUtJ53qdpX9+vq0e7S1i9365cYdT
+tuXz6o75C9x4oT2W3LTQQacSAj7PNEQBYd6t/zTDAKG/Rm85ndkVuaFgwCYmSmbtHKIRM/hPXafhJq
+czqKav2DU3bhdrhWHxF0PekaqXZn4q+Gyv2Bnxpq1rfbE7Dkh93/BEA7fn8bIGy3QW35Y3u1/qOUwS
+qyfG2zMV+qVCDYQhYz0qdpiulmzPt9dQfe3EDiIDdFAluyIDKnESMIGzTiTpbwgvX7BORHn8h4cvQ6
+qGeG0PYHWc58a/f1NoP0r5YUR8jS+PQoeIzWi4yzJ4+UxdFY/8Z6Q92ppHFz6Rv+rkSyWConPvHAXA
+Fpc9yqlU/N7l0GX9mZbYEpC0KrG7idDCmSv1kc6b0JghA8oTxTS0jHjinnMJWSkTWFWTk9RRQ8TW1P
+CJitoDLxzFh47nfqBZLpMc7IXVaAWa78+SUHH8/eHv613YsmHIUQjCsXV6HlBvDzYFbM50wc1lQc0b
+LSde2GcYTpo78LWqSmzrGuUYSWOX0rV2sAeivi/wHW12IVHHmzfPptPX7Yt2/skEwZy+0O8VgnHWnv
+Xn2m7vlgZFpLzqO4QD+LVJFRLUOXOQelOjJTyuYgZFVdNjEZao88h0EKmia/sLhMGuwLiwqsb0wNbp
+xcwpvUpJgYGf4CvpsMh+JTp1umOk15Yf90Xg5w12lkP1MdIm+H4qROJrRYVSU0ywz86COAELWDFy9/
++PnHC6gf0XFGvnej/L4Cc54WcqnFfVA9Nk5VAUVkRJXe8L1sPMIUXqZhWDpYnAAoK7mYeB5aC08uca
+i+n7b4On/6u7rrUsVgBSwbW2S9NJWQBh+A7hrFTjAagLy8unp3dUG+xnQHSI0gtrEVBC0EHQLefH/3
+Xbl3Nmpoh0l9wg+cS4dOr9WLYyv2tQlgN+eU6Po/m5d2T2yVDjs7FLUqy3McOkS14Uc6rNsRLDGEV/
+FUW9MxnE+RcelFYGZ2d1w7wujWQOhZKsdeA8HFWG0RheUXv6tJIwqsKrtBcoJw13xth4eFb7gjv9jX
+g4q6AMPtPE/a1AvZDhF9FjNp0pr6IAO5zNbIoPu4coij0dZcMGlGlz/c+uCs5/qAwg6oNhuQthhkxD
+xNVMXncB23uPoI2CCkcvj26WA06P9xcnw4lsdYMWsbUwIlVRtYdyjUAUSYxPfDHbaV6hPQOgBsoP9V
+2KIxMvwvsK3WfKXlwOprbNqQWaMdoLmxW3DqiEBXNQA4W+8Mv5JFd5yUNn6XgDXt2Vj10Og0txubUf
+c6mbQRa5bnXxPMUPFx0u1asB8HBoMknsYsSlY09XQ6xXVjUxzQgfcQSrkocahkyDEZbrdmWGZDARmQ
+//Ol7aMSrQ/JrY8W8rBAVxCewf7gKbgEtrwUxyOBzgy71kzDUBUvKyYWTCdcjBN8DvW2cF5fM7BMZh
+CzMFTgbLDj4/JGUf04r/KWo1upzIQi/YInN1DkhE69foRmhB93nIgnim9owh8+S9THiXvkOqdrTq6v
+XyEL50AWYeg9qRsl7Nj9Gxje0XYbunPpEA9p/2ZPw9DAK6RvTFsA8pbwrrPuRjR2lJrv8eIiE/GFrl
+psfWpuMyCfPsx3NUPpc6jI1zppOApUJ8B/wuNgBYTp910shGXzX9usfXTW1kysEh1pwFZ5wuJ2cbur
+90r1hdasHHh6fz1aeYVEM5XM9bhHnrlcTrJbKPNheeuTc3OGjBcQmDIl4Zm5a4Kp8o8YHpzRjlKxmt
+5mwdMw9VWY/RrYdWC4E8sO2fugx89vLoQdH4Z6DmbG3Zzqc3rkBPagXt+/2pjAHOeO8gMw7n4bSdiI
+Szp0MPo0lrC19w/G8fHhaHyAO3pHSY1UtHU5oBNYdTHFuH9NxbjhLiTGK9fgeP9jf3/V349P9l9d7L
++52L8GtmKSFaRhRgXwuT5u+yVJliSIsvyORDSHRMz6eK1zBNwOCrH+sH1zV2lpjlTkaUZjV/4NB0Gz
+rEjTSgVh1Izc3UD36pVD5dIANi6srrM0xWVSv6RGMiAYbCWwYGObiKu73/pVWmPvHnVQwmq/am2wHf
+zJ436oonfMuK5Vxpa/nTY3XctFOugratb4VEcfmjD6lZPzBzYivKaD5mtFhepj5F8AoTwYXx8fnnhr
+yJF7D5yujjoOhh7DmGOmKMQRVmClsWBSM1X78RCNdh9YCFCkNYvQptQMhvZ5V95q9a2nEY8tGMyd4+
+QJ12kkdHiGzRqy9HoEIcoXsP2H1siE/IUMu923JyUCOVHCY/alVCLDSae0Yeg6dEu2J0/0vwArVrRV
+3Z35cHfba9+4HIRlH/Wjgw7smsnynZkwQ91gXXLzX0+Mpz2dk0f2NnTS06k3FNF/AEBRwug=
 '''
 
 def unwrap_and_decompress(wrapped_text):
@@ -407,6 +501,57 @@ RTPSTATS
 +---+--------+--------+---------------+-----+---------------+-----+-------+----+
 """
 
+# Color callables shared by several columns. Defining them once lets every
+# column reference the same function object instead of its own lambda.
+
+def color_init(x: str) -> str:
+    return "anormal" if x.startswith("Init") else "attr_color"
+
+def color_empty(x: str) -> str:
+    return "attr_color" if x else "anormal"
+
+def color_connected(x: str) -> str:
+    return "connected" if "connected" in x else "attr_color"
+
+def color_full_duplex(x: str) -> str:
+    return "attr_color" if "full" in x else "anormal"
+
+def color_port(x: str) -> str:
+    return "attr_color" if x and int(x) % 2 == 0 else "odd"
+
+def color_padded_port(x: str) -> str:
+    x = x.strip()
+    return "attr_color" if x.isdigit() and int(x) % 2 == 0 else "odd"
+
+def color_codec(x: str) -> str:
+    return "attr_color" if x.strip().startswith("G711") else "notg711"
+
+# GWs is filled and cleared in place, never rebound, so binding the dict as a
+# default reads it as a local and still sees every discovered gateway.
+def color_bgw_ip(x: str, _gws: Dict[str, str] = GWs) -> str:
+    return "is_bgw_ip" if x and x in _gws else "attr_color"
+
+def color_padded_bgw_ip(x: str, _gws: Dict[str, str] = GWs) -> str:
+    return "is_bgw_ip" if x.strip() in _gws else "attr_color"
+
+def color_dscp(x: str) -> str:
+    return "anormal" if x and x != "46" else "attr_color"
+
+def color_nonzero(x: str) -> str:
+    return "anormal" if x and x != "0" else "attr_color"
+
+# Attribute formatters of the Model and Flash columns.
+
+def model_prefix(x: str) -> str:
+    return x[:4]
+
+def flash_prefix(x: str) -> str:
+    return x[:5]
+
+# Tail slices as C-level callables, no Python frame per cell.
+last8 = itemgetter(slice(-8, None))
+last26 = itemgetter(slice(-26, None))
+
 LAYOUTS = {
     "SYSTEM": [
         ("BGW", {
@@ -451,7 +596,7 @@ LAYOUTS = {
         }),
         ("Model", {
             "attr_name": "model",
-            "attr_func": lambda x: x[:4],
+            "attr_func": model_prefix,
             "attr_color": "normal",
             "color_func": None,
             "attr_fmt": ">5",
@@ -553,7 +698,7 @@ LAYOUTS = {
         }),
         ("Flash", {
             "attr_name": "comp_flash",
-            "attr_func": lambda x: x[:5],
+            "attr_func": flash_prefix,
             "attr_color": "normal",
             "color_func": None,
             "attr_fmt": ">5",
@@ -575,9 +720,7 @@ LAYOUTS = {
             "attr_name": "gw_number",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x.startswith("Init") else "attr_color"
-            ),
+            "color_func": color_init,
             "attr_fmt": ">3",
             "attr_xpos": 1,
         }),
@@ -585,9 +728,7 @@ LAYOUTS = {
             "attr_name": "mm_v1",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x.startswith("Init") else "attr_color"
-            ),
+            "color_func": color_init,
             "attr_fmt": "<6",
             "attr_xpos": 5,
         }),
@@ -595,9 +736,7 @@ LAYOUTS = {
             "attr_name": "mm_v2",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x.startswith("Init") else "attr_color"
-            ),
+            "color_func": color_init,
             "attr_fmt": "<6",
             "attr_xpos": 12,
         }),
@@ -605,9 +744,7 @@ LAYOUTS = {
             "attr_name": "mm_v3",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x.startswith("Init") else "attr_color"
-            ),
+            "color_func": color_init,
             "attr_fmt": "<6",
             "attr_xpos": 19,
         }),
@@ -615,9 +752,7 @@ LAYOUTS = {
             "attr_name": "mm_v4",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x.startswith("Init") else "attr_color"
-            ),
+            "color_func": color_init,
             "attr_fmt": "<6",
             "attr_xpos": 26,
         }),
@@ -625,9 +760,7 @@ LAYOUTS = {
             "attr_name": "mm_v5",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x.startswith("Init") else "attr_color"
-            ),
+            "color_func": color_init,
             "attr_fmt": "<6",
             "attr_xpos": 33,
         }),
@@ -635,9 +768,7 @@ LAYOUTS = {
             "attr_name": "mm_v6",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x.startswith("Init") else "attr_color"
-            ),
+            "color_func": color_init,
             "attr_fmt": "<6",
             "attr_xpos": 40,
         }),
@@ -645,9 +776,7 @@ LAYOUTS = {
             "attr_name": "mm_v7",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x.startswith("Init") else "attr_color"
-            ),
+            "color_func": color_init,
             "attr_fmt": "<6",
             "attr_xpos": 47,
         }),
@@ -655,9 +784,7 @@ LAYOUTS = {
             "attr_name": "mm_v8",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x.startswith("Init") else "attr_color"
-            ),
+            "color_func": color_init,
             "attr_fmt": "<6",
             "attr_xpos": 54,
         }),
@@ -707,9 +834,7 @@ LAYOUTS = {
             "attr_name": "port1_status",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "connected" if "connected" in x else "attr_color"
-            ),
+            "color_func": color_connected,
             "attr_fmt": ">9",
             "attr_xpos": 11,
         }),
@@ -733,9 +858,7 @@ LAYOUTS = {
             "attr_name": "port1_duplex",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "attr_color" if "full" in x else "anormal"
-            ),
+            "color_func": color_full_duplex,
             "attr_fmt": ">4",
             "attr_xpos": 35,
         }),
@@ -751,9 +874,7 @@ LAYOUTS = {
             "attr_name": "port2_status",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "connected" if "connected" in x else "attr_color"
-            ),
+            "color_func": color_connected,
             "attr_fmt": ">9",
             "attr_xpos": 46,
         }),
@@ -777,9 +898,7 @@ LAYOUTS = {
             "attr_name": "port2_duplex",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "attr_color" if "full" in x else "anormal"
-            ),
+            "color_func": color_full_duplex,
             "attr_fmt": ">4",
             "attr_xpos": 70,
         }),
@@ -797,9 +916,7 @@ LAYOUTS = {
             "attr_name": "gw_number",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "attr_color" if x else "anormal"
-            ),
+            "color_func": color_empty,
             "attr_fmt": ">3",
             "attr_xpos": 1,
         }),
@@ -945,23 +1062,23 @@ LAYOUTS = {
             "attr_name": "gw_number",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: "attr_color" if x else "anormal",
+            "color_func": color_empty,
             "attr_fmt": ">3",
             "attr_xpos": 1,
         }),
         ("Start", {
             "attr_name": "start_time",
-            "attr_func": lambda x: x[-8:],
+            "attr_func": last8,
             "attr_color": "normal",
-            "color_func": lambda x: "attr_color" if x else "anormal",
+            "color_func": color_empty,
             "attr_fmt": "^8",
             "attr_xpos": 5,
         }),
         ("End", {
             "attr_name": "end_time",
-            "attr_func": lambda x: x[-8:],
+            "attr_func": last8,
             "attr_color": "normal",
-            "color_func": lambda x: "attr_color" if x else "anormal",
+            "color_func": color_empty,
             "attr_fmt": "^8",
             "attr_xpos": 14,
         }),
@@ -969,7 +1086,7 @@ LAYOUTS = {
             "attr_name": "local_addr",
             "attr_func": None,
             "attr_color": "is_bgw_ip",
-            "color_func": lambda x: "attr_color" if x else "anormal",
+            "color_func": color_empty,
             "attr_fmt": ">15",
             "attr_xpos": 23,
         }),
@@ -977,9 +1094,7 @@ LAYOUTS = {
             "attr_name": "local_port",
             "attr_func": None,
             "attr_color": "port",
-            "color_func": lambda x: (
-                "attr_color" if x and int(x) % 2 == 0 else "odd"
-            ),
+            "color_func": color_port,
             "attr_fmt": ">5",
             "attr_xpos": 39,
         }),
@@ -987,9 +1102,7 @@ LAYOUTS = {
             "attr_name": "remote_addr",
             "attr_func": None,
             "attr_color": "address",
-            "color_func": lambda x: (
-                "is_bgw_ip" if x and x in GWs else "attr_color"
-            ),
+            "color_func": color_bgw_ip,
             "attr_fmt": ">15",
             "attr_xpos": 45,
         }),
@@ -997,9 +1110,7 @@ LAYOUTS = {
             "attr_name": "remote_port",
             "attr_func": None,
             "attr_color": "port",
-            "color_func": lambda x: (
-                "attr_color" if x and int(x) % 2 == 0 else "odd"
-            ),
+            "color_func": color_port,
             "attr_fmt": ">5",
             "attr_xpos": 61,
         }),
@@ -1007,9 +1118,7 @@ LAYOUTS = {
             "attr_name": "codec",
             "attr_func": None,
             "attr_color": "codec",
-            "color_func": lambda x: (
-                "attr_color" if x.startswith("G711") else "notg711"
-            ),
+            "color_func": color_codec,
             "attr_fmt": "^7",
             "attr_xpos": 67,
         }),
@@ -1035,7 +1144,7 @@ LAYOUTS = {
         }),
         ("Filename", {
             "attr_name": "filename",
-            "attr_func": lambda x: x[-26:],
+            "attr_func": last26,
             "attr_color": "normal",
             "color_func": None,
             "attr_fmt": ">26",
@@ -1312,10 +1421,7 @@ RTP_LAYOUT = [
         {
             "attr_func": None,
             "attr_color": "port",
-            "color_func": lambda x: (
-                "attr_color" if x.strip().isdigit() and int(x.strip()) % 2 == 0
-                else "odd"
-            ),
+            "color_func": color_padded_port,
             "attr_fmt": "<5",
             "attr_ypos": 5,
             "attr_xpos": 21,
@@ -1348,9 +1454,7 @@ RTP_LAYOUT = [
         {
             "attr_func": None,
             "attr_color": "codec",
-            "color_func": lambda x: (
-                "attr_color" if x.strip().startswith("G711") else "notg711"
-            ),
+            "color_func": color_codec,
             "attr_fmt": "^7",
             "attr_ypos": 5,
             "attr_xpos": 35,
@@ -1372,10 +1476,7 @@ RTP_LAYOUT = [
         {
             "attr_func": None,
             "attr_color": "port",
-            "color_func": lambda x: (
-                "attr_color" if x.strip().isdigit() and int(x.strip()) % 2 == 0
-                else "odd"
-            ),
+            "color_func": color_padded_port,
             "attr_fmt": ">5",
             "attr_ypos": 5,
             "attr_xpos": 50,
@@ -1397,9 +1498,7 @@ RTP_LAYOUT = [
         {
             "attr_func": None,
             "attr_color": "address",
-            "color_func": lambda x: (
-                "is_bgw_ip" if x.strip() in GWs else "attr_color"
-            ),
+            "color_func": color_padded_bgw_ip,
             "attr_fmt": "<15",
             "attr_ypos": 5,
             "attr_xpos": 56,
@@ -1689,9 +1788,7 @@ RTP_LAYOUT = [
         {
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x and x != "46" else "attr_color"
-            ),
+            "color_func": color_dscp,
             "attr_fmt": ">7",
             "attr_ypos": 11,
             "attr_xpos": 22,
@@ -1713,9 +1810,7 @@ RTP_LAYOUT = [
         {
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x and x != "46" else "attr_color"
-            ),
+            "color_func": color_dscp,
             "attr_fmt": ">5",
             "attr_ypos": 11,
             "attr_xpos": 32,
@@ -1825,9 +1920,7 @@ RTP_LAYOUT = [
         {
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x and x != "0" else "attr_color"
-            ),
+            "color_func": color_nonzero,
             "attr_fmt": ">7",
             "attr_ypos": 13,
             "attr_xpos": 22,
@@ -1871,9 +1964,7 @@ RTP_LAYOUT = [
         {
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x and x != "0" else "attr_color"
-            ),
+            "color_func": color_nonzero,
             "attr_fmt": ">7",
             "attr_ypos": 14,
             "attr_xpos": 22,
@@ -2087,6 +2178,82 @@ ColumnDef = Tuple[str, Dict[str, Any]]
 SpecItem = Tuple[str, Dict[str, Any]]
 Cell = Tuple[int, int, str, int]
 
+class ColumnSpec(NamedTuple):
+    """A layout column with its defaults resolved, see freeze_layout()."""
+    name: str
+    attr_name: str
+    attr_func: Optional[Callable[[Any], Any]]
+    attr_color: str
+    color_func: Optional[Callable[[Any], str]]
+    attr_fmt: Optional[str]
+    fmt_digits: str
+    fmt_len: Optional[int]
+    fmt_func: Optional[Callable[[str], str]]
+    label: str
+    attr_xpos: int
+    attr_ypos: Optional[int]
+
+FrozenLayout = Tuple[ColumnSpec, ...]
+
+def compile_fmt(fmt: str) -> Callable[[str], str]:
+    """Return a callable padding a string the way format(s, fmt) does.
+
+    Plain right or left alignment maps to str.rjust/str.ljust, which are
+    several times cheaper than parsing the spec on every call. Any other
+    spec is bound once into a str.format method.
+    """
+    width = fmt[1:]
+    if width.isdigit():
+        n = int(width)
+        if fmt[0] == ">":
+            return lambda s: s.rjust(n)
+        if fmt[0] == "<":
+            return lambda s: s.ljust(n)
+    return "{{:{}}}".format(fmt).format
+
+def freeze_layout(
+    spec: Union[Iterable[SpecItem], FrozenLayout],
+) -> FrozenLayout:
+    """Convert (name, attrs_dict) items into an immutable tuple of ColumnSpec.
+
+    Lookups, defaults and the width digits of attr_fmt are resolved once here
+    instead of for every cell on every redraw. Already frozen layouts are
+    returned unchanged.
+
+    Args:
+        spec: Iterable of (name, attrs_dict) items, or a frozen layout.
+
+    Returns:
+        Tuple of ColumnSpec in display order.
+    """
+    # iter_attrs passes every row through here; a frozen layout is only
+    # ever built by this function, so its first column identifies it.
+    if isinstance(spec, tuple) and (not spec or isinstance(spec[0], ColumnSpec)):
+        return spec
+
+    columns = []  # type: List[ColumnSpec]
+    for name, d in spec:
+        fmt = d.get("attr_fmt")
+        digits = "".join(c for c in fmt if c.isdigit()) if fmt else ""
+        ypos = d.get("attr_ypos")
+        # Header labels are centered over the field width.
+        label = "{:^{}}".format(name, digits or len(name)) if fmt else name
+        columns.append(ColumnSpec(
+            name=name,
+            attr_name=d.get("attr_name", name),
+            attr_func=d.get("attr_func"),
+            attr_color=d.get("attr_color", "normal"),
+            color_func=d.get("color_func"),
+            attr_fmt=fmt,
+            fmt_digits=digits,
+            fmt_len=int(digits) if digits else None,
+            fmt_func=compile_fmt(fmt) if fmt else None,
+            label=label,
+            attr_xpos=int(d.get("attr_xpos", 0)),
+            attr_ypos=int(ypos) if ypos is not None else None,
+        ))
+    return tuple(columns)
+
 class Layout(object):
     """A screen layout made of ordered column definitions.
 
@@ -2117,8 +2284,15 @@ class Layout(object):
                     If not provided, defaults to an empty dict and
                     you should pass a colors map to iter_cells().
         """
-        self._columns = list(columns)
+        self._columns = tuple(columns)
+        self._frozen = freeze_layout(self._columns)
+        self._widths = {
+            c.name: c.fmt_len or len(c.name) for c in self._frozen
+        }  # type: Dict[str, int]
         self._by_name = {}
+        # Per rendered object: the render arguments, the raw column values
+        # and the cells rendered from them, see iter_attrs().
+        self._prev = WeakKeyDictionary()  # type: WeakKeyDictionary
         self.colors = colors if colors is not None else {}
 
         for name, attrs in self._columns:
@@ -2167,14 +2341,10 @@ class Layout(object):
     def column_width(self, name: str) -> int:
         """Compute column width from attr_fmt, else fall back to len(name).
 
-        Extracts the first integer found in attr_fmt (e.g. ">14" -> 14).
+        The width digits of attr_fmt (e.g. ">14" -> 14) are resolved once by
+        freeze_layout().
         """
-        fmt = self._by_name[name].get("attr_fmt")
-        if not fmt:
-            return len(name)
-
-        m = re.search(r"(\d+)", str(fmt))
-        return int(m.group(1)) if m else len(name)
+        return self._widths[name]
 
     def iter_attrs(
         self,
@@ -2185,22 +2355,69 @@ class Layout(object):
         yoffset: int = 0,
         colors: Optional[Dict[str, int]] = COLORS,
         header: bool = False,
-    ) -> Generator[Tuple[int, int, str, int], None, None]:
-        """Yield (y, x, text, color) cells for this Screen"""
+    ) -> Iterator[Cell]:
+        """Yield (y, x, text, color) cells for this Screen.
+
+        The raw column values of each object are kept together with the
+        cells rendered from them. On the next call for the same object only
+        the columns whose value changed are formatted and colored again,
+        the others reuse their cell.
+        """
         cmap = colors if colors is not None else self.colors
-        return iter_attrs(
-            obj=obj,
-            spec=self._columns,
-            colors=cmap,
-            xoffset=xoffset,
-            yoffset=yoffset,
-            default_y=row_y,
-            header=header,
-        )
+        if header or obj is None:
+            return iter_attrs(
+                obj=obj,
+                spec=self._frozen,
+                colors=cmap,
+                xoffset=xoffset,
+                yoffset=yoffset,
+                default_y=row_y,
+                header=header,
+            )
+
+        columns = self._frozen
+        values = tuple(getattr(obj, c.attr_name, c.name) for c in columns)
+        # color_bgw_ip depends on GWs too, which counts its changes.
+        state = (id(cmap), row_y, xoffset, yoffset, GWs.version)
+        prev = self._prev.get(obj)
+
+        if prev is not None and prev[0] == state:
+            if prev[1] == values:
+                return iter(prev[2])
+            normal = int(cmap.get("normal", 0))
+            cells = list(prev[2])
+            for i, (old, value) in enumerate(zip(prev[1], values)):
+                if old != value:
+                    cells[i] = render_cell(
+                        columns[i], value, cmap, normal,
+                        xoffset=xoffset, yoffset=yoffset, default_y=row_y,
+                    )
+        else:
+            normal = int(cmap.get("normal", 0))
+            cells = [
+                render_cell(
+                    c, value, cmap, normal,
+                    xoffset=xoffset, yoffset=yoffset, default_y=row_y,
+                )
+                for c, value in zip(columns, values)
+            ]
+
+        try:
+            self._prev[obj] = (state, values, cells)
+        except TypeError:
+            pass
+        return iter(cells)
+
+    def invalidate(self, obj: Optional[Any] = None) -> None:
+        """Forget the cells kept for obj, or for all objects if None."""
+        if obj is None:
+            self._prev.clear()
+        else:
+            self._prev.pop(obj, None)
 
 def iter_attrs(
     obj: Optional[Any],
-    spec: Iterable[SpecItem],
+    spec: Union[Iterable[SpecItem], FrozenLayout],
     colors: Dict[str, int],
     *,
     xoffset: int = 0,
@@ -2226,7 +2443,8 @@ def iter_attrs(
 
     Args:
         obj: Object providing attributes; if None render labels.
-        spec: Iterable of (name, attrs_dict) items.
+        spec: Iterable of (name, attrs_dict) items or, preferably, a layout
+            already frozen by freeze_layout().
         colors: Color name -> curses int attribute.
         xoffset/yoffset: Applied to coordinates.
         default_y: Used when attr_ypos is missing.
@@ -2236,59 +2454,88 @@ def iter_attrs(
         (y, x, text, color_attr)
     """
     normal = int(colors.get("normal", 0))
+    labels = header or obj is None
 
-    for name, d in spec:
-        y = int(d.get("attr_ypos", default_y)) + yoffset
-        x = int(d.get("attr_xpos", 0)) + xoffset
-
-        # Value
-        if header or obj is None:
-            value = name
+    for c in freeze_layout(spec):
+        if labels:
+            value = c.name
         else:
-            attr_name = d.get("attr_name", name)
-            value = getattr(obj, attr_name, name)
+            value = getattr(obj, c.attr_name, c.name)
+        yield render_cell(
+            c, value, colors, normal,
+            labels=labels, xoffset=xoffset, yoffset=yoffset,
+            default_y=default_y,
+        )
 
-            fn = d.get("attr_func")
-            if fn:
-                try:
-                    value = fn(value)
-                except Exception:
-                    pass
+def render_cell(
+    c: ColumnSpec,
+    value: Any,
+    colors: Dict[str, int],
+    normal: int,
+    *,
+    labels: bool = False,
+    xoffset: int = 0,
+    yoffset: int = 0,
+    default_y: int = 0,
+) -> Cell:
+    """Return the (y, x, text, color_attr) cell of column c for a raw value.
 
-        # Color name
-        cname = d.get("attr_color", "normal")
-        cfn = d.get("color_func")
-        
-        if header or obj is None:
-            cname = "normal"
-        
-        elif cfn:
-            try:
-                chosen = cfn(value)
-                if chosen == "attr_color":
-                    cname = d.get("attr_color", "normal")
-                else:
-                    cname = chosen
-            except Exception:
-                pass
+    Args:
+        c: Frozen column.
+        value: Raw attribute value, or the column name when labels is True.
+        colors: Color name -> curses int attribute.
+        normal: Color attribute used when a color name is unknown.
+        labels: If True, render the column label instead of the value.
+        xoffset/yoffset: Applied to coordinates.
+        default_y: Used when attr_ypos is missing.
 
-        color_attr = int(colors.get(cname, normal))
+    Returns:
+        (y, x, text, color_attr)
+    """
+    y = (c.attr_ypos if c.attr_ypos is not None else default_y) + yoffset
+    x = c.attr_xpos + xoffset
 
-        # Format
-        fmt = d.get("attr_fmt")
-        if fmt:
-            try:
-                ln = "".join(c for c in fmt if c.isdigit())
-                if header or obj is None:
-                    centered = "^" + ln if ln else "^" + str(len(value))
-                    value = "{:{}}".format(value, centered)
-                else:
-                    ln = int(ln) if ln else None
-                    value = "{:{}}".format(str(value)[:ln], fmt)
-            except Exception:
-                pass
+    # Value
+    if not labels and c.attr_func:
+        try:
+            value = c.attr_func(value)
+        except Exception:
+            pass
 
-        yield y, x, str(value), color_attr
+    # Color name
+    cname = c.attr_color
+
+    if labels:
+        cname = "normal"
+
+    elif c.color_func:
+        try:
+            chosen = c.color_func(value)
+            if chosen != "attr_color":
+                cname = chosen
+        except Exception:
+            pass
+
+    color_attr = colors.get(cname, normal)
+
+    # Format
+    if c.attr_fmt:
+        try:
+            if labels:
+                value = c.label
+            else:
+                value = c.fmt_func(str(value)[:c.fmt_len])
+        except Exception:
+            pass
+
+    return y, x, str(value), color_attr
+
+RTP_COLUMNS = freeze_layout(RTP_LAYOUT)
+
+# Layouts are read-only, one instance per screen is shared by name.
+SCREEN_LAYOUTs = MappingProxyType(
+    {name: Layout(columns) for name, columns in LAYOUTS.items()}
+)
 
 ############################## END LAYOUT #####################################
 ############################## BEGIN FILTER ###################################
@@ -2298,7 +2545,7 @@ FILTER_GROUPs = {
         "current_filter": "",
         "no_filter": False,
         "groups": {
-            "ip_filter": set()
+            "ip_filter": frozenset()
             }
         },
 }
@@ -2317,6 +2564,10 @@ Filter examples:
     -i 10.10.10.1|10.10.10.2  OR  -i 10.10.10.1,10.10.10.2
 """}
 
+FILTER_MENU_LINEs = {
+    group: tuple(menu.splitlines()) for group, menu in FILTER_MENUs.items()
+}
+
 class NoExitArgumentParser(argparse.ArgumentParser):
     def error(self, message):
         raise ValueError(message)
@@ -2326,9 +2577,10 @@ def is_valid_ipv4(ip: str) -> bool:
     """
     Validate whether a string is a valid IPv4 address.
 
-    This function uses a regular expression to ensure the address:
-      - Consists of exactly four octets separated by dots
-      - Each octet is in the range 0–255
+    The address must:
+      - Consist of exactly four octets separated by dots
+      - Have one to three digits per octet, leading zeros allowed
+      - Have each octet in the range 0–255
 
     Args:
         ip: The IPv4 address string to validate.
@@ -2336,12 +2588,19 @@ def is_valid_ipv4(ip: str) -> bool:
     Returns:
         True if the string is a valid IPv4 address, False otherwise.
     """
-    octet = r"(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)"
-    pattern = rf"^({octet}\.){{3}}{octet}$"
-
-    return re.match(pattern, ip) is not None
+    octets = ip.split(".")
+    if len(octets) != 4:
+        return False
+    for octet in octets:
+        if (
+            not 0 < len(octet) <= 3
+            or octet.strip("0123456789")
+            or int(octet) > 255
+        ):
+            return False
+    return True
 
-def parse_and_validate_i(value: str) -> Set[str]:
+def parse_and_validate_i(value: str) -> FrozenSet[str]:
     """
     Parse and validate a list of IPv4 addresses.
 
@@ -2353,25 +2612,20 @@ def parse_and_validate_i(value: str) -> Set[str]:
         value: A string containing one or more IPv4 addresses.
 
     Returns:
-        A set of validated IPv4 address strings.
+        A frozenset of validated IPv4 address strings.
 
     Raises:
         argparse.ArgumentTypeError: If any IP address is invalid.
     """
-    raw_ips = re.split(r"[,\|]", value)
-    ips: Set[str] = set()
-
-    for ip in raw_ips:
-        ip = ip.strip()
-        if not ip:
-            continue
-
-        if not is_valid_ipv4(ip):
-            raise argparse.ArgumentTypeError(f"Invalid IP: {ip}")
+    stripped = (ip.strip() for ip in value.replace("|", ",").split(","))
+    ips = [ip for ip in stripped if ip]
 
-        ips.add(ip)
+    # Checked in input order so the first invalid entry is reported.
+    bad = next((ip for ip in ips if not is_valid_ipv4(ip)), None)
+    if bad is not None:
+        raise argparse.ArgumentTypeError(f"Invalid IP: {bad}")
 
-    return ips
+    return frozenset(ips)
 
 def create_filter_parser() -> "NoExitArgumentParser":
     """
@@ -2401,7 +2655,7 @@ def create_filter_parser() -> "NoExitArgumentParser":
         "-i",
         dest="ip_filter",
         type=parse_and_validate_i,
-        default=set(),  # type: Set[str]
+        default=frozenset(),  # type: FrozenSet[str]
         help="BGW IP filter list separated by | or ,",
     )
 
@@ -2409,13 +2663,55 @@ def create_filter_parser() -> "NoExitArgumentParser":
 
 filter_parser = create_filter_parser()
 
+def _clean_filter(line: str) -> str:
+    """Strip quotes and surrounding whitespace from a filter line."""
+    return line.replace("'", "").replace('"', "").strip()
+
+@lru_cache(maxsize=256)
+def _fast_parse(line: str) -> Dict[str, Any]:
+    """
+    Parse a filter line without going through argparse.
+
+    The filter grammar is only `-n` or `-i <ips>`, so the common shapes are
+    handled directly. Anything else (malformed input, combined or repeated
+    flags) falls back to `filter_parser` which produces the error message.
+
+    Args:
+        line: Raw filter line.
+
+    Returns:
+        A dict shaped like `vars(filter_parser.parse_args(...))`. The result
+        is cached and shared, callers must not mutate it.
+
+    Raises:
+        ValueError: If the line is not a valid filter.
+    """
+    tokens = line.split()
+
+    if not tokens:
+        return {"no_filter": False, "ip_filter": frozenset()}
+
+    if tokens == ["-n"]:
+        return {"no_filter": True, "ip_filter": frozenset()}
+
+    if len(tokens) == 2 and tokens[0] == "-i":
+        try:
+            ips = parse_and_validate_i(tokens[1])
+        except argparse.ArgumentTypeError:
+            pass
+        else:
+            return {"no_filter": False, "ip_filter": ips}
+
+    return vars(filter_parser.parse_args(tokens))
+
 def filter_validator(line: str) -> Optional[str]:
     """
     Validate and parse a filter command line.
 
     This function is typically used as a validator for user input (e.g. from a
-    curses text field). It sanitizes the input, attempts to parse it using the
-    global `filter_parser`, and logs the parsed arguments for debugging.
+    curses text field). It sanitizes the input, attempts to parse it using
+    `_fast_parse` (backed by the global `filter_parser`), and logs the parsed
+    arguments for debugging.
 
     If parsing fails, the error is logged and the error message is returned.
     Returning a string is assumed to signal validation failure to the caller.
@@ -2427,11 +2723,8 @@ def filter_validator(line: str) -> Optional[str]:
         None if the input is valid and successfully parsed.
         A string error message if validation or parsing fails.
     """
-    # Strip quotes and surrounding whitespace
-    cleaned = line.replace("'", "").replace('"', "").strip()
-
     try:
-        args = filter_parser.parse_args(cleaned.split())
+        args = _fast_parse(_clean_filter(line))
         logger.debug(args)
         return None
 
@@ -2450,15 +2743,17 @@ def update_filter(
     if not group_cfg:
         return
 
-    args = vars(filter_parser.parse_args(filter.split()))
+    # Normalized like in filter_validator so the parse it cached is reused.
+    filter = _clean_filter(filter)
+    args = _fast_parse(filter)
     groups = group_cfg.get("groups", {})
     
     # Clear all filters
     if args.get("no_filter"):
         group_cfg["current_filter"] = ""
         group_cfg["no_filter"] = False
-        for g in groups.values():
-            g.clear()
+        for key in groups:
+            groups[key] = frozenset()
         logger.info("Cleared all filters")
         return
 
@@ -2467,14 +2762,100 @@ def update_filter(
         group_cfg["current_filter"] = filter
         group_cfg["no_filter"] = False
         
-        for key, value in args.items():
-            if key in groups and value:
-                groups[key] = value
-                logger.info(f"Updated '{key}' to '{value}'")
+        changed = {
+            key: value for key, value in args.items()
+            if key in groups and value and groups[key] != value
+        }
+        if changed:
+            groups.update(changed)
+            logger.info("Updated filters %s", changed)
 
 ############################## END FILTER #####################################
 ############################## BEGIN BGW ######################################
 
+# Patterns applied to the show command outputs. The CLI output is plain
+# ASCII, so re.ASCII spares the engine the Unicode character classes.
+reActiveSessions = re.compile(r"nal\s+\S+\s+(\S+)", re.ASCII)
+reCaptureBufferSize = re.compile(r"Current buffer size is (\d+) KB", re.ASCII)
+reCaptureOccupancy = re.compile(r"buffer occupancy: (\d+)\.", re.ASCII)
+reCaptureService = re.compile(r"Capture service is (\w+)", re.ASCII)
+reCaptureStatus = re.compile(r"Capture service is \w+ and (\w+)", re.ASCII)
+reCPUUtil = re.compile(r"10\s+\d+%\s+(\d+)%", re.ASCII)
+reDSPInUse = re.compile(r"In Use\s+:\s+(\d+)", re.ASCII)
+reFault = re.compile(r"\s+\+ (\S+)", re.ASCII)
+reFlashMemory = re.compile(r"Flash Memory\s+: (\d+)\S+ ([MG])B", re.ASCII)
+reFWVintage = re.compile(r"FW Vintage\s+:\s+(\S+)", re.ASCII)
+reHWSuffix = re.compile(r"HW Suffix\s+:\s+(\S+)", re.ASCII)
+reHWVintage = re.compile(r"HW Vintage\s+:\s+(\S+)", re.ASCII)
+reLANMAC = re.compile(r"LAN MAC Address\s+:\s+(\S+)", re.ASCII)
+reLocation = re.compile(r"System Location\s+:\s*(\S+)", re.ASCII)
+reMainboardHWSuffix = re.compile(r"Mainboard HW Suffix\s+:\s+(\S+)", re.ASCII)
+reMainboardHWVintage = re.compile(r"Mainboard HW Vintage\s+:\s+(\S+)", re.ASCII)
+reMainPSU = re.compile(r"Main PSU\s+:\s+(\S+)", re.ASCII)
+reMediaSocket = re.compile(r"Media Socket .*?: M?P?(\d+) ", re.ASCII)
+reMemory = re.compile(r"Memory #\d+\s+:\s+(\S+)", re.ASCII)
+reMemToken = re.compile(r"(\d+)([MG]B)", re.ASCII)
+reModel = re.compile(r"Model\s+:\s+(\S+)", re.ASCII)
+rePortLine = re.compile(r"(.*Avaya )", re.ASCII)
+rePortRedundancy = re.compile(r"port redundancy \d+/(\d+) \d+/(\d+)", re.ASCII)
+rePSU1 = re.compile(r"PSU #1\s+:\s+\S+ (\S+)", re.ASCII)
+rePSU2 = re.compile(r"PSU #2\s+:\s+\S+ (\S+)", re.ASCII)
+reRAMMemory = re.compile(r"RAM Memory\s+:\s+(\S+)", re.ASCII)
+reRAMUtil = re.compile(r"10\s+\S+\s+\S+\s+(\d+)%", re.ASCII)
+reSerial = re.compile(r"Serial No\s+:\s+(\S+)", re.ASCII)
+reSLAMonitor = re.compile(r"SLA Monitor:\s+(\S+)", re.ASCII)
+reSLAServer = re.compile(r"Registered Server IP Address:\s+(\S+)", re.ASCII)
+reSNMPTrap = re.compile(r"snmp-server host (\S+) trap", re.ASCII)
+reTemperature = re.compile(r"Temperature\s+:\s+(\S+) \((\S+)\)", re.ASCII)
+reTotalSessions = re.compile(r"nal\s+\S+\s+\S+\s+(\S+)", re.ASCII)
+reUploadFailure = re.compile(r"Failure display\s+:\s+(\S+)", re.ASCII)
+reUploadState = re.compile(r"Running state\s+:\s+(\S+)", re.ASCII)
+reUptime = re.compile(r"Uptime \(\S+\)\s+:\s+(\S+)", re.ASCII)
+reMediaModule = re.compile(
+    r".*?(?P<slot>\S+)"
+    r".*?(?P<type>\S+)"
+    r".*?(?P<code>\S+)"
+    r".*?(?P<suffix>\S+)"
+    r".*?(?P<hw_vint>\S+)"
+    r".*?(?P<fw_vint>\S+)",
+    re.ASCII,
+)
+rePortDetails = re.compile(
+    r".*?(?P<port>\d+/\d+)"
+    r".*?(?P<name>.*)"
+    r".*?(?P<status>(connected|no link|disabled))"
+    r".*?(?P<vlan>\d+)"
+    r".*?(?P<level>\d+)"
+    r".*?(?P<neg>\S+)"
+    r".*?(?P<duplex>\S+)"
+    r".*?(?P<speed>\S+)",
+    re.ASCII,
+)
+
+def cached_on(source: str) -> Callable[[Callable[..., Any]], property]:
+    """Turn a method into a property memoized on its ``show_*`` source text.
+
+    The parsed value is stored in ``self._cache`` together with the source
+    string it was derived from. As the poller replaces the ``show_*``
+    attributes wholesale, an identity check on that string is enough to tell
+    whether the cached value is still current.
+
+    Args:
+        source: Name of the BGW attribute holding the raw command output.
+
+    Returns:
+        A decorator producing a read-only property.
+    """
+    def decorator(func: Callable[..., Any]) -> property:
+        name = func.__name__
+
+        @wraps(func)
+        def getter(self: "BGW") -> Any:
+            return self._cached(name, source, func)
+
+        return property(getter)
+    return decorator
+
 class BGW(object):
     """Represents an Avaya Branch Gateway (BGW) and cached command outputs.
 
@@ -2489,9 +2870,9 @@ class BGW(object):
     Notes:
         - Many properties return "NA" when the corresponding command output is
           missing.
-        - Parsed values are cached in private attributes (e.g. ``_hw``) to avoid
-          repeated regex work. If you overwrite the underlying ``show_*`` string,
-          you may also want to clear the relevant cache field.
+        - Parsed values are cached in ``_cache`` keyed by property name and
+          are reused for as long as the underlying ``show_*`` string is the
+          same object, so assigning new command output invalidates them.
     """
 
     def __init__(
@@ -2529,7 +2910,8 @@ class BGW(object):
         self.avg_poll_secs = 0.0
         self.poll_count = 0
 
-        self.active_session_ids = set()  # type: Set[str]
+        # Sorted numeric ids of the sessions active at the last poll.
+        self.active_session_ids = array("Q")  # type: array
         self.last_seen = ""
         self.last_seen_dt = None  # type: Optional[datetime]
         self.last_session_id = None  # type: Optional[str]
@@ -2551,71 +2933,17 @@ class BGW(object):
         self.show_upload_status_10 = show_upload_status_10
         self.show_voip_dsp = show_voip_dsp
 
-        # Work queue used by your polling/executor layer
-        self.queue = Queue()  # type: Queue
-
-        # --- Lazy caches (keep as you had them) ---
-        self._announcements = None  # type: Optional[str]
-        self._capture_service = None  # type: Optional[str]
-        self._capture_status = None  # type: Optional[str]
-
-        self._chassis_hw = None  # type: Optional[str]
-        self._comp_flash = None  # type: Optional[str]
-        self._cpu_util = None  # type: Optional[str]
-        self._dsp = None  # type: Optional[str]
-        self._faults = None  # type: Optional[str]
-        self._fw = None  # type: Optional[str]
-        self._hw = None  # type: Optional[str]
-        self._inuse_dsp = None  # type: Optional[str]
-        self._last_seen_time = None  # type: Optional[str]
-        self._lldp = None  # type: Optional[str]
-        self._location = None  # type: Optional[str]
-        self._mac = None  # type: Optional[str]
-        self._mainboard_hw = None  # type: Optional[str]
-        self._memory = None  # type: Optional[str]
-        self._mm_groupdict = None  # type: Optional[Dict[str, Dict[str, str]]]
-
-        self._mm_v1 = None  # type: Optional[str]
-        self._mm_v2 = None  # type: Optional[str]
-        self._mm_v3 = None  # type: Optional[str]
-        self._mm_v4 = None  # type: Optional[str]
-        self._mm_v5 = None  # type: Optional[str]
-        self._mm_v6 = None  # type: Optional[str]
-        self._mm_v7 = None  # type: Optional[str]
-        self._mm_v8 = None  # type: Optional[str]
-        self._mm_v10 = None  # type: Optional[str]
-
-        self._model = None  # type: Optional[str]
+        # Pending commands, drained by create_bgw_args on the next poll.
+        # Nothing awaits on it, so a plain deque is enough; poll results
+        # for all BGWs go through the single queue of schedule_queries.
+        self.queue = deque()  # type: deque
+
+        # Parsed values keyed by property name, each stored together with
+        # the show_* text it was parsed from (see cached_on).
+        self._cache = {}  # type: Dict[str, Tuple[str, Any]]
 
         self._packet_capture = ""
         self._pcap_upload = ""
-
-        self._port1 = None  # type: Optional[str]
-        self._port1_status = None  # type: Optional[str]
-        self._port1_neg = None  # type: Optional[str]
-        self._port1_duplex = None  # type: Optional[str]
-        self._port1_speed = None  # type: Optional[str]
-
-        self._port2 = None  # type: Optional[str]
-        self._port2_status = None  # type: Optional[str]
-        self._port2_neg = None  # type: Optional[str]
-        self._port2_duplex = None  # type: Optional[str]
-        self._port2_speed = None  # type: Optional[str]
-
-        self._port_redu = None  # type: Optional[str]
-        self._psu1 = None  # type: Optional[str]
-        self._psu2 = None  # type: Optional[str]
-
-        self._ram_util = None  # type: Optional[str]
-        self._rtp_stat_service = None  # type: Optional[str]
-        self._serial = None  # type: Optional[str]
-        self._slamon_service = None  # type: Optional[str]
-        self._sla_server = None  # type: Optional[str]
-        self._snmp = None  # type: Optional[str]
-        self._snmp_trap = None  # type: Optional[str]
-        self._temp = None  # type: Optional[str]
-        self._uptime = None  # type: Optional[str]
-        self._upload_status = None  # type: Optional[str]
         self._has_filter_501 = None # type: Optional[bool]
 
         # Keep kwargs accepted for forward compatibility
@@ -2623,41 +2951,34 @@ class BGW(object):
 
     # ------------------- RTP / capture -------------------
 
-    @property
+    @cached_on("show_rtp_stat_summary")
     def active_sessions(self) -> str:
         """Active Session value from RTP-Stat summary, or "NA"."""
         if not self.show_rtp_stat_summary:
             return "NA"
-        m = re.search(r"nal\s+\S+\s+(\S+)", self.show_rtp_stat_summary)
+        m = reActiveSessions.search(self.show_rtp_stat_summary)
         return m.group(1) if m else ""
 
-    @property
+    @cached_on("show_announcements_files")
     def announcements(self) -> str:
         """Count of announcement files, as a string, or 'NA'."""
-        if self._announcements is not None:
-            return self._announcements
         if not self.show_announcements_files:
             return "NA"
-        m = re.findall(r"announcement file", self.show_announcements_files)
-        self._announcements = str(len(m))
-        return self._announcements
+        return str(self.show_announcements_files.count("announcement file"))
 
-    @property
+    @cached_on("show_capture")
     def capture_service(self) -> str:
         """Capture service admin state and buffer size, 'enabled ( 1024)'."""
-        if self._capture_service is not None:
-            return self._capture_service
         if not self.show_capture:
             return "NA"
 
-        m = re.search(r"Capture service is (\w+)", self.show_capture)
+        m = reCaptureService.search(self.show_capture)
         state = m.group(1) if m else ""
 
-        m = re.search(r"Current buffer size is (\d+) KB", self.show_capture)
+        m = reCaptureBufferSize.search(self.show_capture)
         size = m.group(1) if m else ""
 
-        self._capture_service = "{} ({:>5})".format(state, size)
-        return self._capture_service
+        return "{} ({:>5})".format(state, size)
 
     @property
     def has_filter_501(self) -> bool:
@@ -2668,7 +2989,7 @@ class BGW(object):
         has_filter_501 = "Capture list 501" in self.show_capture
         return has_filter_501
 
-    @property
+    @cached_on("show_capture")
     def capture_status(self) -> str:
         """Capture runtime status derived from ``show_capture``."""
         if not self.show_capture or "try again" in self.show_capture:
@@ -2677,10 +2998,10 @@ class BGW(object):
         if "disabled" in self.capture_service:
             return "inactive"
 
-        m = re.search(r"Capture service is \w+ and (\w+)", self.show_capture)
+        m = reCaptureStatus.search(self.show_capture)
         status = m.group(1) if m else ""
 
-        m = re.search(r"buffer occupancy: (\d+)\.", self.show_capture)
+        m = reCaptureOccupancy.search(self.show_capture)
         occ = "({:>2}%)".format(m.group(1)) if m else ""
 
         if (
@@ -2767,189 +3088,141 @@ class BGW(object):
 
     # ------------------- HW / system -------------------
 
-    @property
+    @cached_on("show_system")
     def chassis_hw(self) -> str:
         """Chassis HW vintage+suffix (from ``show_system``), or "NA"."""
-        if self._chassis_hw is not None:
-            return self._chassis_hw
         if not self.show_system:
             return "NA"
 
-        m = re.search(r"HW Vintage\s+:\s+(\S+)", self.show_system)
-        vintage = m.group(1) if m else ""
-
-        m = re.search(r"HW Suffix\s+:\s+(\S+)", self.show_system)
-        suffix = m.group(1) if m else ""
+        vintage, suffix = self._hw_vintage_suffix()
+        return "{}{}".format(vintage or "", suffix or "")
 
-        self._chassis_hw = "{}{}".format(vintage, suffix)
-        return self._chassis_hw
-
-    @property
+    @cached_on("show_system")
     def comp_flash(self) -> str:
         """Compact flash size/string if installed, empty string if not, or "NA"."""
-        if self._comp_flash is not None:
-            return self._comp_flash
         if not self.show_system:
             return "NA"
 
-        m = re.search(r"Flash Memory\s+: (\d+)\S+ ([MG])B", self.show_system)
+        m = reFlashMemory.search(self.show_system)
         size, unit = m.group(1) if m else "", m.group(2) if m else ""
-        result = "{}{}B".format(size, unit) if size and unit else ""
-        self._comp_flash = result
-        return result
+        return "{}{}B".format(size, unit) if size and unit else ""
 
-    @property
+    @cached_on("show_utilization")
     def cpu_util(self) -> str:
         """Last 60s CPU utilization percent (from ``show_utilization``), or "NA"."""
         if not self.show_utilization:
             return "NA"
-        m = re.search(r"10\s+\d+%\s+(\d+)%", self.show_utilization)
-        self._cpu_util = "{}%".format(m.group(1)) if m else ""
-        return self._cpu_util
+        m = reCPUUtil.search(self.show_utilization)
+        return "{}%".format(m.group(1)) if m else ""
 
-    @property
+    @cached_on("show_system")
     def dsp(self) -> str:
         """Total DSP count (from ``show_system``), or "NA"."""
-        if self._dsp is not None:
-            return self._dsp
         if not self.show_system:
             return "NA"
-        m = re.findall(r"Media Socket .*?: M?P?(\d+) ", self.show_system)
-        self._dsp = str(sum(int(x) for x in m)) if m else ""
-        return self._dsp
+        m = reMediaSocket.findall(self.show_system)
+        return str(sum(int(x) for x in m)) if m else ""
 
-    @property
+    @cached_on("show_faults")
     def faults(self) -> str:
         """Count of faults from ``show_faults``, or "NA"."""
-        if self._faults is not None:
-            return self._faults
         if not self.show_faults:
             return "NA"
 
         if "No Fault Messages" in self.show_faults:
-            self._faults = "0"
-        else:
-            m = re.findall(r"\s+\+ (\S+)", self.show_faults)
-            self._faults = str(len(m))
-        return self._faults
+            return "0"
+        m = reFault.findall(self.show_faults)
+        return str(len(m))
 
-    @property
+    @cached_on("show_system")
     def fw(self) -> str:
         """Firmware vintage from ``show_system`` (FW Vintage), or "NA"."""
-        if self._fw is not None:
-            return self._fw
         if not self.show_system:
             return "NA"
-        m = re.search(r"FW Vintage\s+:\s+(\S+)", self.show_system)
-        result = m.group(1) if m else ""
-        self._fw = result
-        return result
+        m = reFWVintage.search(self.show_system)
+        return m.group(1) if m else ""
 
-    @property
+    @cached_on("show_system")
     def hw(self) -> str:
         """Hardware vintage+suffix from ``show_system``, or "NA"."""
-        if self._hw is not None:
-            return self._hw
         if not self.show_system:
             return "NA"
 
-        m = re.search(r"HW Vintage\s+:\s+(\S+)", self.show_system)
-        hw_vintage = m.group(1) if m else "?"
-
-        m = re.search(r"HW Suffix\s+:\s+(\S+)", self.show_system)
-        hw_suffix = m.group(1) if m else "?"
-
-        self._hw = "{}{}".format(hw_vintage, hw_suffix)
-        return self._hw
+        vintage, suffix = self._hw_vintage_suffix()
+        return "{}{}".format(vintage or "?", suffix or "?")
 
     @property
     def last_seen_time(self) -> str:
         """Last seen time formatted HH:MM:SS (24h), or empty string."""
-        if self.last_seen_dt:
-            return self.last_seen_dt.strftime("%H:%M:%S")
+        dt = self.last_seen_dt
+        if dt:
+            # Rendered for every BGW on each redraw, plain int formatting
+            # avoids strftime's locale-aware format parsing.
+            return "{:02d}:{:02d}:{:02d}".format(dt.hour, dt.minute, dt.second)
         return ""
 
-    @property
+    @cached_on("show_lldp_config")
     def lldp(self) -> str:
         """LLDP state ('enabled'/'disabled') from ``show_lldp_config``, or "NA"."""
-        if self._lldp is not None:
-            return self._lldp
         if not self.show_lldp_config:
             return "NA"
 
-        self._lldp = (
+        return (
             "disabled"
             if "Application status: disable" in self.show_lldp_config
             else "enabled"
         )
-        return self._lldp
 
-    @property
+    @cached_on("show_system")
     def location(self) -> str:
         """System Location from ``show_system``, or "NA"."""
-        if self._location is not None:
-            return self._location
         if not self.show_system:
             return "NA"
 
         # NOTE: your original regex had an extra space before \s+.
-        m = re.search(r"System Location\s+:\s*(\S+)", self.show_system)
-        result = m.group(1) if m else ""
-        self._location = result
-        return result
+        m = reLocation.search(self.show_system)
+        return m.group(1) if m else ""
 
-    @property
+    @cached_on("show_system")
     def mac(self) -> str:
         """LAN MAC without colons (from ``show_system``), or "NA"."""
-        if self._mac is not None:
-            return self._mac
         if not self.show_system:
             return "NA"
-        m = re.search(r"LAN MAC Address\s+:\s+(\S+)", self.show_system)
-        result = m.group(1).replace(":", "") if m else ""
-        self._mac = result
-        return result
+        m = reLANMAC.search(self.show_system)
+        return m.group(1).replace(":", "") if m else ""
 
-    @property
+    @cached_on("show_system")
     def mainboard_hw(self) -> str:
         """Mainboard HW vintage+suffix from ``show_system``, or "NA"."""
-        if self._mainboard_hw is not None:
-            return self._mainboard_hw
         if not self.show_system:
             return "NA"
 
-        m = re.search(r"Mainboard HW Vintage\s+:\s+(\S+)", self.show_system)
+        m = reMainboardHWVintage.search(self.show_system)
         vintage = m.group(1) if m else "N"
 
-        m = re.search(r"Mainboard HW Suffix\s+:\s+(\S+)", self.show_system)
+        m = reMainboardHWSuffix.search(self.show_system)
         suffix = m.group(1) if m else "A"
 
-        self._mainboard_hw = "{}{}".format(vintage, suffix)
-        return self._mainboard_hw
+        return "{}{}".format(vintage, suffix)
 
-    @property
+    @cached_on("show_system")
     def memory(self) -> str:
         """Total memory as '<n>MB' or model-specific raw string, or "NA"."""
-        if self._memory is not None:
-            return self._memory
         if not self.show_system:
             return "NA"
 
         if self.model and self.model.lower().startswith("g430"):
-            m = re.search(r"RAM Memory\s+:\s+(\S+)", self.show_system)
-            result = m.group(1) if m else ""
-            self._memory = result
-            return result
+            m = reRAMMemory.search(self.show_system)
+            return m.group(1) if m else ""
 
-        m = re.findall(r"Memory #\d+\s+:\s+(\S+)", self.show_system)
-        self._memory = "{}MB".format(
+        m = reMemory.findall(self.show_system)
+        return "{}MB".format(
             sum(self._to_mbyte(x) for x in m)
         ) if m else ""
-        return self._memory
 
     # ------------------- Media modules -------------------
 
-    @property
+    @cached_on("show_mg_list")
     def mm_groupdict(self) -> Dict[str, Dict[str, str]]:
         """Parsed media-module table keyed by slot (e.g. 'v1', 'v2').
 
@@ -2957,11 +3230,8 @@ class BGW(object):
             Dict mapping slot -> parsed fields: slot/type/code/suffix/hw_vint/fw_vint.
             Returns {} if ``show_mg_list`` is missing.
         """
-        if self._mm_groupdict is not None:
-            return self._mm_groupdict
         if not self.show_mg_list:
-            self._mm_groupdict = {}
-            return self._mm_groupdict
+            return {}
 
         groupdict = {}  # type: Dict[str, Dict[str, str]]
 
@@ -2969,110 +3239,63 @@ class BGW(object):
             if not (text.startswith("v") and "Not Installed" not in text):
                 continue
 
-            m = re.search(
-                r".*?(?P<slot>\S+)"
-                r".*?(?P<type>\S+)"
-                r".*?(?P<code>\S+)"
-                r".*?(?P<suffix>\S+)"
-                r".*?(?P<hw_vint>\S+)"
-                r".*?(?P<fw_vint>\S+)",
-                text,
-            )
+            m = reMediaModule.search(text)
             if m:
                 groupdict[m.group("slot")] = m.groupdict()
 
-        self._mm_groupdict = groupdict
-        return self._mm_groupdict
+        return groupdict
 
     def _mm_v(self, slot: int) -> str:
-        """Return module code+suffix for slot (e.g. 1..8)."""
-        code = self.mm_groupdict.get("v{}".format(slot), {}).get("code", "")
+        """Return module code+suffix for slot (e.g. 1..8), or "NA"."""
+        if not self.show_mg_list:
+            return "NA"
+        mm = self.mm_groupdict.get("v{}".format(slot), {})
+        code = mm.get("code", "")
         if code == "ICC":
-            code = self.mm_groupdict.get("v{}".format(slot), {}).get("type", "")
-        suffix = self.mm_groupdict.get("v{}".format(slot), {}).get("suffix", "")
-        return "{}{}".format(code, suffix)
+            code = mm.get("type", "")
+        return "{}{}".format(code, mm.get("suffix", ""))
 
-    @property
+    @cached_on("show_mg_list")
     def mm_v1(self) -> str:
         """Media module code+suffix for slot 1, or "NA"."""
-        if self._mm_v1 is not None:
-            return self._mm_v1
-        if not self.show_mg_list:
-            return "NA"
-        self._mm_v1 = self._mm_v(1)
-        return self._mm_v1
+        return self._mm_v(1)
 
-    @property
+    @cached_on("show_mg_list")
     def mm_v2(self) -> str:
         """Media module code+suffix for slot 2, or "NA"."""
-        if self._mm_v2 is not None:
-            return self._mm_v2
-        if not self.show_mg_list:
-            return "NA"
-        self._mm_v2 = self._mm_v(2)
-        return self._mm_v2
+        return self._mm_v(2)
 
-    @property
+    @cached_on("show_mg_list")
     def mm_v3(self) -> str:
         """Media module code+suffix for slot 3, or "NA"."""
-        if self._mm_v3 is not None:
-            return self._mm_v3
-        if not self.show_mg_list:
-            return "NA"
-        self._mm_v3 = self._mm_v(3)
-        return self._mm_v3
+        return self._mm_v(3)
 
-    @property
+    @cached_on("show_mg_list")
     def mm_v4(self) -> str:
         """Media module code+suffix for slot 4, or "NA"."""
-        if self._mm_v4 is not None:
-            return self._mm_v4
-        if not self.show_mg_list:
-            return "NA"
-        self._mm_v4 = self._mm_v(4)
-        return self._mm_v4
+        return self._mm_v(4)
 
-    @property
+    @cached_on("show_mg_list")
     def mm_v5(self) -> str:
         """Media module code+suffix for slot 5, or "NA"."""
-        if self._mm_v5 is not None:
-            return self._mm_v5
-        if not self.show_mg_list:
-            return "NA"
-        self._mm_v5 = self._mm_v(5)
-        return self._mm_v5
+        return self._mm_v(5)
 
-    @property
+    @cached_on("show_mg_list")
     def mm_v6(self) -> str:
         """Media module code+suffix for slot 6, or "NA"."""
-        if self._mm_v6 is not None:
-            return self._mm_v6
-        if not self.show_mg_list:
-            return "NA"
-        self._mm_v6 = self._mm_v(6)
-        return self._mm_v6
+        return self._mm_v(6)
 
-    @property
+    @cached_on("show_mg_list")
     def mm_v7(self) -> str:
         """Media module code+suffix for slot 7, or "NA"."""
-        if self._mm_v7 is not None:
-            return self._mm_v7
-        if not self.show_mg_list:
-            return "NA"
-        self._mm_v7 = self._mm_v(7)
-        return self._mm_v7
+        return self._mm_v(7)
 
-    @property
+    @cached_on("show_mg_list")
     def mm_v8(self) -> str:
         """Media module code+suffix for slot 8, or "NA"."""
-        if self._mm_v8 is not None:
-            return self._mm_v8
-        if not self.show_mg_list:
-            return "NA"
-        self._mm_v8 = self._mm_v(8)
-        return self._mm_v8
+        return self._mm_v(8)
 
-    @property
+    @cached_on("show_mg_list")
     def mm_v10(self) -> str:
         """Slot 10 module hw_vintage+suffix, or "NA".
 
@@ -3081,236 +3304,162 @@ class BGW(object):
         which inverted the condition and made it always return "NA" when
         mg list exists. This is corrected below.
         """
-        if self._mm_v10 is not None:
-            return self._mm_v10
         if not self.show_mg_list:
             return "NA"
 
         suffix = self.mm_groupdict.get("v10", {}).get("suffix", "")
         hw_vint = self.mm_groupdict.get("v10", {}).get("hw_vint", "")
-        self._mm_v10 = "{}{}".format(hw_vint, suffix)
-        return self._mm_v10
+        return "{}{}".format(hw_vint, suffix)
 
-    @property
+    @cached_on("show_system")
     def model(self) -> str:
         """Gateway model from ``show_system``, or "NA"."""
-        if self._model is not None:
-            return self._model
         if not self.show_system:
             return "NA"
-        m = re.search(r"Model\s+:\s+(\S+)", self.show_system)
-        result = m.group(1) if m else ""
-        self._model = result
-        return result
+        m = reModel.search(self.show_system)
+        return m.group(1) if m else ""
 
     # ------------------- Ports -------------------
 
-    @property
+    @cached_on("show_port")
     def port1(self) -> str:
         """LAN port1 identifier (e.g. '0/1'), or 'NA'."""
-        if self._port1 is not None:
-            return self._port1
         pdict = self._port_groupdict(0)
-        self._port1 = pdict.get("port", "") if pdict else "NA"
-        return self._port1
+        return pdict.get("port", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_port")
     def port1_status(self) -> str:
         """LAN port1 link status, or 'NA'."""
-        if self._port1_status is not None:
-            return self._port1_status
         pdict = self._port_groupdict(0)
-        self._port1_status = pdict.get("status", "") if pdict else "NA"
-        return self._port1_status
+        return pdict.get("status", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_port")
     def port1_neg(self) -> str:
         """LAN port1 autoneg status, or 'NA'."""
-        if self._port1_neg is not None:
-            return self._port1_neg
         pdict = self._port_groupdict(0)
-        self._port1_neg = pdict.get("neg", "") if pdict else "NA"
-        return self._port1_neg
+        return pdict.get("neg", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_port")
     def port1_duplex(self) -> str:
         """LAN port1 duplex setting, or 'NA'."""
-        if self._port1_duplex is not None:
-            return self._port1_duplex
         pdict = self._port_groupdict(0)
-        self._port1_duplex = pdict.get("duplex", "") if pdict else "NA"
-        return self._port1_duplex
+        return pdict.get("duplex", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_port")
     def port1_speed(self) -> str:
         """LAN port1 speed, or 'NA'."""
-        if self._port1_speed is not None:
-            return self._port1_speed
         pdict = self._port_groupdict(0)
-        self._port1_speed = pdict.get("speed", "") if pdict else "NA"
-        return self._port1_speed
+        return pdict.get("speed", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_port")
     def port2(self) -> str:
         """LAN port2 identifier, or 'NA'."""
-        if self._port2 is not None:
-            return self._port2
         pdict = self._port_groupdict(1)
-        self._port2 = pdict.get("port", "") if pdict else "NA"
-        return self._port2
+        return pdict.get("port", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_port")
     def port2_status(self) -> str:
         """LAN port2 link status, or 'NA'."""
-        if self._port2_status is not None:
-            return self._port2_status
         pdict = self._port_groupdict(1)
-        self._port2_status = pdict.get("status", "") if pdict else "NA"
-        return self._port2_status
+        return pdict.get("status", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_port")
     def port2_neg(self) -> str:
         """LAN port2 autoneg status, or 'NA'."""
-        if self._port2_neg is not None:
-            return self._port2_neg
         pdict = self._port_groupdict(1)
-        self._port2_neg = pdict.get("neg", "") if pdict else "NA"
-        return self._port2_neg
+        return pdict.get("neg", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_port")
     def port2_duplex(self) -> str:
         """LAN port2 duplex setting, or 'NA'."""
-        if self._port2_duplex is not None:
-            return self._port2_duplex
         pdict = self._port_groupdict(1)
-        self._port2_duplex = pdict.get("duplex", "") if pdict else "NA"
-        return self._port2_duplex
+        return pdict.get("duplex", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_port")
     def port2_speed(self) -> str:
         """LAN port2 speed, or 'NA'."""
-        if self._port2_speed is not None:
-            return self._port2_speed
         pdict = self._port_groupdict(1)
-        self._port2_speed = pdict.get("speed", "") if pdict else "NA"
-        return self._port2_speed
+        return pdict.get("speed", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_running_config")
     def port_redu(self) -> str:
         """Port redundancy pair 'x/y' from ``show_running_config``, or "NA"."""
-        if self._port_redu is not None:
-            return self._port_redu
         if not self.show_running_config:
             return "NA"
-        m = re.search(
-            r"port redundancy \d+/(\d+) \d+/(\d+)",
-            self.show_running_config,
-        )
-        self._port_redu = "{}/{}".format(m.group(1), m.group(2)) if m else ""
-        return self._port_redu
+        m = rePortRedundancy.search(self.show_running_config)
+        return "{}/{}".format(m.group(1), m.group(2)) if m else ""
 
     # ------------------- PSU / utilization / services -------------------
 
-    @property
+    @cached_on("show_system")
     def psu1(self) -> str:
         """PSU #1 wattage (or model-specific main PSU value), or "NA"."""
-        if self._psu1 is not None:
-            return self._psu1
         if not self.show_system:
             return "NA"
 
         if self.model and self.model.lower().startswith("g430"):
-            m = re.search(r"Main PSU\s+:\s+(\S+)", self.show_system)
-            result = m.group(1) if m else ""
-            self._psu1 = result
-            return result
+            m = reMainPSU.search(self.show_system)
+            return m.group(1) if m else ""
 
-        m = re.search(r"PSU #1\s+:\s+\S+ (\S+)", self.show_system)
-        result = m.group(1) if m and "W" in m.group(1) else ""
-        self._psu1 = result
-        return result
+        m = rePSU1.search(self.show_system)
+        return m.group(1) if m and "W" in m.group(1) else ""
 
-    @property
+    @cached_on("show_system")
     def psu2(self) -> str:
         """PSU #2 wattage, or "NA"."""
-        if self._psu2 is not None:
-            return self._psu2
         if not self.show_system:
             return "NA"
-        m = re.search(r"PSU #2\s+:\s+\S+ (\S+)", self.show_system)
-        result = m.group(1) if m and "W" in m.group(1) else ""
-        self._psu2 = result
-        return result
+        m = rePSU2.search(self.show_system)
+        return m.group(1) if m and "W" in m.group(1) else ""
 
-    @property
+    @cached_on("show_utilization")
     def ram_util(self) -> str:
         """RAM utilization percent (from ``show_utilization``), or "NA"."""
         if not self.show_utilization:
             return "NA"
-        m = re.search(r"10\s+\S+\s+\S+\s+(\d+)%", self.show_utilization)
-        self._ram_util = "{}%".format(m.group(1)) if m else ""
-        return self._ram_util
+        m = reRAMUtil.search(self.show_utilization)
+        return "{}%".format(m.group(1)) if m else ""
 
-    @property
+    @cached_on("show_running_config")
     def rtp_stat_service(self) -> str:
         """RTP-Stat service admin status ('enabled'/'disabled'), or "NA"."""
-        if self._rtp_stat_service is not None:
-            return self._rtp_stat_service
         if not self.show_running_config:
             return "NA"
-        self._rtp_stat_service = (
+        return (
             "enabled" if "rtp-stat-service" in self.show_running_config else "disabled"
         )
-        return self._rtp_stat_service
 
     @rtp_stat_service.setter
     def rtp_stat_service(self, _: str) -> None:
         pass
 
-    @property
+    @cached_on("show_system")
     def serial(self) -> str:
         """Serial number from ``show_system``, or "NA"."""
-        if self._serial is not None:
-            return self._serial
         if not self.show_system:
             return "NA"
-        m = re.search(r"Serial No\s+:\s+(\S+)", self.show_system)
-        result = m.group(1) if m else ""
-        self._serial = result
-        return result
+        m = reSerial.search(self.show_system)
+        return m.group(1) if m else ""
 
-    @property
+    @cached_on("show_sla_monitor")
     def slamon_service(self) -> str:
         """SLA Monitor admin state from ``show_sla_monitor``, or "NA"."""
-        if self._slamon_service is not None:
-            return self._slamon_service
         if not self.show_sla_monitor:
             return "NA"
-        m = re.search(r"SLA Monitor:\s+(\S+)", self.show_sla_monitor)
-        result = m.group(1).lower() if m else ""
-        self._slamon_service = result
-        return result
+        m = reSLAMonitor.search(self.show_sla_monitor)
+        return m.group(1).lower() if m else ""
 
-    @property
+    @cached_on("show_sla_monitor")
     def sla_server(self) -> str:
         """Registered SLA monitor server IP, or "NA"."""
-        if self._sla_server is not None:
-            return self._sla_server
         if not self.show_sla_monitor:
             return "NA"
-        m = re.search(
-            r"Registered Server IP Address:\s+(\S+)",
-            self.show_sla_monitor,
-        )
-        result = m.group(1) if m else ""
-        self._sla_server = result
-        return result
+        m = reSLAServer.search(self.show_sla_monitor)
+        return m.group(1) if m else ""
 
-    @property
+    @cached_on("show_running_config")
     def snmp(self) -> str:
         """Configured SNMP versions: 'v2', 'v3', 'v2&3', '' or 'NA'."""
-        if self._snmp is not None:
-            return self._snmp
         if not self.show_running_config:
             return "NA"
 
@@ -3320,52 +3469,42 @@ class BGW(object):
         if "encrypted-snmp-server user" in self.show_running_config:
             versions.append("3")
 
-        self._snmp = "v" + "&".join(versions) if versions else ""
-        return self._snmp
+        return "v" + "&".join(versions) if versions else ""
 
-    @property
+    @cached_on("show_running_config")
     def snmp_trap(self) -> str:
         """SNMP trap configuration ('enabled'/'disabled') or 'NA'."""
-        if self._snmp_trap is not None:
-            return self._snmp_trap
         if not self.show_running_config:
             return "NA"
-        m = re.search(r"snmp-server host (\S+) trap", self.show_running_config)
-        self._snmp_trap = "enabled" if m else "disabled"
-        return self._snmp_trap
+        m = reSNMPTrap.search(self.show_running_config)
+        return "enabled" if m else "disabled"
 
-    @property
+    @cached_on("show_temp")
     def temp(self) -> str:
         """Ambient temperature as '<cur>/<max>' from ``show_temp``, or "NA"."""
-        if self._temp is not None:
-            return self._temp
         if not self.show_temp:
             return "NA"
-        m = re.search(r"Temperature\s+:\s+(\S+) \((\S+)\)", self.show_temp)
-        self._temp = "{}/{}".format(m.group(1), m.group(2)) if m else ""
-        return self._temp
+        m = reTemperature.search(self.show_temp)
+        return "{}/{}".format(m.group(1), m.group(2)) if m else ""
 
-    @property
+    @cached_on("show_rtp_stat_summary")
     def total_sessions(self) -> str:
         """Total Session value from RTP-Stat summary, or "NA"."""
         if not self.show_rtp_stat_summary:
             return "NA"
-        m = re.search(r"nal\s+\S+\s+\S+\s+(\S+)", self.show_rtp_stat_summary)
+        m = reTotalSessions.search(self.show_rtp_stat_summary)
         return m.group(1) if m else ""
 
-    @property
+    @cached_on("show_upload_status_10")
     def upload_status(self) -> str:
         """Derived upload status from ``show_upload_status_10``."""
         if not self.show_upload_status_10:
             return ""
 
-        m = re.search(r"Running state\s+:\s+(\S+)", self.show_upload_status_10)
+        m = reUploadState.search(self.show_upload_status_10)
         status = m.group(1).lower() if m else ""
 
-        m = re.search(
-            r"Failure display\s+:\s+(\S+)",
-            self.show_upload_status_10,
-        )
+        m = reUploadFailure.search(self.show_upload_status_10)
         failure = m.group(1).lower() if m else ""
 
         if status == "executing":
@@ -3374,33 +3513,28 @@ class BGW(object):
             return "failed"
         return status
 
-    @property
+    @cached_on("show_system")
     def uptime(self) -> str:
         """Gateway uptime as a compact string (e.g. '3d12h4m55s'), or "NA"."""
-        if self._uptime is not None:
-            return self._uptime
         if not self.show_system:
             return "NA"
 
-        m = re.search(r"Uptime \(\S+\)\s+:\s+(\S+)", self.show_system)
+        m = reUptime.search(self.show_system)
         if m:
-            result = (
+            return (
                 m.group(1)
                 .replace(",", "d")
                 .replace(":", "h", 1)
                 .replace(":", "m")
                 + "s"
             )
-        else:
-            result = ""
-        self._uptime = result
-        return result 
+        return ""
 
-    @property
+    @cached_on("show_voip_dsp")
     def inuse_dsp(self) -> str:
         """Total in-use DSP count from ``show_voip_dsp``."""
         inuse = 0
-        dsps = re.findall(r"In Use\s+:\s+(\d+)", self.show_voip_dsp or "")
+        dsps = reDSPInUse.findall(self.show_voip_dsp or "")
         for dsp in dsps:
             try:
                 inuse += int(dsp)
@@ -3471,15 +3605,53 @@ class BGW(object):
                 if cmd == "show upload status 10":
                     self.pcap_upload = self.upload_status
                     if self.upload_status == "executing":
-                        try:
-                            self.queue.put_nowait("show upload status 10")
-                        except Exception:
-                            pass
+                        self.queue.append("show upload status 10")
 
         _ = kwargs
 
+    def _cached(
+        self,
+        name: str,
+        source: str,
+        parse: Callable[["BGW"], Any],
+    ) -> Any:
+        """Return ``parse(self)`` memoized on the identity of ``source``.
+
+        Args:
+            name: Key of the value in ``_cache``.
+            source: Name of the ``show_*`` attribute the value derives from.
+            parse: Function computing the value from the BGW.
+
+        Returns:
+            The cached value while ``source`` is unchanged, else a fresh one.
+        """
+        text = getattr(self, source)
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] is text:
+            return cached[1]
+        value = parse(self)
+        if type(value) is str:
+            # Status strings repeat across the fleet, share one copy each.
+            value = sys.intern(value)
+        self._cache[name] = (text, value)
+        return value
+
+    def _hw_vintage_suffix(self) -> Tuple[Optional[str], Optional[str]]:
+        """HW vintage and suffix from ``show_system``, shared by hw/chassis_hw."""
+        def parse(bgw: "BGW") -> Tuple[Optional[str], Optional[str]]:
+            m = reHWVintage.search(bgw.show_system)
+            vintage = m.group(1) if m else None
+            m = reHWSuffix.search(bgw.show_system)
+            suffix = m.group(1) if m else None
+            return vintage, suffix
+        return self._cached("_hw_vintage_suffix", "show_system", parse)
+
     def _port_groupdict(self, idx: int) -> Dict[str, str]:
-        """Extract port details from ``show_port``.
+        """Return the port details of a LAN port.
+
+        Both ports are parsed in one pass over ``show_port`` by
+        :meth:`_port_groupdicts` and kept in ``_cache`` until ``show_port``
+        is replaced, so the ten port properties share a single parse.
 
         Args:
             idx: 0 for port1, 1 for port2.
@@ -3488,29 +3660,21 @@ class BGW(object):
             Dict with keys: port/name/status/vlan/level/neg/duplex/speed.
             Returns {} if parsing fails or ``show_port`` missing.
         """
-        if not self.show_port:
-            return {}
-
-        matches = re.findall(r"(.*Avaya )", self.show_port)
-        if not matches:
-            return {}
+        pdicts = self._cached(
+            "_port_groupdicts", "show_port", BGW._port_groupdicts
+        )
+        return pdicts[idx] if idx < len(pdicts) else {}
 
-        line = matches[idx] if idx < len(matches) else ""
-        if not line:
-            return {}
+    def _port_groupdicts(self) -> List[Dict[str, str]]:
+        """Extract the details of every 'Avaya' port line of ``show_port``."""
+        if not self.show_port:
+            return []
 
-        m = re.search(
-            r".*?(?P<port>\d+/\d+)"
-            r".*?(?P<name>.*)"
-            r".*?(?P<status>(connected|no link|disabled))"
-            r".*?(?P<vlan>\d+)"
-            r".*?(?P<level>\d+)"
-            r".*?(?P<neg>\S+)"
-            r".*?(?P<duplex>\S+)"
-            r".*?(?P<speed>\S+)",
-            line,
-        )
-        return m.groupdict() if m else {}
+        pdicts = []  # type: List[Dict[str, str]]
+        for line in rePortLine.findall(self.show_port):
+            m = rePortDetails.search(line) if line else None
+            pdicts.append(m.groupdict() if m else {})
+        return pdicts
 
     def properties_asdict(self) -> Dict[str, Any]:
         """Return all @property values as a dict."""
@@ -3529,7 +3693,7 @@ class BGW(object):
     @staticmethod
     def _to_mbyte(mem_str: str) -> int:
         """Convert a memory token like '256MB' or '1GB' to MB (int)."""
-        m = re.search(r"(\d+)([MG]B)", mem_str or "")
+        m = reMemToken.search(mem_str or "")
         if not m:
             return 0
         num = int(m.group(1))
@@ -3662,8 +3826,8 @@ class RTPDetails(object):
         self.start_time = ""          # type: str
         self.end_time = ""            # type: str
 
-        for k, v in params.items():
-            setattr(self, k, v)
+        # One bulk update instead of ~85 setattr() calls per parsed session.
+        self.__dict__.update(params)
 
     @property
     def nok(self) -> str:
@@ -4021,6 +4185,44 @@ BGWMap = Mapping[str, Any]
 Progress = Tuple[int, int, int]
 ProgressCallback = Callable[[Progress], None]
 
+GW_PROTOCOLs = {
+    "1039": "ptls",
+    "2944": "tls",
+    "2945": "unenc",
+    "61440": "h323",
+    "61441": "h323",
+    "61442": "h323",
+    "61443": "h323",
+    "61444": "h323",
+}
+GW_NETSTAT_COMMAND = "netstat -tan | grep ESTABLISHED | grep -E '{}'".format(
+    "|".join(GW_PROTOCOLs)
+)
+# Order of the per-gateway values passed to the expect script in argv.
+EXPECT_ARGs = (
+    "lan_ip",
+    "user",
+    "passwd",
+    "rtp_stats",
+    "prev_last_session_id",
+    "prev_active_session_ids",
+    "commands",
+    "control_path",
+    "control_persist",
+    "debug",
+)
+# Expect script template -> path of the file it was written to.
+EXPECT_SCRIPT_PATHs = {}  # type: Dict[str, str]
+reGWConnection = re.compile(
+    r"([0-9.]+):(1039|2944|2945|6144[0-4])\s+([0-9.]+):([0-9]+)"
+)
+
+# capinfos / rtp,streams output, scanned once per Capture.
+reFirstPacketTime = re.compile(r"First packet time:\s+(.*?)\.")
+reLastPacketTime = re.compile(r"Last packet time:\s+(.*?)\.")
+reRTPStreamLine = re.compile(r"^[^\n]*?0x", re.MULTILINE)
+reRTPProblemLine = re.compile(r"X[^\S\n]*$", re.MULTILINE)
+
 class CommandResult:
     """A consistent container for command output."""
 
@@ -4103,54 +4305,56 @@ class Capture:
     def received_timestamp_str(self):
         return self.received_timestamp.strftime("%Y-%m-%d,%H:%M:%S")
 
+    # The values below are drawn on every PCAP redraw. They are cached
+    # against None so that empty results and zero counts stay cached too.
+
     @property
     def first_packet_time(self):
-        if self._first_packet_time:
+        if self._first_packet_time is not None:
             return self._first_packet_time
         
         if not self.capinfos:
             return ""
         
-        m = re.search(r"First packet time:\s+(.*?)\.", self.capinfos)
+        m = reFirstPacketTime.search(self.capinfos)
         self._first_packet_time = m.group(1) if m else ""
         return self._first_packet_time 
             
     @property
     def last_packet_time(self):
-        if self._last_packet_time:
+        if self._last_packet_time is not None:
             return self._last_packet_time
         
         if not self.capinfos:
             return ""
         
-        m = re.search(r"Last packet time:\s+(.*?)\.", self.capinfos)
+        m = reLastPacketTime.search(self.capinfos)
         self._last_packet_time = m.group(1) if m else ""
         return self._last_packet_time
 
     @property
     def rtp_problems(self):
-        if self._rtp_problems:
+        if self._rtp_problems is not None:
             return self._rtp_problems
         
         if not self.rtpinfos:
             return 0
         
-        lines = self.rtpinfos.splitlines()
-        problems = sum(1 for x in lines if x.strip().endswith("X"))
-        self._rtp_problems = problems
+        # Lines flagged with a trailing "X" in the Problems? column.
+        self._rtp_problems = len(reRTPProblemLine.findall(self.rtpinfos))
         
         return self._rtp_problems
 
     @property
     def rtp_streams(self):
-        if self._rtp_streams:
+        if self._rtp_streams is not None:
             return self._rtp_streams
         
         if not self.rtpinfos:
             return ""
         
-        rtps = sum(1 for x in self.rtpinfos.splitlines() if "0x" in x)
-        self._rtp_streams = rtps
+        # Stream lines are the ones carrying a hex SSRC.
+        self._rtp_streams = len(reRTPStreamLine.findall(self.rtpinfos))
         
         return self._rtp_streams
 
@@ -4170,14 +4374,52 @@ class Capture:
 
         return f"Capture({', '.join(fields)})"
 
-def create_bgw_script(
-    bgw: "BGW",
-    script_template: str = EXPECT_SCRIPT,
-) -> str:
+def expect_script_path(script_template: str = EXPECT_SCRIPT) -> str:
+    """
+    Return the path of the Expect script, writing it to a file if needed.
+
+    The template variables are filled with reads of the script's argv, so
+    the same file serves every gateway and poll. It is created with mode
+    0600 under a unique name and removed when the process exits. A file
+    removed meanwhile, e.g. by a tmp cleaner, is written again.
+
+    Args:
+        script_template: The Expect script template to format.
+
+    Returns:
+        The path of the script file.
+    """
+    path = EXPECT_SCRIPT_PATHs.get(script_template)
+    if path is not None:
+        if os.path.exists(path):
+            return path
+        logger.warning(f"Expect script {path} is gone, writing it again")
+
+    script = script_template.format(**{
+        name: f"[lindex $argv {i}]" for i, name in enumerate(EXPECT_ARGs)
+    })
+
+    fd, path = tempfile.mkstemp(prefix="monitorbgw-", suffix=".exp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(script)
+    atexit.register(remove_file, path)
+    EXPECT_SCRIPT_PATHs[script_template] = path
+
+    logger.info(f"Expect script written to {path}")
+    return path
+
+def remove_file(path: str) -> None:
+    """Remove a file, ignoring one that is already gone."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def create_bgw_args(bgw: "BGW") -> List[str]:
     """
-    Generate an Expect script for querying a BGW.
+    Generate the expect arguments for querying a BGW.
 
-    The generated script depends on whether the BGW has been seen before:
+    The arguments depend on whether the BGW has been seen before:
     - If this is the first discovery, discovery commands are used and RTP
       statistics are disabled.
     - If the BGW has been seen previously, query commands are used and RTP
@@ -4185,11 +4427,10 @@ def create_bgw_script(
     - Any queued commands are prepended to the command list.
 
     Args:
-        bgw: The BGW instance to generate the script for.
-        script_template: The Expect script template to format.
+        bgw: The BGW instance to generate the arguments for.
 
     Returns:
-        A fully formatted Expect script as a string.
+        The script path followed by the values listed in EXPECT_ARGs.
     """
     debug: int = 1 if logger.getEffectiveLevel() == 10 else 0
 
@@ -4198,17 +4439,17 @@ def create_bgw_script(
         rtp_stats: int = 0
         commands: List[str] = CONFIG["discovery_commands"][:]
         prev_last_session_id: str = ""
-        prev_active_session_ids: Iterable[str] = []
+        prev_active_session_ids: Iterable[int] = ()
 
     else:
         # Regular polling
         rtp_stats = 1
         prev_last_session_id = bgw.last_session_id or ""
-        prev_active_session_ids = sorted(bgw.active_session_ids)
+        prev_active_session_ids = bgw.active_session_ids
         commands = CONFIG["query_commands"][:]
 
-        if not bgw.queue.empty():
-            queued_commands = bgw.queue.get_nowait()
+        if bgw.queue:
+            queued_commands = bgw.queue.popleft()
             if isinstance(queued_commands, str):
                 queued_commands = [queued_commands]
 
@@ -4223,14 +4464,14 @@ def create_bgw_script(
         "lan_ip": bgw.lan_ip,
         "user": CONFIG["user"],
         "passwd": CONFIG["passwd"],
-        "prev_last_session_id": f'"{prev_last_session_id}"',
-        "prev_active_session_ids": "{"
-        + " ".join(f'"{sid}"' for sid in prev_active_session_ids)
-        + "}",
+        "prev_last_session_id": prev_last_session_id,
+        "prev_active_session_ids": " ".join(
+            f'"{sid:0>5}"' for sid in prev_active_session_ids
+        ),
         "rtp_stats": rtp_stats,
-        "commands": "{"
-        + " ".join(f'"{cmd}"' for cmd in commands)
-        + "}",
+        "commands": " ".join(f'"{cmd}"' for cmd in commands),
+        "control_path": ssh_control_path(),
+        "control_persist": CONFIG.get("ssh_control_persist") or "600s",
         "debug": debug,
     }
 
@@ -4240,7 +4481,67 @@ def create_bgw_script(
         bgw.lan_ip,
     )
 
-    return script_template.format(**template_args)
+    return [expect_script_path()] + [
+        str(template_args[name]) for name in EXPECT_ARGs
+    ]
+
+def ssh_control_path() -> str:
+    """
+    Return the OpenSSH ControlPath shared by the sessions of a gateway.
+
+    With a ControlMaster per gateway only the first poll pays for the TCP
+    and authentication handshake, later polls open a channel over it.
+
+    Returns:
+        The ControlPath pattern, or "" when multiplexing is disabled.
+    """
+    return _ssh_control_path(CONFIG.get("ssh_control_dir") or "")
+
+@lru_cache(maxsize=4)
+def _ssh_control_path(control_dir: str) -> str:
+    if not control_dir:
+        return ""
+
+    control_dir = os.path.expanduser(control_dir)
+    try:
+        os.makedirs(control_dir, mode=0o700, exist_ok=True)
+        os.chmod(control_dir, 0o700)
+    except OSError as e:
+        logger.error(f"{e} while creating {control_dir}")
+        return ""
+
+    return os.path.join(control_dir, "%r@%h:%p")
+
+def close_ssh_masters(lan_ips: Iterable[str], timeout: float = 5) -> None:
+    """
+    Ask the SSH ControlMaster of each gateway to exit.
+
+    Args:
+        lan_ips: IP addresses of the gateways that may have a master.
+        timeout: Seconds to wait for each master to exit.
+    """
+    control_path = ssh_control_path()
+    if not control_path:
+        return
+
+    procs = []
+    for lan_ip in lan_ips:
+        try:
+            procs.append(subprocess.Popen(
+                ["ssh", "-q", "-o", f"ControlPath={control_path}",
+                 "-O", "exit", f"{CONFIG['user']}@{lan_ip}"],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            ))
+        except OSError as e:
+            logger.error(f"{e} while closing SSH master - {lan_ip}")
+
+    for proc in procs:
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
 
 def connected_gws(
     ip_filter: Optional[Iterable[str]] = None
@@ -4254,33 +4555,23 @@ def connected_gws(
         Dict: A dictionary of connected gateways.
     """
     result: Dict[str, str] = {}
-    ip_filter = set(ip_filter) if ip_filter else set()
-
-    ports = "1039|2944|2945|61440|61441|61442|61443|61444"
-    command = "netstat -tan | grep ESTABLISHED | grep -E '{}'".format(ports)
-    pattern = r"([0-9.]+):(1039|2944|2945|6144[0-4])\s+([0-9.]+):([0-9]+)"
-    protocols = {
-        "1039": "ptls",
-        "2944": "tls",
-        "2945": "unenc",
-        "61440": "h323",
-        "61441": "h323",
-        "61442": "h323",
-        "61443": "h323",
-        "61444": "h323",
-    }
+    ip_filter = frozenset(ip_filter) if ip_filter else frozenset()
 
-    connections = os.popen(command).read()
+    connections = os.popen(GW_NETSTAT_COMMAND).read()
 
-    for m in re.finditer(pattern, connections):
+    for m in reGWConnection.finditer(connections):
         ip, port = m.group(3, 2)
 
-        proto = protocols.get(port, "unknown")
+        # Hashed membership guard before any further per-IP work.
+        if ip_filter and ip not in ip_filter:
+            continue
+
+        proto = GW_PROTOCOLs.get(port, "unknown")
         logger.debug(f"Found GW using {proto} - {ip}")
 
-        if not ip_filter or ip in ip_filter:
-            result[ip] = proto
-            logger.info(f"Added GW to results - {ip}")
+        # The lan_ip becomes a long-lived key of the BGW storage.
+        result[sys.intern(ip)] = proto
+        logger.info(f"Added GW to results - {ip}")
 
     result = {ip: result[ip] for ip in sorted(result)}
     return result if result else {ip: "unknown" for ip in ip_filter}
@@ -4459,8 +4750,11 @@ async def process_queue(
 ) -> None:
     """Continuously consume items from an asyncio queue and process them.
 
-    This coroutine blocks on ``queue.get()`` and forwards each received item to
-    ``process_item(...)`` to update BGW state and the RTP session storage.
+    This coroutine blocks on ``queue.get()`` and then drains whatever else is
+    already waiting, forwarding each item to ``process_item(...)`` to update
+    BGW state and the RTP session storage. Results arriving together from
+    several BGWs are handled as one batch and ``callback`` (a full redraw) is
+    invoked once per batch rather than once per item.
 
     Args:
         queue: An asyncio queue yielding items to be processed (often a
@@ -4473,20 +4767,29 @@ async def process_queue(
         None.
     """
     while True:
-        item = await queue.get()
+        batch = [await queue.get()]
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+
         try:
-            logger.debug("Got item from process queue: %r", item)
-            process_item(
-                item,
-                storage=storage,
-                callback=callback,
-                nok_rtp_only=nok_rtp_only
-            )
+            logger.debug("Got %d item(s) from process queue", len(batch))
+            for item in batch:
+                try:
+                    process_item(
+                        item,
+                        storage=storage,
+                        nok_rtp_only=nok_rtp_only
+                    )
+                except Exception as e:
+                    logger.error("%r while processing %r", e, item)
+            if callback:
+                callback()
         finally:
-            try:
-                queue.task_done()
-            except Exception:
-                pass
+            for _ in batch:
+                try:
+                    queue.task_done()
+                except Exception:
+                    pass
 
 def process_item(
     item: Any,
@@ -4543,6 +4846,13 @@ def process_item(
         logger.debug("Unexpected data in %r", item)
         return
 
+    # Fresh strings come out of every JSON decode; intern the identifiers
+    # so the GWs/BGWs key lookups on each poll and redraw hit by identity.
+    if gw_number:
+        gw_number = data["gw_number"] = sys.intern(gw_number)
+    if lan_ip:
+        lan_ip = data["lan_ip"] = sys.intern(lan_ip)
+
     if bgw is None:
         bgw = BGWs.get(gw_number)
         if not bgw:
@@ -4553,7 +4863,7 @@ def process_item(
         GWs.update({lan_ip: gw_number})
         logger.info("Updated GWs with %s -> %s", lan_ip, gw_number)
 
-    active_session_ids: Set[str] = set()
+    active_session_ids = array("Q")
 
     bgw.update(**data)
     logger.debug(
@@ -4570,7 +4880,17 @@ def process_item(
             session_id = "{:0>5}".format(rtpdetails.session_id)
 
             if rtpdetails.is_active:
-                active_session_ids.add(session_id)
+                # A garbled id must not abort the rest of the batch.
+                try:
+                    insort_left(
+                        active_session_ids, int(rtpdetails.session_id)
+                    )
+                except (ValueError, OverflowError):
+                    logger.error(
+                        "Invalid session id %r - %s",
+                        rtpdetails.session_id,
+                        lan_ip,
+                    )
                 # If nok_rtp_only is True wait for the session to complete
                 if nok_rtp_only:
                     continue
@@ -4752,70 +5072,131 @@ async def query(
     bgw: BGW,
     semaphore: Optional[asyncio.Semaphore] = None,
     name: Optional[str] = None,
-    queue: Optional[asyncio.Queue] = None,
+    timeout: float = 25,
+) -> CommandResult:
+    """Query a BGW once, polling goes through ``poll_scheduler`` instead.
+
+    Args:
+        bgw: The BGW to query.
+        semaphore: Limits the number of concurrent queries.
+        name: Label used in logs and results, defaults to the LAN IP.
+        timeout: Query timeout in seconds.
+
+    Returns:
+        The ``CommandResult`` of the expect script.
+    """
+    name = name if name else bgw.lan_ip
+    semaphore = semaphore if semaphore else asyncio.Semaphore(1)
+
+    try:
+        async with semaphore:
+            logger.debug(
+                f"Semaphore acquired ({semaphore._value} free) - {name}"
+            )
+
+            return await run_cmd(
+                program="expect",
+                args=create_bgw_args(bgw),
+                timeout=timeout,
+                name=name,
+            )
+
+    except asyncio.CancelledError:
+        logger.error(f"CancelledError - {name}")
+        raise
+
+    except Exception as e:
+        logger.error(f"{repr(e)} in {name}")
+        raise
+
+    finally:
+        logger.debug(
+            f"Semaphore released ({semaphore._value} free) - {name}"
+        )
+
+async def poll_scheduler(
+    bgws: BGWMap,
+    queue: asyncio.Queue,
+    semaphore: Optional[asyncio.Semaphore] = None,
     timeout: float = 25,
     polling_secs: float = 30,
-) -> Optional[CommandResult]:
+) -> None:
+    """Poll BGWs from a single task as they fall due, in batches.
 
-    name = name if name else bgw.lan_ip
+    A min-heap holds ``(next_due, name)`` for every BGW. The scheduler sleeps
+    until the earliest entry falls due, then pops all due entries and polls
+    them together in one ``asyncio.gather`` batch, still bounded by
+    ``semaphore``. Each BGW is pushed back with its next due time as soon as
+    its own poll completes, which also wakes the scheduler, so a slow gateway
+    does not hold back the others. Results are put on ``queue``, where
+    gateways finishing together are picked up by ``process_queue`` as one
+    batch.
+
+    Args:
+        bgws: Mapping of name -> BGW. The names polled are a snapshot taken
+            at start, BGWs added later are not polled and removed ones are
+            dropped when they next fall due.
+        queue: Queue receiving the successful ``CommandResult`` objects.
+        semaphore: Limits the number of concurrent polls.
+        timeout: Per poll timeout in seconds.
+        polling_secs: Interval between the starts of two polls of a BGW.
+    """
     semaphore = semaphore if semaphore else asyncio.Semaphore(1)
-    avg_sleep = 0.0
-    sleep_n = 0
+    now = time.monotonic()
+    heap = [(now, name) for name in bgws]  # type: List[Tuple[float, str]]
+    heapq.heapify(heap)
+    pushed = asyncio.Event()
+
+    async def poll(name: str) -> None:
+        bgw = bgws.get(name)
+        if bgw is None:
+            logger.debug(f"No longer polled - {name}")
+            return
 
-    while True:
+        t0 = time.monotonic()
         try:
-            t0 = time.monotonic()
             async with semaphore:
-                logger.debug(
-                    f"Semaphore acquired ({semaphore._value} free) - {name}"
-                )
-
                 result = await run_cmd(
                     program="expect",
-                    args=["-c", create_bgw_script(bgw)],
+                    args=create_bgw_args(bgw),
                     timeout=timeout,
                     name=name,
                 )
-
-                if isinstance(result, CommandResult):
-                    if not queue:
-                        return result
-                    await queue.put(result)
-
-            elapsed = time.monotonic() - t0
-            sleep = round(max(polling_secs - elapsed, 0.0), 2)
-            
-            sleep_n += 1
-            avg_sleep = (avg_sleep * (sleep_n - 1) + sleep) / sleep_n
-            avg_sleep = round(avg_sleep, 2)
-            
-            logger.debug(
-                f"Semaphore released ({semaphore._value} free), "
-                f"Cycle elapsed {elapsed:.2f}s, sleeping {sleep:.2f}s "
-                f"(avg_sleep {avg_sleep:.2f}s) - {name}"
-            )
-
-            if sleep:
-                await asyncio.sleep(sleep)
+            if isinstance(result, CommandResult):
+                await queue.put(result)
 
         except asyncio.CancelledError:
             logger.error(f"CancelledError - {name}")
             raise
 
-        except asyncio.TimeoutError:
-            logger.error(f"TimeoutError in {name}")
-            if not queue:
-                raise
-
         except Exception as e:
             logger.error(f"{repr(e)} in {name}")
-            if not queue:
-                raise
 
-        finally:
-            logger.debug(
-                f"Semaphore released ({semaphore._value} free) - {name}"
-            )
+        heapq.heappush(heap, (t0 + polling_secs, name))
+        pushed.set()
+
+    async def poll_batch(names: List[str]) -> None:
+        await asyncio.gather(*(poll(n) for n in names), return_exceptions=True)
+
+    while True:
+        now = time.monotonic()
+        due = []  # type: List[str]
+        while heap and heap[0][0] <= now:
+            due.append(heapq.heappop(heap)[1])
+
+        if due:
+            logger.debug(f"Polling batch of {len(due)} BGW(s)")
+            schedule_task(poll_batch(due))
+
+        # Sleep until the next entry falls due, or until a poll completes
+        # and pushes one, which may be due earlier. With every BGW in
+        # flight the heap is empty and only a push wakes the scheduler.
+        pushed.clear()
+        delay = heap[0][0] - time.monotonic() if heap else None
+        try:
+            await asyncio.wait_for(pushed.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
 
 async def discovery(
     loop: "asyncio.AbstractEventLoop",
@@ -4885,7 +5266,10 @@ def schedule_queries(
 
       - Creates a shared semaphore limiting concurrent polling.
       - Optionally creates a work queue (when polling).
-      - Schedules one `query(...)` task per BGW and returns the task list.
+      - When polling, schedules a single `poll_scheduler(...)` task which
+        polls the BGWs in batches as they fall due.
+      - Otherwise (discovery) schedules one single-shot `query(...)` task
+        per BGW.
 
     Args:
         loop: Event loop to schedule tasks on.
@@ -4893,7 +5277,8 @@ def schedule_queries(
         callback: Optional progress callback passed to `process_queue`.
 
     Returns:
-        A list of scheduled task objects (Tasks/Futures), one per BGW query.
+        A list of scheduled task objects (Tasks/Futures), one per BGW query,
+        or just the `poll_scheduler` task when polling.
         (The queue consumer task is scheduled but not included in this list.)
     """
     queue = asyncio.Queue(loop=loop) if GWs else None  # type: ignore
@@ -4919,6 +5304,18 @@ def schedule_queries(
             loop=loop,
         )
 
+        task = schedule_task(
+            poll_scheduler(
+                bgw_map,
+                queue=queue,
+                semaphore=semaphore,
+                timeout=timeout,
+                polling_secs=polling_secs,
+            ),
+            loop=loop,
+        )
+        return [task]
+
     tasks: List["asyncio.Future[Any]"] = []
 
     for lan_ip, bgw in bgw_map.items():
@@ -4927,9 +5324,7 @@ def schedule_queries(
                 bgw,
                 semaphore=semaphore,
                 name=lan_ip,
-                queue=queue,
                 timeout=timeout,
-                polling_secs=polling_secs,
             ),
             name=lan_ip,
             loop=loop,
@@ -5136,6 +5531,8 @@ class Display(ABC):
         tab: Optional tab UI object (implementation-specific).
         loop: Optional asyncio event loop used by the application.
         loop_shutdown_requested: Flag set by caller when a shutdown is requested.
+        pending_draws: Redraws requested via `request_draw()`, run once per
+            main-loop iteration by `flush_draws()`.
         done: When True the main loop exits.
         active_ws_idx: Index of current workspace in `workspaces`.
         special_pair: A curses color-pair number reserved for "special" UI text.
@@ -5163,6 +5560,7 @@ class Display(ABC):
         self.active_ws_idx = 0  # type: int
         self.loop = None  # type: Optional["asyncio.AbstractEventLoop"]
         self.loop_shutdown_requested = False
+        self.pending_draws = {}  # type: Dict[str, Callable[[], None]]
 
         # Cache current size (subclasses may use it).
         self.maxy, self.maxx = self.stdscr.getmaxyx()
@@ -5195,6 +5593,39 @@ class Display(ABC):
         """Request clean exit from the curses main loop."""
         self.done = True
 
+    def request_draw(self, name: str, draw: Callable[[], None]) -> None:
+        """Schedule `draw` to run on the next pass of the main loop.
+
+        Requests with the same `name` collapse into one, so several asyncio
+        callbacks firing within one tick (e.g. results from many BGWs) lead
+        to a single redraw.
+
+        Args:
+            name: Key identifying the redraw.
+            draw: Callable performing the redraw.
+        """
+        self.pending_draws[name] = draw
+
+    def flush_draws(self) -> None:
+        """Run and clear the redraws requested since the last flush."""
+        if not self.pending_draws:
+            return
+        draws = list(self.pending_draws.values())
+        self.pending_draws.clear()
+        for draw in draws:
+            draw()
+        self.commit()
+
+    def commit(self) -> None:
+        """Push all staged window updates to the terminal at once.
+
+        Draw methods only stage their windows with `noutrefresh()` (or via
+        the panel stack), the main loop calls this once per pass so a pass
+        costs a single `doupdate()`.
+        """
+        curses.panel.update_panels()
+        curses.doupdate()
+
     def run(self) -> None:
         """Main curses loop.
 
@@ -5213,15 +5644,16 @@ class Display(ABC):
             pass
 
         self.make_display()
+        self.commit()
 
         while not self.done:
-            curses.panel.update_panels()
             ch = self.stdscr.getch()
 
             if ch == curses.ERR:
                 # No input. Tick asyncio if present.
                 if self.loop is not None:
                     tick_async_loop(self.loop)
+                    self.flush_draws()
 
                     if self.loop_shutdown_requested:
                         if finalize_loop_if_idle(self.loop):
@@ -5236,10 +5668,9 @@ class Display(ABC):
 
                 if self.maxy >= self.miny and self.maxx >= self.minx:
                     self.make_display()
-                    curses.panel.update_panels()
-                    curses.doupdate()
                     if self.active_workspace is not None:
                         self.active_workspace.menubar.draw()
+                    self.commit()
                 else:
                     self.stdscr.erase()
                     self.stdscr.refresh()
@@ -5254,6 +5685,7 @@ class Display(ABC):
             
             logger.debug("Detected char %r (%s)", ch, ch_repr)
             self.handle_char(ch)
+            self.commit()
 
     @property
     def active_workspace(self) -> Optional[Any]:
@@ -5348,6 +5780,7 @@ class MyDisplay(Display):
         if self.tab is not None:
             self.tab.draw()
 
+        ws.erase_bodywin()
         ws.draw()
 
     def handle_char(self, char: int) -> None:
@@ -5415,6 +5848,10 @@ class Tab(object):
         self.color_text = int(color_text)
         self.color_border = int(color_border)
 
+        # Inactive tab attributes, computed once instead of per tab.
+        self._dim_border = self.color_border | curses.A_DIM
+        self._dim_text = self.color_text | curses.A_DIM
+
         self.stdscr = None          # type: Any
         self.win = None             # type: Optional[Any]
         self.maxy = 0
@@ -5497,8 +5934,8 @@ class Tab(object):
             border_attr = self.color_border
             text_attr = self.color_text
         else:
-            border_attr = self.color_border | curses.A_DIM
-            text_attr = self.color_text | curses.A_DIM
+            border_attr = self._dim_border
+            text_attr = self._dim_text
 
         try:
             self.win.addstr(0, xpos, top, border_attr)
@@ -5708,6 +6145,8 @@ class Menubar(object):
         begin_x = 0
 
         self.win = curses.newwin(height, width, begin_y, begin_x)
+        # On the panel stack so update_panels() does not paint stdscr over it.
+        self.panel = curses.panel.new_panel(self.win)
         self.maxy, self.maxx = self.win.getmaxyx()
         self.color = self.bar_color | curses.A_REVERSE
 
@@ -5731,8 +6170,10 @@ class Menubar(object):
         status_end = self._draw_status_labels()
         self._draw_button_labels(status_end)
 
+        # Every workspace has its own menubar on the same line.
+        self.panel.top()
         try:
-            self.win.refresh()
+            self.win.noutrefresh()
         except _curses.error:
             pass
 
@@ -5901,6 +6342,17 @@ class TextPanel(object):
         self.posx = 0
         self.max_width = 0
 
+        # Rows on screen from the last draw, None until drawn or after erase.
+        self._drawn = None  # type: Optional[List[str]]
+
+        self.nlines, self.ncols, begin_y, begin_x = self._geometry()
+
+        self.win = curses.newwin(self.nlines, self.ncols, begin_y, begin_x)
+        self.panel = curses.panel.new_panel(self.win)
+        self.panel.hide()
+
+    def _geometry(self) -> Tuple[int, int, int, int]:
+        """Return (nlines, ncols, begin_y, begin_x) fitting `storage`."""
         scr_h, scr_w = self.stdscr.getmaxyx()
         usable_h = scr_h - self.yoffset - 1
         usable_w = scr_w
@@ -5912,19 +6364,47 @@ class TextPanel(object):
         # Desired height: storage lines + 2 border lines
         desired_h = len(self.storage) + 2
 
-        self.nlines = min(max_h, desired_h)
-        self.ncols = max_w
+        nlines = min(max_h, desired_h)
+        ncols = max_w
 
         begin_x = self.margin
 
         # Center within usable area, then clamp
-        center_off = (usable_h - self.nlines) // 2
+        center_off = (usable_h - nlines) // 2
         begin_y = self.yoffset + max(0, center_off)
-        begin_y = min(begin_y, self.yoffset + max(0, usable_h - self.nlines))
+        begin_y = min(begin_y, self.yoffset + max(0, usable_h - nlines))
 
-        self.win = curses.newwin(self.nlines, self.ncols, begin_y, begin_x)
-        self.panel = curses.panel.new_panel(self.win)
-        self.panel.hide()
+        return nlines, ncols, begin_y, begin_x
+
+    def set_storage(self, storage: Sequence[str]) -> None:
+        """
+        Load new lines into the panel, reusing its window.
+
+        The window is resized and moved to fit `storage` and the viewport is
+        reset to the top left.
+
+        Args:
+            storage: Text lines to show.
+        """
+        self.storage = storage
+        self.posy = 0
+        self.posx = 0
+        self._drawn = None
+
+        nlines, ncols, begin_y, begin_x = self._geometry()
+
+        # Order the calls so the window stays on screen in between.
+        try:
+            if nlines > self.nlines:
+                self.panel.move(begin_y, begin_x)
+                self.win.resize(nlines, ncols)
+            else:
+                self.win.resize(nlines, ncols)
+                self.panel.move(begin_y, begin_x)
+        except curses.error:
+            pass
+
+        self.nlines, self.ncols = self.win.getmaxyx()
 
     def draw(self, storage: Optional[Sequence[str]] = None) -> None:
         """Render current viewport and show the panel."""
@@ -5940,12 +6420,22 @@ class TextPanel(object):
         it = data[self.posy : self.posy + page_h]
         self.max_width = max((len(x) for x in it), default=0)
 
+        rows = [
+            line[self.posx : self.posx + view_w].ljust(view_w)
+            for line in it
+        ]
+        # Drawing always shows and raises the panel, keys that do not
+        # scroll just leave the viewport as it was.
+        self.panel.show()
+        self.panel.top()
+        if rows == self._drawn:
+            return
+        self._drawn = rows
+
         self.win.erase()
 
-        for row, line in enumerate(it, start=1):
+        for row, text in enumerate(rows, start=1):
             try:
-                slice_ = line[self.posx : self.posx + view_w]
-                text = "{:<{w}}".format(slice_, w=view_w)
                 self.win.addstr(row, 1, text, self.color_text)
             except curses.error:
                 pass
@@ -5957,22 +6447,10 @@ class TextPanel(object):
         except curses.error:
             pass
 
-        self.panel.show()
-        self.panel.top()
-        curses.panel.update_panels()
-        try:
-            self.win.refresh()
-        except curses.error:
-            pass
-
     def erase(self) -> None:
-        """Hide the panel and refresh the underlying screen."""
+        """Hide the panel, the next commit repaints what was below it."""
+        self._drawn = None
         self.panel.hide()
-        curses.panel.update_panels()
-        try:
-            self.stdscr.refresh()
-        except curses.error:
-            pass
 
     def handle_char(self, char: int) -> None:
         """
@@ -6085,13 +6563,29 @@ class ObjectPanel(object):
         self.panel = curses.panel.new_panel(self.win)
         self.panel.hide()
 
+        # Cells on screen from the last draw, None until drawn or after erase.
+        self._drawn = None  # type: Optional[List[Tuple[int, int, str, int]]]
+
     def draw(self, obj: Optional[Any] = None) -> None:
         """
         Draw the panel contents.
 
+        The panel is redrawn on every poll, an unchanged object is skipped.
+
         Args:
             obj: Optional override object to render; defaults to `self.obj`.
         """
+        target = self.obj if obj is None else obj
+
+        cells = list(self.attr_iterator(target))
+        # Shown on the panel stack, pushed out by the next Display.commit().
+        # Only the repaint is skipped for an unchanged object.
+        self.panel.show()
+        self.panel.top()
+        if cells == self._drawn:
+            return
+        self._drawn = cells
+
         self.win.erase()
 
         try:
@@ -6101,10 +6595,8 @@ class ObjectPanel(object):
         except curses.error:
             pass
 
-        target = self.obj if obj is None else obj
-
         maxy, maxx = self.win.getmaxyx()
-        for ypos, xpos, text, color in self.attr_iterator(target):
+        for ypos, xpos, text, color in cells:
             # Basic bounds guard; still keep try/except for safety.
             if ypos < 0 or xpos < 0 or ypos >= maxy or xpos >= maxx:
                 continue
@@ -6113,11 +6605,6 @@ class ObjectPanel(object):
             except curses.error:
                 pass
 
-        self.panel.show()
-        self.panel.top()
-        curses.panel.update_panels()
-        curses.doupdate()
-
     def handle_char(self, char: int) -> None:
         """
         Handle a keypress.
@@ -6136,6 +6623,7 @@ class ObjectPanel(object):
 
     def erase(self) -> None:
         """Hide and clear the panel."""
+        self._drawn = None
         try:
             self.win.erase()
             self.win.noutrefresh()
@@ -6143,8 +6631,6 @@ class ObjectPanel(object):
             pass
 
         self.panel.hide()
-        curses.panel.update_panels()
-        curses.doupdate()
 
 class Confirmation(object):
     """
@@ -6240,9 +6726,6 @@ class Confirmation(object):
         except curses.error:
             pass
 
-        curses.panel.update_panels()
-        curses.doupdate()
-
     def erase(self) -> None:
         """Hide the panel and refresh the underlying screen."""
         try:
@@ -6252,20 +6735,19 @@ class Confirmation(object):
             pass
 
         self.panel.hide()
-        curses.panel.update_panels()
-        curses.doupdate()
 
 class ProgressBar(object):
     """
-    A 1-line progress bar panel driven by a queue.
+    A 1-line progress bar panel showing the latest progress update.
 
-    The queue is expected to provide tuples: (ok, err, total). The bar displays
-    progress as (ok + err) / total and overlays the "filled" portion in a
-    different color.
+    The `progress` attribute holds the most recent (ok, err, total) tuple,
+    producers overwrite it and older updates are simply dropped. The bar
+    displays progress as (ok + err) / total and overlays the "filled" portion
+    in a different color.
 
     Typical usage:
         - Create the ProgressBar once (it creates/shows its panel).
-        - Call draw() repeatedly from your main loop.
+        - Set `progress` and call draw() from your main loop.
         - Optionally provide a callback that is called once when progress hits
           100% (fraction >= 1.0).
     """
@@ -6273,7 +6755,6 @@ class ProgressBar(object):
     def __init__(
         self,
         display: Any,
-        queue: Any,
         callback: Optional[Callable[[], None]] = None,
         text: str = "In Progress",
         yoffset: int = 0,
@@ -6283,7 +6764,6 @@ class ProgressBar(object):
         workspace_chars: Optional[Sequence[int]] = None,
     ) -> None:
         self.display = display
-        self.queue = queue
         self.callback = callback
         self.text = text
         self.yoffset = yoffset
@@ -6300,6 +6780,7 @@ class ProgressBar(object):
         """Create the curses window and panel."""
         self.stdscr = self.display.stdscr
         self.fraction = 0.0
+        self.progress = None  # type: Optional[Tuple[int, int, int]]
         self._done = False
 
         maxy, maxx = self.stdscr.getmaxyx()
@@ -6335,21 +6816,15 @@ class ProgressBar(object):
         """
         Render the current progress state.
 
-        If the queue contains a progress tuple, it is consumed and used to
-        update the bar; otherwise the bar is redrawn with the current fraction.
+        If `progress` is set it is used to update the bar; otherwise the bar
+        is redrawn with the current fraction.
         """
         # Use the actual window width for formatting/drawing
         _, w = self.win.getmaxyx()
 
-        # Pull latest progress update if available
         try:
-            if not self.queue.empty():
-                ok, err, total = self.queue.get_nowait()  # type: ignore[misc]
-                try:
-                    self.queue.task_done()  # type: ignore[attr-defined]
-                except Exception:
-                    pass
-
+            if self.progress is not None:
+                ok, err, total = self.progress
                 done = ok + err
                 if total and total > 0:
                     self.fraction = float(done) / float(total)
@@ -6366,7 +6841,7 @@ class ProgressBar(object):
             else:
                 label = self.text
         except Exception:
-            # If the queue isn't the shape you expect, keep drawing safely.
+            # If progress isn't the shape you expect, keep drawing safely.
             label = self.text
 
         filled_width = int(self.fraction * w)
@@ -6384,9 +6859,6 @@ class ProgressBar(object):
         except curses.error:
             pass
 
-        curses.panel.update_panels()
-        curses.doupdate()
-
         # Fire completion callback once
         if not self._done and self.fraction >= 1.0 and self.callback is not None:
             self._done = True
@@ -6401,8 +6873,6 @@ class ProgressBar(object):
             pass
 
         self.panel.hide()
-        curses.panel.update_panels()
-        curses.doupdate()
 
 class FilterPanel(object):
     """
@@ -6431,7 +6901,7 @@ class FilterPanel(object):
         color_filter: int = 12288
     ) -> None:
         self.display = display
-        self.storage = list(storage)
+        self.storage = storage
         self.current_filter = current_filter
         self.validator = validator
         self.callback = callback
@@ -6444,6 +6914,10 @@ class FilterPanel(object):
         self.color_err = color_err
         self.color_filter = color_filter
 
+        # Precomputed attributes used on every help redraw.
+        self._help_attr = self.color_text | curses.A_DIM
+        self._enter_attr = self.color_text | curses.A_REVERSE
+
         self.cur_filter_label = "Current Filter: "
         self.new_filter_label = "    New Filter: "
 
@@ -6468,6 +6942,11 @@ class FilterPanel(object):
         self.maxy, self.maxx = self.win.getmaxyx()
         self.err = ""
 
+        # Regions needing an addstr pass on the next draw.
+        self._help_dirty = True
+        self._err_dirty = True
+        self._cf_dirty = True
+
         # Current Filter Window
         cf_y = self.cf_y = min(len(self.storage) + 3, nlines - 5)
         cf_x = self.cf_x = len(self.cur_filter_label) + 1
@@ -6485,6 +6964,14 @@ class FilterPanel(object):
 
     def draw(self) -> None:
         """Redraw the full panel."""
+        self.draw_static()
+        self.draw_dynamic()
+
+    def draw_static(self) -> None:
+        """Draw the parts that do not change while the panel is up."""
+        if not self._help_dirty:
+            return
+
         try:
             self.win.attron(self.color_border)
             self.win.box()
@@ -6493,9 +6980,18 @@ class FilterPanel(object):
             pass
 
         self.draw_help()
-        self.draw_error()
-        self.draw_current_filter()
         self.draw_new_filter()
+        self._help_dirty = False
+
+    def draw_dynamic(self) -> None:
+        """Draw the error line and current filter if changed, then refresh."""
+        if self._err_dirty:
+            self.draw_error()
+            self._err_dirty = False
+
+        if self._cf_dirty:
+            self.draw_current_filter()
+            self._cf_dirty = False
 
         self.win.noutrefresh()
         self.cfwin.noutrefresh()
@@ -6506,15 +7002,14 @@ class FilterPanel(object):
         """Draw the help text (storage) and the ENTER hint."""
         for r, line in enumerate(self.storage, 1):
             try:
-                self.win.addstr(r, 1, line, self.color_text | curses.A_DIM)
+                self.win.addstr(r, 1, line, self._help_attr)
             except curses.error:
                 pass
 
         ypos = self.maxy - 2
         xpos = self.maxx // 2 - 4
-        color = self.color_text | curses.A_REVERSE
         try:
-            self.win.addstr(ypos, xpos, " ENTER ", color)
+            self.win.addstr(ypos, xpos, " ENTER ", self._enter_attr)
         except curses.error:
             pass
 
@@ -6560,8 +7055,6 @@ class FilterPanel(object):
             pass
 
         self.panel.hide()
-        curses.panel.update_panels()
-        curses.doupdate()
 
     def handle_char(self) -> Optional[int]:
         """
@@ -6577,13 +7070,21 @@ class FilterPanel(object):
         except curses.error:
             pass
 
+        # Block in getch() while the panel is up instead of polling.
+        self.stdscr.nodelay(False)
+        try:
+            return self._input_loop()
+        finally:
+            self.stdscr.nodelay(True)
+
+    def _input_loop(self) -> Optional[int]:
+        """Read and dispatch keys until submit or cancel."""
         self.draw()
 
         while True:
             char = self.stdscr.getch()
 
             if char == curses.ERR:
-                time.sleep(0.1)
                 continue
 
             # ESC to cancel
@@ -6608,13 +7109,15 @@ class FilterPanel(object):
                 if self.validator is not None:
                     err = self.validator(result)
                     if err:
-                        self.err = err
+                        if err != self.err:
+                            self.err = err
+                            self._err_dirty = True
                         self.tbwin.move(saved_y, saved_x)
                         try:
                             curses.curs_set(1)
                         except curses.error:
                             pass
-                        self.draw()
+                        self.draw_dynamic()
                         continue
 
                 if self.callback is not None:
@@ -6630,8 +7133,10 @@ class FilterPanel(object):
                 char = curses.ascii.EOT
 
             try:
+                # Only the textbox changed; help and labels are static.
                 self.textbox.do_command(char)
-                self.draw()
+                self.tbwin.noutrefresh()
+                curses.doupdate()
             except curses.error:
                 # Ignore curses drawing/editing errors on edge conditions
                 pass
@@ -6716,6 +7221,15 @@ class Workspace(object):
         body_w = self.maxx - 2 # 2 for border
         self.bodywin = self.win.derwin(body_h, body_w, self.header_height, 1)
 
+        # Cells last drawn on each body row, see draw_bodywin.
+        self._body_rows = {}  # type: Dict[int, Tuple[int, List[Tuple[int, str, int]]]]
+
+        # Dim state the frame and header were last drawn with, None if stale.
+        self._chrome_dim = None  # type: Optional[bool]
+
+        # Text/object panels kept for reuse, keyed by kind.
+        self.panel_pool: Dict[str, Any] = {}
+
         self.button_map: Dict[int, Any] = {}
         for button in self.buttons:
             self.button_map[button.char_int] = button
@@ -6728,10 +7242,14 @@ class Workspace(object):
         self.draw()
 
     def draw(self, dim: bool=False) -> None:
-        """Redraw frame, header, body, and menubar."""
+        """Redraw body and menubar, and the frame and header if stale."""
         self.draw_bodywin(dim)
-        self.draw_box(dim)
-        self.draw_headerwin(dim)
+        # The frame and header only change with the dim state, so they are
+        # not redrawn on every poll, just after erase_bodywin or a dim flip.
+        if self._chrome_dim != dim:
+            self.draw_box(dim)
+            self.draw_headerwin(dim)
+            self._chrome_dim = dim
         self.menubar.draw()
 
     def _layout_iter(self, obj: Optional[Any] = None) -> Iterable[Any]:
@@ -6795,19 +7313,26 @@ class Workspace(object):
             except curses.error:
                 pass
 
-        self.headerwin.refresh()
+        self.headerwin.noutrefresh()
+
+    def erase_bodywin(self) -> None:
+        """Erase the body and forget the rows and frame drawn on it."""
+        try:
+            self.bodywin.erase()
+        except curses.error:
+            pass
+        self._body_rows.clear()
+        self._chrome_dim = None
 
     def draw_bodywin(self, dim: bool=False, xoffset: int=1) -> None:
         """Draw visible rows from storage. The xoffset compensates for
            the left border and is subtracted from xpos.
+
+           The cells of each row are compared with those drawn on that row
+           the last time and only rows that changed are cleared and redrawn.
         """
         if self.panel.hidden():
            return
- 
-        try:
-            self.bodywin.erase()
-        except curses.error:
-            pass
 
         body_h, _ = self.bodywin.getmaxyx()
         n = len(self.storage)
@@ -6830,6 +7355,7 @@ class Workspace(object):
         colorb = self.color_border | curses.A_DIM if dim else self.color_border
 
         for row, obj in enumerate(visible):
+            cells = []  # type: List[Tuple[int, str, int]]
             for cell in self._layout_iter(obj):
                 try:
                     _, xpos, text, color = cell
@@ -6841,18 +7367,67 @@ class Workspace(object):
                     
                 xpos = max(0, xpos - xoffset)
                 color = color | curses.A_DIM if dim else color
+                cells.append((xpos, text, color))
+
+            prev = self._body_rows.get(row)
+            if prev == (colorb, cells):
+                continue
+            self._body_rows[row] = (colorb, cells)
+
+            if (
+                prev is not None
+                and prev[0] == colorb
+                and self._same_grid(prev[1], cells)
+            ):
+                # Same cell grid as before, overwrite only the changed cells.
+                cells = [c for p, c in zip(prev[1], cells) if p != c]
+            else:
+                try:
+                    self.bodywin.move(row, 0)
+                    self.bodywin.clrtoeol()
+                except curses.error:
+                    pass
 
+            for xpos, text, color in cells:
                 try:
                     self.bodywin.addstr(row, xpos, text, color)
                     self.bodywin.addstr(row, xpos + len(text), u"│", colorb)
                 except curses.error:
                     pass
 
+        # Clear rows left over from a longer storage.
+        for row in [r for r in self._body_rows if r >= len(visible)]:
+            del self._body_rows[row]
+            try:
+                self.bodywin.move(row, 0)
+                self.bodywin.clrtoeol()
+            except curses.error:
+                pass
+
         if not self.panel.hidden():
             self.bodywin.noutrefresh()
             #self.draw_box(dim)
         self.menubar.draw()
 
+    @staticmethod
+    def _same_grid(
+        prev: List[Tuple[int, str, int]],
+        cells: List[Tuple[int, str, int]],
+    ) -> bool:
+        """Return True if cells can be drawn over prev one by one.
+
+        That is the case when both rows place equally long texts at the same
+        positions and no cell, with its trailing border, overlaps the next.
+        """
+        if len(prev) != len(cells):
+            return False
+        for p, c in zip(prev, cells):
+            if p[0] != c[0] or len(p[1]) != len(c[1]):
+                return False
+        return all(
+            a[0] + len(a[1]) < b[0] for a, b in zip(cells, cells[1:])
+        )
+
     def cursor_handler(self, char: int) -> None:
         """Update cursor/scroll state and control autoscroll."""
         body_h, _ = self.bodywin.getmaxyx()
@@ -6965,11 +7540,8 @@ class Workspace(object):
 
             aws = self.display.active_workspace
             if aws:
-                try:
-                    aws.bodywin.erase()
-                except curses.error:
-                    pass
-
+                # Its windows kept their contents while hidden, draw() only
+                # touches rows whose cells changed since.
                 aws.draw()
                 aws.panel.top()
                 aws.panel.show()
@@ -7025,14 +7597,16 @@ def change_terminal(to_type="xterm-256color"):
         The original terminal type
     """
     old_term = os.environ.get("TERM", "")
-    available_types = get_available_terminal_types()
 
-    if to_type != old_term:
-        if to_type in available_types:
-            os.environ["TERM"] = to_type
-            logger.info(f"Changed terminal to '{to_type}'")
-        else:
-            logger.error(f"Terminal {to_type} is not available")
+    # Nothing to change, avoid forking 'toe' for the terminal list.
+    if to_type == old_term:
+        return old_term
+
+    if to_type in get_available_terminal_types():
+        os.environ["TERM"] = to_type
+        logger.info(f"Changed terminal to '{to_type}'")
+    else:
+        logger.error(f"Terminal {to_type} is not available")
 
     return old_term
 
@@ -7052,14 +7626,17 @@ def get_local_ip() -> str:
 
 ############################## END UTILS ######################################
 ############################## BEGIN UI FUNCTIONS #############################
+
+# Cells of the RTP details panel per RTPDetails, with the GWs version they
+# were rendered at. Entries go away together with their RTPDetails.
+RTP_PANEL_CELLs = WeakKeyDictionary()  # type: WeakKeyDictionary
+
 def hide_panel(ws):
     ws.active_panel.panel.hide()
     del ws.active_panel
     ws.panel.top()
     ws.active_panel = ws.panel
     ws.draw(dim=False)
-    curses.panel.update_panels()
-    curses.doupdate()
     ws.display.active_handle_char = ws.handle_char
 
     return 1
@@ -7071,7 +7648,7 @@ def make_filterpanel(ws, group):
 
     logger.debug("Make filterpanel requested")
     
-    storage = FILTER_MENUs[group].splitlines()
+    storage = FILTER_MENU_LINEs[group]
     current = FILTER_GROUPs[ws.filter_group]["current_filter"]
 
     def filter_callback(filter):
@@ -7090,14 +7667,13 @@ def make_filterpanel(ws, group):
     ws.active_panel = panel
     panel.panel.show()
     panel.panel.top()
-    panel.draw()
     is_canceled = panel.handle_char()
     return is_canceled
 
 def discovery_start(ws):
     logger.info("Discovery start requested")
 
-    ws.bodywin.erase()
+    ws.erase_bodywin()
     ws.draw(dim=True)
 
     is_canceled = make_filterpanel(ws, "bgw")
@@ -7110,11 +7686,9 @@ def discovery_start(ws):
 
     ip_filter = FILTER_GROUPs["bgw"]["groups"]["ip_filter"]
     loop = startup_async_loop()
-    progress_queue = Queue(loop=loop)
-    
+
     panel = ProgressBar(
         ws.display,
-        queue=progress_queue,
         workspace_chars = [ord("s"), ord("S")]
     )
 
@@ -7125,9 +7699,14 @@ def discovery_start(ws):
         Args:
             progress_update: A tuple of (ok, err, total) counts.
         """
-        nonlocal progress_queue, panel, ws
+        nonlocal panel, ws
+
+        # Only the latest update is shown, so it simply replaces the last.
+        panel.progress = progress_update
+        ws.display.request_draw("progress", draw_progress)
 
-        progress_queue.put_nowait(progress_update)
+    def draw_progress():
+        nonlocal panel, ws
         ws.menubar.draw()
         panel.draw()
 
@@ -7154,8 +7733,6 @@ def discovery_start(ws):
     ws.active_panel = panel
     panel.panel.show()
     panel.panel.top()
-    curses.panel.update_panels()
-    curses.doupdate()
 
     ws.display.loop = loop
     ws.display.active_handle_char = panel.handle_char
@@ -7179,6 +7756,10 @@ def polling_start(ws):
     logger.info("Polling start requested")
     
     def process_item_callback():
+        nonlocal ws
+        ws.display.request_draw("polling", draw_polling)
+
+    def draw_polling():
         nonlocal ws
         aws = ws.display.active_workspace
         polling_workspace = any(x.name == "button_polling" for x in aws.buttons)
@@ -7191,7 +7772,6 @@ def polling_start(ws):
                 aws.active_panel.draw(rtpdetails)
             else:
                 aws.draw()
-            curses.doupdate()
             aws.menubar.draw()
 
     loop = ws.display.loop
@@ -7218,24 +7798,28 @@ def polling_stop(ws):
 
     return 1
 
+# Capture state (first word of capture_status) -> (commands, new status)
+CAPTURE_ACTIONs = {
+    "running": (("capture stop",), "stopping"),
+    "stopped": (("clear capture-buffer", "capture start"), "starting"),
+}
+
 def capture_toggle(ws):
     if not ws.display.loop:
         return
 
     bgw = ws.storage.select(ws.storage_cursor + ws.body_posy)
 
-    if "running" in bgw.capture_status:
-        commands = ["capture stop"]
-        status = "stopping"
-    elif "stopped" in bgw.capture_status:
-        commands = ["clear capture-buffer", "capture start"]
-        if not bgw.has_filter_501:
-            commands = CONFIG["capture_setup"] + commands[:]
-        status = "starting"
-    else:
+    action = CAPTURE_ACTIONs.get(bgw.capture_status.split(" ", 1)[0])
+    if action is None:
         return
 
-    bgw.queue.put_nowait(commands)
+    commands, status = action
+    commands = list(commands)
+    if status == "starting" and not bgw.has_filter_501:
+        commands = CONFIG["capture_setup"] + commands
+
+    bgw.queue.append(commands)
     bgw.packet_capture = status
     logger.info(f"PCAP {status} requested")
 
@@ -7245,6 +7829,21 @@ def capture_toggle(ws):
 
     return 1
 
+@lru_cache(maxsize=1)
+def upload_command_prefix():
+    """Return the BGW upload command up to the file name.
+
+    The HTTP server settings do not change while running, and resolving
+    0.0.0.0 runs netstat, so the prefix is built once on the first upload.
+    """
+    http_server = CONFIG.get("http_server", "0.0.0.0")
+    http_port = CONFIG.get("http_port")
+    upload_dir = CONFIG.get("upload_dir")
+    if http_server == "0.0.0.0":
+        http_server = get_local_ip()
+
+    return f"copy capture-file https http://{http_server}:{http_port}/{upload_dir}/"
+
 def capture_upload(ws):
     if not ws.display.loop or not CONFIG.get("http_server"):
         logger.info("HTTP server not configured, request ignored")
@@ -7255,18 +7854,11 @@ def capture_upload(ws):
     if bgw.pcap_upload == "requested":
         return
 
-    http_server = CONFIG.get("http_server", "0.0.0.0")
-    http_port = CONFIG.get("http_port")
-    upload_dir = CONFIG.get("upload_dir")
-    if http_server == "0.0.0.0":
-        http_server = get_local_ip()
-
-    dest = f"{http_server}:{http_port}/{upload_dir}"
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"{timestamp}_{bgw.gw_number}.cap"
 
-    command = f"copy capture-file https http://{dest}/{filename}"
-    bgw.queue.put_nowait(command)
+    command = upload_command_prefix() + filename
+    bgw.queue.append(command)
     bgw.pcap_upload = "requested"
     logger.info(f"PCAP upload '{command}' requested")
 
@@ -7297,12 +7889,22 @@ def clear_storage(ws):
     panel.panel.show()
     panel.panel.top()
     panel.draw()
-    curses.panel.update_panels()
-    curses.doupdate()
     ws.display.active_handle_char = panel.handle_char
 
     return panel
 
+def make_show_button(func_on):
+    """Return an Enter button toggling the panel opened by `func_on`."""
+    return Button(
+        char_int = ord("\n"),
+        func_on = func_on,
+        label_on = "Hide Panel",
+        label_off = "Show More",
+        func_off = hide_panel,
+        status_color_on = 66304,
+        status_color_off = 68096
+    )
+
 def make_textpanel(ws, *attr_names):
     bgw = ws.storage.select(ws.storage_cursor + ws.body_posy)
 
@@ -7317,24 +7919,26 @@ def make_textpanel(ws, *attr_names):
             continue
         attr = str(getattr(bgw, attr_name)).strip()
         storage.extend(["", f"COMMAND: {attr_name}", ""])
-        storage.extend([x.rstrip() for x in attr.splitlines()])
+        storage.extend(map(str.rstrip, attr.splitlines()))
 
     if not storage:
         return
 
-    panel = TextPanel(
-        display = ws.display,
-        storage = storage,
-        name = f"TextPanel({attr})",
-    )
+    panel = ws.panel_pool.get("text")
+    if panel is None:
+        panel = ws.panel_pool["text"] = TextPanel(
+            display = ws.display,
+            storage = storage,
+        )
+    else:
+        panel.set_storage(storage)
+    panel.name = f"TextPanel({attr})"
 
     ws.draw(dim=True)    
     ws.active_panel = panel
     panel.panel.show()
     panel.panel.top()
     panel.draw()
-    curses.panel.update_panels()
-    curses.doupdate()
     ws.display.active_handle_char = panel.handle_char
 
     return panel
@@ -7383,30 +7987,39 @@ def show_rtp(ws):
 
     logger.info("Show RTP objectpanel requested")
 
-    rtp_attr_iter = partial(
-        iter_attrs,
-        spec=RTP_LAYOUT,
-        colors=COLORS,
-        xoffset=0,
-        yoffset=0,
-        default_y=0,
-        header=False,
-    )
-
-    panel = ObjectPanel(
-        display=ws.display,
-        obj=rtpdetails,
-        attr_iterator=rtp_attr_iter,
-        name = "ObjectPanel(RTP)"
-    )
+    def rtp_attr_iter(rtpdetails):
+        # RTPDetails are not modified once parsed, so render each one once,
+        # again only if GWs changed, the remote_addr color depends on it.
+        cached = RTP_PANEL_CELLs.get(rtpdetails)
+        if cached is None or cached[0] != GWs.version:
+            cached = (GWs.version, tuple(iter_attrs(
+                rtpdetails,
+                spec=RTP_COLUMNS,
+                colors=COLORS,
+                xoffset=0,
+                yoffset=0,
+                default_y=0,
+                header=False,
+            )))
+            RTP_PANEL_CELLs[rtpdetails] = cached
+        return iter(cached[1])
+
+    panel = ws.panel_pool.get("rtp")
+    if panel is None:
+        panel = ws.panel_pool["rtp"] = ObjectPanel(
+            display=ws.display,
+            obj=rtpdetails,
+            attr_iterator=rtp_attr_iter,
+            name = "ObjectPanel(RTP)"
+        )
+    else:
+        panel.obj = rtpdetails
 
     ws.draw(dim=True)    
     ws.active_panel = panel
     panel.panel.show()
     panel.panel.top()
     panel.draw()
-    curses.panel.update_panels()
-    curses.doupdate()
     ws.display.active_handle_char = panel.handle_char
 
     return panel
@@ -7419,19 +8032,23 @@ def show_pcap(ws):
 
     logger.info("Show PCAP textpanel requested")
 
-    panel = TextPanel(
-        display = ws.display,
-        storage = capture.rtpinfos.splitlines(),
-        name = "TextPanel(PCAP)",
-    )
+    storage = capture.rtpinfos.splitlines()
+
+    panel = ws.panel_pool.get("text")
+    if panel is None:
+        panel = ws.panel_pool["text"] = TextPanel(
+            display = ws.display,
+            storage = storage,
+            name = "TextPanel(PCAP)",
+        )
+    else:
+        panel.set_storage(storage)
 
     ws.draw(dim=True)    
     ws.active_panel = panel
     panel.panel.show()
     panel.panel.top()
     panel.draw()
-    curses.panel.update_panels()
-    curses.doupdate()
     ws.display.active_handle_char = panel.handle_char
 
     return panel
@@ -7470,7 +8087,7 @@ def main(stdscr, miny: int=24, minx: int=80):
         while must_resize(stdscr, miny, minx):
             char = stdscr.getch()
             if char == curses.ERR:
-                time.sleep(0.1)
+                continue
             elif char == curses.KEY_RESIZE:
                 stdscr.erase()
             elif chr(char) in ("q", "Q"):
@@ -7513,85 +8130,14 @@ def main(stdscr, miny: int=24, minx: int=80):
             status_color_off = 68096
         )
 
-        button_show_system = Button(
-            char_int = ord("\n"),
-            func_on = show_system,
-            label_on = "Hide Panel",
-            label_off = "Show More",
-            func_off = hide_panel,
-            status_color_on = 66304,
-            status_color_off = 68096
-        )
-
-        button_show_misc = Button(
-            char_int = ord("\n"),
-            func_on = show_misc,
-            label_on = "Hide Panel",
-            label_off = "Show More",
-            func_off = hide_panel,
-            status_color_on = 66304,
-            status_color_off = 68096
-        )
-
-        button_show_mg_list = Button(
-            char_int = ord("\n"),
-            func_on = show_mg_list,
-            label_on = "Hide Panel",
-            label_off = "Show More",
-            func_off = hide_panel,
-            status_color_on = 66304,
-            status_color_off = 68096
-        )
-
-        button_show_port = Button(
-            char_int = ord("\n"),
-            func_on = show_port,
-            label_on = "Hide Panel",
-            label_off = "Show More",
-            func_off = hide_panel,
-            status_color_on = 66304,
-            status_color_off = 68096
-        )
-
-        button_show_config = Button(
-            char_int = ord("\n"),
-            func_on = show_config,
-            label_on = "Hide Panel",
-            label_off = "Show More",
-            func_off = hide_panel,
-            status_color_on = 66304,
-            status_color_off = 68096
-        )
-
-        button_show_pcap = Button(
-            char_int = ord("\n"),
-            func_on = show_pcap,
-            label_on = "Hide Panel",
-            label_off = "Show More",
-            func_off = hide_panel,
-            status_color_on = 66304,
-            status_color_off = 68096
-        )
-
-        button_show_status = Button(
-            char_int = ord("\n"),
-            func_on = show_status,
-            label_on = "Hide Panel",
-            label_off = "Show More",
-            func_off = hide_panel,
-            status_color_on = 66304,
-            status_color_off = 68096
-        )
-
-        button_show_rtp = Button(
-            char_int = ord("\n"),
-            func_on = show_rtp,
-            label_on = "Hide Panel",
-            label_off = "Show More",
-            func_off = hide_panel,
-            status_color_on = 66304,
-            status_color_off = 68096
-        )
+        button_show_system = make_show_button(show_system)
+        button_show_misc = make_show_button(show_misc)
+        button_show_mg_list = make_show_button(show_mg_list)
+        button_show_port = make_show_button(show_port)
+        button_show_config = make_show_button(show_config)
+        button_show_pcap = make_show_button(show_pcap)
+        button_show_status = make_show_button(show_status)
+        button_show_rtp = make_show_button(show_rtp)
 
         button_capture = Button(
             char_int = ord("t"),
@@ -7612,7 +8158,7 @@ def main(stdscr, miny: int=24, minx: int=80):
         workspaces = [
             Workspace(
                 mydisplay,
-                layout=Layout(LAYOUTS["SYSTEM"]),
+                layout=SCREEN_LAYOUTs["SYSTEM"],
                 buttons=[
                     button_discovery,
                     button_show_system
@@ -7623,7 +8169,7 @@ def main(stdscr, miny: int=24, minx: int=80):
             ),
             Workspace(
                 mydisplay,
-                layout=Layout(LAYOUTS["MISC"]),
+                layout=SCREEN_LAYOUTs["MISC"],
                 buttons=[
                     button_discovery,
                     button_show_misc
@@ -7634,7 +8180,7 @@ def main(stdscr, miny: int=24, minx: int=80):
             ),
             Workspace(
                 mydisplay,
-                layout=Layout(LAYOUTS["MODULE"]),
+                layout=SCREEN_LAYOUTs["MODULE"],
                 buttons=[
                     button_discovery,
                     button_show_mg_list
@@ -7645,7 +8191,7 @@ def main(stdscr, miny: int=24, minx: int=80):
             ),
             Workspace(
                 mydisplay,
-                layout=Layout(LAYOUTS["PORT"]),
+                layout=SCREEN_LAYOUTs["PORT"],
                 buttons=[
                     button_discovery,
                     button_show_port
@@ -7656,7 +8202,7 @@ def main(stdscr, miny: int=24, minx: int=80):
             ),
             Workspace(
                 mydisplay,
-                layout=Layout(LAYOUTS["CONFIG"]),
+                layout=SCREEN_LAYOUTs["CONFIG"],
                 buttons=[
                     button_discovery,
                     button_show_config
@@ -7667,7 +8213,7 @@ def main(stdscr, miny: int=24, minx: int=80):
             ),
             Workspace(
                 mydisplay,
-                layout=Layout(LAYOUTS["STATUS"]),
+                layout=SCREEN_LAYOUTs["STATUS"],
                 buttons=[
                     button_polling,
                     button_show_status,
@@ -7680,7 +8226,7 @@ def main(stdscr, miny: int=24, minx: int=80):
             ),
             Workspace(
                 mydisplay,
-                layout=Layout(LAYOUTS["RTPSTATS"]),
+                layout=SCREEN_LAYOUTs["RTPSTATS"],
                 buttons=[
                     button_polling,
                     button_show_rtp,
@@ -7691,7 +8237,7 @@ def main(stdscr, miny: int=24, minx: int=80):
             ),
             Workspace(
                 mydisplay,
-                layout=Layout(LAYOUTS["PCAP"]),
+                layout=SCREEN_LAYOUTs["PCAP"],
                 buttons=[
                     button_show_pcap
                 ],
@@ -7791,6 +8337,12 @@ def application_context(CONFIG):
             curses.endwin()
         except:
             pass
+        # Only after the terminal is restored, a failure here must not
+        # leave it in raw mode.
+        try:
+            close_ssh_masters(bgw.lan_ip for bgw in BGWs.values())
+        except Exception as e:
+            logger.error("Failed to close SSH masters: %r", e)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Monitors Avaya Gateways')
@@ -7824,6 +8376,10 @@ if __name__ == "__main__":
     parser.add_argument('--upload_dir', dest='upload_dir',
                         default=CONFIG.get('upload_dir', '/tmp'),
                         help='PCAP Upload directory, default /tmp')
+    parser.add_argument('--ssh-control-dir', dest='ssh_control_dir',
+                        default=CONFIG.get('ssh_control_dir'),
+                        help='SSH ControlMaster socket directory, '
+                             'enables multiplexing, default off')
     parser.add_argument('--no-http', dest='no_http', action='store_true',
                         default=False,
                         help='Don\'t run HTTP server, default False')
@@ -4,13 +4,21 @@
 ############################## BEGIN IMPORTS ##################################
 
 import asyncio
+import atexit
+import heapq
 import json
 import os
 import re
+import subprocess
+import sys
+import tempfile
 import time
+from array import array
 from asyncio import Queue, Semaphore
+from bisect import insort_left
 from datetime import datetime
-from typing import Any, Callable, MutableMapping, Coroutine, Dict, List, Optional, Tuple, Set, Mapping, Iterable
+from functools import lru_cache
+from typing import Any, Callable, MutableMapping, Coroutine, Dict, List, Optional, Tuple, Mapping, Iterable
 
 ############################## END IMPORTS ####################################
 
@@ -33,6 +41,44 @@ BGWMap = Mapping[str, Any]
 Progress = Tuple[int, int, int]
 ProgressCallback = Callable[[Progress], None]
 
+GW_PROTOCOLs = {
+    "1039": "ptls",
+    "2944": "tls",
+    "2945": "unenc",
+    "61440": "h323",
+    "61441": "h323",
+    "61442": "h323",
+    "61443": "h323",
+    "61444": "h323",
+}
+GW_NETSTAT_COMMAND = "netstat -tan | grep ESTABLISHED | grep -E '{}'".format(
+    "|".join(GW_PROTOCOLs)
+)
+# Order of the per-gateway values passed to the expect script in argv.
+EXPECT_ARGs = (
+    "lan_ip",
+    "user",
+    "passwd",
+    "rtp_stats",
+    "prev_last_session_id",
+    "prev_active_session_ids",
+    "commands",
+    "control_path",
+    "control_persist",
+    "debug",
+)
+# Expect script template -> path of the file it was written to.
+EXPECT_SCRIPT_PATHs = {}  # type: Dict[str, str]
+reGWConnection = re.compile(
+    r"([0-9.]+):(1039|2944|2945|6144[0-4])\s+([0-9.]+):([0-9]+)"
+)
+
+# capinfos / rtp,streams output, scanned once per Capture.
+reFirstPacketTime = re.compile(r"First packet time:\s+(.*?)\.")
+reLastPacketTime = re.compile(r"Last packet time:\s+(.*?)\.")
+reRTPStreamLine = re.compile(r"^[^\n]*?0x", re.MULTILINE)
+reRTPProblemLine = re.compile(r"X[^\S\n]*$", re.MULTILINE)
+
 class CommandResult:
     """A consistent container for command output."""
 
@@ -115,54 +161,56 @@ class Capture:
     def received_timestamp_str(self):
         return self.received_timestamp.strftime("%Y-%m-%d,%H:%M:%S")
 
+    # The values below are drawn on every PCAP redraw. They are cached
+    # against None so that empty results and zero counts stay cached too.
+
     @property
     def first_packet_time(self):
-        if self._first_packet_time:
+        if self._first_packet_time is not None:
             return self._first_packet_time
         
         if not self.capinfos:
             return ""
         
-        m = re.search(r"First packet time:\s+(.*?)\.", self.capinfos)
+        m = reFirstPacketTime.search(self.capinfos)
         self._first_packet_time = m.group(1) if m else ""
         return self._first_packet_time 
             
     @property
     def last_packet_time(self):
-        if self._last_packet_time:
+        if self._last_packet_time is not None:
             return self._last_packet_time
         
         if not self.capinfos:
             return ""
         
-        m = re.search(r"Last packet time:\s+(.*?)\.", self.capinfos)
+        m = reLastPacketTime.search(self.capinfos)
         self._last_packet_time = m.group(1) if m else ""
         return self._last_packet_time
 
     @property
     def rtp_problems(self):
-        if self._rtp_problems:
+        if self._rtp_problems is not None:
             return self._rtp_problems
         
         if not self.rtpinfos:
             return 0
         
-        lines = self.rtpinfos.splitlines()
-        problems = sum(1 for x in lines if x.strip().endswith("X"))
-        self._rtp_problems = problems
+        # Lines flagged with a trailing "X" in the Problems? column.
+        self._rtp_problems = len(reRTPProblemLine.findall(self.rtpinfos))
         
         return self._rtp_problems
 
     @property
     def rtp_streams(self):
-        if self._rtp_streams:
+        if self._rtp_streams is not None:
             return self._rtp_streams
         
         if not self.rtpinfos:
             return ""
         
-        rtps = sum(1 for x in self.rtpinfos.splitlines() if "0x" in x)
-        self._rtp_streams = rtps
+        # Stream lines are the ones carrying a hex SSRC.
+        self._rtp_streams = len(reRTPStreamLine.findall(self.rtpinfos))
         
         return self._rtp_streams
 
@@ -182,14 +230,52 @@ class Capture:
 
         return f"Capture({', '.join(fields)})"
 
-def create_bgw_script(
-    bgw: "BGW",
-    script_template: str = EXPECT_SCRIPT,
-) -> str:
+def expect_script_path(script_template: str = EXPECT_SCRIPT) -> str:
+    """
+    Return the path of the Expect script, writing it to a file if needed.
+
+    The template variables are filled with reads of the script's argv, so
+    the same file serves every gateway and poll. It is created with mode
+    0600 under a unique name and removed when the process exits. A file
+    removed meanwhile, e.g. by a tmp cleaner, is written again.
+
+    Args:
+        script_template: The Expect script template to format.
+
+    Returns:
+        The path of the script file.
+    """
+    path = EXPECT_SCRIPT_PATHs.get(script_template)
+    if path is not None:
+        if os.path.exists(path):
+            return path
+        logger.warning(f"Expect script {path} is gone, writing it again")
+
+    script = script_template.format(**{
+        name: f"[lindex $argv {i}]" for i, name in enumerate(EXPECT_ARGs)
+    })
+
+    fd, path = tempfile.mkstemp(prefix="monitorbgw-", suffix=".exp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(script)
+    atexit.register(remove_file, path)
+    EXPECT_SCRIPT_PATHs[script_template] = path
+
+    logger.info(f"Expect script written to {path}")
+    return path
+
+def remove_file(path: str) -> None:
+    """Remove a file, ignoring one that is already gone."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def create_bgw_args(bgw: "BGW") -> List[str]:
     """
-    Generate an Expect script for querying a BGW.
+    Generate the expect arguments for querying a BGW.
 
-    The generated script depends on whether the BGW has been seen before:
+    The arguments depend on whether the BGW has been seen before:
     - If this is the first discovery, discovery commands are used and RTP
       statistics are disabled.
     - If the BGW has been seen previously, query commands are used and RTP
@@ -197,11 +283,10 @@ def create_bgw_script(
     - Any queued commands are prepended to the command list.
 
     Args:
-        bgw: The BGW instance to generate the script for.
-        script_template: The Expect script template to format.
+        bgw: The BGW instance to generate the arguments for.
 
     Returns:
-        A fully formatted Expect script as a string.
+        The script path followed by the values listed in EXPECT_ARGs.
     """
     debug: int = 1 if logger.getEffectiveLevel() == 10 else 0
 
@@ -210,17 +295,17 @@ def create_bgw_script(
         rtp_stats: int = 0
         commands: List[str] = CONFIG["discovery_commands"][:]
         prev_last_session_id: str = ""
-        prev_active_session_ids: Iterable[str] = []
+        prev_active_session_ids: Iterable[int] = ()
 
     else:
         # Regular polling
         rtp_stats = 1
         prev_last_session_id = bgw.last_session_id or ""
-        prev_active_session_ids = sorted(bgw.active_session_ids)
+        prev_active_session_ids = bgw.active_session_ids
         commands = CONFIG["query_commands"][:]
 
-        if not bgw.queue.empty():
-            queued_commands = bgw.queue.get_nowait()
+        if bgw.queue:
+            queued_commands = bgw.queue.popleft()
             if isinstance(queued_commands, str):
                 queued_commands = [queued_commands]
 
@@ -235,14 +320,14 @@ def create_bgw_script(
         "lan_ip": bgw.lan_ip,
         "user": CONFIG["user"],
         "passwd": CONFIG["passwd"],
-        "prev_last_session_id": f'"{prev_last_session_id}"',
-        "prev_active_session_ids": "{"
-        + " ".join(f'"{sid}"' for sid in prev_active_session_ids)
-        + "}",
+        "prev_last_session_id": prev_last_session_id,
+        "prev_active_session_ids": " ".join(
+            f'"{sid:0>5}"' for sid in prev_active_session_ids
+        ),
         "rtp_stats": rtp_stats,
-        "commands": "{"
-        + " ".join(f'"{cmd}"' for cmd in commands)
-        + "}",
+        "commands": " ".join(f'"{cmd}"' for cmd in commands),
+        "control_path": ssh_control_path(),
+        "control_persist": CONFIG.get("ssh_control_persist") or "600s",
         "debug": debug,
     }
 
@@ -252,7 +337,67 @@ def create_bgw_script(
         bgw.lan_ip,
     )
 
-    return script_template.format(**template_args)
+    return [expect_script_path()] + [
+        str(template_args[name]) for name in EXPECT_ARGs
+    ]
+
+def ssh_control_path() -> str:
+    """
+    Return the OpenSSH ControlPath shared by the sessions of a gateway.
+
+    With a ControlMaster per gateway only the first poll pays for the TCP
+    and authentication handshake, later polls open a channel over it.
+
+    Returns:
+        The ControlPath pattern, or "" when multiplexing is disabled.
+    """
+    return _ssh_control_path(CONFIG.get("ssh_control_dir") or "")
+
+@lru_cache(maxsize=4)
+def _ssh_control_path(control_dir: str) -> str:
+    if not control_dir:
+        return ""
+
+    control_dir = os.path.expanduser(control_dir)
+    try:
+        os.makedirs(control_dir, mode=0o700, exist_ok=True)
+        os.chmod(control_dir, 0o700)
+    except OSError as e:
+        logger.error(f"{e} while creating {control_dir}")
+        return ""
+
+    return os.path.join(control_dir, "%r@%h:%p")
+
+def close_ssh_masters(lan_ips: Iterable[str], timeout: float = 5) -> None:
+    """
+    Ask the SSH ControlMaster of each gateway to exit.
+
+    Args:
+        lan_ips: IP addresses of the gateways that may have a master.
+        timeout: Seconds to wait for each master to exit.
+    """
+    control_path = ssh_control_path()
+    if not control_path:
+        return
+
+    procs = []
+    for lan_ip in lan_ips:
+        try:
+            procs.append(subprocess.Popen(
+                ["ssh", "-q", "-o", f"ControlPath={control_path}",
+                 "-O", "exit", f"{CONFIG['user']}@{lan_ip}"],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            ))
+        except OSError as e:
+            logger.error(f"{e} while closing SSH master - {lan_ip}")
+
+    for proc in procs:
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
 
 def connected_gws(
     ip_filter: Optional[Iterable[str]] = None
@@ -266,33 +411,23 @@ def connected_gws(
         Dict: A dictionary of connected gateways.
     """
     result: Dict[str, str] = {}
-    ip_filter = set(ip_filter) if ip_filter else set()
-
-    ports = "1039|2944|2945|61440|61441|61442|61443|61444"
-    command = "netstat -tan | grep ESTABLISHED | grep -E '{}'".format(ports)
-    pattern = r"([0-9.]+):(1039|2944|2945|6144[0-4])\s+([0-9.]+):([0-9]+)"
-    protocols = {
-        "1039": "ptls",
-        "2944": "tls",
-        "2945": "unenc",
-        "61440": "h323",
-        "61441": "h323",
-        "61442": "h323",
-        "61443": "h323",
-        "61444": "h323",
-    }
+    ip_filter = frozenset(ip_filter) if ip_filter else frozenset()
 
-    connections = os.popen(command).read()
+    connections = os.popen(GW_NETSTAT_COMMAND).read()
 
-    for m in re.finditer(pattern, connections):
+    for m in reGWConnection.finditer(connections):
         ip, port = m.group(3, 2)
 
-        proto = protocols.get(port, "unknown")
+        # Hashed membership guard before any further per-IP work.
+        if ip_filter and ip not in ip_filter:
+            continue
+
+        proto = GW_PROTOCOLs.get(port, "unknown")
         logger.debug(f"Found GW using {proto} - {ip}")
 
-        if not ip_filter or ip in ip_filter:
-            result[ip] = proto
-            logger.info(f"Added GW to results - {ip}")
+        # The lan_ip becomes a long-lived key of the BGW storage.
+        result[sys.intern(ip)] = proto
+        logger.info(f"Added GW to results - {ip}")
 
     result = {ip: result[ip] for ip in sorted(result)}
     return result if result else {ip: "unknown" for ip in ip_filter}
@@ -471,8 +606,11 @@ async def process_queue(
 ) -> None:
     """Continuously consume items from an asyncio queue and process them.
 
-    This coroutine blocks on ``queue.get()`` and forwards each received item to
-    ``process_item(...)`` to update BGW state and the RTP session storage.
+    This coroutine blocks on ``queue.get()`` and then drains whatever else is
+    already waiting, forwarding each item to ``process_item(...)`` to update
+    BGW state and the RTP session storage. Results arriving together from
+    several BGWs are handled as one batch and ``callback`` (a full redraw) is
+    invoked once per batch rather than once per item.
 
     Args:
         queue: An asyncio queue yielding items to be processed (often a
@@ -485,20 +623,29 @@ async def process_queue(
         None.
     """
     while True:
-        item = await queue.get()
+        batch = [await queue.get()]
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+
         try:
-            logger.debug("Got item from process queue: %r", item)
-            process_item(
-                item,
-                storage=storage,
-                callback=callback,
-                nok_rtp_only=nok_rtp_only
-            )
+            logger.debug("Got %d item(s) from process queue", len(batch))
+            for item in batch:
+                try:
+                    process_item(
+                        item,
+                        storage=storage,
+                        nok_rtp_only=nok_rtp_only
+                    )
+                except Exception as e:
+                    logger.error("%r while processing %r", e, item)
+            if callback:
+                callback()
         finally:
-            try:
-                queue.task_done()
-            except Exception:
-                pass
+            for _ in batch:
+                try:
+                    queue.task_done()
+                except Exception:
+                    pass
 
 def process_item(
     item: Any,
@@ -555,6 +702,13 @@ def process_item(
         logger.debug("Unexpected data in %r", item)
         return
 
+    # Fresh strings come out of every JSON decode; intern the identifiers
+    # so the GWs/BGWs key lookups on each poll and redraw hit by identity.
+    if gw_number:
+        gw_number = data["gw_number"] = sys.intern(gw_number)
+    if lan_ip:
+        lan_ip = data["lan_ip"] = sys.intern(lan_ip)
+
     if bgw is None:
         bgw = BGWs.get(gw_number)
         if not bgw:
@@ -565,7 +719,7 @@ def process_item(
         GWs.update({lan_ip: gw_number})
         logger.info("Updated GWs with %s -> %s", lan_ip, gw_number)
 
-    active_session_ids: Set[str] = set()
+    active_session_ids = array("Q")
 
     bgw.update(**data)
     logger.debug(
@@ -582,7 +736,17 @@ def process_item(
             session_id = "{:0>5}".format(rtpdetails.session_id)
 
             if rtpdetails.is_active:
-                active_session_ids.add(session_id)
+                # A garbled id must not abort the rest of the batch.
+                try:
+                    insort_left(
+                        active_session_ids, int(rtpdetails.session_id)
+                    )
+                except (ValueError, OverflowError):
+                    logger.error(
+                        "Invalid session id %r - %s",
+                        rtpdetails.session_id,
+                        lan_ip,
+                    )
                 # If nok_rtp_only is True wait for the session to complete
                 if nok_rtp_only:
                     continue
@@ -764,70 +928,131 @@ async def query(
     bgw: BGW,
     semaphore: Optional[asyncio.Semaphore] = None,
     name: Optional[str] = None,
-    queue: Optional[asyncio.Queue] = None,
     timeout: float = 25,
-    polling_secs: float = 30,
-) -> Optional[CommandResult]:
+) -> CommandResult:
+    """Query a BGW once, polling goes through ``poll_scheduler`` instead.
+
+    Args:
+        bgw: The BGW to query.
+        semaphore: Limits the number of concurrent queries.
+        name: Label used in logs and results, defaults to the LAN IP.
+        timeout: Query timeout in seconds.
 
+    Returns:
+        The ``CommandResult`` of the expect script.
+    """
     name = name if name else bgw.lan_ip
     semaphore = semaphore if semaphore else asyncio.Semaphore(1)
-    avg_sleep = 0.0
-    sleep_n = 0
 
-    while True:
+    try:
+        async with semaphore:
+            logger.debug(
+                f"Semaphore acquired ({semaphore._value} free) - {name}"
+            )
+
+            return await run_cmd(
+                program="expect",
+                args=create_bgw_args(bgw),
+                timeout=timeout,
+                name=name,
+            )
+
+    except asyncio.CancelledError:
+        logger.error(f"CancelledError - {name}")
+        raise
+
+    except Exception as e:
+        logger.error(f"{repr(e)} in {name}")
+        raise
+
+    finally:
+        logger.debug(
+            f"Semaphore released ({semaphore._value} free) - {name}"
+        )
+
+async def poll_scheduler(
+    bgws: BGWMap,
+    queue: asyncio.Queue,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    timeout: float = 25,
+    polling_secs: float = 30,
+) -> None:
+    """Poll BGWs from a single task as they fall due, in batches.
+
+    A min-heap holds ``(next_due, name)`` for every BGW. The scheduler sleeps
+    until the earliest entry falls due, then pops all due entries and polls
+    them together in one ``asyncio.gather`` batch, still bounded by
+    ``semaphore``. Each BGW is pushed back with its next due time as soon as
+    its own poll completes, which also wakes the scheduler, so a slow gateway
+    does not hold back the others. Results are put on ``queue``, where
+    gateways finishing together are picked up by ``process_queue`` as one
+    batch.
+
+    Args:
+        bgws: Mapping of name -> BGW. The names polled are a snapshot taken
+            at start, BGWs added later are not polled and removed ones are
+            dropped when they next fall due.
+        queue: Queue receiving the successful ``CommandResult`` objects.
+        semaphore: Limits the number of concurrent polls.
+        timeout: Per poll timeout in seconds.
+        polling_secs: Interval between the starts of two polls of a BGW.
+    """
+    semaphore = semaphore if semaphore else asyncio.Semaphore(1)
+    now = time.monotonic()
+    heap = [(now, name) for name in bgws]  # type: List[Tuple[float, str]]
+    heapq.heapify(heap)
+    pushed = asyncio.Event()
+
+    async def poll(name: str) -> None:
+        bgw = bgws.get(name)
+        if bgw is None:
+            logger.debug(f"No longer polled - {name}")
+            return
+
+        t0 = time.monotonic()
         try:
-            t0 = time.monotonic()
             async with semaphore:
-                logger.debug(
-                    f"Semaphore acquired ({semaphore._value} free) - {name}"
-                )
-
                 result = await run_cmd(
                     program="expect",
-                    args=["-c", create_bgw_script(bgw)],
+                    args=create_bgw_args(bgw),
                     timeout=timeout,
                     name=name,
                 )
-
-                if isinstance(result, CommandResult):
-                    if not queue:
-                        return result
-                    await queue.put(result)
-
-            elapsed = time.monotonic() - t0
-            sleep = round(max(polling_secs - elapsed, 0.0), 2)
-            
-            sleep_n += 1
-            avg_sleep = (avg_sleep * (sleep_n - 1) + sleep) / sleep_n
-            avg_sleep = round(avg_sleep, 2)
-            
-            logger.debug(
-                f"Semaphore released ({semaphore._value} free), "
-                f"Cycle elapsed {elapsed:.2f}s, sleeping {sleep:.2f}s "
-                f"(avg_sleep {avg_sleep:.2f}s) - {name}"
-            )
-
-            if sleep:
-                await asyncio.sleep(sleep)
+            if isinstance(result, CommandResult):
+                await queue.put(result)
 
         except asyncio.CancelledError:
             logger.error(f"CancelledError - {name}")
             raise
 
-        except asyncio.TimeoutError:
-            logger.error(f"TimeoutError in {name}")
-            if not queue:
-                raise
-
         except Exception as e:
             logger.error(f"{repr(e)} in {name}")
-            if not queue:
-                raise
 
-        finally:
-            logger.debug(
-                f"Semaphore released ({semaphore._value} free) - {name}"
-            )
+        heapq.heappush(heap, (t0 + polling_secs, name))
+        pushed.set()
+
+    async def poll_batch(names: List[str]) -> None:
+        await asyncio.gather(*(poll(n) for n in names), return_exceptions=True)
+
+    while True:
+        now = time.monotonic()
+        due = []  # type: List[str]
+        while heap and heap[0][0] <= now:
+            due.append(heapq.heappop(heap)[1])
+
+        if due:
+            logger.debug(f"Polling batch of {len(due)} BGW(s)")
+            schedule_task(poll_batch(due))
+
+        # Sleep until the next entry falls due, or until a poll completes
+        # and pushes one, which may be due earlier. With every BGW in
+        # flight the heap is empty and only a push wakes the scheduler.
+        pushed.clear()
+        delay = heap[0][0] - time.monotonic() if heap else None
+        try:
+            await asyncio.wait_for(pushed.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
 
 async def discovery(
     loop: "asyncio.AbstractEventLoop",
@@ -897,7 +1122,10 @@ def schedule_queries(
 
       - Creates a shared semaphore limiting concurrent polling.
       - Optionally creates a work queue (when polling).
-      - Schedules one `query(...)` task per BGW and returns the task list.
+      - When polling, schedules a single `poll_scheduler(...)` task which
+        polls the BGWs in batches as they fall due.
+      - Otherwise (discovery) schedules one single-shot `query(...)` task
+        per BGW.
 
     Args:
         loop: Event loop to schedule tasks on.
@@ -905,7 +1133,8 @@ def schedule_queries(
         callback: Optional progress callback passed to `process_queue`.
 
     Returns:
-        A list of scheduled task objects (Tasks/Futures), one per BGW query.
+        A list of scheduled task objects (Tasks/Futures), one per BGW query,
+        or just the `poll_scheduler` task when polling.
         (The queue consumer task is scheduled but not included in this list.)
     """
     queue = asyncio.Queue(loop=loop) if GWs else None  # type: ignore
@@ -931,6 +1160,18 @@ def schedule_queries(
             loop=loop,
         )
 
+        task = schedule_task(
+            poll_scheduler(
+                bgw_map,
+                queue=queue,
+                semaphore=semaphore,
+                timeout=timeout,
+                polling_secs=polling_secs,
+            ),
+            loop=loop,
+        )
+        return [task]
+
     tasks: List["asyncio.Future[Any]"] = []
 
     for lan_ip, bgw in bgw_map.items():
@@ -939,9 +1180,7 @@ def schedule_queries(
                 bgw,
                 semaphore=semaphore,
                 name=lan_ip,
-                queue=queue,
                 timeout=timeout,
-                polling_secs=polling_secs,
             ),
             name=lan_ip,
             loop=loop,
@@ -4,8 +4,11 @@
 ############################## BEGIN IMPORTS ##################################
 
 import re
-from typing import Optional, Any, Dict, Set
-from asyncio import Queue
+import sys
+from array import array
+from functools import wraps
+from typing import Optional, Any, Callable, Dict, List, Tuple
+from collections import deque
 from datetime import datetime
 import logging
 logger = logging.getLogger(__name__)
@@ -13,6 +16,89 @@ logger = logging.getLogger(__name__)
 ############################## END IMPORTS ####################################
 ############################## BEGIN BGW ######################################
 
+# Patterns applied to the show command outputs. The CLI output is plain
+# ASCII, so re.ASCII spares the engine the Unicode character classes.
+reActiveSessions = re.compile(r"nal\s+\S+\s+(\S+)", re.ASCII)
+reCaptureBufferSize = re.compile(r"Current buffer size is (\d+) KB", re.ASCII)
+reCaptureOccupancy = re.compile(r"buffer occupancy: (\d+)\.", re.ASCII)
+reCaptureService = re.compile(r"Capture service is (\w+)", re.ASCII)
+reCaptureStatus = re.compile(r"Capture service is \w+ and (\w+)", re.ASCII)
+reCPUUtil = re.compile(r"10\s+\d+%\s+(\d+)%", re.ASCII)
+reDSPInUse = re.compile(r"In Use\s+:\s+(\d+)", re.ASCII)
+reFault = re.compile(r"\s+\+ (\S+)", re.ASCII)
+reFlashMemory = re.compile(r"Flash Memory\s+: (\d+)\S+ ([MG])B", re.ASCII)
+reFWVintage = re.compile(r"FW Vintage\s+:\s+(\S+)", re.ASCII)
+reHWSuffix = re.compile(r"HW Suffix\s+:\s+(\S+)", re.ASCII)
+reHWVintage = re.compile(r"HW Vintage\s+:\s+(\S+)", re.ASCII)
+reLANMAC = re.compile(r"LAN MAC Address\s+:\s+(\S+)", re.ASCII)
+reLocation = re.compile(r"System Location\s+:\s*(\S+)", re.ASCII)
+reMainboardHWSuffix = re.compile(r"Mainboard HW Suffix\s+:\s+(\S+)", re.ASCII)
+reMainboardHWVintage = re.compile(r"Mainboard HW Vintage\s+:\s+(\S+)", re.ASCII)
+reMainPSU = re.compile(r"Main PSU\s+:\s+(\S+)", re.ASCII)
+reMediaSocket = re.compile(r"Media Socket .*?: M?P?(\d+) ", re.ASCII)
+reMemory = re.compile(r"Memory #\d+\s+:\s+(\S+)", re.ASCII)
+reMemToken = re.compile(r"(\d+)([MG]B)", re.ASCII)
+reModel = re.compile(r"Model\s+:\s+(\S+)", re.ASCII)
+rePortLine = re.compile(r"(.*Avaya )", re.ASCII)
+rePortRedundancy = re.compile(r"port redundancy \d+/(\d+) \d+/(\d+)", re.ASCII)
+rePSU1 = re.compile(r"PSU #1\s+:\s+\S+ (\S+)", re.ASCII)
+rePSU2 = re.compile(r"PSU #2\s+:\s+\S+ (\S+)", re.ASCII)
+reRAMMemory = re.compile(r"RAM Memory\s+:\s+(\S+)", re.ASCII)
+reRAMUtil = re.compile(r"10\s+\S+\s+\S+\s+(\d+)%", re.ASCII)
+reSerial = re.compile(r"Serial No\s+:\s+(\S+)", re.ASCII)
+reSLAMonitor = re.compile(r"SLA Monitor:\s+(\S+)", re.ASCII)
+reSLAServer = re.compile(r"Registered Server IP Address:\s+(\S+)", re.ASCII)
+reSNMPTrap = re.compile(r"snmp-server host (\S+) trap", re.ASCII)
+reTemperature = re.compile(r"Temperature\s+:\s+(\S+) \((\S+)\)", re.ASCII)
+reTotalSessions = re.compile(r"nal\s+\S+\s+\S+\s+(\S+)", re.ASCII)
+reUploadFailure = re.compile(r"Failure display\s+:\s+(\S+)", re.ASCII)
+reUploadState = re.compile(r"Running state\s+:\s+(\S+)", re.ASCII)
+reUptime = re.compile(r"Uptime \(\S+\)\s+:\s+(\S+)", re.ASCII)
+reMediaModule = re.compile(
+    r".*?(?P<slot>\S+)"
+    r".*?(?P<type>\S+)"
+    r".*?(?P<code>\S+)"
+    r".*?(?P<suffix>\S+)"
+    r".*?(?P<hw_vint>\S+)"
+    r".*?(?P<fw_vint>\S+)",
+    re.ASCII,
+)
+rePortDetails = re.compile(
+    r".*?(?P<port>\d+/\d+)"
+    r".*?(?P<name>.*)"
+    r".*?(?P<status>(connected|no link|disabled))"
+    r".*?(?P<vlan>\d+)"
+    r".*?(?P<level>\d+)"
+    r".*?(?P<neg>\S+)"
+    r".*?(?P<duplex>\S+)"
+    r".*?(?P<speed>\S+)",
+    re.ASCII,
+)
+
+def cached_on(source: str) -> Callable[[Callable[..., Any]], property]:
+    """Turn a method into a property memoized on its ``show_*`` source text.
+
+    The parsed value is stored in ``self._cache`` together with the source
+    string it was derived from. As the poller replaces the ``show_*``
+    attributes wholesale, an identity check on that string is enough to tell
+    whether the cached value is still current.
+
+    Args:
+        source: Name of the BGW attribute holding the raw command output.
+
+    Returns:
+        A decorator producing a read-only property.
+    """
+    def decorator(func: Callable[..., Any]) -> property:
+        name = func.__name__
+
+        @wraps(func)
+        def getter(self: "BGW") -> Any:
+            return self._cached(name, source, func)
+
+        return property(getter)
+    return decorator
+
 class BGW(object):
     """Represents an Avaya Branch Gateway (BGW) and cached command outputs.
 
@@ -27,9 +113,9 @@ class BGW(object):
     Notes:
         - Many properties return "NA" when the corresponding command output is
           missing.
-        - Parsed values are cached in private attributes (e.g. ``_hw``) to avoid
-          repeated regex work. If you overwrite the underlying ``show_*`` string,
-          you may also want to clear the relevant cache field.
+        - Parsed values are cached in ``_cache`` keyed by property name and
+          are reused for as long as the underlying ``show_*`` string is the
+          same object, so assigning new command output invalidates them.
     """
 
     def __init__(
@@ -67,7 +153,8 @@ class BGW(object):
         self.avg_poll_secs = 0.0
         self.poll_count = 0
 
-        self.active_session_ids = set()  # type: Set[str]
+        # Sorted numeric ids of the sessions active at the last poll.
+        self.active_session_ids = array("Q")  # type: array
         self.last_seen = ""
         self.last_seen_dt = None  # type: Optional[datetime]
         self.last_session_id = None  # type: Optional[str]
@@ -89,71 +176,17 @@ class BGW(object):
         self.show_upload_status_10 = show_upload_status_10
         self.show_voip_dsp = show_voip_dsp
 
-        # Work queue used by your polling/executor layer
-        self.queue = Queue()  # type: Queue
-
-        # --- Lazy caches (keep as you had them) ---
-        self._announcements = None  # type: Optional[str]
-        self._capture_service = None  # type: Optional[str]
-        self._capture_status = None  # type: Optional[str]
-
-        self._chassis_hw = None  # type: Optional[str]
-        self._comp_flash = None  # type: Optional[str]
-        self._cpu_util = None  # type: Optional[str]
-        self._dsp = None  # type: Optional[str]
-        self._faults = None  # type: Optional[str]
-        self._fw = None  # type: Optional[str]
-        self._hw = None  # type: Optional[str]
-        self._inuse_dsp = None  # type: Optional[str]
-        self._last_seen_time = None  # type: Optional[str]
-        self._lldp = None  # type: Optional[str]
-        self._location = None  # type: Optional[str]
-        self._mac = None  # type: Optional[str]
-        self._mainboard_hw = None  # type: Optional[str]
-        self._memory = None  # type: Optional[str]
-        self._mm_groupdict = None  # type: Optional[Dict[str, Dict[str, str]]]
-
-        self._mm_v1 = None  # type: Optional[str]
-        self._mm_v2 = None  # type: Optional[str]
-        self._mm_v3 = None  # type: Optional[str]
-        self._mm_v4 = None  # type: Optional[str]
-        self._mm_v5 = None  # type: Optional[str]
-        self._mm_v6 = None  # type: Optional[str]
-        self._mm_v7 = None  # type: Optional[str]
-        self._mm_v8 = None  # type: Optional[str]
-        self._mm_v10 = None  # type: Optional[str]
-
-        self._model = None  # type: Optional[str]
+        # Pending commands, drained by create_bgw_args on the next poll.
+        # Nothing awaits on it, so a plain deque is enough; poll results
+        # for all BGWs go through the single queue of schedule_queries.
+        self.queue = deque()  # type: deque
+
+        # Parsed values keyed by property name, each stored together with
+        # the show_* text it was parsed from (see cached_on).
+        self._cache = {}  # type: Dict[str, Tuple[str, Any]]
 
         self._packet_capture = ""
         self._pcap_upload = ""
-
-        self._port1 = None  # type: Optional[str]
-        self._port1_status = None  # type: Optional[str]
-        self._port1_neg = None  # type: Optional[str]
-        self._port1_duplex = None  # type: Optional[str]
-        self._port1_speed = None  # type: Optional[str]
-
-        self._port2 = None  # type: Optional[str]
-        self._port2_status = None  # type: Optional[str]
-        self._port2_neg = None  # type: Optional[str]
-        self._port2_duplex = None  # type: Optional[str]
-        self._port2_speed = None  # type: Optional[str]
-
-        self._port_redu = None  # type: Optional[str]
-        self._psu1 = None  # type: Optional[str]
-        self._psu2 = None  # type: Optional[str]
-
-        self._ram_util = None  # type: Optional[str]
-        self._rtp_stat_service = None  # type: Optional[str]
-        self._serial = None  # type: Optional[str]
-        self._slamon_service = None  # type: Optional[str]
-        self._sla_server = None  # type: Optional[str]
-        self._snmp = None  # type: Optional[str]
-        self._snmp_trap = None  # type: Optional[str]
-        self._temp = None  # type: Optional[str]
-        self._uptime = None  # type: Optional[str]
-        self._upload_status = None  # type: Optional[str]
         self._has_filter_501 = None # type: Optional[bool]
 
         # Keep kwargs accepted for forward compatibility
@@ -161,41 +194,34 @@ class BGW(object):
 
     # ------------------- RTP / capture -------------------
 
-    @property
+    @cached_on("show_rtp_stat_summary")
     def active_sessions(self) -> str:
         """Active Session value from RTP-Stat summary, or "NA"."""
         if not self.show_rtp_stat_summary:
             return "NA"
-        m = re.search(r"nal\s+\S+\s+(\S+)", self.show_rtp_stat_summary)
+        m = reActiveSessions.search(self.show_rtp_stat_summary)
         return m.group(1) if m else ""
 
-    @property
+    @cached_on("show_announcements_files")
     def announcements(self) -> str:
         """Count of announcement files, as a string, or 'NA'."""
-        if self._announcements is not None:
-            return self._announcements
         if not self.show_announcements_files:
             return "NA"
-        m = re.findall(r"announcement file", self.show_announcements_files)
-        self._announcements = str(len(m))
-        return self._announcements
+        return str(self.show_announcements_files.count("announcement file"))
 
-    @property
+    @cached_on("show_capture")
     def capture_service(self) -> str:
         """Capture service admin state and buffer size, 'enabled ( 1024)'."""
-        if self._capture_service is not None:
-            return self._capture_service
         if not self.show_capture:
             return "NA"
 
-        m = re.search(r"Capture service is (\w+)", self.show_capture)
+        m = reCaptureService.search(self.show_capture)
         state = m.group(1) if m else ""
 
-        m = re.search(r"Current buffer size is (\d+) KB", self.show_capture)
+        m = reCaptureBufferSize.search(self.show_capture)
         size = m.group(1) if m else ""
 
-        self._capture_service = "{} ({:>5})".format(state, size)
-        return self._capture_service
+        return "{} ({:>5})".format(state, size)
 
     @property
     def has_filter_501(self) -> bool:
@@ -206,7 +232,7 @@ class BGW(object):
         has_filter_501 = "Capture list 501" in self.show_capture
         return has_filter_501
 
-    @property
+    @cached_on("show_capture")
     def capture_status(self) -> str:
         """Capture runtime status derived from ``show_capture``."""
         if not self.show_capture or "try again" in self.show_capture:
@@ -215,10 +241,10 @@ class BGW(object):
         if "disabled" in self.capture_service:
             return "inactive"
 
-        m = re.search(r"Capture service is \w+ and (\w+)", self.show_capture)
+        m = reCaptureStatus.search(self.show_capture)
         status = m.group(1) if m else ""
 
-        m = re.search(r"buffer occupancy: (\d+)\.", self.show_capture)
+        m = reCaptureOccupancy.search(self.show_capture)
         occ = "({:>2}%)".format(m.group(1)) if m else ""
 
         if (
@@ -305,189 +331,141 @@ class BGW(object):
 
     # ------------------- HW / system -------------------
 
-    @property
+    @cached_on("show_system")
     def chassis_hw(self) -> str:
         """Chassis HW vintage+suffix (from ``show_system``), or "NA"."""
-        if self._chassis_hw is not None:
-            return self._chassis_hw
         if not self.show_system:
             return "NA"
 
-        m = re.search(r"HW Vintage\s+:\s+(\S+)", self.show_system)
-        vintage = m.group(1) if m else ""
+        vintage, suffix = self._hw_vintage_suffix()
+        return "{}{}".format(vintage or "", suffix or "")
 
-        m = re.search(r"HW Suffix\s+:\s+(\S+)", self.show_system)
-        suffix = m.group(1) if m else ""
-
-        self._chassis_hw = "{}{}".format(vintage, suffix)
-        return self._chassis_hw
-
-    @property
+    @cached_on("show_system")
     def comp_flash(self) -> str:
         """Compact flash size/string if installed, empty string if not, or "NA"."""
-        if self._comp_flash is not None:
-            return self._comp_flash
         if not self.show_system:
             return "NA"
 
-        m = re.search(r"Flash Memory\s+: (\d+)\S+ ([MG])B", self.show_system)
+        m = reFlashMemory.search(self.show_system)
         size, unit = m.group(1) if m else "", m.group(2) if m else ""
-        result = "{}{}B".format(size, unit) if size and unit else ""
-        self._comp_flash = result
-        return result
+        return "{}{}B".format(size, unit) if size and unit else ""
 
-    @property
+    @cached_on("show_utilization")
     def cpu_util(self) -> str:
         """Last 60s CPU utilization percent (from ``show_utilization``), or "NA"."""
         if not self.show_utilization:
             return "NA"
-        m = re.search(r"10\s+\d+%\s+(\d+)%", self.show_utilization)
-        self._cpu_util = "{}%".format(m.group(1)) if m else ""
-        return self._cpu_util
+        m = reCPUUtil.search(self.show_utilization)
+        return "{}%".format(m.group(1)) if m else ""
 
-    @property
+    @cached_on("show_system")
     def dsp(self) -> str:
         """Total DSP count (from ``show_system``), or "NA"."""
-        if self._dsp is not None:
-            return self._dsp
         if not self.show_system:
             return "NA"
-        m = re.findall(r"Media Socket .*?: M?P?(\d+) ", self.show_system)
-        self._dsp = str(sum(int(x) for x in m)) if m else ""
-        return self._dsp
+        m = reMediaSocket.findall(self.show_system)
+        return str(sum(int(x) for x in m)) if m else ""
 
-    @property
+    @cached_on("show_faults")
     def faults(self) -> str:
         """Count of faults from ``show_faults``, or "NA"."""
-        if self._faults is not None:
-            return self._faults
         if not self.show_faults:
             return "NA"
 
         if "No Fault Messages" in self.show_faults:
-            self._faults = "0"
-        else:
-            m = re.findall(r"\s+\+ (\S+)", self.show_faults)
-            self._faults = str(len(m))
-        return self._faults
+            return "0"
+        m = reFault.findall(self.show_faults)
+        return str(len(m))
 
-    @property
+    @cached_on("show_system")
     def fw(self) -> str:
         """Firmware vintage from ``show_system`` (FW Vintage), or "NA"."""
-        if self._fw is not None:
-            return self._fw
         if not self.show_system:
             return "NA"
-        m = re.search(r"FW Vintage\s+:\s+(\S+)", self.show_system)
-        result = m.group(1) if m else ""
-        self._fw = result
-        return result
+        m = reFWVintage.search(self.show_system)
+        return m.group(1) if m else ""
 
-    @property
+    @cached_on("show_system")
     def hw(self) -> str:
         """Hardware vintage+suffix from ``show_system``, or "NA"."""
-        if self._hw is not None:
-            return self._hw
         if not self.show_system:
             return "NA"
 
-        m = re.search(r"HW Vintage\s+:\s+(\S+)", self.show_system)
-        hw_vintage = m.group(1) if m else "?"
-
-        m = re.search(r"HW Suffix\s+:\s+(\S+)", self.show_system)
-        hw_suffix = m.group(1) if m else "?"
-
-        self._hw = "{}{}".format(hw_vintage, hw_suffix)
-        return self._hw
+        vintage, suffix = self._hw_vintage_suffix()
+        return "{}{}".format(vintage or "?", suffix or "?")
 
     @property
     def last_seen_time(self) -> str:
         """Last seen time formatted HH:MM:SS (24h), or empty string."""
-        if self.last_seen_dt:
-            return self.last_seen_dt.strftime("%H:%M:%S")
+        dt = self.last_seen_dt
+        if dt:
+            # Rendered for every BGW on each redraw, plain int formatting
+            # avoids strftime's locale-aware format parsing.
+            return "{:02d}:{:02d}:{:02d}".format(dt.hour, dt.minute, dt.second)
         return ""
 
-    @property
+    @cached_on("show_lldp_config")
     def lldp(self) -> str:
         """LLDP state ('enabled'/'disabled') from ``show_lldp_config``, or "NA"."""
-        if self._lldp is not None:
-            return self._lldp
         if not self.show_lldp_config:
             return "NA"
 
-        self._lldp = (
+        return (
             "disabled"
             if "Application status: disable" in self.show_lldp_config
             else "enabled"
         )
-        return self._lldp
 
-    @property
+    @cached_on("show_system")
     def location(self) -> str:
         """System Location from ``show_system``, or "NA"."""
-        if self._location is not None:
-            return self._location
         if not self.show_system:
             return "NA"
 
         # NOTE: your original regex had an extra space before \s+.
-        m = re.search(r"System Location\s+:\s*(\S+)", self.show_system)
-        result = m.group(1) if m else ""
-        self._location = result
-        return result
+        m = reLocation.search(self.show_system)
+        return m.group(1) if m else ""
 
-    @property
+    @cached_on("show_system")
     def mac(self) -> str:
         """LAN MAC without colons (from ``show_system``), or "NA"."""
-        if self._mac is not None:
-            return self._mac
         if not self.show_system:
             return "NA"
-        m = re.search(r"LAN MAC Address\s+:\s+(\S+)", self.show_system)
-        result = m.group(1).replace(":", "") if m else ""
-        self._mac = result
-        return result
+        m = reLANMAC.search(self.show_system)
+        return m.group(1).replace(":", "") if m else ""
 
-    @property
+    @cached_on("show_system")
     def mainboard_hw(self) -> str:
         """Mainboard HW vintage+suffix from ``show_system``, or "NA"."""
-        if self._mainboard_hw is not None:
-            return self._mainboard_hw
         if not self.show_system:
             return "NA"
 
-        m = re.search(r"Mainboard HW Vintage\s+:\s+(\S+)", self.show_system)
+        m = reMainboardHWVintage.search(self.show_system)
         vintage = m.group(1) if m else "N"
 
-        m = re.search(r"Mainboard HW Suffix\s+:\s+(\S+)", self.show_system)
+        m = reMainboardHWSuffix.search(self.show_system)
         suffix = m.group(1) if m else "A"
 
-        self._mainboard_hw = "{}{}".format(vintage, suffix)
-        return self._mainboard_hw
+        return "{}{}".format(vintage, suffix)
 
-    @property
+    @cached_on("show_system")
     def memory(self) -> str:
         """Total memory as '<n>MB' or model-specific raw string, or "NA"."""
-        if self._memory is not None:
-            return self._memory
         if not self.show_system:
             return "NA"
 
         if self.model and self.model.lower().startswith("g430"):
-            m = re.search(r"RAM Memory\s+:\s+(\S+)", self.show_system)
-            result = m.group(1) if m else ""
-            self._memory = result
-            return result
+            m = reRAMMemory.search(self.show_system)
+            return m.group(1) if m else ""
 
-        m = re.findall(r"Memory #\d+\s+:\s+(\S+)", self.show_system)
-        self._memory = "{}MB".format(
+        m = reMemory.findall(self.show_system)
+        return "{}MB".format(
             sum(self._to_mbyte(x) for x in m)
         ) if m else ""
-        return self._memory
 
     # ------------------- Media modules -------------------
 
-    @property
+    @cached_on("show_mg_list")
     def mm_groupdict(self) -> Dict[str, Dict[str, str]]:
         """Parsed media-module table keyed by slot (e.g. 'v1', 'v2').
 
@@ -495,11 +473,8 @@ class BGW(object):
             Dict mapping slot -> parsed fields: slot/type/code/suffix/hw_vint/fw_vint.
             Returns {} if ``show_mg_list`` is missing.
         """
-        if self._mm_groupdict is not None:
-            return self._mm_groupdict
         if not self.show_mg_list:
-            self._mm_groupdict = {}
-            return self._mm_groupdict
+            return {}
 
         groupdict = {}  # type: Dict[str, Dict[str, str]]
 
@@ -507,110 +482,63 @@ class BGW(object):
             if not (text.startswith("v") and "Not Installed" not in text):
                 continue
 
-            m = re.search(
-                r".*?(?P<slot>\S+)"
-                r".*?(?P<type>\S+)"
-                r".*?(?P<code>\S+)"
-                r".*?(?P<suffix>\S+)"
-                r".*?(?P<hw_vint>\S+)"
-                r".*?(?P<fw_vint>\S+)",
-                text,
-            )
+            m = reMediaModule.search(text)
             if m:
                 groupdict[m.group("slot")] = m.groupdict()
 
-        self._mm_groupdict = groupdict
-        return self._mm_groupdict
+        return groupdict
 
     def _mm_v(self, slot: int) -> str:
-        """Return module code+suffix for slot (e.g. 1..8)."""
-        code = self.mm_groupdict.get("v{}".format(slot), {}).get("code", "")
+        """Return module code+suffix for slot (e.g. 1..8), or "NA"."""
+        if not self.show_mg_list:
+            return "NA"
+        mm = self.mm_groupdict.get("v{}".format(slot), {})
+        code = mm.get("code", "")
         if code == "ICC":
-            code = self.mm_groupdict.get("v{}".format(slot), {}).get("type", "")
-        suffix = self.mm_groupdict.get("v{}".format(slot), {}).get("suffix", "")
-        return "{}{}".format(code, suffix)
+            code = mm.get("type", "")
+        return "{}{}".format(code, mm.get("suffix", ""))
 
-    @property
+    @cached_on("show_mg_list")
     def mm_v1(self) -> str:
         """Media module code+suffix for slot 1, or "NA"."""
-        if self._mm_v1 is not None:
-            return self._mm_v1
-        if not self.show_mg_list:
-            return "NA"
-        self._mm_v1 = self._mm_v(1)
-        return self._mm_v1
+        return self._mm_v(1)
 
-    @property
+    @cached_on("show_mg_list")
     def mm_v2(self) -> str:
         """Media module code+suffix for slot 2, or "NA"."""
-        if self._mm_v2 is not None:
-            return self._mm_v2
-        if not self.show_mg_list:
-            return "NA"
-        self._mm_v2 = self._mm_v(2)
-        return self._mm_v2
+        return self._mm_v(2)
 
-    @property
+    @cached_on("show_mg_list")
     def mm_v3(self) -> str:
         """Media module code+suffix for slot 3, or "NA"."""
-        if self._mm_v3 is not None:
-            return self._mm_v3
-        if not self.show_mg_list:
-            return "NA"
-        self._mm_v3 = self._mm_v(3)
-        return self._mm_v3
+        return self._mm_v(3)
 
-    @property
+    @cached_on("show_mg_list")
     def mm_v4(self) -> str:
         """Media module code+suffix for slot 4, or "NA"."""
-        if self._mm_v4 is not None:
-            return self._mm_v4
-        if not self.show_mg_list:
-            return "NA"
-        self._mm_v4 = self._mm_v(4)
-        return self._mm_v4
+        return self._mm_v(4)
 
-    @property
+    @cached_on("show_mg_list")
     def mm_v5(self) -> str:
         """Media module code+suffix for slot 5, or "NA"."""
-        if self._mm_v5 is not None:
-            return self._mm_v5
-        if not self.show_mg_list:
-            return "NA"
-        self._mm_v5 = self._mm_v(5)
-        return self._mm_v5
+        return self._mm_v(5)
 
-    @property
+    @cached_on("show_mg_list")
     def mm_v6(self) -> str:
         """Media module code+suffix for slot 6, or "NA"."""
-        if self._mm_v6 is not None:
-            return self._mm_v6
-        if not self.show_mg_list:
-            return "NA"
-        self._mm_v6 = self._mm_v(6)
-        return self._mm_v6
+        return self._mm_v(6)
 
-    @property
+    @cached_on("show_mg_list")
     def mm_v7(self) -> str:
         """Media module code+suffix for slot 7, or "NA"."""
-        if self._mm_v7 is not None:
-            return self._mm_v7
-        if not self.show_mg_list:
-            return "NA"
-        self._mm_v7 = self._mm_v(7)
-        return self._mm_v7
+        return self._mm_v(7)
 
-    @property
+    @cached_on("show_mg_list")
     def mm_v8(self) -> str:
         """Media module code+suffix for slot 8, or "NA"."""
-        if self._mm_v8 is not None:
-            return self._mm_v8
-        if not self.show_mg_list:
-            return "NA"
-        self._mm_v8 = self._mm_v(8)
-        return self._mm_v8
+        return self._mm_v(8)
 
-    @property
+    @cached_on("show_mg_list")
     def mm_v10(self) -> str:
         """Slot 10 module hw_vintage+suffix, or "NA".
 
@@ -619,236 +547,162 @@ class BGW(object):
         which inverted the condition and made it always return "NA" when
         mg list exists. This is corrected below.
         """
-        if self._mm_v10 is not None:
-            return self._mm_v10
         if not self.show_mg_list:
             return "NA"
 
         suffix = self.mm_groupdict.get("v10", {}).get("suffix", "")
         hw_vint = self.mm_groupdict.get("v10", {}).get("hw_vint", "")
-        self._mm_v10 = "{}{}".format(hw_vint, suffix)
-        return self._mm_v10
+        return "{}{}".format(hw_vint, suffix)
 
-    @property
+    @cached_on("show_system")
     def model(self) -> str:
         """Gateway model from ``show_system``, or "NA"."""
-        if self._model is not None:
-            return self._model
         if not self.show_system:
             return "NA"
-        m = re.search(r"Model\s+:\s+(\S+)", self.show_system)
-        result = m.group(1) if m else ""
-        self._model = result
-        return result
+        m = reModel.search(self.show_system)
+        return m.group(1) if m else ""
 
     # ------------------- Ports -------------------
 
-    @property
+    @cached_on("show_port")
     def port1(self) -> str:
         """LAN port1 identifier (e.g. '0/1'), or 'NA'."""
-        if self._port1 is not None:
-            return self._port1
         pdict = self._port_groupdict(0)
-        self._port1 = pdict.get("port", "") if pdict else "NA"
-        return self._port1
+        return pdict.get("port", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_port")
     def port1_status(self) -> str:
         """LAN port1 link status, or 'NA'."""
-        if self._port1_status is not None:
-            return self._port1_status
         pdict = self._port_groupdict(0)
-        self._port1_status = pdict.get("status", "") if pdict else "NA"
-        return self._port1_status
+        return pdict.get("status", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_port")
     def port1_neg(self) -> str:
         """LAN port1 autoneg status, or 'NA'."""
-        if self._port1_neg is not None:
-            return self._port1_neg
         pdict = self._port_groupdict(0)
-        self._port1_neg = pdict.get("neg", "") if pdict else "NA"
-        return self._port1_neg
+        return pdict.get("neg", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_port")
     def port1_duplex(self) -> str:
         """LAN port1 duplex setting, or 'NA'."""
-        if self._port1_duplex is not None:
-            return self._port1_duplex
         pdict = self._port_groupdict(0)
-        self._port1_duplex = pdict.get("duplex", "") if pdict else "NA"
-        return self._port1_duplex
+        return pdict.get("duplex", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_port")
     def port1_speed(self) -> str:
         """LAN port1 speed, or 'NA'."""
-        if self._port1_speed is not None:
-            return self._port1_speed
         pdict = self._port_groupdict(0)
-        self._port1_speed = pdict.get("speed", "") if pdict else "NA"
-        return self._port1_speed
+        return pdict.get("speed", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_port")
     def port2(self) -> str:
         """LAN port2 identifier, or 'NA'."""
-        if self._port2 is not None:
-            return self._port2
         pdict = self._port_groupdict(1)
-        self._port2 = pdict.get("port", "") if pdict else "NA"
-        return self._port2
+        return pdict.get("port", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_port")
     def port2_status(self) -> str:
         """LAN port2 link status, or 'NA'."""
-        if self._port2_status is not None:
-            return self._port2_status
         pdict = self._port_groupdict(1)
-        self._port2_status = pdict.get("status", "") if pdict else "NA"
-        return self._port2_status
+        return pdict.get("status", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_port")
     def port2_neg(self) -> str:
         """LAN port2 autoneg status, or 'NA'."""
-        if self._port2_neg is not None:
-            return self._port2_neg
         pdict = self._port_groupdict(1)
-        self._port2_neg = pdict.get("neg", "") if pdict else "NA"
-        return self._port2_neg
+        return pdict.get("neg", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_port")
     def port2_duplex(self) -> str:
         """LAN port2 duplex setting, or 'NA'."""
-        if self._port2_duplex is not None:
-            return self._port2_duplex
         pdict = self._port_groupdict(1)
-        self._port2_duplex = pdict.get("duplex", "") if pdict else "NA"
-        return self._port2_duplex
+        return pdict.get("duplex", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_port")
     def port2_speed(self) -> str:
         """LAN port2 speed, or 'NA'."""
-        if self._port2_speed is not None:
-            return self._port2_speed
         pdict = self._port_groupdict(1)
-        self._port2_speed = pdict.get("speed", "") if pdict else "NA"
-        return self._port2_speed
+        return pdict.get("speed", "") if pdict else "NA"
 
-    @property
+    @cached_on("show_running_config")
     def port_redu(self) -> str:
         """Port redundancy pair 'x/y' from ``show_running_config``, or "NA"."""
-        if self._port_redu is not None:
-            return self._port_redu
         if not self.show_running_config:
             return "NA"
-        m = re.search(
-            r"port redundancy \d+/(\d+) \d+/(\d+)",
-            self.show_running_config,
-        )
-        self._port_redu = "{}/{}".format(m.group(1), m.group(2)) if m else ""
-        return self._port_redu
+        m = rePortRedundancy.search(self.show_running_config)
+        return "{}/{}".format(m.group(1), m.group(2)) if m else ""
 
     # ------------------- PSU / utilization / services -------------------
 
-    @property
+    @cached_on("show_system")
     def psu1(self) -> str:
         """PSU #1 wattage (or model-specific main PSU value), or "NA"."""
-        if self._psu1 is not None:
-            return self._psu1
         if not self.show_system:
             return "NA"
 
         if self.model and self.model.lower().startswith("g430"):
-            m = re.search(r"Main PSU\s+:\s+(\S+)", self.show_system)
-            result = m.group(1) if m else ""
-            self._psu1 = result
-            return result
+            m = reMainPSU.search(self.show_system)
+            return m.group(1) if m else ""
 
-        m = re.search(r"PSU #1\s+:\s+\S+ (\S+)", self.show_system)
-        result = m.group(1) if m and "W" in m.group(1) else ""
-        self._psu1 = result
-        return result
+        m = rePSU1.search(self.show_system)
+        return m.group(1) if m and "W" in m.group(1) else ""
 
-    @property
+    @cached_on("show_system")
     def psu2(self) -> str:
         """PSU #2 wattage, or "NA"."""
-        if self._psu2 is not None:
-            return self._psu2
         if not self.show_system:
             return "NA"
-        m = re.search(r"PSU #2\s+:\s+\S+ (\S+)", self.show_system)
-        result = m.group(1) if m and "W" in m.group(1) else ""
-        self._psu2 = result
-        return result
+        m = rePSU2.search(self.show_system)
+        return m.group(1) if m and "W" in m.group(1) else ""
 
-    @property
+    @cached_on("show_utilization")
     def ram_util(self) -> str:
         """RAM utilization percent (from ``show_utilization``), or "NA"."""
         if not self.show_utilization:
             return "NA"
-        m = re.search(r"10\s+\S+\s+\S+\s+(\d+)%", self.show_utilization)
-        self._ram_util = "{}%".format(m.group(1)) if m else ""
-        return self._ram_util
+        m = reRAMUtil.search(self.show_utilization)
+        return "{}%".format(m.group(1)) if m else ""
 
-    @property
+    @cached_on("show_running_config")
     def rtp_stat_service(self) -> str:
         """RTP-Stat service admin status ('enabled'/'disabled'), or "NA"."""
-        if self._rtp_stat_service is not None:
-            return self._rtp_stat_service
         if not self.show_running_config:
             return "NA"
-        self._rtp_stat_service = (
+        return (
             "enabled" if "rtp-stat-service" in self.show_running_config else "disabled"
         )
-        return self._rtp_stat_service
 
     @rtp_stat_service.setter
     def rtp_stat_service(self, _: str) -> None:
         pass
 
-    @property
+    @cached_on("show_system")
     def serial(self) -> str:
         """Serial number from ``show_system``, or "NA"."""
-        if self._serial is not None:
-            return self._serial
         if not self.show_system:
             return "NA"
-        m = re.search(r"Serial No\s+:\s+(\S+)", self.show_system)
-        result = m.group(1) if m else ""
-        self._serial = result
-        return result
+        m = reSerial.search(self.show_system)
+        return m.group(1) if m else ""
 
-    @property
+    @cached_on("show_sla_monitor")
     def slamon_service(self) -> str:
         """SLA Monitor admin state from ``show_sla_monitor``, or "NA"."""
-        if self._slamon_service is not None:
-            return self._slamon_service
         if not self.show_sla_monitor:
             return "NA"
-        m = re.search(r"SLA Monitor:\s+(\S+)", self.show_sla_monitor)
-        result = m.group(1).lower() if m else ""
-        self._slamon_service = result
-        return result
+        m = reSLAMonitor.search(self.show_sla_monitor)
+        return m.group(1).lower() if m else ""
 
-    @property
+    @cached_on("show_sla_monitor")
     def sla_server(self) -> str:
         """Registered SLA monitor server IP, or "NA"."""
-        if self._sla_server is not None:
-            return self._sla_server
         if not self.show_sla_monitor:
             return "NA"
-        m = re.search(
-            r"Registered Server IP Address:\s+(\S+)",
-            self.show_sla_monitor,
-        )
-        result = m.group(1) if m else ""
-        self._sla_server = result
-        return result
+        m = reSLAServer.search(self.show_sla_monitor)
+        return m.group(1) if m else ""
 
-    @property
+    @cached_on("show_running_config")
     def snmp(self) -> str:
         """Configured SNMP versions: 'v2', 'v3', 'v2&3', '' or 'NA'."""
-        if self._snmp is not None:
-            return self._snmp
         if not self.show_running_config:
             return "NA"
 
@@ -858,52 +712,42 @@ class BGW(object):
         if "encrypted-snmp-server user" in self.show_running_config:
             versions.append("3")
 
-        self._snmp = "v" + "&".join(versions) if versions else ""
-        return self._snmp
+        return "v" + "&".join(versions) if versions else ""
 
-    @property
+    @cached_on("show_running_config")
     def snmp_trap(self) -> str:
         """SNMP trap configuration ('enabled'/'disabled') or 'NA'."""
-        if self._snmp_trap is not None:
-            return self._snmp_trap
         if not self.show_running_config:
             return "NA"
-        m = re.search(r"snmp-server host (\S+) trap", self.show_running_config)
-        self._snmp_trap = "enabled" if m else "disabled"
-        return self._snmp_trap
+        m = reSNMPTrap.search(self.show_running_config)
+        return "enabled" if m else "disabled"
 
-    @property
+    @cached_on("show_temp")
     def temp(self) -> str:
         """Ambient temperature as '<cur>/<max>' from ``show_temp``, or "NA"."""
-        if self._temp is not None:
-            return self._temp
         if not self.show_temp:
             return "NA"
-        m = re.search(r"Temperature\s+:\s+(\S+) \((\S+)\)", self.show_temp)
-        self._temp = "{}/{}".format(m.group(1), m.group(2)) if m else ""
-        return self._temp
+        m = reTemperature.search(self.show_temp)
+        return "{}/{}".format(m.group(1), m.group(2)) if m else ""
 
-    @property
+    @cached_on("show_rtp_stat_summary")
     def total_sessions(self) -> str:
         """Total Session value from RTP-Stat summary, or "NA"."""
         if not self.show_rtp_stat_summary:
             return "NA"
-        m = re.search(r"nal\s+\S+\s+\S+\s+(\S+)", self.show_rtp_stat_summary)
+        m = reTotalSessions.search(self.show_rtp_stat_summary)
         return m.group(1) if m else ""
 
-    @property
+    @cached_on("show_upload_status_10")
     def upload_status(self) -> str:
         """Derived upload status from ``show_upload_status_10``."""
         if not self.show_upload_status_10:
             return ""
 
-        m = re.search(r"Running state\s+:\s+(\S+)", self.show_upload_status_10)
+        m = reUploadState.search(self.show_upload_status_10)
         status = m.group(1).lower() if m else ""
 
-        m = re.search(
-            r"Failure display\s+:\s+(\S+)",
-            self.show_upload_status_10,
-        )
+        m = reUploadFailure.search(self.show_upload_status_10)
         failure = m.group(1).lower() if m else ""
 
         if status == "executing":
@@ -912,33 +756,28 @@ class BGW(object):
             return "failed"
         return status
 
-    @property
+    @cached_on("show_system")
     def uptime(self) -> str:
         """Gateway uptime as a compact string (e.g. '3d12h4m55s'), or "NA"."""
-        if self._uptime is not None:
-            return self._uptime
         if not self.show_system:
             return "NA"
 
-        m = re.search(r"Uptime \(\S+\)\s+:\s+(\S+)", self.show_system)
+        m = reUptime.search(self.show_system)
         if m:
-            result = (
+            return (
                 m.group(1)
                 .replace(",", "d")
                 .replace(":", "h", 1)
                 .replace(":", "m")
                 + "s"
             )
-        else:
-            result = ""
-        self._uptime = result
-        return result 
+        return ""
 
-    @property
+    @cached_on("show_voip_dsp")
     def inuse_dsp(self) -> str:
         """Total in-use DSP count from ``show_voip_dsp``."""
         inuse = 0
-        dsps = re.findall(r"In Use\s+:\s+(\d+)", self.show_voip_dsp or "")
+        dsps = reDSPInUse.findall(self.show_voip_dsp or "")
         for dsp in dsps:
             try:
                 inuse += int(dsp)
@@ -1009,15 +848,53 @@ class BGW(object):
                 if cmd == "show upload status 10":
                     self.pcap_upload = self.upload_status
                     if self.upload_status == "executing":
-                        try:
-                            self.queue.put_nowait("show upload status 10")
-                        except Exception:
-                            pass
+                        self.queue.append("show upload status 10")
 
         _ = kwargs
 
+    def _cached(
+        self,
+        name: str,
+        source: str,
+        parse: Callable[["BGW"], Any],
+    ) -> Any:
+        """Return ``parse(self)`` memoized on the identity of ``source``.
+
+        Args:
+            name: Key of the value in ``_cache``.
+            source: Name of the ``show_*`` attribute the value derives from.
+            parse: Function computing the value from the BGW.
+
+        Returns:
+            The cached value while ``source`` is unchanged, else a fresh one.
+        """
+        text = getattr(self, source)
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] is text:
+            return cached[1]
+        value = parse(self)
+        if type(value) is str:
+            # Status strings repeat across the fleet, share one copy each.
+            value = sys.intern(value)
+        self._cache[name] = (text, value)
+        return value
+
+    def _hw_vintage_suffix(self) -> Tuple[Optional[str], Optional[str]]:
+        """HW vintage and suffix from ``show_system``, shared by hw/chassis_hw."""
+        def parse(bgw: "BGW") -> Tuple[Optional[str], Optional[str]]:
+            m = reHWVintage.search(bgw.show_system)
+            vintage = m.group(1) if m else None
+            m = reHWSuffix.search(bgw.show_system)
+            suffix = m.group(1) if m else None
+            return vintage, suffix
+        return self._cached("_hw_vintage_suffix", "show_system", parse)
+
     def _port_groupdict(self, idx: int) -> Dict[str, str]:
-        """Extract port details from ``show_port``.
+        """Return the port details of a LAN port.
+
+        Both ports are parsed in one pass over ``show_port`` by
+        :meth:`_port_groupdicts` and kept in ``_cache`` until ``show_port``
+        is replaced, so the ten port properties share a single parse.
 
         Args:
             idx: 0 for port1, 1 for port2.
@@ -1026,29 +903,21 @@ class BGW(object):
             Dict with keys: port/name/status/vlan/level/neg/duplex/speed.
             Returns {} if parsing fails or ``show_port`` missing.
         """
-        if not self.show_port:
-            return {}
-
-        matches = re.findall(r"(.*Avaya )", self.show_port)
-        if not matches:
-            return {}
+        pdicts = self._cached(
+            "_port_groupdicts", "show_port", BGW._port_groupdicts
+        )
+        return pdicts[idx] if idx < len(pdicts) else {}
 
-        line = matches[idx] if idx < len(matches) else ""
-        if not line:
-            return {}
+    def _port_groupdicts(self) -> List[Dict[str, str]]:
+        """Extract the details of every 'Avaya' port line of ``show_port``."""
+        if not self.show_port:
+            return []
 
-        m = re.search(
-            r".*?(?P<port>\d+/\d+)"
-            r".*?(?P<name>.*)"
-            r".*?(?P<status>(connected|no link|disabled))"
-            r".*?(?P<vlan>\d+)"
-            r".*?(?P<level>\d+)"
-            r".*?(?P<neg>\S+)"
-            r".*?(?P<duplex>\S+)"
-            r".*?(?P<speed>\S+)",
-            line,
-        )
-        return m.groupdict() if m else {}
+        pdicts = []  # type: List[Dict[str, str]]
+        for line in rePortLine.findall(self.show_port):
+            m = rePortDetails.search(line) if line else None
+            pdicts.append(m.groupdict() if m else {})
+        return pdicts
 
     def properties_asdict(self) -> Dict[str, Any]:
         """Return all @property values as a dict."""
@@ -1067,7 +936,7 @@ class BGW(object):
     @staticmethod
     def _to_mbyte(mem_str: str) -> int:
         """Convert a memory token like '256MB' or '1GB' to MB (int)."""
-        m = re.search(r"(\d+)([MG]B)", mem_str or "")
+        m = reMemToken.search(mem_str or "")
         if not m:
             return 0
         num = int(m.group(1))
@@ -1084,5 +953,6 @@ class BGW(object):
 ############################## END BGW ########################################
 
 if __name__ == "__main__":
-    bgw = BGW(**{'lan_ip': '10.10.48.58', 'proto': 'ptls', 'polling_secs': 10, 'gw_name': 'AvayaG450A', 'gw_number': '001', 'polls': 1, 'avg_poll_secs': 10, 'active_session_ids': set(), 'last_seen': datetime(2025, 12, 16, 14, 33, 39), 'last_session_id': '', 'show_announcements_files': '\r\n ID      File               Description    Size (Bytes)      Date\r\n---- ------------------ ------------------ ------------ -------------------\r\n101   moh.wav            announcement file      239798    2022-08-23,8:45:26  \r\n102   emergency.wav      announcement file       26618    2023-03-24,11:36:10 \r\n103   public_announceme  announcement file      201914    2024-10-24,7:37:52  \r\n104   mohtest.wav        announcement file     9648106    2025-07-15,14:50:16 \r\n\r\nNv-Ram:\r\nTotal bytes used             : 10119680  \r\nTotal bytes free             : 12672000  \r\nTotal bytes capacity (fixed) : 22791680', 'show_capture': '\r\n\r\nCapture service is enabled and active\r\nCapture start time 09/12/2025-09:25:13\r\nCapture stop time not-stopped\r\nCurrent buffer size is 1024 KB\r\nBuffer mode is non-cyclic\r\nMaximum number of bytes captured from each frame: 4096\r\nCapture list 501 on all interfaces\r\nCapture IPSec decrypted\r\nNumber of captured frames in file: 604 (out of 145200 total captured frames)\r\nMemory buffer occupancy: 4.62% (including overheads)', 'show_faults': '\r\n\r\nCURRENTLY ACTIVE FAULTS\r\n--------------------------------------------------------------------------\r\n\r\n-- Media Module Faults --\r\n\t+ Insertion failure, mmid = v5, 11/24-07:37:04.00\r\n\r\nCurrent Alarm Indications, ALM LED is off\r\n--------------------------------------------------------------------------\r\nNone', 'show_lldp_config': '\r\n\r\nLldp Configuration \r\n-------------------\r\nApplication status: disable \r\nTx interval: 30 seconds\r\nTx hold multiplier: 4 seconds\r\nTx delay: 2 seconds\r\nReinit delay: 2 seconds', 'show_mg_list': '\r\nSLOT   TYPE         CODE        SUFFIX  HW VINTAGE  FW VINTAGE \r\n----   --------     ----------  ------  ----------  -----------\r\nv1     -- Not Installed --\r\nv2     -- Not Installed --\r\nv3     E1T1         MM710       B       16          52\r\nv4     -- Not Installed --\r\nv5     -- Initializing --\r\nv6     Analog       MM714       B       23          94\r\nv7     -- Not Installed --\r\nv8     -- Not Installed --\r\nv10    Mainboard    G450        B       2           42.36.0(A)', 'show_port': '\r\nPort   Name             Status    Vlan Level  Neg     Dup. Spd. Type\r\n------ ---------------- --------- ---- ------ ------- ---- ---- ----------------\r\n10/5   NO NAME          connected 1     0     enable  full 1G   Avaya Inc., G450 Media Gateway 10/100/1000BaseTx Port 10/5\r\n\r\n10/6   NO NAME          no link   1     0     enable  full 1G   Avaya Inc., G450 Media Gateway 10/100/1000BaseTx Port 10/6', 'show_rtp_stat_summary': '', 'show_running_config': '\r\n\r\n! version 42.36.0\r\nConfig info release 42.36.0 time "13:33:51 16 DEC 2025 " serial_number 10IS41452851\r\n !\r\nencrypted-username +ikJzwEP/t+XkAlH3l+zsw== password G6uSyomIZMSDb0NnT4RwvSb4IrSGUtuQ9ypCGFikR4w= access-type fe/kaDE5GWBC9Nfj6bNkgA==\r\n!\r\nencrypted-username mJ6sF5BOZeIUWsyCb3C1bw== password 8tMk4PMmywAU0cVXzSERF/aaj9WF0EAq4dB4c0qOLbU= access-type gf0PKwZMZRJ4zRba06ZC3w==\r\nhostname "AvayaG450A"\r\nset system location "Calgary" \r\nno ip telnet \r\nip tftp-server file-system-size 2288\r\nset port mirror source-port 10/5 mirror-port 10/6 sampling always direction both\r\n!\r\nip capture-list 501\r\n name "udp"\r\n!\r\n ip-rule 1\r\n  ip-protocol udp\r\n exit\r\n ip-rule default\r\n  composite-operation "No-Capture"\r\n exit\r\n!\r\nexit\r\n!\r\nds-mode t1\r\n!\r\ninterface Vlan 1\r\n icc-vlan\r\n server-blade-vlan 5\r\n ip address 10.10.48.58     255.255.255.0  \r\n pmi\r\n exit\r\n!\r\ninterface FastEthernet 10/3\r\n exit\r\n!\r\ninterface FastEthernet 10/4\r\n exit\r\n!\r\ninterface Console\r\n speed 9600\r\n exit\r\n!\r\ninterface USB-Modem\r\n description "Default Modem Setup"\r\n timeout absolute 10\r\n ppp authentication ras\r\n no shutdown\r\n ip address 10.3.248.253    255.255.255.252\r\n exit\r\n!\r\ncapture max-frame-size 4096\r\ncapture buffer-mode non-cyclic\r\ncapture filter-group 501\r\nlogin authentication min-password-length 8\r\n!\r\nlogin authentication lockout 0 attempt 0\r\n! Avaya Login Confirmation Received.\r\nEASGManage enableEASG\r\nproduct-id 8c2ae2eead3e6cca800be892bb6e3411\r\n!\r\nset logging file enable \r\nset logging file condition all Error \r\nset logging file condition BOOT Debug \r\n!\r\nno snmp-server community \r\nencrypted-snmp-server user JSXE8Ccs0N0TnuoQek8jwLmaP391mjHjbt9glvbZ2M0= gAAa6QMAG08/c+A= v3ReadISO v3 auth sha 1FCIRMijXV+77fer97/S9O3FlfqIPrTOC5uTFcklYM8=  priv aes128 yyv5YmpCoEn5xZ24B7MR4Y03gnnqwygOY3eQTGRZZB0= \r\nencrypted-snmp-server user 0Ce9aP8Q25tEoXTe0YGwKmt2qLFQJ+UOpG6SMzseQdg= gAAa6QMAG08/c+A= v3TrapISO v3 auth sha TgX0mUpViHn56rSWounTurOYUdreS7rWWY7KssAnYj4=  priv aes128 p5Rdzsia/+4+Uc7f9oeJOj38gI6qX+2Fy1WDL5PTkh8= \r\nsnmp-server group v3ReadISO v3 priv read iso  \r\nsnmp-server group v3TrapISO v3 priv notify iso  \r\nsnmp-server host 10.10.48.92 traps v3 priv bbysnmpv3trap \r\n!\r\nip default-gateway 10.10.48.254    1 low  \r\n!\r\nset sync interface primary v3\r\nset sync source primary\r\nrtp-stat-service\r\nrtp-stat fault\r\nanalog-test\r\nexit\r\n!\r\nset sla-monitor enable\r\nset sla-server-ip-address 10.10.48.198\r\nudp keepalive 10\r\nset mgc list 10.10.48.240\r\nset mediaserver 10.10.48.240 10.10.48.240 23 telnet\r\nset mediaserver 10.10.48.240 10.10.48.240 5023 sat\r\n!#\r\n!# End of configuration file. Press Enter to continue.', 'show_sla_monitor': '\r\n\r\nSLA Monitor:                  Enabled\r\nRegistered Server IP Address: 0.0.0.0\r\nRegistered Server IP Port:    0\r\nConfigured Server IP Address: 10.10.48.198\r\nConfigured Server IP Port:    50011\r\nCapture Mode:                 None\r\nVersion:                      2.7.0', 'show_system': '\r\nSystem Name             : \r\nSystem Location         : Calgary\r\nSystem Contact          : \r\nUptime (d,h:m:s)        : 22,06:00:13\r\nCall Controller Time    : 13:33:56 16 DEC 2025 \r\nSerial No               : 13TG01116522\r\nModel                   : G450\r\nChassis HW Vintage      : 1\r\nChassis HW Suffix       : A\r\nMainboard HW Vintage    : 2\r\nMainboard HW Suffix     : B\r\nMainboard HW CS         : 2.1.7\r\nMainboard FW Vintage    : 42.36.0\r\nLAN MAC Address         : 00:1b:4f:3f:73:e0\r\nWAN1 MAC Address        : 00:1b:4f:3f:73:e1\r\nWAN2 MAC Address        : 00:1b:4f:3f:73:e2\r\nSERVICES MAC address    : 00:1b:4f:3f:73:e3\r\nMemory #1               : 256MB\r\nMemory #2               : Not present\r\nCompact Flash Memory    : No CompactFlash card is installed\r\nPSU #1                  : AC 400W\r\nPSU #2                  : Not present\r\nMedia Socket #1         : MP160 VoIP DSP Module\r\nMedia Socket #2         : Not present\r\nMedia Socket #3         : Not present\r\nMedia Socket #4         : Not present\r\nFAN Tray                : Present', 'show_temp': '\r\nAmbient\r\n-------\r\nTemperature : 36C (97F)\r\nHigh Warning: 42C (108F)\r\nLow Warning : -5C (23F)', 'show_utilization': '\r\n\r\nMod   CPU      CPU     RAM      RAM\r\n      5sec     60sec   used(%)  Total(Kb)\r\n---   ------   -----  -------  ----------\r\n10    Appl. Disabled    48%     190838 Kb', 'show_voip_dsp': '\r\nDSP #1 PARAMETERS\r\n--------------------------------------------------------------\r\nBoard type     : MP160\r\nHw Vintage     : 0 B\r\nFw Vintage     : 182\r\n\r\nDSP#1 CURRENT STATE\r\n--------------------------------------------------------------\r\nIn Use         : 0 of 160 channels, 0 of 4800 points (0.0% used)\r\nState          : Idle\r\nAdmin State    : Release\r\n\r\nCore# Channels Admin     State\r\n      In Use   State\r\n----- -------- --------- -------\r\n    1  0 of 40   Release Idle\r\n    2  0 of 40   Release Idle\r\n    3  0 of 40   Release Idle\r\n    4  0 of 40   Release Idle\r\n\r\n\r\nDSP #2 Not Present\r\n\r\n\r\nDSP #3 Not Present\r\n\r\n\r\nDSP #4 Not Present', 'queue': Queue(), '_active_session': None, '_announcements': None, '_capture_service': None, '_chassis_hw': None, '_comp_flash': None, '_cpu_util': None, '_dsp': None, '_faults': None, '_fw': None, '_hw': None, '_inuse_dsp': None, '_last_seen_time': None, '_lldp': None, '_location': None, '_mac': None, '_mainboard_hw': None, '_memory': None, '_mm_groupdict': None, '_mm_v1': None, '_mm_v2': None, '_mm_v3': None, '_mm_v4': None, '_mm_v5': None, '_mm_v6': None, '_mm_v7': None, '_mm_v8': None, '_mm_v10': None, '_model': None, '_port1': None, '_port1_status': None, '_port1_neg': None, '_port1_duplex': None, '_port1_speed': None, '_port2': None, '_port2_status': None, '_port2_neg': None, '_port2_duplex': None, '_port2_speed': None, '_port_redu': None, '_psu1': None, '_psu2': None, '_ram_util': None, '_rtp_stat_service': None, '_serial': None, '_slamon_service': None, '_sla_server': None, '_snmp': None, '_snmp_trap': None, '_temp': None, '_total_session': None, '_uptime': None})
+    from demo import load_demo_bgws
+    bgw = next(iter(load_demo_bgws().values()))
     print(bgw)
@@ -15,6 +15,8 @@ CONFIG = {
     "http_server": "0.0.0.0",
     "http_port": 8080,
     "upload_dir": "/tmp",
+    "ssh_control_dir": None,
+    "ssh_control_persist": "600s",
     "nok_rtp_only": False,
     "discovery_commands": [
         "set utilization cpu",
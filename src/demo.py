@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+"""
+Demo fixtures for running the modules standalone during development.
+
+The sample gateway, RTP and capture data lives gzip compressed in
+fixtures/demo.json.gz and is only read when one of the loaders below is
+called. This module is not part of the built script.
+"""
+
+import gzip
+import json
+import os
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+DEMO_FIXTURE = os.path.join(FIXTURES_DIR, "demo.json.gz")
+
+@lru_cache(maxsize=1)
+def _load_fixture(path: str = DEMO_FIXTURE) -> Dict[str, Any]:
+    """Read, decompress and decode the demo fixture file once."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+def load_demo_bgws() -> Dict[str, Any]:
+    """Return demo BGW instances keyed by gw_number."""
+    from bgw import BGW
+    return {d["gw_number"]: BGW(**d) for d in _load_fixture()["bgws"]}
+
+def load_demo_gws() -> Dict[str, str]:
+    """Return the demo lan_ip -> gw_number index."""
+    return dict(_load_fixture()["gws"])
+
+def load_demo_rtpstats() -> Dict[str, str]:
+    """Return raw 'show rtp-stat detailed' outputs keyed by global id."""
+    return dict(_load_fixture()["rtps"])
+
+def load_demo_rtps() -> Dict[str, Any]:
+    """Return parsed demo RTPDetails keyed by global id."""
+    from rtpparser import parse_rtpstat
+    return {
+        global_id: parse_rtpstat(global_id, rtpstat)
+        for global_id, rtpstat in load_demo_rtpstats().items()
+    }
+
+def load_demo_pcaps() -> Dict[str, Any]:
+    """Return demo Capture instances keyed by filename."""
+    from aloop import Capture
+    pcaps = {}
+    for d in _load_fixture()["pcaps"]:
+        d = dict(d)
+        d["received_timestamp"] = datetime.strptime(
+            d["received_timestamp"], "%Y-%m-%d %H:%M:%S.%f"
+        )
+        pcaps[d["filename"]] = Capture(**d)
+    return pcaps
@@ -4,8 +4,8 @@
 ############################## BEGIN IMPORTS ##################################
 
 import argparse
-import re
-from typing import Any, Optional, Set, Dict, MutableMapping
+from functools import lru_cache
+from typing import Any, Optional, Dict, FrozenSet, MutableMapping
 
 ############################## END IMPORTS ####################################
 
@@ -19,7 +19,7 @@ FILTER_GROUPs = {
         "current_filter": "",
         "no_filter": False,
         "groups": {
-            "ip_filter": set()
+            "ip_filter": frozenset()
             }
         },
 }
@@ -38,6 +38,10 @@ Filter examples:
     -i 10.10.10.1|10.10.10.2  OR  -i 10.10.10.1,10.10.10.2
 """}
 
+FILTER_MENU_LINEs = {
+    group: tuple(menu.splitlines()) for group, menu in FILTER_MENUs.items()
+}
+
 class NoExitArgumentParser(argparse.ArgumentParser):
     def error(self, message):
         raise ValueError(message)
@@ -47,9 +51,10 @@ def is_valid_ipv4(ip: str) -> bool:
     """
     Validate whether a string is a valid IPv4 address.
 
-    This function uses a regular expression to ensure the address:
-      - Consists of exactly four octets separated by dots
-      - Each octet is in the range 0–255
+    The address must:
+      - Consist of exactly four octets separated by dots
+      - Have one to three digits per octet, leading zeros allowed
+      - Have each octet in the range 0–255
 
     Args:
         ip: The IPv4 address string to validate.
@@ -57,12 +62,19 @@ def is_valid_ipv4(ip: str) -> bool:
     Returns:
         True if the string is a valid IPv4 address, False otherwise.
     """
-    octet = r"(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)"
-    pattern = rf"^({octet}\.){{3}}{octet}$"
-
-    return re.match(pattern, ip) is not None
-
-def parse_and_validate_i(value: str) -> Set[str]:
+    octets = ip.split(".")
+    if len(octets) != 4:
+        return False
+    for octet in octets:
+        if (
+            not 0 < len(octet) <= 3
+            or octet.strip("0123456789")
+            or int(octet) > 255
+        ):
+            return False
+    return True
+
+def parse_and_validate_i(value: str) -> FrozenSet[str]:
     """
     Parse and validate a list of IPv4 addresses.
 
@@ -74,25 +86,20 @@ def parse_and_validate_i(value: str) -> Set[str]:
         value: A string containing one or more IPv4 addresses.
 
     Returns:
-        A set of validated IPv4 address strings.
+        A frozenset of validated IPv4 address strings.
 
     Raises:
         argparse.ArgumentTypeError: If any IP address is invalid.
     """
-    raw_ips = re.split(r"[,\|]", value)
-    ips: Set[str] = set()
-
-    for ip in raw_ips:
-        ip = ip.strip()
-        if not ip:
-            continue
-
-        if not is_valid_ipv4(ip):
-            raise argparse.ArgumentTypeError(f"Invalid IP: {ip}")
+    stripped = (ip.strip() for ip in value.replace("|", ",").split(","))
+    ips = [ip for ip in stripped if ip]
 
-        ips.add(ip)
+    # Checked in input order so the first invalid entry is reported.
+    bad = next((ip for ip in ips if not is_valid_ipv4(ip)), None)
+    if bad is not None:
+        raise argparse.ArgumentTypeError(f"Invalid IP: {bad}")
 
-    return ips
+    return frozenset(ips)
 
 def create_filter_parser() -> "NoExitArgumentParser":
     """
@@ -122,7 +129,7 @@ def create_filter_parser() -> "NoExitArgumentParser":
         "-i",
         dest="ip_filter",
         type=parse_and_validate_i,
-        default=set(),  # type: Set[str]
+        default=frozenset(),  # type: FrozenSet[str]
         help="BGW IP filter list separated by | or ,",
     )
 
@@ -130,13 +137,55 @@ def create_filter_parser() -> "NoExitArgumentParser":
 
 filter_parser = create_filter_parser()
 
+def _clean_filter(line: str) -> str:
+    """Strip quotes and surrounding whitespace from a filter line."""
+    return line.replace("'", "").replace('"', "").strip()
+
+@lru_cache(maxsize=256)
+def _fast_parse(line: str) -> Dict[str, Any]:
+    """
+    Parse a filter line without going through argparse.
+
+    The filter grammar is only `-n` or `-i <ips>`, so the common shapes are
+    handled directly. Anything else (malformed input, combined or repeated
+    flags) falls back to `filter_parser` which produces the error message.
+
+    Args:
+        line: Raw filter line.
+
+    Returns:
+        A dict shaped like `vars(filter_parser.parse_args(...))`. The result
+        is cached and shared, callers must not mutate it.
+
+    Raises:
+        ValueError: If the line is not a valid filter.
+    """
+    tokens = line.split()
+
+    if not tokens:
+        return {"no_filter": False, "ip_filter": frozenset()}
+
+    if tokens == ["-n"]:
+        return {"no_filter": True, "ip_filter": frozenset()}
+
+    if len(tokens) == 2 and tokens[0] == "-i":
+        try:
+            ips = parse_and_validate_i(tokens[1])
+        except argparse.ArgumentTypeError:
+            pass
+        else:
+            return {"no_filter": False, "ip_filter": ips}
+
+    return vars(filter_parser.parse_args(tokens))
+
 def filter_validator(line: str) -> Optional[str]:
     """
     Validate and parse a filter command line.
 
     This function is typically used as a validator for user input (e.g. from a
-    curses text field). It sanitizes the input, attempts to parse it using the
-    global `filter_parser`, and logs the parsed arguments for debugging.
+    curses text field). It sanitizes the input, attempts to parse it using
+    `_fast_parse` (backed by the global `filter_parser`), and logs the parsed
+    arguments for debugging.
 
     If parsing fails, the error is logged and the error message is returned.
     Returning a string is assumed to signal validation failure to the caller.
@@ -148,11 +197,8 @@ def filter_validator(line: str) -> Optional[str]:
         None if the input is valid and successfully parsed.
         A string error message if validation or parsing fails.
     """
-    # Strip quotes and surrounding whitespace
-    cleaned = line.replace("'", "").replace('"', "").strip()
-
     try:
-        args = filter_parser.parse_args(cleaned.split())
+        args = _fast_parse(_clean_filter(line))
         logger.debug(args)
         return None
 
@@ -171,15 +217,17 @@ def update_filter(
     if not group_cfg:
         return
 
-    args = vars(filter_parser.parse_args(filter.split()))
+    # Normalized like in filter_validator so the parse it cached is reused.
+    filter = _clean_filter(filter)
+    args = _fast_parse(filter)
     groups = group_cfg.get("groups", {})
     
     # Clear all filters
     if args.get("no_filter"):
         group_cfg["current_filter"] = ""
         group_cfg["no_filter"] = False
-        for g in groups.values():
-            g.clear()
+        for key in groups:
+            groups[key] = frozenset()
         logger.info("Cleared all filters")
         return
 
@@ -188,23 +236,26 @@ def update_filter(
         group_cfg["current_filter"] = filter
         group_cfg["no_filter"] = False
         
-        for key, value in args.items():
-            if key in groups and value:
-                groups[key] = value
-                logger.info(f"Updated '{key}' to '{value}'")
+        changed = {
+            key: value for key, value in args.items()
+            if key in groups and value and groups[key] != value
+        }
+        if changed:
+            groups.update(changed)
+            logger.info("Updated filters %s", changed)
 
 ############################## END FILTER #####################################
 
 def parse_and_validate_b(s):
     """Parse BGW number"""
     result = set()
-    nums = set(re.split(r"[,|\|]", s))
+    nums = set(s.replace("|", ",").split(","))
     for num in nums:
         if len(num) > 3 or not num.isdigit() or num == "0":
             raise argparse.ArgumentTypeError(f"Invalid number: {num}")
         num = f"{num.strip():0>3}"
         result.add(num)
-    return result
+    return frozenset(result)
 
 if __name__ == "__main__":
     line = '-i 10.10.10.2'
@@ -3,8 +3,11 @@
 
 ############################## BEGIN IMPORTS ##################################
 
-import re
-from typing import Any, Dict, Iterable, List, Tuple, Optional, Iterator, Generator
+from operator import itemgetter
+from types import MappingProxyType
+from weakref import WeakKeyDictionary
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Optional, Iterator, Generator
+from typing import NamedTuple, Union
 
 ############################## END IMPORTS ####################################
 
@@ -86,6 +89,57 @@ RTPSTATS
 +---+--------+--------+---------------+-----+---------------+-----+-------+----+
 """
 
+# Color callables shared by several columns. Defining them once lets every
+# column reference the same function object instead of its own lambda.
+
+def color_init(x: str) -> str:
+    return "anormal" if x.startswith("Init") else "attr_color"
+
+def color_empty(x: str) -> str:
+    return "attr_color" if x else "anormal"
+
+def color_connected(x: str) -> str:
+    return "connected" if "connected" in x else "attr_color"
+
+def color_full_duplex(x: str) -> str:
+    return "attr_color" if "full" in x else "anormal"
+
+def color_port(x: str) -> str:
+    return "attr_color" if x and int(x) % 2 == 0 else "odd"
+
+def color_padded_port(x: str) -> str:
+    x = x.strip()
+    return "attr_color" if x.isdigit() and int(x) % 2 == 0 else "odd"
+
+def color_codec(x: str) -> str:
+    return "attr_color" if x.strip().startswith("G711") else "notg711"
+
+# GWs is filled and cleared in place, never rebound, so binding the dict as a
+# default reads it as a local and still sees every discovered gateway.
+def color_bgw_ip(x: str, _gws: Dict[str, str] = GWs) -> str:
+    return "is_bgw_ip" if x and x in _gws else "attr_color"
+
+def color_padded_bgw_ip(x: str, _gws: Dict[str, str] = GWs) -> str:
+    return "is_bgw_ip" if x.strip() in _gws else "attr_color"
+
+def color_dscp(x: str) -> str:
+    return "anormal" if x and x != "46" else "attr_color"
+
+def color_nonzero(x: str) -> str:
+    return "anormal" if x and x != "0" else "attr_color"
+
+# Attribute formatters of the Model and Flash columns.
+
+def model_prefix(x: str) -> str:
+    return x[:4]
+
+def flash_prefix(x: str) -> str:
+    return x[:5]
+
+# Tail slices as C-level callables, no Python frame per cell.
+last8 = itemgetter(slice(-8, None))
+last26 = itemgetter(slice(-26, None))
+
 LAYOUTS = {
     "SYSTEM": [
         ("BGW", {
@@ -130,7 +184,7 @@ LAYOUTS = {
         }),
         ("Model", {
             "attr_name": "model",
-            "attr_func": lambda x: x[:4],
+            "attr_func": model_prefix,
             "attr_color": "normal",
             "color_func": None,
             "attr_fmt": ">5",
@@ -232,7 +286,7 @@ LAYOUTS = {
         }),
         ("Flash", {
             "attr_name": "comp_flash",
-            "attr_func": lambda x: x[:5],
+            "attr_func": flash_prefix,
             "attr_color": "normal",
             "color_func": None,
             "attr_fmt": ">5",
@@ -254,9 +308,7 @@ LAYOUTS = {
             "attr_name": "gw_number",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x.startswith("Init") else "attr_color"
-            ),
+            "color_func": color_init,
             "attr_fmt": ">3",
             "attr_xpos": 1,
         }),
@@ -264,9 +316,7 @@ LAYOUTS = {
             "attr_name": "mm_v1",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x.startswith("Init") else "attr_color"
-            ),
+            "color_func": color_init,
             "attr_fmt": "<6",
             "attr_xpos": 5,
         }),
@@ -274,9 +324,7 @@ LAYOUTS = {
             "attr_name": "mm_v2",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x.startswith("Init") else "attr_color"
-            ),
+            "color_func": color_init,
             "attr_fmt": "<6",
             "attr_xpos": 12,
         }),
@@ -284,9 +332,7 @@ LAYOUTS = {
             "attr_name": "mm_v3",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x.startswith("Init") else "attr_color"
-            ),
+            "color_func": color_init,
             "attr_fmt": "<6",
             "attr_xpos": 19,
         }),
@@ -294,9 +340,7 @@ LAYOUTS = {
             "attr_name": "mm_v4",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x.startswith("Init") else "attr_color"
-            ),
+            "color_func": color_init,
             "attr_fmt": "<6",
             "attr_xpos": 26,
         }),
@@ -304,9 +348,7 @@ LAYOUTS = {
             "attr_name": "mm_v5",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x.startswith("Init") else "attr_color"
-            ),
+            "color_func": color_init,
             "attr_fmt": "<6",
             "attr_xpos": 33,
         }),
@@ -314,9 +356,7 @@ LAYOUTS = {
             "attr_name": "mm_v6",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x.startswith("Init") else "attr_color"
-            ),
+            "color_func": color_init,
             "attr_fmt": "<6",
             "attr_xpos": 40,
         }),
@@ -324,9 +364,7 @@ LAYOUTS = {
             "attr_name": "mm_v7",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x.startswith("Init") else "attr_color"
-            ),
+            "color_func": color_init,
             "attr_fmt": "<6",
             "attr_xpos": 47,
         }),
@@ -334,9 +372,7 @@ LAYOUTS = {
             "attr_name": "mm_v8",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x.startswith("Init") else "attr_color"
-            ),
+            "color_func": color_init,
             "attr_fmt": "<6",
             "attr_xpos": 54,
         }),
@@ -386,9 +422,7 @@ LAYOUTS = {
             "attr_name": "port1_status",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "connected" if "connected" in x else "attr_color"
-            ),
+            "color_func": color_connected,
             "attr_fmt": ">9",
             "attr_xpos": 11,
         }),
@@ -412,9 +446,7 @@ LAYOUTS = {
             "attr_name": "port1_duplex",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "attr_color" if "full" in x else "anormal"
-            ),
+            "color_func": color_full_duplex,
             "attr_fmt": ">4",
             "attr_xpos": 35,
         }),
@@ -430,9 +462,7 @@ LAYOUTS = {
             "attr_name": "port2_status",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "connected" if "connected" in x else "attr_color"
-            ),
+            "color_func": color_connected,
             "attr_fmt": ">9",
             "attr_xpos": 46,
         }),
@@ -456,9 +486,7 @@ LAYOUTS = {
             "attr_name": "port2_duplex",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "attr_color" if "full" in x else "anormal"
-            ),
+            "color_func": color_full_duplex,
             "attr_fmt": ">4",
             "attr_xpos": 70,
         }),
@@ -476,9 +504,7 @@ LAYOUTS = {
             "attr_name": "gw_number",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "attr_color" if x else "anormal"
-            ),
+            "color_func": color_empty,
             "attr_fmt": ">3",
             "attr_xpos": 1,
         }),
@@ -624,23 +650,23 @@ LAYOUTS = {
             "attr_name": "gw_number",
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: "attr_color" if x else "anormal",
+            "color_func": color_empty,
             "attr_fmt": ">3",
             "attr_xpos": 1,
         }),
         ("Start", {
             "attr_name": "start_time",
-            "attr_func": lambda x: x[-8:],
+            "attr_func": last8,
             "attr_color": "normal",
-            "color_func": lambda x: "attr_color" if x else "anormal",
+            "color_func": color_empty,
             "attr_fmt": "^8",
             "attr_xpos": 5,
         }),
         ("End", {
             "attr_name": "end_time",
-            "attr_func": lambda x: x[-8:],
+            "attr_func": last8,
             "attr_color": "normal",
-            "color_func": lambda x: "attr_color" if x else "anormal",
+            "color_func": color_empty,
             "attr_fmt": "^8",
             "attr_xpos": 14,
         }),
@@ -648,7 +674,7 @@ LAYOUTS = {
             "attr_name": "local_addr",
             "attr_func": None,
             "attr_color": "is_bgw_ip",
-            "color_func": lambda x: "attr_color" if x else "anormal",
+            "color_func": color_empty,
             "attr_fmt": ">15",
             "attr_xpos": 23,
         }),
@@ -656,9 +682,7 @@ LAYOUTS = {
             "attr_name": "local_port",
             "attr_func": None,
             "attr_color": "port",
-            "color_func": lambda x: (
-                "attr_color" if x and int(x) % 2 == 0 else "odd"
-            ),
+            "color_func": color_port,
             "attr_fmt": ">5",
             "attr_xpos": 39,
         }),
@@ -666,9 +690,7 @@ LAYOUTS = {
             "attr_name": "remote_addr",
             "attr_func": None,
             "attr_color": "address",
-            "color_func": lambda x: (
-                "is_bgw_ip" if x and x in GWs else "attr_color"
-            ),
+            "color_func": color_bgw_ip,
             "attr_fmt": ">15",
             "attr_xpos": 45,
         }),
@@ -676,9 +698,7 @@ LAYOUTS = {
             "attr_name": "remote_port",
             "attr_func": None,
             "attr_color": "port",
-            "color_func": lambda x: (
-                "attr_color" if x and int(x) % 2 == 0 else "odd"
-            ),
+            "color_func": color_port,
             "attr_fmt": ">5",
             "attr_xpos": 61,
         }),
@@ -686,9 +706,7 @@ LAYOUTS = {
             "attr_name": "codec",
             "attr_func": None,
             "attr_color": "codec",
-            "color_func": lambda x: (
-                "attr_color" if x.startswith("G711") else "notg711"
-            ),
+            "color_func": color_codec,
             "attr_fmt": "^7",
             "attr_xpos": 67,
         }),
@@ -714,7 +732,7 @@ LAYOUTS = {
         }),
         ("Filename", {
             "attr_name": "filename",
-            "attr_func": lambda x: x[-26:],
+            "attr_func": last26,
             "attr_color": "normal",
             "color_func": None,
             "attr_fmt": ">26",
@@ -991,10 +1009,7 @@ RTP_LAYOUT = [
         {
             "attr_func": None,
             "attr_color": "port",
-            "color_func": lambda x: (
-                "attr_color" if x.strip().isdigit() and int(x.strip()) % 2 == 0
-                else "odd"
-            ),
+            "color_func": color_padded_port,
             "attr_fmt": "<5",
             "attr_ypos": 5,
             "attr_xpos": 21,
@@ -1027,9 +1042,7 @@ RTP_LAYOUT = [
         {
             "attr_func": None,
             "attr_color": "codec",
-            "color_func": lambda x: (
-                "attr_color" if x.strip().startswith("G711") else "notg711"
-            ),
+            "color_func": color_codec,
             "attr_fmt": "^7",
             "attr_ypos": 5,
             "attr_xpos": 35,
@@ -1051,10 +1064,7 @@ RTP_LAYOUT = [
         {
             "attr_func": None,
             "attr_color": "port",
-            "color_func": lambda x: (
-                "attr_color" if x.strip().isdigit() and int(x.strip()) % 2 == 0
-                else "odd"
-            ),
+            "color_func": color_padded_port,
             "attr_fmt": ">5",
             "attr_ypos": 5,
             "attr_xpos": 50,
@@ -1076,9 +1086,7 @@ RTP_LAYOUT = [
         {
             "attr_func": None,
             "attr_color": "address",
-            "color_func": lambda x: (
-                "is_bgw_ip" if x.strip() in GWs else "attr_color"
-            ),
+            "color_func": color_padded_bgw_ip,
             "attr_fmt": "<15",
             "attr_ypos": 5,
             "attr_xpos": 56,
@@ -1368,9 +1376,7 @@ RTP_LAYOUT = [
         {
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x and x != "46" else "attr_color"
-            ),
+            "color_func": color_dscp,
             "attr_fmt": ">7",
             "attr_ypos": 11,
             "attr_xpos": 22,
@@ -1392,9 +1398,7 @@ RTP_LAYOUT = [
         {
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x and x != "46" else "attr_color"
-            ),
+            "color_func": color_dscp,
             "attr_fmt": ">5",
             "attr_ypos": 11,
             "attr_xpos": 32,
@@ -1504,9 +1508,7 @@ RTP_LAYOUT = [
         {
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x and x != "0" else "attr_color"
-            ),
+            "color_func": color_nonzero,
             "attr_fmt": ">7",
             "attr_ypos": 13,
             "attr_xpos": 22,
@@ -1550,9 +1552,7 @@ RTP_LAYOUT = [
         {
             "attr_func": None,
             "attr_color": "normal",
-            "color_func": lambda x: (
-                "anormal" if x and x != "0" else "attr_color"
-            ),
+            "color_func": color_nonzero,
             "attr_fmt": ">7",
             "attr_ypos": 14,
             "attr_xpos": 22,
@@ -1766,6 +1766,82 @@ ColumnDef = Tuple[str, Dict[str, Any]]
 SpecItem = Tuple[str, Dict[str, Any]]
 Cell = Tuple[int, int, str, int]
 
+class ColumnSpec(NamedTuple):
+    """A layout column with its defaults resolved, see freeze_layout()."""
+    name: str
+    attr_name: str
+    attr_func: Optional[Callable[[Any], Any]]
+    attr_color: str
+    color_func: Optional[Callable[[Any], str]]
+    attr_fmt: Optional[str]
+    fmt_digits: str
+    fmt_len: Optional[int]
+    fmt_func: Optional[Callable[[str], str]]
+    label: str
+    attr_xpos: int
+    attr_ypos: Optional[int]
+
+FrozenLayout = Tuple[ColumnSpec, ...]
+
+def compile_fmt(fmt: str) -> Callable[[str], str]:
+    """Return a callable padding a string the way format(s, fmt) does.
+
+    Plain right or left alignment maps to str.rjust/str.ljust, which are
+    several times cheaper than parsing the spec on every call. Any other
+    spec is bound once into a str.format method.
+    """
+    width = fmt[1:]
+    if width.isdigit():
+        n = int(width)
+        if fmt[0] == ">":
+            return lambda s: s.rjust(n)
+        if fmt[0] == "<":
+            return lambda s: s.ljust(n)
+    return "{{:{}}}".format(fmt).format
+
+def freeze_layout(
+    spec: Union[Iterable[SpecItem], FrozenLayout],
+) -> FrozenLayout:
+    """Convert (name, attrs_dict) items into an immutable tuple of ColumnSpec.
+
+    Lookups, defaults and the width digits of attr_fmt are resolved once here
+    instead of for every cell on every redraw. Already frozen layouts are
+    returned unchanged.
+
+    Args:
+        spec: Iterable of (name, attrs_dict) items, or a frozen layout.
+
+    Returns:
+        Tuple of ColumnSpec in display order.
+    """
+    # iter_attrs passes every row through here; a frozen layout is only
+    # ever built by this function, so its first column identifies it.
+    if isinstance(spec, tuple) and (not spec or isinstance(spec[0], ColumnSpec)):
+        return spec
+
+    columns = []  # type: List[ColumnSpec]
+    for name, d in spec:
+        fmt = d.get("attr_fmt")
+        digits = "".join(c for c in fmt if c.isdigit()) if fmt else ""
+        ypos = d.get("attr_ypos")
+        # Header labels are centered over the field width.
+        label = "{:^{}}".format(name, digits or len(name)) if fmt else name
+        columns.append(ColumnSpec(
+            name=name,
+            attr_name=d.get("attr_name", name),
+            attr_func=d.get("attr_func"),
+            attr_color=d.get("attr_color", "normal"),
+            color_func=d.get("color_func"),
+            attr_fmt=fmt,
+            fmt_digits=digits,
+            fmt_len=int(digits) if digits else None,
+            fmt_func=compile_fmt(fmt) if fmt else None,
+            label=label,
+            attr_xpos=int(d.get("attr_xpos", 0)),
+            attr_ypos=int(ypos) if ypos is not None else None,
+        ))
+    return tuple(columns)
+
 class Layout(object):
     """A screen layout made of ordered column definitions.
 
@@ -1796,8 +1872,15 @@ class Layout(object):
                     If not provided, defaults to an empty dict and
                     you should pass a colors map to iter_cells().
         """
-        self._columns = list(columns)
+        self._columns = tuple(columns)
+        self._frozen = freeze_layout(self._columns)
+        self._widths = {
+            c.name: c.fmt_len or len(c.name) for c in self._frozen
+        }  # type: Dict[str, int]
         self._by_name = {}
+        # Per rendered object: the render arguments, the raw column values
+        # and the cells rendered from them, see iter_attrs().
+        self._prev = WeakKeyDictionary()  # type: WeakKeyDictionary
         self.colors = colors if colors is not None else {}
 
         for name, attrs in self._columns:
@@ -1846,14 +1929,10 @@ class Layout(object):
     def column_width(self, name: str) -> int:
         """Compute column width from attr_fmt, else fall back to len(name).
 
-        Extracts the first integer found in attr_fmt (e.g. ">14" -> 14).
+        The width digits of attr_fmt (e.g. ">14" -> 14) are resolved once by
+        freeze_layout().
         """
-        fmt = self._by_name[name].get("attr_fmt")
-        if not fmt:
-            return len(name)
-
-        m = re.search(r"(\d+)", str(fmt))
-        return int(m.group(1)) if m else len(name)
+        return self._widths[name]
 
     def iter_attrs(
         self,
@@ -1864,22 +1943,69 @@ class Layout(object):
         yoffset: int = 0,
         colors: Optional[Dict[str, int]] = COLORS,
         header: bool = False,
-    ) -> Generator[Tuple[int, int, str, int], None, None]:
-        """Yield (y, x, text, color) cells for this Screen"""
+    ) -> Iterator[Cell]:
+        """Yield (y, x, text, color) cells for this Screen.
+
+        The raw column values of each object are kept together with the
+        cells rendered from them. On the next call for the same object only
+        the columns whose value changed are formatted and colored again,
+        the others reuse their cell.
+        """
         cmap = colors if colors is not None else self.colors
-        return iter_attrs(
-            obj=obj,
-            spec=self._columns,
-            colors=cmap,
-            xoffset=xoffset,
-            yoffset=yoffset,
-            default_y=row_y,
-            header=header,
-        )
+        if header or obj is None:
+            return iter_attrs(
+                obj=obj,
+                spec=self._frozen,
+                colors=cmap,
+                xoffset=xoffset,
+                yoffset=yoffset,
+                default_y=row_y,
+                header=header,
+            )
+
+        columns = self._frozen
+        values = tuple(getattr(obj, c.attr_name, c.name) for c in columns)
+        # color_bgw_ip depends on GWs too, which counts its changes.
+        state = (id(cmap), row_y, xoffset, yoffset, GWs.version)
+        prev = self._prev.get(obj)
+
+        if prev is not None and prev[0] == state:
+            if prev[1] == values:
+                return iter(prev[2])
+            normal = int(cmap.get("normal", 0))
+            cells = list(prev[2])
+            for i, (old, value) in enumerate(zip(prev[1], values)):
+                if old != value:
+                    cells[i] = render_cell(
+                        columns[i], value, cmap, normal,
+                        xoffset=xoffset, yoffset=yoffset, default_y=row_y,
+                    )
+        else:
+            normal = int(cmap.get("normal", 0))
+            cells = [
+                render_cell(
+                    c, value, cmap, normal,
+                    xoffset=xoffset, yoffset=yoffset, default_y=row_y,
+                )
+                for c, value in zip(columns, values)
+            ]
+
+        try:
+            self._prev[obj] = (state, values, cells)
+        except TypeError:
+            pass
+        return iter(cells)
+
+    def invalidate(self, obj: Optional[Any] = None) -> None:
+        """Forget the cells kept for obj, or for all objects if None."""
+        if obj is None:
+            self._prev.clear()
+        else:
+            self._prev.pop(obj, None)
 
 def iter_attrs(
     obj: Optional[Any],
-    spec: Iterable[SpecItem],
+    spec: Union[Iterable[SpecItem], FrozenLayout],
     colors: Dict[str, int],
     *,
     xoffset: int = 0,
@@ -1905,7 +2031,8 @@ def iter_attrs(
 
     Args:
         obj: Object providing attributes; if None render labels.
-        spec: Iterable of (name, attrs_dict) items.
+        spec: Iterable of (name, attrs_dict) items or, preferably, a layout
+            already frozen by freeze_layout().
         colors: Color name -> curses int attribute.
         xoffset/yoffset: Applied to coordinates.
         default_y: Used when attr_ypos is missing.
@@ -1915,95 +2042,98 @@ def iter_attrs(
         (y, x, text, color_attr)
     """
     normal = int(colors.get("normal", 0))
+    labels = header or obj is None
 
-    for name, d in spec:
-        y = int(d.get("attr_ypos", default_y)) + yoffset
-        x = int(d.get("attr_xpos", 0)) + xoffset
-
-        # Value
-        if header or obj is None:
-            value = name
+    for c in freeze_layout(spec):
+        if labels:
+            value = c.name
         else:
-            attr_name = d.get("attr_name", name)
-            value = getattr(obj, attr_name, name)
-
-            fn = d.get("attr_func")
-            if fn:
-                try:
-                    value = fn(value)
-                except Exception:
-                    pass
-
-        # Color name
-        cname = d.get("attr_color", "normal")
-        cfn = d.get("color_func")
-        
-        if header or obj is None:
-            cname = "normal"
-        
-        elif cfn:
-            try:
-                chosen = cfn(value)
-                if chosen == "attr_color":
-                    cname = d.get("attr_color", "normal")
-                else:
-                    cname = chosen
-            except Exception:
-                pass
-
-        color_attr = int(colors.get(cname, normal))
-
-        # Format
-        fmt = d.get("attr_fmt")
-        if fmt:
-            try:
-                ln = "".join(c for c in fmt if c.isdigit())
-                if header or obj is None:
-                    centered = "^" + ln if ln else "^" + str(len(value))
-                    value = "{:{}}".format(value, centered)
-                else:
-                    ln = int(ln) if ln else None
-                    value = "{:{}}".format(str(value)[:ln], fmt)
-            except Exception:
-                pass
-
-        yield y, x, str(value), color_attr
+            value = getattr(obj, c.attr_name, c.name)
+        yield render_cell(
+            c, value, colors, normal,
+            labels=labels, xoffset=xoffset, yoffset=yoffset,
+            default_y=default_y,
+        )
+
+def render_cell(
+    c: ColumnSpec,
+    value: Any,
+    colors: Dict[str, int],
+    normal: int,
+    *,
+    labels: bool = False,
+    xoffset: int = 0,
+    yoffset: int = 0,
+    default_y: int = 0,
+) -> Cell:
+    """Return the (y, x, text, color_attr) cell of column c for a raw value.
+
+    Args:
+        c: Frozen column.
+        value: Raw attribute value, or the column name when labels is True.
+        colors: Color name -> curses int attribute.
+        normal: Color attribute used when a color name is unknown.
+        labels: If True, render the column label instead of the value.
+        xoffset/yoffset: Applied to coordinates.
+        default_y: Used when attr_ypos is missing.
+
+    Returns:
+        (y, x, text, color_attr)
+    """
+    y = (c.attr_ypos if c.attr_ypos is not None else default_y) + yoffset
+    x = c.attr_xpos + xoffset
+
+    # Value
+    if not labels and c.attr_func:
+        try:
+            value = c.attr_func(value)
+        except Exception:
+            pass
+
+    # Color name
+    cname = c.attr_color
+
+    if labels:
+        cname = "normal"
+
+    elif c.color_func:
+        try:
+            chosen = c.color_func(value)
+            if chosen != "attr_color":
+                cname = chosen
+        except Exception:
+            pass
+
+    color_attr = colors.get(cname, normal)
+
+    # Format
+    if c.attr_fmt:
+        try:
+            if labels:
+                value = c.label
+            else:
+                value = c.fmt_func(str(value)[:c.fmt_len])
+        except Exception:
+            pass
+
+    return y, x, str(value), color_attr
+
+RTP_COLUMNS = freeze_layout(RTP_LAYOUT)
+
+# Layouts are read-only, one instance per screen is shared by name.
+SCREEN_LAYOUTs = MappingProxyType(
+    {name: Layout(columns) for name, columns in LAYOUTS.items()}
+)
 
 ############################## END LAYOUT #####################################
 
 if __name__ == "__main__":
-    from rtpparser import parse_rtpstat
-    from queue import Queue
-    from bgw import BGW
-    from storage import MemoryStorage
-    from datetime import datetime
-    from queue import Queue
-    from main import GWs
-
-    def setup():
-        bgw1 = BGW(**{'lan_ip': '10.10.48.58', 'proto': 'ptls', 'polling_secs': 10, 'gw_name': 'AvayaG450A', 'gw_number': '001', 'polls': 1, 'avg_poll_secs': 10, 'active_session_ids': set(), 'last_seen': datetime(2025, 12, 16, 14, 33, 39), 'last_session_id': '', 'show_announcements_files': '\r\n ID      File               Description    Size (Bytes)      Date\r\n---- ------------------ ------------------ ------------ -------------------\r\n101   moh.wav            announcement file      239798    2022-08-23,8:45:26  \r\n102   emergency.wav      announcement file       26618    2023-03-24,11:36:10 \r\n103   public_announceme  announcement file      201914    2024-10-24,7:37:52  \r\n104   mohtest.wav        announcement file     9648106    2025-07-15,14:50:16 \r\n\r\nNv-Ram:\r\nTotal bytes used             : 10119680  \r\nTotal bytes free             : 12672000  \r\nTotal bytes capacity (fixed) : 22791680', 'show_capture': '\r\n\r\nCapture service is enabled and active\r\nCapture start time 09/12/2025-09:25:13\r\nCapture stop time not-stopped\r\nCurrent buffer size is 1024 KB\r\nBuffer mode is non-cyclic\r\nMaximum number of bytes captured from each frame: 4096\r\nCapture list 501 on all interfaces\r\nCapture IPSec decrypted\r\nNumber of captured frames in file: 604 (out of 145200 total captured frames)\r\nMemory buffer occupancy: 4.62% (including overheads)', 'show_faults': '\r\n\r\nCURRENTLY ACTIVE FAULTS\r\n--------------------------------------------------------------------------\r\n\r\n-- Media Module Faults --\r\n\t+ Insertion failure, mmid = v5, 11/24-07:37:04.00\r\n\r\nCurrent Alarm Indications, ALM LED is off\r\n--------------------------------------------------------------------------\r\nNone', 'show_lldp_config': '\r\n\r\nLldp Configuration \r\n-------------------\r\nApplication status: enable \r\nTx interval: 30 seconds\r\nTx hold multiplier: 4 seconds\r\nTx delay: 2 seconds\r\nReinit delay: 2 seconds', 'show_mg_list': '\r\nSLOT   TYPE         CODE        SUFFIX  HW VINTAGE  FW VINTAGE \r\n----   --------     ----------  ------  ----------  -----------\r\nv1     -- Not Installed --\r\nv2     -- Not Installed --\r\nv3     E1T1         MM710       B       16          52\r\nv4     -- Not Installed --\r\nv5     -- Initializing --\r\nv6     Analog       MM714       B       23          94\r\nv7     -- Not Installed --\r\nv8     -- Not Installed --\r\nv10    Mainboard    G450        B       2           42.36.0(A)', 'show_port': '\r\nPort   Name             Status    Vlan Level  Neg     Dup. Spd. Type\r\n------ ---------------- --------- ---- ------ ------- ---- ---- ----------------\r\n10/5   NO NAME          connected 1     0     enable  half 1G   Avaya Inc., G450 Media Gateway 10/100/1000BaseTx Port 10/5\r\n\r\n10/6   NO NAME          no link   1     0     enable  full 1G   Avaya Inc., G450 Media Gateway 10/100/1000BaseTx Port 10/6', 'show_rtp_stat_summary': '', 'show_running_config': '\r\n\r\n! version 42.36.0\r\nConfig info release 42.36.0 time "13:33:51 16 DEC 2025 " serial_number 10IS41452851\r\n !\r\nencrypted-username +ikJzwEP/t+XkAlH3l+zsw== password G6uSyomIZMSDb0NnT4RwvSb4IrSGUtuQ9ypCGFikR4w= access-type fe/kaDE5GWBC9Nfj6bNkgA==\r\n!\r\nencrypted-username mJ6sF5BOZeIUWsyCb3C1bw== password 8tMk4PMmywAU0cVXzSERF/aaj9WF0EAq4dB4c0qOLbU= access-type gf0PKwZMZRJ4zRba06ZC3w==\r\nhostname "AvayaG450A"\r\nset system location "Ontario Lab" \r\nno ip telnet \r\nip tftp-server file-system-size 2288\r\nset port mirror source-port 10/5 mirror-port 10/6 sampling always direction both\r\n!\r\nip capture-list 501\r\n name "udp"\r\n!\r\n ip-rule 1\r\n  ip-protocol udp\r\n exit\r\n ip-rule default\r\n  composite-operation "No-Capture"\r\n exit\r\n!\r\nexit\r\n!\r\nds-mode t1\r\n!\r\ninterface Vlan 1\r\n icc-vlan\r\n server-blade-vlan 5\r\n ip address 10.10.48.58     255.255.255.0  \r\n pmi\r\n exit\r\n!\r\ninterface FastEthernet 10/3\r\n exit\r\n!\r\ninterface FastEthernet 10/4\r\n exit\r\n!\r\ninterface Console\r\n speed 9600\r\n exit\r\n!\r\ninterface USB-Modem\r\n description "Default Modem Setup"\r\n timeout absolute 10\r\n ppp authentication ras\r\n no shutdown\r\n ip address 10.3.248.253    255.255.255.252\r\n exit\r\n!\r\ncapture max-frame-size 4096\r\ncapture buffer-mode non-cyclic\r\ncapture filter-group 501\r\nlogin authentication min-password-length 8\r\n!\r\nlogin authentication lockout 0 attempt 0\r\n! Avaya Login Confirmation Received.\r\nEASGManage enableEASG\r\nproduct-id 8c2ae2eead3e6cca800be892bb6e3411\r\n!\r\nset logging file enable \r\nset logging file condition all Error \r\nset logging file condition BOOT Debug \r\n!\r\nno snmp-server community \r\nencrypted-snmp-server user JSXE8Ccs0N0TnuoQek8jwLmaP391mjHjbt9glvbZ2M0= gAAa6QMAG08/c+A= v3ReadISO v3 auth sha 1FCIRMijXV+77fer97/S9O3FlfqIPrTOC5uTFcklYM8=  priv aes128 yyv5YmpCoEn5xZ24B7MR4Y03gnnqwygOY3eQTGRZZB0= \r\nencrypted-snmp-server user 0Ce9aP8Q25tEoXTe0YGwKmt2qLFQJ+UOpG6SMzseQdg= gAAa6QMAG08/c+A= v3TrapISO v3 auth sha TgX0mUpViHn56rSWounTurOYUdreS7rWWY7KssAnYj4=  priv aes128 p5Rdzsia/+4+Uc7f9oeJOj38gI6qX+2Fy1WDL5PTkh8= \r\nsnmp-server group v3ReadISO v3 priv read iso  \r\nsnmp-server group v3TrapISO v3 priv notify iso  \r\nsnmp-server host 10.10.48.92 traps v3 priv bbysnmpv3trap \r\n!\r\nip default-gateway 10.10.48.254    1 low  \r\n!\r\nset sync interface primary v3\r\nset sync source primary\r\nrtp-stat-service\r\nrtp-stat fault\r\nanalog-test\r\nexit\r\n!\r\nset sla-monitor enable\r\nset sla-server-ip-address 10.10.48.198\r\nudp keepalive 10\r\nset mgc list 10.10.48.240\r\nset mediaserver 10.10.48.240 10.10.48.240 23 telnet\r\nset mediaserver 10.10.48.240 10.10.48.240 5023 sat\r\n!#\r\n!# End of configuration file. Press Enter to continue.', 'show_sla_monitor': '\r\n\r\nSLA Monitor:                  Enabled\r\nRegistered Server IP Address: 192.111.111.111\r\nRegistered Server IP Port:    0\r\nConfigured Server IP Address: 10.10.48.198\r\nConfigured Server IP Port:    50011\r\nCapture Mode:                 None\r\nVersion:                      2.7.0', 'show_system': '\r\nSystem Name             : Ontario Lab\r\nSystem Location         : Ontario Lab\r\nSystem Contact          : \r\nUptime (d,h:m:s)        : 422,06:00:13\r\nCall Controller Time    : 13:33:56 16 DEC 2025 \r\nSerial No               : 13TG01116522\r\nModel                   : G430v3\r\nChassis HW Vintage      : 3\r\nChassis HW Suffix       : A\r\nMainboard HW Vintage    : 2\r\nMainboard HW Suffix     : B\r\nMainboard HW CS         : 2.1.7\r\nMainboard FW Vintage    : 42.36.0\r\nLAN MAC Address         : 00:1b:4f:3f:73:e0\r\nWAN1 MAC Address        : 00:1b:4f:3f:73:e1\r\nWAN2 MAC Address        : 00:1b:4f:3f:73:e2\r\nSERVICES MAC address    : 00:1b:4f:3f:73:e3\r\nMemory #1               : 256MB\r\nMemory #2               : Not present\r\nCompact Flash Memory    : 1GB Compact Flash card is installed\r\nPSU #1                  : AC 400W\r\nPSU #2                  : Not present\r\nMedia Socket #1         : MP160 VoIP DSP Module\r\nMedia Socket #2         : Not present\r\nMedia Socket #3         : Not present\r\nMedia Socket #4         : Not present\r\nFAN Tray                : Present', 'show_temp': '\r\nAmbient\r\n-------\r\nTemperature : -5C (23F)\r\nHigh Warning: 42C (108F)\r\nLow Warning : -5C (23F)', 'show_utilization': '\r\n\r\nMod   CPU      CPU     RAM      RAM\r\n      5sec     60sec   used(%)  Total(Kb)\r\n---   ------   -----  -------  ----------\r\n10    Appl. Disabled    48%     190838 Kb', 'show_voip_dsp': '\r\nDSP #1 PARAMETERS\r\n--------------------------------------------------------------\r\nBoard type     : MP160\r\nHw Vintage     : 0 B\r\nFw Vintage     : 182\r\n\r\nDSP#1 CURRENT STATE\r\n--------------------------------------------------------------\r\nIn Use         : 0 of 160 channels, 0 of 4800 points (0.0% used)\r\nState          : Idle\r\nAdmin State    : Release\r\n\r\nCore# Channels Admin     State\r\n      In Use   State\r\n----- -------- --------- -------\r\n    1  0 of 40   Release Idle\r\n    2  0 of 40   Release Idle\r\n    3  0 of 40   Release Idle\r\n    4  0 of 40   Release Idle\r\n\r\n\r\nDSP #2 Not Present\r\n\r\n\r\nDSP #3 Not Present\r\n\r\n\r\nDSP #4 Not Present', 'queue': Queue(), '_active_session': None, '_announcements': None, '_capture_service': None, '_chassis_hw': None, '_comp_flash': None, '_cpu_util': None, '_dsp': None, '_faults': None, '_fw': None, '_hw': None, '_inuse_dsp': None, '_last_seen_time': None, '_lldp': None, '_location': None, '_mac': None, '_mainboard_hw': None, '_memory': None, '_mm_groupdict': None, '_mm_v1': None, '_mm_v2': None, '_mm_v3': None, '_mm_v4': None, '_mm_v5': None, '_mm_v6': None, '_mm_v7': None, '_mm_v8': None, '_mm_v10': None, '_model': None, '_port1': None, '_port1_status': None, '_port1_neg': None, '_port1_duplex': None, '_port1_speed': None, '_port2': None, '_port2_status': None, '_port2_neg': None, '_port2_duplex': None, '_port2_speed': None, '_port_redu': None, '_psu1': None, '_psu2': None, '_ram_util': None, '_rtp_stat_service': None, '_serial': None, '_slamon_service': None, '_sla_server': None, '_snmp': None, '_snmp_trap': None, '_temp': None, '_total_session': None, '_uptime': None})
-        bgw2 = BGW(**{'lan_ip': '10.10.48.59', 'proto': 'ptls', 'polling_secs': 10, 'gw_name': 'AvayaG450B', 'gw_number': '002', 'polls': 1, 'avg_poll_secs': 10, 'active_session_ids': set(), 'last_seen': datetime(2025, 12, 16, 14, 33, 39), 'last_session_id': '', 'show_announcements_files': '\r\n ID      File               Description    Size (Bytes)      Date\r\n---- ------------------ ------------------ ------------ -------------------\r\n101   moh.wav            announcement file      239798    2022-08-23,8:45:26  \r\n102   emergency.wav      announcement file       26618    2023-03-24,11:36:10 \r\n103   public_announceme  announcement file      201914    2024-10-24,7:37:52  \r\n104   mohtest.wav        announcement file     9648106    2025-07-15,14:50:16 \r\n\r\nNv-Ram:\r\nTotal bytes used             : 10119680  \r\nTotal bytes free             : 12672000  \r\nTotal bytes capacity (fixed) : 22791680', 'show_capture': '\r\n\r\nCapture service is enabled and active\r\nCapture start time 09/12/2025-09:25:13\r\nCapture stop time not-stopped\r\nCurrent buffer size is 1024 KB\r\nBuffer mode is non-cyclic\r\nMaximum number of bytes captured from each frame: 4096\r\nCapture list 501 on all interfaces\r\nCapture IPSec decrypted\r\nNumber of captured frames in file: 604 (out of 145200 total captured frames)\r\nMemory buffer occupancy: 4.62% (including overheads)', 'show_faults': '\r\n\r\nCURRENTLY ACTIVE FAULTS\r\n--------------------------------------------------------------------------\r\n\r\n-- Media Module Faults --\r\n\t+ Insertion failure, mmid = v5, 11/24-07:37:04.00\r\n\r\nCurrent Alarm Indications, ALM LED is off\r\n--------------------------------------------------------------------------\r\nNone', 'show_lldp_config': '\r\n\r\nLldp Configuration \r\n-------------------\r\nApplication status: disable \r\nTx interval: 30 seconds\r\nTx hold multiplier: 4 seconds\r\nTx delay: 2 seconds\r\nReinit delay: 2 seconds', 'show_mg_list': '\r\nSLOT   TYPE         CODE        SUFFIX  HW VINTAGE  FW VINTAGE \r\n----   --------     ----------  ------  ----------  -----------\r\nv1     -- Not Installed --\r\nv2     -- Not Installed --\r\nv3     E1T1         MM710       B       16          52\r\nv4     -- Not Installed --\r\nv5     -- Initializing --\r\nv6     Analog       MM714       B       23          94\r\nv7     -- Not Installed --\r\nv8     -- Not Installed --\r\nv10    Mainboard    G450        B       2           42.36.0(A)', 'show_port': '\r\nPort   Name             Status    Vlan Level  Neg     Dup. Spd. Type\r\n------ ---------------- --------- ---- ------ ------- ---- ---- ----------------\r\n10/5   NO NAME          connected 1     0     enable  full 1G   Avaya Inc., G450 Media Gateway 10/100/1000BaseTx Port 10/5\r\n\r\n10/6   NO NAME          connected   1     0     enable  half 10M   Avaya Inc., G450 Media Gateway 10/100/1000BaseTx Port 10/6', 'show_rtp_stat_summary': '', 'show_running_config': '\r\n\r\n! version 42.36.0\r\nConfig info release 42.36.0 time "13:33:51 16 DEC 2025 " serial_number 10IS41452851\r\n !\r\nencrypted-username +ikJzwEP/t+XkAlH3l+zsw== password G6uSyomIZMSDb0NnT4RwvSb4IrSGUtuQ9ypCGFikR4w= access-type fe/kaDE5GWBC9Nfj6bNkgA==\r\n!\r\nencrypted-username mJ6sF5BOZeIUWsyCb3C1bw== password 8tMk4PMmywAU0cVXzSERF/aaj9WF0EAq4dB4c0qOLbU= access-type gf0PKwZMZRJ4zRba06ZC3w==\r\nhostname "AvayaG450A"\r\nset system location "Calgary" \r\nno ip telnet \r\nip tftp-server file-system-size 2288\r\nset port mirror source-port 10/5 mirror-port 10/6 sampling always direction both\r\n!\r\nip capture-list 501\r\n name "udp"\r\n!\r\n ip-rule 1\r\n  ip-protocol udp\r\n exit\r\n ip-rule default\r\n  composite-operation "No-Capture"\r\n exit\r\n!\r\nexit\r\n!\r\nds-mode t1\r\n!\r\ninterface Vlan 1\r\n icc-vlan\r\n server-blade-vlan 5\r\n ip address 10.10.48.59     255.255.255.0  \r\n pmi\r\n exit\r\n!\r\ninterface FastEthernet 10/3\r\n exit\r\n!\r\ninterface FastEthernet 10/4\r\n exit\r\n!\r\ninterface Console\r\n speed 9600\r\n exit\r\n!\r\ninterface USB-Modem\r\n description "Default Modem Setup"\r\n timeout absolute 10\r\n ppp authentication ras\r\n no shutdown\r\n ip address 10.3.248.253    255.255.255.252\r\n exit\r\n!\r\ncapture max-frame-size 4096\r\ncapture buffer-mode non-cyclic\r\ncapture filter-group 501\r\nlogin authentication min-password-length 8\r\n!\r\nlogin authentication lockout 0 attempt 0\r\n! Avaya Login Confirmation Received.\r\nEASGManage enableEASG\r\nproduct-id 8c2ae2eead3e6cca800be892bb6e3411\r\n!\r\nset logging file enable \r\nset logging file condition all Error \r\nset logging file condition BOOT Debug \r\n!\r\nno snmp-server community \r\nencrypted-snmp-server user JSXE8Ccs0N0TnuoQek8jwLmaP391mjHjbt9glvbZ2M0= gAAa6QMAG08/c+A= v3ReadISO v3 auth sha 1FCIRMijXV+77fer97/S9O3FlfqIPrTOC5uTFcklYM8=  priv aes128 yyv5YmpCoEn5xZ24B7MR4Y03gnnqwygOY3eQTGRZZB0= \r\nencrypted-snmp-server user 0Ce9aP8Q25tEoXTe0YGwKmt2qLFQJ+UOpG6SMzseQdg= gAAa6QMAG08/c+A= v3TrapISO v3 auth sha TgX0mUpViHn56rSWounTurOYUdreS7rWWY7KssAnYj4=  priv aes128 p5Rdzsia/+4+Uc7f9oeJOj38gI6qX+2Fy1WDL5PTkh8= \r\nsnmp-server group v3ReadISO v3 priv read iso  \r\nsnmp-server group v3TrapISO v3 priv notify iso  \r\nsnmp-server host 10.10.48.92 traps v3 priv bbysnmpv3trap \r\n!\r\nip default-gateway 10.10.48.254    1 low  \r\n!\r\nset sync interface primary v3\r\nset sync source primary\r\nrtp-stat-service\r\nrtp-stat fault\r\nanalog-test\r\nexit\r\n!\r\nset sla-monitor enable\r\nset sla-server-ip-address 10.10.48.198\r\nudp keepalive 10\r\nset mgc list 10.10.48.240\r\nset mediaserver 10.10.48.240 10.10.48.240 23 telnet\r\nset mediaserver 10.10.48.240 10.10.48.240 5023 sat\r\n!#\r\n!# End of configuration file. Press Enter to continue.', 'show_sla_monitor': '\r\n\r\nSLA Monitor:                  Enabled\r\nRegistered Server IP Address: 0.0.0.0\r\nRegistered Server IP Port:    0\r\nConfigured Server IP Address: 10.10.48.198\r\nConfigured Server IP Port:    50011\r\nCapture Mode:                 None\r\nVersion:                      2.7.0', 'show_system': '\r\nSystem Name             : Calgary\r\nSystem Location         : Calgary\r\nSystem Contact          : \r\nUptime (d,h:m:s)        : 22,06:00:13\r\nCall Controller Time    : 13:33:56 16 DEC 2025 \r\nSerial No               : 13TG01116522\r\nModel                   : G450\r\nChassis HW Vintage      : 1\r\nChassis HW Suffix       : A\r\nMainboard HW Vintage    : 2\r\nMainboard HW Suffix     : B\r\nMainboard HW CS         : 2.1.7\r\nMainboard FW Vintage    : 42.36.0\r\nLAN MAC Address         : 00:1b:4f:3f:73:e8\r\nWAN1 MAC Address        : 00:1b:4f:3f:73:e1\r\nWAN2 MAC Address        : 00:1b:4f:3f:73:e2\r\nSERVICES MAC address    : 00:1b:4f:3f:73:e3\r\nMemory #1               : 256MB\r\nMemory #2               : Not present\r\nCompact Flash Memory    : No CompactFlash card is installed\r\nPSU #1                  : AC 400W\r\nPSU #2                  : Not present\r\nMedia Socket #1         : MP160 VoIP DSP Module\r\nMedia Socket #2         : Not present\r\nMedia Socket #3         : Not present\r\nMedia Socket #4         : Not present\r\nFAN Tray                : Present', 'show_temp': '\r\nAmbient\r\n-------\r\nTemperature : 42C (108F)\r\nHigh Warning: 42C (108F)\r\nLow Warning : -5C (23F)', 'show_utilization': '\r\n\r\nMod   CPU      CPU     RAM      RAM\r\n      5sec     60sec   used(%)  Total(Kb)\r\n---   ------   -----  -------  ----------\r\n10    Appl. Disabled    48%     190838 Kb', 'show_voip_dsp': '\r\nDSP #1 PARAMETERS\r\n--------------------------------------------------------------\r\nBoard type     : MP160\r\nHw Vintage     : 0 B\r\nFw Vintage     : 182\r\n\r\nDSP#1 CURRENT STATE\r\n--------------------------------------------------------------\r\nIn Use         : 0 of 160 channels, 0 of 4800 points (0.0% used)\r\nState          : Idle\r\nAdmin State    : Release\r\n\r\nCore# Channels Admin     State\r\n      In Use   State\r\n----- -------- --------- -------\r\n    1  0 of 40   Release Idle\r\n    2  0 of 40   Release Idle\r\n    3  0 of 40   Release Idle\r\n    4  0 of 40   Release Idle\r\n\r\n\r\nDSP #2 Not Present\r\n\r\n\r\nDSP #3 Not Present\r\n\r\n\r\nDSP #4 Not Present', 'queue': Queue(), '_active_session': None, '_announcements': None, '_capture_service': None, '_chassis_hw': None, '_comp_flash': None, '_cpu_util': None, '_dsp': None, '_faults': None, '_fw': None, '_hw': None, '_inuse_dsp': None, '_last_seen_time': None, '_lldp': None, '_location': None, '_mac': None, '_mainboard_hw': None, '_memory': None, '_mm_groupdict': None, '_mm_v1': None, '_mm_v2': None, '_mm_v3': None, '_mm_v4': None, '_mm_v5': None, '_mm_v6': None, '_mm_v7': None, '_mm_v8': None, '_mm_v10': None, '_model': None, '_port1': None, '_port1_status': None, '_port1_neg': None, '_port1_duplex': None, '_port1_speed': None, '_port2': None, '_port2_status': None, '_port2_neg': None, '_port2_duplex': None, '_port2_speed': None, '_port_redu': None, '_psu1': None, '_psu2': None, '_ram_util': None, '_rtp_stat_service': None, '_serial': None, '_slamon_service': None, '_sla_server': None, '_snmp': None, '_snmp_trap': None, '_temp': None, '_total_session': None, '_uptime': None})
-        bgw3 = BGW(**{'lan_ip': '192.168.110.111', 'proto': 'ptls', 'polling_secs': 10, 'gw_name': 'AvayaG450C', 'gw_number': '003', 'polls': 1, 'avg_poll_secs': 10, 'active_session_ids': set(), 'last_seen': datetime(2025, 12, 16, 14, 33, 39), 'last_session_id': '', 'show_announcements_files': '\r\n ID      File               Description    Size (Bytes)      Date\r\n---- ------------------ ------------------ ------------ -------------------\r\n101   moh.wav            announcement file      239798    2022-08-23,8:45:26  \r\n102   emergency.wav      announcement file       26618    2023-03-24,11:36:10 \r\n103   public_announceme  announcement file      201914    2024-10-24,7:37:52  \r\n104   mohtest.wav        announcement file     9648106    2025-07-15,14:50:16 \r\n\r\nNv-Ram:\r\nTotal bytes used             : 10119680  \r\nTotal bytes free             : 12672000  \r\nTotal bytes capacity (fixed) : 22791680', 'show_capture': '\r\n\r\nCapture service is enabled and active\r\nCapture start time 09/12/2025-09:25:13\r\nCapture stop time not-stopped\r\nCurrent buffer size is 1024 KB\r\nBuffer mode is non-cyclic\r\nMaximum number of bytes captured from each frame: 4096\r\nCapture list 501 on all interfaces\r\nCapture IPSec decrypted\r\nNumber of captured frames in file: 604 (out of 145200 total captured frames)\r\nMemory buffer occupancy: 4.62% (including overheads)', 'show_faults': '\r\n\r\nNo Fault Messages\r\n--------------------------------------------------------------------------\r\nNone', 'show_lldp_config': '\r\n\r\nLldp Configuration \r\n-------------------\r\nApplication status: disable \r\nTx interval: 30 seconds\r\nTx hold multiplier: 4 seconds\r\nTx delay: 2 seconds\r\nReinit delay: 2 seconds', 'show_mg_list': '\r\nSLOT   TYPE         CODE        SUFFIX  HW VINTAGE  FW VINTAGE \r\n----   --------     ----------  ------  ----------  -----------\r\nv1     -- Not Installed --\r\nv2     -- Not Installed --\r\nv3     E1T1         MM710       B       16          52\r\nv4     -- Not Installed --\r\nv5     -- Initializing --\r\nv6     Analog       MM714       B       23          94\r\nv7     -- Not Installed --\r\nv8     -- Not Installed --\r\nv10    Mainboard    G450        B       2           42.36.0(A)', 'show_port': '\r\nPort   Name             Status    Vlan Level  Neg     Dup. Spd. Type\r\n------ ---------------- --------- ---- ------ ------- ---- ---- ----------------\r\n10/5   NO NAME          connected 1     0     enable  full 1G   Avaya Inc., G450 Media Gateway 10/100/1000BaseTx Port 10/5\r\n\r\n10/6   NO NAME          no link   1     0     enable  full 1G   Avaya Inc., G450 Media Gateway 10/100/1000BaseTx Port 10/6', 'show_rtp_stat_summary': '', 'show_running_config': '\r\n\r\n! version 42.36.0\r\nConfig info release 42.36.0 time "13:33:51 16 DEC 2025 " serial_number 10IS41452851\r\n !\r\nencrypted-username +ikJzwEP/t+XkAlH3l+zsw== password G6uSyomIZMSDb0NnT4RwvSb4IrSGUtuQ9ypCGFikR4w= access-type fe/kaDE5GWBC9Nfj6bNkgA==\r\n!\r\nencrypted-username mJ6sF5BOZeIUWsyCb3C1bw== password 8tMk4PMmywAU0cVXzSERF/aaj9WF0EAq4dB4c0qOLbU= access-type gf0PKwZMZRJ4zRba06ZC3w==\r\nhostname "AvayaG450A"\r\nset system location "Calgary" \r\nno ip telnet \r\nip tftp-server file-system-size 2288\r\nset port mirror source-port 10/5 mirror-port 10/6 sampling always direction both\r\n!\r\nip capture-list 501\r\n name "udp"\r\n!\r\n ip-rule 1\r\n  ip-protocol udp\r\n exit\r\n ip-rule default\r\n  composite-operation "No-Capture"\r\n exit\r\n!\r\nexit\r\n!\r\nds-mode t1\r\n!\r\ninterface Vlan 1\r\n icc-vlan\r\n server-blade-vlan 5\r\n ip address 10.10.48.60     255.255.255.0  \r\n pmi\r\n exit\r\n!\r\ninterface FastEthernet 10/3\r\n exit\r\n!\r\ninterface FastEthernet 10/4\r\n exit\r\n!\r\ninterface Console\r\n speed 9600\r\n exit\r\n!\r\ninterface USB-Modem\r\n description "Default Modem Setup"\r\n timeout absolute 10\r\n ppp authentication ras\r\n no shutdown\r\n ip address 10.3.248.253    255.255.255.252\r\n exit\r\n!\r\ncapture max-frame-size 4096\r\ncapture buffer-mode non-cyclic\r\ncapture filter-group 501\r\nlogin authentication min-password-length 8\r\n!\r\nlogin authentication lockout 0 attempt 0\r\n! Avaya Login Confirmation Received.\r\nEASGManage enableEASG\r\nproduct-id 8c2ae2eead3e6cca800be892bb6e3411\r\n!\r\nset logging file enable \r\nset logging file condition all Error \r\nset logging file condition BOOT Debug \r\n!\r\nno snmp-server community \r\nencrypted-snmp-server user JSXE8Ccs0N0TnuoQek8jwLmaP391mjHjbt9glvbZ2M0= gAAa6QMAG08/c+A= v3ReadISO v3 auth sha 1FCIRMijXV+77fer97/S9O3FlfqIPrTOC5uTFcklYM8=  priv aes128 yyv5YmpCoEn5xZ24B7MR4Y03gnnqwygOY3eQTGRZZB0= \r\nencrypted-snmp-server user 0Ce9aP8Q25tEoXTe0YGwKmt2qLFQJ+UOpG6SMzseQdg= gAAa6QMAG08/c+A= v3TrapISO v3 auth sha TgX0mUpViHn56rSWounTurOYUdreS7rWWY7KssAnYj4=  priv aes128 p5Rdzsia/+4+Uc7f9oeJOj38gI6qX+2Fy1WDL5PTkh8= \r\nsnmp-server group v3ReadISO v3 priv read iso  \r\nsnmp-server group v3TrapISO v3 priv notify iso  \r\nsnmp-server host 10.10.48.92 traps v3 priv bbysnmpv3trap \r\n!\r\nip default-gateway 10.10.48.254    1 low  \r\n!\r\nset sync interface primary v3\r\nset sync source primary\r\nrtp-stat-service\r\nrtp-stat fault\r\nanalog-test\r\nexit\r\n!\r\nset sla-monitor enable\r\nset sla-server-ip-address 10.10.48.198\r\nudp keepalive 10\r\nset mgc list 10.10.48.240\r\nset mediaserver 10.10.48.240 10.10.48.240 23 telnet\r\nset mediaserver 10.10.48.240 10.10.48.240 5023 sat\r\n!#\r\n!# End of configuration file. Press Enter to continue.', 'show_sla_monitor': '\r\n\r\nSLA Monitor:                 Disabled\r\nRegistered Server IP Address: 0.0.0.0\r\nRegistered Server IP Port:    0\r\nConfigured Server IP Address: 10.10.48.198\r\nConfigured Server IP Port:    50011\r\nCapture Mode:                 None\r\nVersion:                      2.7.0', 'show_system': '\r\nSystem Name             : \r\nSystem Location         : Calgary\r\nSystem Contact          : \r\nUptime (d,h:m:s)        : 22,06:00:13\r\nCall Controller Time    : 13:33:56 16 DEC 2025 \r\nSerial No               : 13TG01116522\r\nModel                   : G450\r\nChassis HW Vintage      : 1\r\nChassis HW Suffix       : A\r\nMainboard HW Vintage    : 2\r\nMainboard HW Suffix     : B\r\nMainboard HW CS         : 2.1.7\r\nMainboard FW Vintage    : 42.36.0\r\nLAN MAC Address         : 00:1b:4f:3f:73:e4\r\nWAN1 MAC Address        : 00:1b:4f:3f:73:e1\r\nWAN2 MAC Address        : 00:1b:4f:3f:73:e2\r\nSERVICES MAC address    : 00:1b:4f:3f:73:e4\r\nMemory #1               : 256MB\r\nMemory #2               : Not present\r\nCompact Flash Memory    : No CompactFlash card is installed\r\nPSU #1                  : AC 400W\r\nPSU #2                  : Not present\r\nMedia Socket #1         : MP160 VoIP DSP Module\r\nMedia Socket #2         : Not present\r\nMedia Socket #3         : Not present\r\nMedia Socket #4         : Not present\r\nFAN Tray                : Present', 'show_temp': '\r\nAmbient\r\n-------\r\nTemperature : 36C (97F)\r\nHigh Warning: 42C (108F)\r\nLow Warning : -5C (23F)', 'show_utilization': '\r\n\r\nMod   CPU      CPU     RAM      RAM\r\n      5sec     60sec   used(%)  Total(Kb)\r\n---   ------   -----  -------  ----------\r\n10    Appl. Disabled    48%     190838 Kb', 'show_voip_dsp': '\r\nDSP #1 PARAMETERS\r\n--------------------------------------------------------------\r\nBoard type     : MP160\r\nHw Vintage     : 0 B\r\nFw Vintage     : 182\r\n\r\nDSP#1 CURRENT STATE\r\n--------------------------------------------------------------\r\nIn Use         : 0 of 160 channels, 0 of 4800 points (0.0% used)\r\nState          : Idle\r\nAdmin State    : Release\r\n\r\nCore# Channels Admin     State\r\n      In Use   State\r\n----- -------- --------- -------\r\n    1  0 of 40   Release Idle\r\n    2  0 of 40   Release Idle\r\n    3  0 of 40   Release Idle\r\n    4  0 of 40   Release Idle\r\n\r\n\r\nDSP #2 Not Present\r\n\r\n\r\nDSP #3 Not Present\r\n\r\n\r\nDSP #4 Not Present', 'queue': Queue(), '_active_session': None, '_announcements': None, '_capture_service': None, '_chassis_hw': None, '_comp_flash': None, '_cpu_util': None, '_dsp': None, '_faults': None, '_fw': None, '_hw': None, '_inuse_dsp': None, '_last_seen_time': None, '_lldp': None, '_location': None, '_mac': None, '_mainboard_hw': None, '_memory': None, '_mm_groupdict': None, '_mm_v1': None, '_mm_v2': None, '_mm_v3': None, '_mm_v4': None, '_mm_v5': None, '_mm_v6': None, '_mm_v7': None, '_mm_v8': None, '_mm_v10': None, '_model': None, '_port1': None, '_port1_status': None, '_port1_neg': None, '_port1_duplex': None, '_port1_speed': None, '_port2': None, '_port2_status': None, '_port2_neg': None, '_port2_duplex': None, '_port2_speed': None, '_port_redu': None, '_psu1': None, '_psu2': None, '_ram_util': None, '_rtp_stat_service': None, '_serial': None, '_slamon_service': None, '_sla_server': None, '_snmp': None, '_snmp_trap': None, '_temp': None, '_total_session': None, '_uptime': None})
-        BGWs = MemoryStorage({'10.10.48.58': bgw1, '10.10.48.59': bgw2, '192.168.110.111': bgw3})
-        GWs = {'10.10.48.58': "001", "10.10.48.59": "002", "192.168.110.111": "003", "10.44.244.51": "004"}
-
-        STORAGE = MemoryStorage()
-        d = {
-            "2024-11-04,10:06:07,001,00001": "\r\nshow rtp-stat detailed 00001\r\n\r\nSession-ID: 1\r\nStatus: Terminated, QOS: Faulted, EngineId: 10\r\nStart-Time: 2024-11-04,10:06:07, End-Time: 2024-11-04,10:07:07\r\nDuration: 00:02:00\r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.111:2052 SSRC 1653399062\r\nRemote-Address: 10.10.48.192:35000 SSRC 2704961869 (0)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG729A 200B 20mS srtpAesCm128HmacSha180, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 4.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 0.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 1243, Loss 0.3% #0, Avg-Loss 0.3%, RTT 0mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 0, Seq-Fall 1, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 0, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 0.0% #0, Avg-Loss 0.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2025-12-14,10:07:27,002,00002": "\r\nshow rtp-stat detailed 00002\r\n\r\nSession-ID: 1\r\nStatus: Active, QOS: Ok, EngineId: 10\r\nStart-Time: 2025-12-14,10:07:27, End-Time: -\r\nDuration: - \r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.112:2052 SSRC 1653399062\r\nRemote-Address: 10.10.48.192:35000 SSRC 2704961869 (0)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG711U 200B 20mS srtpAesCm128HmacSha180, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 334.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 0.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 123, Loss 0.3% #0, Avg-Loss 0.3%, RTT 0mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 2, Seq-Fall 0, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 46, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 2.0% #0, Avg-Loss 1.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2025-12-14,10:08:07,003,00001": "\r\nshow rtp-stat detailed 00001\r\n\r\nSession-ID: 1\r\nStatus: Active, QOS: Ok, EngineId: 10\r\nStart-Time: 2025-12-14,10:08:07, End-Time: 2025-12-14,10:08:22\r\nDuration: 00:12:20\r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.113:2056 SSRC 1653399062\r\nRemote-Address: 192.168.110.111:35001 SSRC 2704961869 (0)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG711U 230B 30mS Off, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 334.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 1.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 0, Loss 0.3% #0, Avg-Loss 0.3%, RTT 0mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 0, Seq-Fall 0, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 46, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 0.0% #0, Avg-Loss 0.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-
-        }
-
-        for global_id, value in d.items():
-                rtpdetailed = parse_rtpstat(global_id, value)
-                STORAGE.put({global_id: rtpdetailed})
-
-    bgw = BGW(**{'lan_ip': '10.10.48.58', 'proto': 'ptls', 'polling_secs': 10, 'gw_name': 'AvayaG450A', 'gw_number': '001', 'polls': 1, 'avg_poll_secs': 10, 'active_session_ids': set(), 'last_seen': datetime(2025, 12, 16, 14, 33, 39), 'last_session_id': '', 'show_announcements_files': '\r\n ID      File               Description    Size (Bytes)      Date\r\n---- ------------------ ------------------ ------------ -------------------\r\n101   moh.wav            announcement file      239798    2022-08-23,8:45:26  \r\n102   emergency.wav      announcement file       26618    2023-03-24,11:36:10 \r\n103   public_announceme  announcement file      201914    2024-10-24,7:37:52  \r\n104   mohtest.wav        announcement file     9648106    2025-07-15,14:50:16 \r\n\r\nNv-Ram:\r\nTotal bytes used             : 10119680  \r\nTotal bytes free             : 12672000  \r\nTotal bytes capacity (fixed) : 22791680', 'show_capture': '\r\n\r\nCapture service is enabled and active\r\nCapture start time 09/12/2025-09:25:13\r\nCapture stop time not-stopped\r\nCurrent buffer size is 1024 KB\r\nBuffer mode is non-cyclic\r\nMaximum number of bytes captured from each frame: 4096\r\nCapture list 501 on all interfaces\r\nCapture IPSec decrypted\r\nNumber of captured frames in file: 604 (out of 145200 total captured frames)\r\nMemory buffer occupancy: 4.62% (including overheads)', 'show_faults': '\r\n\r\nCURRENTLY ACTIVE FAULTS\r\n--------------------------------------------------------------------------\r\n\r\n-- Media Module Faults --\r\n\t+ Insertion failure, mmid = v5, 11/24-07:37:04.00\r\n\r\nCurrent Alarm Indications, ALM LED is off\r\n--------------------------------------------------------------------------\r\nNone', 'show_lldp_config': '\r\n\r\nLldp Configuration \r\n-------------------\r\nApplication status: disable \r\nTx interval: 30 seconds\r\nTx hold multiplier: 4 seconds\r\nTx delay: 2 seconds\r\nReinit delay: 2 seconds', 'show_mg_list': '\r\nSLOT   TYPE         CODE        SUFFIX  HW VINTAGE  FW VINTAGE \r\n----   --------     ----------  ------  ----------  -----------\r\nv1     -- Not Installed --\r\nv2     -- Not Installed --\r\nv3     E1T1         MM710       B       16          52\r\nv4     -- Not Installed --\r\nv5     -- Initializing --\r\nv6     Analog       MM714       B       23          94\r\nv7     -- Not Installed --\r\nv8     -- Not Installed --\r\nv10    Mainboard    G450        B       2           42.36.0(A)', 'show_port': '\r\nPort   Name             Status    Vlan Level  Neg     Dup. Spd. Type\r\n------ ---------------- --------- ---- ------ ------- ---- ---- ----------------\r\n10/5   NO NAME          connected 1     0     enable  full 1G   Avaya Inc., G450 Media Gateway 10/100/1000BaseTx Port 10/5\r\n\r\n10/6   NO NAME          no link   1     0     enable  full 1G   Avaya Inc., G450 Media Gateway 10/100/1000BaseTx Port 10/6', 'show_rtp_stat_summary': '', 'show_running_config': '\r\n\r\n! version 42.36.0\r\nConfig info release 42.36.0 time "13:33:51 16 DEC 2025 " serial_number 10IS41452851\r\n !\r\nencrypted-username +ikJzwEP/t+XkAlH3l+zsw== password G6uSyomIZMSDb0NnT4RwvSb4IrSGUtuQ9ypCGFikR4w= access-type fe/kaDE5GWBC9Nfj6bNkgA==\r\n!\r\nencrypted-username mJ6sF5BOZeIUWsyCb3C1bw== password 8tMk4PMmywAU0cVXzSERF/aaj9WF0EAq4dB4c0qOLbU= access-type gf0PKwZMZRJ4zRba06ZC3w==\r\nhostname "AvayaG450A"\r\nset system location "Calgary" \r\nno ip telnet \r\nip tftp-server file-system-size 2288\r\nset port mirror source-port 10/5 mirror-port 10/6 sampling always direction both\r\n!\r\nip capture-list 501\r\n name "udp"\r\n!\r\n ip-rule 1\r\n  ip-protocol udp\r\n exit\r\n ip-rule default\r\n  composite-operation "No-Capture"\r\n exit\r\n!\r\nexit\r\n!\r\nds-mode t1\r\n!\r\ninterface Vlan 1\r\n icc-vlan\r\n server-blade-vlan 5\r\n ip address 10.10.48.58     255.255.255.0  \r\n pmi\r\n exit\r\n!\r\ninterface FastEthernet 10/3\r\n exit\r\n!\r\ninterface FastEthernet 10/4\r\n exit\r\n!\r\ninterface Console\r\n speed 9600\r\n exit\r\n!\r\ninterface USB-Modem\r\n description "Default Modem Setup"\r\n timeout absolute 10\r\n ppp authentication ras\r\n no shutdown\r\n ip address 10.3.248.253    255.255.255.252\r\n exit\r\n!\r\ncapture max-frame-size 4096\r\ncapture buffer-mode non-cyclic\r\ncapture filter-group 501\r\nlogin authentication min-password-length 8\r\n!\r\nlogin authentication lockout 0 attempt 0\r\n! Avaya Login Confirmation Received.\r\nEASGManage enableEASG\r\nproduct-id 8c2ae2eead3e6cca800be892bb6e3411\r\n!\r\nset logging file enable \r\nset logging file condition all Error \r\nset logging file condition BOOT Debug \r\n!\r\nno snmp-server community \r\nencrypted-snmp-server user JSXE8Ccs0N0TnuoQek8jwLmaP391mjHjbt9glvbZ2M0= gAAa6QMAG08/c+A= v3ReadISO v3 auth sha 1FCIRMijXV+77fer97/S9O3FlfqIPrTOC5uTFcklYM8=  priv aes128 yyv5YmpCoEn5xZ24B7MR4Y03gnnqwygOY3eQTGRZZB0= \r\nencrypted-snmp-server user 0Ce9aP8Q25tEoXTe0YGwKmt2qLFQJ+UOpG6SMzseQdg= gAAa6QMAG08/c+A= v3TrapISO v3 auth sha TgX0mUpViHn56rSWounTurOYUdreS7rWWY7KssAnYj4=  priv aes128 p5Rdzsia/+4+Uc7f9oeJOj38gI6qX+2Fy1WDL5PTkh8= \r\nsnmp-server group v3ReadISO v3 priv read iso  \r\nsnmp-server group v3TrapISO v3 priv notify iso  \r\nsnmp-server host 10.10.48.92 traps v3 priv bbysnmpv3trap \r\n!\r\nip default-gateway 10.10.48.254    1 low  \r\n!\r\nset sync interface primary v3\r\nset sync source primary\r\nrtp-stat-service\r\nrtp-stat fault\r\nanalog-test\r\nexit\r\n!\r\nset sla-monitor enable\r\nset sla-server-ip-address 10.10.48.198\r\nudp keepalive 10\r\nset mgc list 10.10.48.240\r\nset mediaserver 10.10.48.240 10.10.48.240 23 telnet\r\nset mediaserver 10.10.48.240 10.10.48.240 5023 sat\r\n!#\r\n!# End of configuration file. Press Enter to continue.', 'show_sla_monitor': '\r\n\r\nSLA Monitor:                  Enabled\r\nRegistered Server IP Address: 0.0.0.0\r\nRegistered Server IP Port:    0\r\nConfigured Server IP Address: 10.10.48.198\r\nConfigured Server IP Port:    50011\r\nCapture Mode:                 None\r\nVersion:                      2.7.0', 'show_system': '\r\nSystem Name             : \r\nSystem Location         : Calgary\r\nSystem Contact          : \r\nUptime (d,h:m:s)        : 22,06:00:13\r\nCall Controller Time    : 13:33:56 16 DEC 2025 \r\nSerial No               : 13TG01116522\r\nModel                   : G450\r\nChassis HW Vintage      : 1\r\nChassis HW Suffix       : A\r\nMainboard HW Vintage    : 2\r\nMainboard HW Suffix     : B\r\nMainboard HW CS         : 2.1.7\r\nMainboard FW Vintage    : 42.36.0\r\nLAN MAC Address         : 00:1b:4f:3f:73:e0\r\nWAN1 MAC Address        : 00:1b:4f:3f:73:e1\r\nWAN2 MAC Address        : 00:1b:4f:3f:73:e2\r\nSERVICES MAC address    : 00:1b:4f:3f:73:e3\r\nMemory #1               : 256MB\r\nMemory #2               : Not present\r\nCompact Flash Memory    : No CompactFlash card is installed\r\nPSU #1                  : AC 400W\r\nPSU #2                  : Not present\r\nMedia Socket #1         : MP160 VoIP DSP Module\r\nMedia Socket #2         : Not present\r\nMedia Socket #3         : Not present\r\nMedia Socket #4         : Not present\r\nFAN Tray                : Present', 'show_temp': '\r\nAmbient\r\n-------\r\nTemperature : 36C (97F)\r\nHigh Warning: 42C (108F)\r\nLow Warning : -5C (23F)', 'show_utilization': '\r\n\r\nMod   CPU      CPU     RAM      RAM\r\n      5sec     60sec   used(%)  Total(Kb)\r\n---   ------   -----  -------  ----------\r\n10    Appl. Disabled    48%     190838 Kb', 'show_voip_dsp': '\r\nDSP #1 PARAMETERS\r\n--------------------------------------------------------------\r\nBoard type     : MP160\r\nHw Vintage     : 0 B\r\nFw Vintage     : 182\r\n\r\nDSP#1 CURRENT STATE\r\n--------------------------------------------------------------\r\nIn Use         : 0 of 160 channels, 0 of 4800 points (0.0% used)\r\nState          : Idle\r\nAdmin State    : Release\r\n\r\nCore# Channels Admin     State\r\n      In Use   State\r\n----- -------- --------- -------\r\n    1  0 of 40   Release Idle\r\n    2  0 of 40   Release Idle\r\n    3  0 of 40   Release Idle\r\n    4  0 of 40   Release Idle\r\n\r\n\r\nDSP #2 Not Present\r\n\r\n\r\nDSP #3 Not Present\r\n\r\n\r\nDSP #4 Not Present', 'queue': Queue(), '_active_session': None, '_announcements': None, '_capture_service': None, '_chassis_hw': None, '_comp_flash': None, '_cpu_util': None, '_dsp': None, '_faults': None, '_fw': None, '_hw': None, '_inuse_dsp': None, '_last_seen_time': None, '_lldp': None, '_location': None, '_mac': None, '_mainboard_hw': None, '_memory': None, '_mm_groupdict': None, '_mm_v1': None, '_mm_v2': None, '_mm_v3': None, '_mm_v4': None, '_mm_v5': None, '_mm_v6': None, '_mm_v7': None, '_mm_v8': None, '_mm_v10': None, '_model': None, '_port1': None, '_port1_status': None, '_port1_neg': None, '_port1_duplex': None, '_port1_speed': None, '_port2': None, '_port2_status': None, '_port2_neg': None, '_port2_duplex': None, '_port2_speed': None, '_port_redu': None, '_psu1': None, '_psu2': None, '_ram_util': None, '_rtp_stat_service': None, '_serial': None, '_slamon_service': None, '_sla_server': None, '_snmp': None, '_snmp_trap': None, '_temp': None, '_total_session': None, '_uptime': None})
-    rtpdetails = parse_rtpstat("2024-11-04,10:06:07,001,00001", "\r\nshow rtp-stat detailed 00001\r\n\r\nSession-ID: 1\r\nStatus: Terminated, QOS: Ok, EngineId: 10\r\nStart-Time: 2024-11-04,10:06:07, End-Time: 2024-11-04,10:07:07\r\nDuration: 00:00:00\r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.110:2052 SSRC 1653399062\r\nRemote-Address: 10.10.48.192:35000 SSRC 2704961869 (0)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG711U 200B 20mS srtpAesCm128HmacSha180, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 4.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 0.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 1, Loss 0.3% #0, Avg-Loss 0.3%, RTT 0mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 0, Seq-Fall 0, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 46, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 0.0% #0, Avg-Loss 0.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n")
-
-    for layout_name, columns in LAYOUTS.items():
-        layout = Layout(columns)
+    from demo import load_demo_bgws, load_demo_rtps
+
+    bgw = next(iter(load_demo_bgws().values()))
+    rtpdetails = next(iter(load_demo_rtps().values()))
+
+    for layout_name, layout in SCREEN_LAYOUTs.items():
         
         print(f"========== {layout_name} COLUMNS ==========")
         for y, x, text, color in layout.iter_attrs(obj=None):
@@ -2016,7 +2146,7 @@ if __name__ == "__main__":
     print("====== RTPDetailed ======")
     for y, x, text, color in iter_attrs(
         obj=rtpdetails,
-        spec=RTP_LAYOUT,
+        spec=RTP_COLUMNS,
         colors=COLORS,
         xoffset=0,
         yoffset=0,
@@ -36,30 +36,39 @@ os.nice(19)
 
 import argparse
 import asyncio
+import atexit
 import base64
 import _curses, curses, curses.ascii, curses.panel, curses.textpad
+import heapq
 import json
 import locale
 import logging
 import re
 import resource
 import socket
+import subprocess
 import sys
+import tempfile
 import termios
 import time
 import zlib
 
 from abc import ABC, abstractmethod
+from array import array
 from asyncio import Queue, Semaphore
-from bisect import insort_left
+from bisect import bisect_left, insort_left
 from contextlib import contextmanager
+from collections import deque
 from collections.abc import MutableMapping, ItemsView
 from datetime import datetime
-from functools import partial
+from functools import lru_cache, partial, wraps
+from operator import itemgetter
+from types import MappingProxyType
+from weakref import WeakKeyDictionary
 from urllib.parse import unquote
 from typing import AbstractSet, Any, Callable, Coroutine, Dict, FrozenSet
 from typing import Generator, Generic, Iterable, Iterator, ItemsView
-from typing import List, Mapping, MutableMapping, Optional, Set, Sequence
+from typing import List, Mapping, MutableMapping, NamedTuple, Optional, Set, Sequence
 from typing import Tuple, TypeVar, Union
 from typing import TYPE_CHECKING
 
@@ -76,20 +85,23 @@ from rtpparser import *
 from workspace import MyDisplay, Button, FilterPanel, ProgressBar, Confirmation, TextPanel, ObjectPanel, Workspace
 from filter import *
 from utils import *
-from layout import LAYOUTS, Layout, RTP_LAYOUT, COLORS, iter_attrs
+from layout import SCREEN_LAYOUTs, RTP_COLUMNS, COLORS, iter_attrs
 
 ############################## BEGIN MODULES ##################################
 
 ############################## END MODULES ####################################
 ############################## BEGIN UI FUNCTIONS #############################
+
+# Cells of the RTP details panel per RTPDetails, with the GWs version they
+# were rendered at. Entries go away together with their RTPDetails.
+RTP_PANEL_CELLs = WeakKeyDictionary()  # type: WeakKeyDictionary
+
 def hide_panel(ws):
     ws.active_panel.panel.hide()
     del ws.active_panel
     ws.panel.top()
     ws.active_panel = ws.panel
     ws.draw(dim=False)
-    curses.panel.update_panels()
-    curses.doupdate()
     ws.display.active_handle_char = ws.handle_char
 
     return 1
@@ -101,7 +113,7 @@ def make_filterpanel(ws, group):
 
     logger.debug("Make filterpanel requested")
     
-    storage = FILTER_MENUs[group].splitlines()
+    storage = FILTER_MENU_LINEs[group]
     current = FILTER_GROUPs[ws.filter_group]["current_filter"]
 
     def filter_callback(filter):
@@ -120,14 +132,13 @@ def make_filterpanel(ws, group):
     ws.active_panel = panel
     panel.panel.show()
     panel.panel.top()
-    panel.draw()
     is_canceled = panel.handle_char()
     return is_canceled
 
 def discovery_start(ws):
     logger.info("Discovery start requested")
 
-    ws.bodywin.erase()
+    ws.erase_bodywin()
     ws.draw(dim=True)
 
     is_canceled = make_filterpanel(ws, "bgw")
@@ -140,11 +151,9 @@ def discovery_start(ws):
 
     ip_filter = FILTER_GROUPs["bgw"]["groups"]["ip_filter"]
     loop = startup_async_loop()
-    progress_queue = Queue(loop=loop)
-    
+
     panel = ProgressBar(
         ws.display,
-        queue=progress_queue,
         workspace_chars = [ord("s"), ord("S")]
     )
 
@@ -155,9 +164,14 @@ def discovery_start(ws):
         Args:
             progress_update: A tuple of (ok, err, total) counts.
         """
-        nonlocal progress_queue, panel, ws
+        nonlocal panel, ws
 
-        progress_queue.put_nowait(progress_update)
+        # Only the latest update is shown, so it simply replaces the last.
+        panel.progress = progress_update
+        ws.display.request_draw("progress", draw_progress)
+
+    def draw_progress():
+        nonlocal panel, ws
         ws.menubar.draw()
         panel.draw()
 
@@ -184,8 +198,6 @@ def discovery_start(ws):
     ws.active_panel = panel
     panel.panel.show()
     panel.panel.top()
-    curses.panel.update_panels()
-    curses.doupdate()
 
     ws.display.loop = loop
     ws.display.active_handle_char = panel.handle_char
@@ -209,6 +221,10 @@ def polling_start(ws):
     logger.info("Polling start requested")
     
     def process_item_callback():
+        nonlocal ws
+        ws.display.request_draw("polling", draw_polling)
+
+    def draw_polling():
         nonlocal ws
         aws = ws.display.active_workspace
         polling_workspace = any(x.name == "button_polling" for x in aws.buttons)
@@ -221,7 +237,6 @@ def polling_start(ws):
                 aws.active_panel.draw(rtpdetails)
             else:
                 aws.draw()
-            curses.doupdate()
             aws.menubar.draw()
 
     loop = ws.display.loop
@@ -248,24 +263,28 @@ def polling_stop(ws):
 
     return 1
 
+# Capture state (first word of capture_status) -> (commands, new status)
+CAPTURE_ACTIONs = {
+    "running": (("capture stop",), "stopping"),
+    "stopped": (("clear capture-buffer", "capture start"), "starting"),
+}
+
 def capture_toggle(ws):
     if not ws.display.loop:
         return
 
     bgw = ws.storage.select(ws.storage_cursor + ws.body_posy)
 
-    if "running" in bgw.capture_status:
-        commands = ["capture stop"]
-        status = "stopping"
-    elif "stopped" in bgw.capture_status:
-        commands = ["clear capture-buffer", "capture start"]
-        if not bgw.has_filter_501:
-            commands = CONFIG["capture_setup"] + commands[:]
-        status = "starting"
-    else:
+    action = CAPTURE_ACTIONs.get(bgw.capture_status.split(" ", 1)[0])
+    if action is None:
         return
 
-    bgw.queue.put_nowait(commands)
+    commands, status = action
+    commands = list(commands)
+    if status == "starting" and not bgw.has_filter_501:
+        commands = CONFIG["capture_setup"] + commands
+
+    bgw.queue.append(commands)
     bgw.packet_capture = status
     logger.info(f"PCAP {status} requested")
 
@@ -275,6 +294,21 @@ def capture_toggle(ws):
 
     return 1
 
+@lru_cache(maxsize=1)
+def upload_command_prefix():
+    """Return the BGW upload command up to the file name.
+
+    The HTTP server settings do not change while running, and resolving
+    0.0.0.0 runs netstat, so the prefix is built once on the first upload.
+    """
+    http_server = CONFIG.get("http_server", "0.0.0.0")
+    http_port = CONFIG.get("http_port")
+    upload_dir = CONFIG.get("upload_dir")
+    if http_server == "0.0.0.0":
+        http_server = get_local_ip()
+
+    return f"copy capture-file https http://{http_server}:{http_port}/{upload_dir}/"
+
 def capture_upload(ws):
     if not ws.display.loop or not CONFIG.get("http_server"):
         logger.info("HTTP server not configured, request ignored")
@@ -285,18 +319,11 @@ def capture_upload(ws):
     if bgw.pcap_upload == "requested":
         return
 
-    http_server = CONFIG.get("http_server", "0.0.0.0")
-    http_port = CONFIG.get("http_port")
-    upload_dir = CONFIG.get("upload_dir")
-    if http_server == "0.0.0.0":
-        http_server = get_local_ip()
-
-    dest = f"{http_server}:{http_port}/{upload_dir}"
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"{timestamp}_{bgw.gw_number}.cap"
 
-    command = f"copy capture-file https http://{dest}/{filename}"
-    bgw.queue.put_nowait(command)
+    command = upload_command_prefix() + filename
+    bgw.queue.append(command)
     bgw.pcap_upload = "requested"
     logger.info(f"PCAP upload '{command}' requested")
 
@@ -327,12 +354,22 @@ def clear_storage(ws):
     panel.panel.show()
     panel.panel.top()
     panel.draw()
-    curses.panel.update_panels()
-    curses.doupdate()
     ws.display.active_handle_char = panel.handle_char
 
     return panel
 
+def make_show_button(func_on):
+    """Return an Enter button toggling the panel opened by `func_on`."""
+    return Button(
+        char_int = ord("\n"),
+        func_on = func_on,
+        label_on = "Hide Panel",
+        label_off = "Show More",
+        func_off = hide_panel,
+        status_color_on = 66304,
+        status_color_off = 68096
+    )
+
 def make_textpanel(ws, *attr_names):
     bgw = ws.storage.select(ws.storage_cursor + ws.body_posy)
 
@@ -347,24 +384,26 @@ def make_textpanel(ws, *attr_names):
             continue
         attr = str(getattr(bgw, attr_name)).strip()
         storage.extend(["", f"COMMAND: {attr_name}", ""])
-        storage.extend([x.rstrip() for x in attr.splitlines()])
+        storage.extend(map(str.rstrip, attr.splitlines()))
 
     if not storage:
         return
 
-    panel = TextPanel(
-        display = ws.display,
-        storage = storage,
-        name = f"TextPanel({attr})",
-    )
+    panel = ws.panel_pool.get("text")
+    if panel is None:
+        panel = ws.panel_pool["text"] = TextPanel(
+            display = ws.display,
+            storage = storage,
+        )
+    else:
+        panel.set_storage(storage)
+    panel.name = f"TextPanel({attr})"
 
     ws.draw(dim=True)    
     ws.active_panel = panel
     panel.panel.show()
     panel.panel.top()
     panel.draw()
-    curses.panel.update_panels()
-    curses.doupdate()
     ws.display.active_handle_char = panel.handle_char
 
     return panel
@@ -413,30 +452,39 @@ def show_rtp(ws):
 
     logger.info("Show RTP objectpanel requested")
 
-    rtp_attr_iter = partial(
-        iter_attrs,
-        spec=RTP_LAYOUT,
-        colors=COLORS,
-        xoffset=0,
-        yoffset=0,
-        default_y=0,
-        header=False,
-    )
-
-    panel = ObjectPanel(
-        display=ws.display,
-        obj=rtpdetails,
-        attr_iterator=rtp_attr_iter,
-        name = "ObjectPanel(RTP)"
-    )
+    def rtp_attr_iter(rtpdetails):
+        # RTPDetails are not modified once parsed, so render each one once,
+        # again only if GWs changed, the remote_addr color depends on it.
+        cached = RTP_PANEL_CELLs.get(rtpdetails)
+        if cached is None or cached[0] != GWs.version:
+            cached = (GWs.version, tuple(iter_attrs(
+                rtpdetails,
+                spec=RTP_COLUMNS,
+                colors=COLORS,
+                xoffset=0,
+                yoffset=0,
+                default_y=0,
+                header=False,
+            )))
+            RTP_PANEL_CELLs[rtpdetails] = cached
+        return iter(cached[1])
+
+    panel = ws.panel_pool.get("rtp")
+    if panel is None:
+        panel = ws.panel_pool["rtp"] = ObjectPanel(
+            display=ws.display,
+            obj=rtpdetails,
+            attr_iterator=rtp_attr_iter,
+            name = "ObjectPanel(RTP)"
+        )
+    else:
+        panel.obj = rtpdetails
 
     ws.draw(dim=True)    
     ws.active_panel = panel
     panel.panel.show()
     panel.panel.top()
     panel.draw()
-    curses.panel.update_panels()
-    curses.doupdate()
     ws.display.active_handle_char = panel.handle_char
 
     return panel
@@ -449,19 +497,23 @@ def show_pcap(ws):
 
     logger.info("Show PCAP textpanel requested")
 
-    panel = TextPanel(
-        display = ws.display,
-        storage = capture.rtpinfos.splitlines(),
-        name = "TextPanel(PCAP)",
-    )
+    storage = capture.rtpinfos.splitlines()
+
+    panel = ws.panel_pool.get("text")
+    if panel is None:
+        panel = ws.panel_pool["text"] = TextPanel(
+            display = ws.display,
+            storage = storage,
+            name = "TextPanel(PCAP)",
+        )
+    else:
+        panel.set_storage(storage)
 
     ws.draw(dim=True)    
     ws.active_panel = panel
     panel.panel.show()
     panel.panel.top()
     panel.draw()
-    curses.panel.update_panels()
-    curses.doupdate()
     ws.display.active_handle_char = panel.handle_char
 
     return panel
@@ -500,7 +552,7 @@ def main(stdscr, miny: int=24, minx: int=80):
         while must_resize(stdscr, miny, minx):
             char = stdscr.getch()
             if char == curses.ERR:
-                time.sleep(0.1)
+                continue
             elif char == curses.KEY_RESIZE:
                 stdscr.erase()
             elif chr(char) in ("q", "Q"):
@@ -543,85 +595,14 @@ def main(stdscr, miny: int=24, minx: int=80):
             status_color_off = 68096
         )
 
-        button_show_system = Button(
-            char_int = ord("\n"),
-            func_on = show_system,
-            label_on = "Hide Panel",
-            label_off = "Show More",
-            func_off = hide_panel,
-            status_color_on = 66304,
-            status_color_off = 68096
-        )
-
-        button_show_misc = Button(
-            char_int = ord("\n"),
-            func_on = show_misc,
-            label_on = "Hide Panel",
-            label_off = "Show More",
-            func_off = hide_panel,
-            status_color_on = 66304,
-            status_color_off = 68096
-        )
-
-        button_show_mg_list = Button(
-            char_int = ord("\n"),
-            func_on = show_mg_list,
-            label_on = "Hide Panel",
-            label_off = "Show More",
-            func_off = hide_panel,
-            status_color_on = 66304,
-            status_color_off = 68096
-        )
-
-        button_show_port = Button(
-            char_int = ord("\n"),
-            func_on = show_port,
-            label_on = "Hide Panel",
-            label_off = "Show More",
-            func_off = hide_panel,
-            status_color_on = 66304,
-            status_color_off = 68096
-        )
-
-        button_show_config = Button(
-            char_int = ord("\n"),
-            func_on = show_config,
-            label_on = "Hide Panel",
-            label_off = "Show More",
-            func_off = hide_panel,
-            status_color_on = 66304,
-            status_color_off = 68096
-        )
-
-        button_show_pcap = Button(
-            char_int = ord("\n"),
-            func_on = show_pcap,
-            label_on = "Hide Panel",
-            label_off = "Show More",
-            func_off = hide_panel,
-            status_color_on = 66304,
-            status_color_off = 68096
-        )
-
-        button_show_status = Button(
-            char_int = ord("\n"),
-            func_on = show_status,
-            label_on = "Hide Panel",
-            label_off = "Show More",
-            func_off = hide_panel,
-            status_color_on = 66304,
-            status_color_off = 68096
-        )
-
-        button_show_rtp = Button(
-            char_int = ord("\n"),
-            func_on = show_rtp,
-            label_on = "Hide Panel",
-            label_off = "Show More",
-            func_off = hide_panel,
-            status_color_on = 66304,
-            status_color_off = 68096
-        )
+        button_show_system = make_show_button(show_system)
+        button_show_misc = make_show_button(show_misc)
+        button_show_mg_list = make_show_button(show_mg_list)
+        button_show_port = make_show_button(show_port)
+        button_show_config = make_show_button(show_config)
+        button_show_pcap = make_show_button(show_pcap)
+        button_show_status = make_show_button(show_status)
+        button_show_rtp = make_show_button(show_rtp)
 
         button_capture = Button(
             char_int = ord("t"),
@@ -642,7 +623,7 @@ def main(stdscr, miny: int=24, minx: int=80):
         workspaces = [
             Workspace(
                 mydisplay,
-                layout=Layout(LAYOUTS["SYSTEM"]),
+                layout=SCREEN_LAYOUTs["SYSTEM"],
                 buttons=[
                     button_discovery,
                     button_show_system
@@ -653,7 +634,7 @@ def main(stdscr, miny: int=24, minx: int=80):
             ),
             Workspace(
                 mydisplay,
-                layout=Layout(LAYOUTS["MISC"]),
+                layout=SCREEN_LAYOUTs["MISC"],
                 buttons=[
                     button_discovery,
                     button_show_misc
@@ -664,7 +645,7 @@ def main(stdscr, miny: int=24, minx: int=80):
             ),
             Workspace(
                 mydisplay,
-                layout=Layout(LAYOUTS["MODULE"]),
+                layout=SCREEN_LAYOUTs["MODULE"],
                 buttons=[
                     button_discovery,
                     button_show_mg_list
@@ -675,7 +656,7 @@ def main(stdscr, miny: int=24, minx: int=80):
             ),
             Workspace(
                 mydisplay,
-                layout=Layout(LAYOUTS["PORT"]),
+                layout=SCREEN_LAYOUTs["PORT"],
                 buttons=[
                     button_discovery,
                     button_show_port
@@ -686,7 +667,7 @@ def main(stdscr, miny: int=24, minx: int=80):
             ),
             Workspace(
                 mydisplay,
-                layout=Layout(LAYOUTS["CONFIG"]),
+                layout=SCREEN_LAYOUTs["CONFIG"],
                 buttons=[
                     button_discovery,
                     button_show_config
@@ -697,7 +678,7 @@ def main(stdscr, miny: int=24, minx: int=80):
             ),
             Workspace(
                 mydisplay,
-                layout=Layout(LAYOUTS["STATUS"]),
+                layout=SCREEN_LAYOUTs["STATUS"],
                 buttons=[
                     button_polling,
                     button_show_status,
@@ -710,7 +691,7 @@ def main(stdscr, miny: int=24, minx: int=80):
             ),
             Workspace(
                 mydisplay,
-                layout=Layout(LAYOUTS["RTPSTATS"]),
+                layout=SCREEN_LAYOUTs["RTPSTATS"],
                 buttons=[
                     button_polling,
                     button_show_rtp,
@@ -721,7 +702,7 @@ def main(stdscr, miny: int=24, minx: int=80):
             ),
             Workspace(
                 mydisplay,
-                layout=Layout(LAYOUTS["PCAP"]),
+                layout=SCREEN_LAYOUTs["PCAP"],
                 buttons=[
                     button_show_pcap
                 ],
@@ -821,6 +802,12 @@ def application_context(CONFIG):
             curses.endwin()
         except:
             pass
+        # Only after the terminal is restored, a failure here must not
+        # leave it in raw mode.
+        try:
+            close_ssh_masters(bgw.lan_ip for bgw in BGWs.values())
+        except Exception as e:
+            logger.error("Failed to close SSH masters: %r", e)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Monitors Avaya Gateways')
@@ -854,6 +841,10 @@ if __name__ == "__main__":
     parser.add_argument('--upload_dir', dest='upload_dir',
                         default=CONFIG.get('upload_dir', '/tmp'),
                         help='PCAP Upload directory, default /tmp')
+    parser.add_argument('--ssh-control-dir', dest='ssh_control_dir',
+                        default=CONFIG.get('ssh_control_dir'),
+                        help='SSH ControlMaster socket directory, '
+                             'enables multiplexing, default off')
     parser.add_argument('--no-http', dest='no_http', action='store_true',
                         default=False,
                         help='Don\'t run HTTP server, default False')
@@ -10,47 +10,49 @@ import zlib
 ############################## BEGIN SCRIPT ###################################
 
 COMPRESSED_EXPECT_SCRIPT = '''\
-eJzVWXtz27gR/1+fAqHpO/lBW3KbztRt2t4l6aWX5jF2rjMZidFAJCSxoUAaAK34NPruXbxIgKRsp+
-2kU43HooDdxeKHfYIHT84rzs7nGT0nX0qSiMEBejcXOKMcJcV6jWmKikqUlUALVqzRD7f4DqMfGabJ
-Cv2EBdngO2C5IqJiwPLz9bu3aJOJFVrqOZTRRXHaEsWRfL768B5xgUXGRZZwEPLmbx/Q37OEUE7g1y
-1hPCsoGp2N0QuSoIvRxe8GB/d90AeyLnNYF/0DswzPc8LRvQyDAScC5ZjOshJt9fdOjVWcMLSV//Xv
-EnO+SdFWf+sxJsqZ1J+jbf1oqBm5neWYixknXG5ilknenlGHHiciuyXOHDcs3QnNZTAFMvukx1Myr5
-Zoq752g/shO0Av1ak/FjEDWVEKUIWjSQ6Hh6ICXQuWJeJVwcVrcvd8RZLPGV0+o4Wc+wVQfE2LDZXT
-/K9ZTp6dp+T2nFZ5HitxIlsTsAw0Hhk4inUpUDA9OkCBOSIfy0APswSNBpgxMDMXkJke2m53O2dWnZ
-EW4VHkxXKmjns0GGQLGAs1cjt4HCD4KAWAaAGao0B7yUzRzEJtM2cwHShaJWCiKMkXwIaj0LLGjUT5
-UTQpyQmYa02jZkEnu2w6X6JJURLakCAcq2nQY5ZRQRjFOYoWDsFosHvw2OXJv2dFQtKKPXjm6tjhUB
-L0Tw74E57gksBeuGA+SjCAJvAPzh6tceluN5hOA/kPvpyxQI8F7hhVY9QdYmqIuUNCDYnAIIZCWFYD
-w1QoUgMKCKW4KGZSd3XiVq1lXswBO+P+y82M4jVR39V6DvZgjA7Ab5vftFYEPi2r65pZDY/SINhutd
-K4hHNNzeA00GpMg0s0DSYuzsbG4mlwino5jeZ9rGbqfl61233canI/f41Rv+Jm8kF+i+w9UizJfln2
-IKQQC7KEfZExCFJj9XtRMIIhc223n8kdusV5RcAgJvrolp0YErsmrHz7SajEKSvy1geljOP2qObvCJ
-aO+3aq1Ildb2jUH7mhwZO+252CJNfs/iMAuvb7/wHCbhd47i/HG/9PcgJeZAqZ7VY/NKGAkSWv5ijC
-eS7DzZRGkbgDbW4gcKCbKoOMxxAvcUKQhA0Gk4KKjFYkihDQTz6haXz8OvAjQ2jWgyinn7prvS0g/I
-sVljskeXp2HDyG60VByZNH0srdGP2mKqHuZVK42fAN/9csW66EJY8dMNdQzdiioxNPdfauja9ezIzA
-kQWh4Q1sJpMViJssjlVuAiMETTAtxArCsS0hSzhKTtAGw6mcnUkUHE4ljzE4raAR8YOW8Nxd1DEkvW
-JaoLuiArFUuOeLhh/P3x79ubuKKjgqxggV1q5CUxvAz+G8WiwIO/JYjMVaap+7JVzC9NHNggapmVWs
-bxehqZy+laoegI5H/C/A+lqsgmPnlM++rcYP6/aNFeI5IaXJEI9V0hbt/d6n24oPmqbjck6JC+VnlQ
-s08SJ0HXMkVU9kyskCiAyrjSY6Qh2g57BJhvPsV5LWQYN8IUklexbdnGolVzCT6xCTygp/Cc86wkny
-meWtQ50qeSF/Wi1HMuu0op9uvmTdDs2JX0wosqZLaLcZ8qN641ByBy9e/vjLT5fQnknFCfre7vL7Bs
-xFXvGVIndBdapxLCro0RIsVMJ3ovFEhvA6DIPryOYEQFnzZexoaCQ8eSa36uppmq+Lp7/xVeciBSkg
-WctCm5XuhBT4AHTfLvaC0QLk5dXVu6tL9DWie0BqGbGxrSDoIGgRcM77u+/q3EmhEwy6mPgHPrQqHV
-m+ziq2WjHT2oDtmWOk2utiUcs9NZ03ZHZoakVRlnLrYNW6PlJm3bVgLk14nc6UNGXD5UxWXMoJ9Mnu
-t2tbMFofCB1J9d49EKyNeU4U1g/uUnHLCgwruZHFiYTb07VrHga+8Z74YqZHTekCFW7vRcvWb2R7SN
-RVR9wua/xNBnxVbGQFHUnPQbaMNuKCuG1d7nb9zRnN1QWF2ZB3GhC2CETEMs9EU89JP+7U6hOoBiGU
-w9On4WQU/T4+OZryE9kxKxkzBC1VF9jc5I4eIMIsvR/usMvkH0DnZqyF/ldhK4Wh8b+BbePzDZcFK1
-LYdCEzQntAs3s34PiIwFIeAJRs9ppfXUX3XCG2fteAteUZW3XQ6BW3H5tJv5/EXcTa7fnXGDN0fBT1
-qxYcpoHGIEtnKUmyNc4dnl5yNdgmB3RgHkypZDUODQ06QePdTm9LJxSgAfo/PjNrNKT+lqx/dJAHB1
-2DeQaHo6egEshyQhxNmFRm3OczLUGNvawJWxIVcKWdyO+xSgsXvs+Am8zBZmGrULNBxpfuLUnV10UT
-t2y5lfOCCRRVNLuBJie07P4VmiZ+3HWivFF8gzP68F2iuk48QNcl3lB0ff1KVuEUikXY+oCrQQ4ZO7
-qB7R3vdqG9aw7lJe1fzG2YFPBKlm9ESYDiLaMDv5EM3su7+oKll6ofMZ2nvsCHSGnw76liVc0RUeix
-NyoM2KLGL2n/IC94BZRAv3WPkxSL/4Yo+Gtt5vg9YetM2QfUmDQjqd+S7lupYXuhuJrFnrp6N52jXl
-1VIVBFgwb2RY66HZWR2FyPqtdBptmXlmUvUANYwv7WlBD+6iQ0nHyacgio0XCanhxNpkMZR3saGVkA
-dK5kldk0rwMIdV8OEKozBkrlG6Dg5PBjdLiODtPTw1eXh28uD68hR+gLfjB+ghlk0UgG27o04ShIiv
-IOJbgE8yeRvEw/howK5W80brzNun7DpTJTVeYFTm3RPR4F7WIuzxsWCaOqg+wLsYFfrzUqjSBcyJ6m
-yHNpDv47MxmCGQEH5oKk5uVF8yrKf4HRipiTnkQc708oPVnLybiSRcWp1OeqrdMNYu1QZzJAT9EgOb
-0s1rOGStNuvWr1KbGQL0dg+FpgJiLpbJeQxofT65OjU6cFsCWVA07fQj3t+GPqlJQIDHYk695aWBB7
-orwfDxUv9gOOAKVxu/RvU81ha5+9UWfjnbXVMcpmkcDZ2UoooyqehBbPsF2511pPwETpErrr0AiJ0Z
-/QuF99058ymYkympIvNRMax73Uui5SplvnWH6q/gLZJ0hZzRsLF+5+ed177mFYr+E3bD3YNZWM9vJ3
-+sB0wgS/pPpNuNZ0oILzxLyDigcqAIcs+RfT8sbS
+eJzVWvtz27gR/l1/BULTd37JltymM3XrtrkkvfTSPMbOdSYjKRqIhCQ2FEgDoBWfRv97d/EgwYdsp7
+1J5zQZUwJ3F4sPi8W3QPaenBVSnM0Sfsa+5CxSvT3ybqZowiWJstWK8phkhcoLReYiW5Fnt/SOkh8E
+5dGS/EgVW9M7ULliqhCg8tP1u7dknaglWZh3JOHz7KRhShL8fvXhPZGKqkSqJJJg5M0/PpB/JhHjks
+GvWyZkknEyOB2SFywi54PzP/T27vuQD2yVp9Av+RcVCZ2lTJJ7FXo9yRRJKZ8mOdmY51a3FZIJssG/
+5ndOpVzHZGOepk2ofIr+S7Ipv1ppwW6nKZVqKpnEQUwT1O1o9eRppJJb5r2TVqX9wmhZTEHMfXPtXI
+ksneYUpmHj/2q8R4Cl8kRMg5GK2axYkI1+bHv3A79HXurYeSzuFvgsVzAgSUYputHPyLUSSaReZVK9
+ZnfPlyz6nPDFJc/w3c8wF695tub4Wv49SdnlWcxuz3iRppNeMiebTVgbOWckCLZbaO8R+KQ0zxlGoO
+0UTD434m9gSpi4pIXKvNb3YOOybnGsDTU/norBz9MyDb2tgVQlKwYLgAwHdtazVa5IMD7cI4GNxHrI
+BKZZRGTQo0LAavLnfWqaNhswX73VoWhM1CTSbDHVUT3oWbTM1JYAaQdAaA7QksAkg6mWmYZmaZzC60
+DLagMjLcm+wAglCZ3qpLKIHy0Ts5TBqixl9FvwyXUbzxZklMH0VCKETvRr8GOacJgfTlPSn3sCA4T1
+gbjE0HwvsojFhXgwKHVcwqRE5N8S8GcyojmDsUgl6ihBAxnBHwhOsqK5P9xgPA7wDzy8tsC0BX4b12
+3cbxK6SfhNSjepwCJGQujWACN0xtUNGgjtuMqm6LuecefWIs1mgJ3Ncov1lNMV089iNYN4sEEH4DfD
+rxbvjahrh1kJj/Yg2GyM03bZmcZxYNwYBxdkHIx8nG2MTcbBCenUtJ53qdpX9+vq0e7S1i9365cYdT
+tuXz6o75C9x4oT2W3LTQQacSAj7PNEQBYd6t/zTDAKG/Rm85ndkVuaFgwCYmSmbtHKIRM/hPXafhJq
+czqKav2DU3bhdrhWHxF0PekaqXZn4q+Gyv2Bnxpq1rfbE7Dkh93/BEA7fn8bIGy3QW35Y3u1/qOUwS
+qyfG2zMV+qVCDYQhYz0qdpiulmzPt9dQfe3EDiIDdFAluyIDKnESMIGzTiTpbwgvX7BORHn8h4cvQ6
+qGeG0PYHWc58a/f1NoP0r5YUR8jS+PQoeIzWi4yzJ4+UxdFY/8Z6Q92ppHFz6Rv+rkSyWConPvHAXA
+Fpc9yqlU/N7l0GX9mZbYEpC0KrG7idDCmSv1kc6b0JghA8oTxTS0jHjinnMJWSkTWFWTk9RRQ8TW1P
+CJitoDLxzFh47nfqBZLpMc7IXVaAWa78+SUHH8/eHv613YsmHIUQjCsXV6HlBvDzYFbM50wc1lQc0b
+LSde2GcYTpo78LWqSmzrGuUYSWOX0rV2sAeivi/wHW12IVHHmzfPptPX7Yt2/skEwZy+0O8VgnHWnv
+Xn2m7vlgZFpLzqO4QD+LVJFRLUOXOQelOjJTyuYgZFVdNjEZao88h0EKmia/sLhMGuwLiwqsb0wNbp
+xcwpvUpJgYGf4CvpsMh+JTp1umOk15Yf90Xg5w12lkP1MdIm+H4qROJrRYVSU0ywz86COAELWDFy9/
++PnHC6gf0XFGvnej/L4Cc54WcqnFfVA9Nk5VAUVkRJXe8L1sPMIUXqZhWDpYnAAoK7mYeB5aC08uca
+i+n7b4On/6u7rrUsVgBSwbW2S9NJWQBh+A7hrFTjAagLy8unp3dUG+xnQHSI0gtrEVBC0EHQLefH/3
+Xbl3Nmpoh0l9wg+cS4dOr9WLYyv2tQlgN+eU6Po/m5d2T2yVDjs7FLUqy3McOkS14Uc6rNsRLDGEV/
+FUW9MxnE+RcelFYGZ2d1w7wujWQOhZKsdeA8HFWG0RheUXv6tJIwqsKrtBcoJw13xth4eFb7gjv9jX
+g4q6AMPtPE/a1AvZDhF9FjNp0pr6IAO5zNbIoPu4coij0dZcMGlGlz/c+uCs5/qAwg6oNhuQthhkxD
+xNVMXncB23uPoI2CCkcvj26WA06P9xcnw4lsdYMWsbUwIlVRtYdyjUAUSYxPfDHbaV6hPQOgBsoP9V
+2KIxMvwvsK3WfKXlwOprbNqQWaMdoLmxW3DqiEBXNQA4W+8Mv5JFd5yUNn6XgDXt2Vj10Og0txubUf
+c6mbQRa5bnXxPMUPFx0u1asB8HBoMknsYsSlY09XQ6xXVjUxzQgfcQSrkocahkyDEZbrdmWGZDARmQ
+//Ol7aMSrQ/JrY8W8rBAVxCewf7gKbgEtrwUxyOBzgy71kzDUBUvKyYWTCdcjBN8DvW2cF5fM7BMZh
+CzMFTgbLDj4/JGUf04r/KWo1upzIQi/YInN1DkhE69foRmhB93nIgnim9owh8+S9THiXvkOqdrTq6v
+XyEL50AWYeg9qRsl7Nj9Gxje0XYbunPpEA9p/2ZPw9DAK6RvTFsA8pbwrrPuRjR2lJrv8eIiE/GFrl
+psfWpuMyCfPsx3NUPpc6jI1zppOApUJ8B/wuNgBYTp910shGXzX9usfXTW1kysEh1pwFZ5wuJ2cbur
+90r1hdasHHh6fz1aeYVEM5XM9bhHnrlcTrJbKPNheeuTc3OGjBcQmDIl4Zm5a4Kp8o8YHpzRjlKxmt
+5mwdMw9VWY/RrYdWC4E8sO2fugx89vLoQdH4Z6DmbG3Zzqc3rkBPagXt+/2pjAHOeO8gMw7n4bSdiI
+Szp0MPo0lrC19w/G8fHhaHyAO3pHSY1UtHU5oBNYdTHFuH9NxbjhLiTGK9fgeP9jf3/V349P9l9d7L
++52L8GtmKSFaRhRgXwuT5u+yVJliSIsvyORDSHRMz6eK1zBNwOCrH+sH1zV2lpjlTkaUZjV/4NB0Gz
+rEjTSgVh1Izc3UD36pVD5dIANi6srrM0xWVSv6RGMiAYbCWwYGObiKu73/pVWmPvHnVQwmq/am2wHf
+zJ436oonfMuK5Vxpa/nTY3XctFOugratb4VEcfmjD6lZPzBzYivKaD5mtFhepj5F8AoTwYXx8fnnhr
+yJF7D5yujjoOhh7DmGOmKMQRVmClsWBSM1X78RCNdh9YCFCkNYvQptQMhvZ5V95q9a2nEY8tGMyd4+
+QJ12kkdHiGzRqy9HoEIcoXsP2H1siE/IUMu923JyUCOVHCY/alVCLDSae0Yeg6dEu2J0/0vwArVrRV
+3Z35cHfba9+4HIRlH/Wjgw7smsnynZkwQ91gXXLzX0+Mpz2dk0f2NnTS06k3FNF/AEBRwug=
 '''
 
 def unwrap_and_decompress(wrapped_text):
@@ -4,7 +4,7 @@
 ############################## BEGIN IMPORTS ##################################
 
 from abc import ABC, abstractmethod
-from bisect import insort_left
+from bisect import bisect_left, insort_left
 from collections.abc import MutableMapping, ItemsView
 
 from typing import (
@@ -31,6 +31,8 @@ V = TypeVar("V")
 class AbstractRepository(ABC, Generic[K, V]):
     """Abstract key/value repository interface."""
 
+    __slots__ = ()
+
     @abstractmethod
     def put(self, items: Dict[K, V]) -> None:
         """Insert or update multiple items."""
@@ -58,6 +60,11 @@ class SlicableOrderedDict(MutableMapping, Generic[K, V]):
           * key -> V
     """
 
+    __slots__ = (
+        "_items", "_keys", "_version", "_values_cache",
+        "_values_cache_version", "maxlen", "name",
+    )
+
     def __init__(
         self,
         items: Optional[Dict[K, V]] = None,
@@ -65,24 +72,30 @@ class SlicableOrderedDict(MutableMapping, Generic[K, V]):
         name: Optional[str] = None,
     ) -> None:
         self._items = dict(items) if items else {}  # type: Dict[K, V]
-        self._keys = sorted(self._items.keys()) if items else []  # type: List[K]
+        self._keys = sorted(self._items)  # type: List[K]
+        self._version = 0
+        self._values_cache = []  # type: List[V]
+        self._values_cache_version = -1
         self.maxlen = maxlen
         self.name = name
 
     def __iter__(self) -> Iterator[K]:
-        yield from self._keys
+        return iter(self._keys)
 
     def __getitem__(
         self,
         key: Union[int, slice, Tuple[int, int], K],
     ) -> Union[V, List[V]]:
-        if isinstance(key, slice):
-            idxs = range(len(self._items)).__getitem__(key)
-            return [self._items[self._keys[i]] for i in idxs]
-
+        # Slicing the sorted key list yields the visible keys directly,
+        # without building index ranges and indexing _keys once per row.
         if isinstance(key, tuple):
-            idxs = range(len(self._items)).__getitem__(slice(*key))
-            return [self._items[self._keys[i]] for i in idxs]
+            key = slice(*key)
+
+        if isinstance(key, slice):
+            if key.indices(len(self._keys)) == (0, len(self._keys), 1):
+                return self.values_list()
+            items = self._items
+            return [items[k] for k in self._keys[key]]
 
         if isinstance(key, int):
             if 0 <= key < len(self._items):
@@ -92,30 +105,52 @@ class SlicableOrderedDict(MutableMapping, Generic[K, V]):
         return self._items[key]
 
     def __setitem__(self, key: K, item: V) -> None:
-        if key in self._items:
-            self._items[key] = item
+        items = self._items
+        self._version += 1
+        if key in items:
+            items[key] = item
             return
 
-        if self.maxlen and len(self._items) == self.maxlen:
-            first_key = self._keys.pop(0)
-            del self._items[first_key]
+        maxlen = self.maxlen
+        if maxlen:
+            # A loop rather than a single eviction also trims the storage
+            # down when maxlen was lowered after items were stored.
+            keys = self._keys
+            while len(items) >= maxlen:
+                del items[keys.pop(0)]
 
         insort_left(self._keys, key)
-        self._items[key] = item
+        items[key] = item
 
     def __delitem__(self, key: K) -> None:
         if key not in self._items:
             raise KeyError(key)
         del self._items[key]
-        self._keys.remove(key)
+        del self._keys[bisect_left(self._keys, key)]
+        self._version += 1
 
     def __contains__(self, key: Any) -> bool:
         return key in self._items
 
     def index(self, key: K) -> int:
-        if key in self._keys:
-            return self._keys.index(key)
-        raise ValueError(key)
+        # Misses are answered by the hashed dict without touching _keys,
+        # hits are located by bisecting the sorted key list.
+        if key not in self._items:
+            raise ValueError(key)
+        return bisect_left(self._keys, key)
+
+    def values_list(self) -> List[V]:
+        """
+        Return all values in key order.
+
+        The list is rebuilt only after a mutation, repeated full range
+        reads in between share it, so callers must not modify it.
+        """
+        if self._values_cache_version != self._version:
+            items = self._items
+            self._values_cache = [items[k] for k in self._keys]
+            self._values_cache_version = self._version
+        return self._values_cache
 
     def keys(self) -> AbstractSet[K]:
         return self._items.keys()
@@ -129,6 +164,7 @@ class SlicableOrderedDict(MutableMapping, Generic[K, V]):
     def clear(self) -> None:
         self._items.clear()
         self._keys[:] = []
+        self._version += 1
 
     def __len__(self) -> int:
         return len(self._items)
@@ -146,15 +182,15 @@ class MemoryStorage(SlicableOrderedDict[K, V], AbstractRepository[K, V]):
     - Use `select(...)` for range/index/slice retrieval.
     """
 
+    __slots__ = ()
+
     def put(self, items: Dict[K, V]) -> None:
+        setitem = self.__setitem__
         for k, v in items.items():
-            self[k] = v
+            setitem(k, v)
 
     def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
-        try:
-            return self._items[key]
-        except KeyError:
-            return default
+        return self._items.get(key, default)
 
     def select(
         self,
@@ -168,7 +204,52 @@ class MemoryStorage(SlicableOrderedDict[K, V], AbstractRepository[K, V]):
             key = slice(None, None)
         return self[key]
 
-GWs = {}
+class VersionedDict(dict):
+    """
+    Dict counting its mutations in `version`.
+
+    Caches of values derived from the contents keep the version they were
+    built at and are stale once it moved on.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self.version += 1
+        return super().setdefault(key, default)
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self.version += 1
+        return value
+
+    def popitem(self) -> Tuple[Any, Any]:
+        item = super().popitem()
+        self.version += 1
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+GWs = VersionedDict()
 BGWs = MemoryStorage(name="BGWs")
 RTPs = MemoryStorage(maxlen=36, name="RTPs")
 PCAPs = MemoryStorage(name="PCAPs")
@@ -40,14 +40,16 @@ def change_terminal(to_type="xterm-256color"):
         The original terminal type
     """
     old_term = os.environ.get("TERM", "")
-    available_types = get_available_terminal_types()
-
-    if to_type != old_term:
-        if to_type in available_types:
-            os.environ["TERM"] = to_type
-            logger.info(f"Changed terminal to '{to_type}'")
-        else:
-            logger.error(f"Terminal {to_type} is not available")
+
+    # Nothing to change, avoid forking 'toe' for the terminal list.
+    if to_type == old_term:
+        return old_term
+
+    if to_type in get_available_terminal_types():
+        os.environ["TERM"] = to_type
+        logger.info(f"Changed terminal to '{to_type}'")
+    else:
+        logger.error(f"Terminal {to_type} is not available")
 
     return old_term
 
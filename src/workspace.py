@@ -8,8 +8,6 @@ import resource
 import sys
 import time
 from abc import ABC, abstractmethod
-from asyncio import Queue
-from datetime import datetime
 from functools import partial
 from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
 from typing import Tuple, TYPE_CHECKING
@@ -20,9 +18,7 @@ if TYPE_CHECKING:
 ############################## END IMPORTS ####################################
 
 from storage import MemoryStorage, BGWs, RTPs
-from bgw import BGW
-from aloop import tick_async_loop, finalize_loop_if_idle, Capture
-from rtpparser import parse_rtpstat
+from aloop import tick_async_loop, finalize_loop_if_idle
 import logging
 logger = logging.getLogger(__name__)
 
@@ -56,6 +52,8 @@ class Display(ABC):
         tab: Optional tab UI object (implementation-specific).
         loop: Optional asyncio event loop used by the application.
         loop_shutdown_requested: Flag set by caller when a shutdown is requested.
+        pending_draws: Redraws requested via `request_draw()`, run once per
+            main-loop iteration by `flush_draws()`.
         done: When True the main loop exits.
         active_ws_idx: Index of current workspace in `workspaces`.
         special_pair: A curses color-pair number reserved for "special" UI text.
@@ -83,6 +81,7 @@ class Display(ABC):
         self.active_ws_idx = 0  # type: int
         self.loop = None  # type: Optional["asyncio.AbstractEventLoop"]
         self.loop_shutdown_requested = False
+        self.pending_draws = {}  # type: Dict[str, Callable[[], None]]
 
         # Cache current size (subclasses may use it).
         self.maxy, self.maxx = self.stdscr.getmaxyx()
@@ -115,6 +114,39 @@ class Display(ABC):
         """Request clean exit from the curses main loop."""
         self.done = True
 
+    def request_draw(self, name: str, draw: Callable[[], None]) -> None:
+        """Schedule `draw` to run on the next pass of the main loop.
+
+        Requests with the same `name` collapse into one, so several asyncio
+        callbacks firing within one tick (e.g. results from many BGWs) lead
+        to a single redraw.
+
+        Args:
+            name: Key identifying the redraw.
+            draw: Callable performing the redraw.
+        """
+        self.pending_draws[name] = draw
+
+    def flush_draws(self) -> None:
+        """Run and clear the redraws requested since the last flush."""
+        if not self.pending_draws:
+            return
+        draws = list(self.pending_draws.values())
+        self.pending_draws.clear()
+        for draw in draws:
+            draw()
+        self.commit()
+
+    def commit(self) -> None:
+        """Push all staged window updates to the terminal at once.
+
+        Draw methods only stage their windows with `noutrefresh()` (or via
+        the panel stack), the main loop calls this once per pass so a pass
+        costs a single `doupdate()`.
+        """
+        curses.panel.update_panels()
+        curses.doupdate()
+
     def run(self) -> None:
         """Main curses loop.
 
@@ -133,15 +165,16 @@ class Display(ABC):
             pass
 
         self.make_display()
+        self.commit()
 
         while not self.done:
-            curses.panel.update_panels()
             ch = self.stdscr.getch()
 
             if ch == curses.ERR:
                 # No input. Tick asyncio if present.
                 if self.loop is not None:
                     tick_async_loop(self.loop)
+                    self.flush_draws()
 
                     if self.loop_shutdown_requested:
                         if finalize_loop_if_idle(self.loop):
@@ -156,10 +189,9 @@ class Display(ABC):
 
                 if self.maxy >= self.miny and self.maxx >= self.minx:
                     self.make_display()
-                    curses.panel.update_panels()
-                    curses.doupdate()
                     if self.active_workspace is not None:
                         self.active_workspace.menubar.draw()
+                    self.commit()
                 else:
                     self.stdscr.erase()
                     self.stdscr.refresh()
@@ -174,6 +206,7 @@ class Display(ABC):
             
             logger.debug("Detected char %r (%s)", ch, ch_repr)
             self.handle_char(ch)
+            self.commit()
 
     @property
     def active_workspace(self) -> Optional[Any]:
@@ -268,6 +301,7 @@ class MyDisplay(Display):
         if self.tab is not None:
             self.tab.draw()
 
+        ws.erase_bodywin()
         ws.draw()
 
     def handle_char(self, char: int) -> None:
@@ -335,6 +369,10 @@ class Tab(object):
         self.color_text = int(color_text)
         self.color_border = int(color_border)
 
+        # Inactive tab attributes, computed once instead of per tab.
+        self._dim_border = self.color_border | curses.A_DIM
+        self._dim_text = self.color_text | curses.A_DIM
+
         self.stdscr = None          # type: Any
         self.win = None             # type: Optional[Any]
         self.maxy = 0
@@ -417,8 +455,8 @@ class Tab(object):
             border_attr = self.color_border
             text_attr = self.color_text
         else:
-            border_attr = self.color_border | curses.A_DIM
-            text_attr = self.color_text | curses.A_DIM
+            border_attr = self._dim_border
+            text_attr = self._dim_text
 
         try:
             self.win.addstr(0, xpos, top, border_attr)
@@ -628,6 +666,8 @@ class Menubar(object):
         begin_x = 0
 
         self.win = curses.newwin(height, width, begin_y, begin_x)
+        # On the panel stack so update_panels() does not paint stdscr over it.
+        self.panel = curses.panel.new_panel(self.win)
         self.maxy, self.maxx = self.win.getmaxyx()
         self.color = self.bar_color | curses.A_REVERSE
 
@@ -651,8 +691,10 @@ class Menubar(object):
         status_end = self._draw_status_labels()
         self._draw_button_labels(status_end)
 
+        # Every workspace has its own menubar on the same line.
+        self.panel.top()
         try:
-            self.win.refresh()
+            self.win.noutrefresh()
         except _curses.error:
             pass
 
@@ -821,6 +863,17 @@ class TextPanel(object):
         self.posx = 0
         self.max_width = 0
 
+        # Rows on screen from the last draw, None until drawn or after erase.
+        self._drawn = None  # type: Optional[List[str]]
+
+        self.nlines, self.ncols, begin_y, begin_x = self._geometry()
+
+        self.win = curses.newwin(self.nlines, self.ncols, begin_y, begin_x)
+        self.panel = curses.panel.new_panel(self.win)
+        self.panel.hide()
+
+    def _geometry(self) -> Tuple[int, int, int, int]:
+        """Return (nlines, ncols, begin_y, begin_x) fitting `storage`."""
         scr_h, scr_w = self.stdscr.getmaxyx()
         usable_h = scr_h - self.yoffset - 1
         usable_w = scr_w
@@ -832,19 +885,47 @@ class TextPanel(object):
         # Desired height: storage lines + 2 border lines
         desired_h = len(self.storage) + 2
 
-        self.nlines = min(max_h, desired_h)
-        self.ncols = max_w
+        nlines = min(max_h, desired_h)
+        ncols = max_w
 
         begin_x = self.margin
 
         # Center within usable area, then clamp
-        center_off = (usable_h - self.nlines) // 2
+        center_off = (usable_h - nlines) // 2
         begin_y = self.yoffset + max(0, center_off)
-        begin_y = min(begin_y, self.yoffset + max(0, usable_h - self.nlines))
+        begin_y = min(begin_y, self.yoffset + max(0, usable_h - nlines))
 
-        self.win = curses.newwin(self.nlines, self.ncols, begin_y, begin_x)
-        self.panel = curses.panel.new_panel(self.win)
-        self.panel.hide()
+        return nlines, ncols, begin_y, begin_x
+
+    def set_storage(self, storage: Sequence[str]) -> None:
+        """
+        Load new lines into the panel, reusing its window.
+
+        The window is resized and moved to fit `storage` and the viewport is
+        reset to the top left.
+
+        Args:
+            storage: Text lines to show.
+        """
+        self.storage = storage
+        self.posy = 0
+        self.posx = 0
+        self._drawn = None
+
+        nlines, ncols, begin_y, begin_x = self._geometry()
+
+        # Order the calls so the window stays on screen in between.
+        try:
+            if nlines > self.nlines:
+                self.panel.move(begin_y, begin_x)
+                self.win.resize(nlines, ncols)
+            else:
+                self.win.resize(nlines, ncols)
+                self.panel.move(begin_y, begin_x)
+        except curses.error:
+            pass
+
+        self.nlines, self.ncols = self.win.getmaxyx()
 
     def draw(self, storage: Optional[Sequence[str]] = None) -> None:
         """Render current viewport and show the panel."""
@@ -860,12 +941,22 @@ class TextPanel(object):
         it = data[self.posy : self.posy + page_h]
         self.max_width = max((len(x) for x in it), default=0)
 
+        rows = [
+            line[self.posx : self.posx + view_w].ljust(view_w)
+            for line in it
+        ]
+        # Drawing always shows and raises the panel, keys that do not
+        # scroll just leave the viewport as it was.
+        self.panel.show()
+        self.panel.top()
+        if rows == self._drawn:
+            return
+        self._drawn = rows
+
         self.win.erase()
 
-        for row, line in enumerate(it, start=1):
+        for row, text in enumerate(rows, start=1):
             try:
-                slice_ = line[self.posx : self.posx + view_w]
-                text = "{:<{w}}".format(slice_, w=view_w)
                 self.win.addstr(row, 1, text, self.color_text)
             except curses.error:
                 pass
@@ -877,22 +968,10 @@ class TextPanel(object):
         except curses.error:
             pass
 
-        self.panel.show()
-        self.panel.top()
-        curses.panel.update_panels()
-        try:
-            self.win.refresh()
-        except curses.error:
-            pass
-
     def erase(self) -> None:
-        """Hide the panel and refresh the underlying screen."""
+        """Hide the panel, the next commit repaints what was below it."""
+        self._drawn = None
         self.panel.hide()
-        curses.panel.update_panels()
-        try:
-            self.stdscr.refresh()
-        except curses.error:
-            pass
 
     def handle_char(self, char: int) -> None:
         """
@@ -1005,13 +1084,29 @@ class ObjectPanel(object):
         self.panel = curses.panel.new_panel(self.win)
         self.panel.hide()
 
+        # Cells on screen from the last draw, None until drawn or after erase.
+        self._drawn = None  # type: Optional[List[Tuple[int, int, str, int]]]
+
     def draw(self, obj: Optional[Any] = None) -> None:
         """
         Draw the panel contents.
 
+        The panel is redrawn on every poll, an unchanged object is skipped.
+
         Args:
             obj: Optional override object to render; defaults to `self.obj`.
         """
+        target = self.obj if obj is None else obj
+
+        cells = list(self.attr_iterator(target))
+        # Shown on the panel stack, pushed out by the next Display.commit().
+        # Only the repaint is skipped for an unchanged object.
+        self.panel.show()
+        self.panel.top()
+        if cells == self._drawn:
+            return
+        self._drawn = cells
+
         self.win.erase()
 
         try:
@@ -1021,10 +1116,8 @@ class ObjectPanel(object):
         except curses.error:
             pass
 
-        target = self.obj if obj is None else obj
-
         maxy, maxx = self.win.getmaxyx()
-        for ypos, xpos, text, color in self.attr_iterator(target):
+        for ypos, xpos, text, color in cells:
             # Basic bounds guard; still keep try/except for safety.
             if ypos < 0 or xpos < 0 or ypos >= maxy or xpos >= maxx:
                 continue
@@ -1033,11 +1126,6 @@ class ObjectPanel(object):
             except curses.error:
                 pass
 
-        self.panel.show()
-        self.panel.top()
-        curses.panel.update_panels()
-        curses.doupdate()
-
     def handle_char(self, char: int) -> None:
         """
         Handle a keypress.
@@ -1056,6 +1144,7 @@ class ObjectPanel(object):
 
     def erase(self) -> None:
         """Hide and clear the panel."""
+        self._drawn = None
         try:
             self.win.erase()
             self.win.noutrefresh()
@@ -1063,8 +1152,6 @@ class ObjectPanel(object):
             pass
 
         self.panel.hide()
-        curses.panel.update_panels()
-        curses.doupdate()
 
 class Confirmation(object):
     """
@@ -1160,9 +1247,6 @@ class Confirmation(object):
         except curses.error:
             pass
 
-        curses.panel.update_panels()
-        curses.doupdate()
-
     def erase(self) -> None:
         """Hide the panel and refresh the underlying screen."""
         try:
@@ -1172,20 +1256,19 @@ class Confirmation(object):
             pass
 
         self.panel.hide()
-        curses.panel.update_panels()
-        curses.doupdate()
 
 class ProgressBar(object):
     """
-    A 1-line progress bar panel driven by a queue.
+    A 1-line progress bar panel showing the latest progress update.
 
-    The queue is expected to provide tuples: (ok, err, total). The bar displays
-    progress as (ok + err) / total and overlays the "filled" portion in a
-    different color.
+    The `progress` attribute holds the most recent (ok, err, total) tuple,
+    producers overwrite it and older updates are simply dropped. The bar
+    displays progress as (ok + err) / total and overlays the "filled" portion
+    in a different color.
 
     Typical usage:
         - Create the ProgressBar once (it creates/shows its panel).
-        - Call draw() repeatedly from your main loop.
+        - Set `progress` and call draw() from your main loop.
         - Optionally provide a callback that is called once when progress hits
           100% (fraction >= 1.0).
     """
@@ -1193,7 +1276,6 @@ class ProgressBar(object):
     def __init__(
         self,
         display: Any,
-        queue: Any,
         callback: Optional[Callable[[], None]] = None,
         text: str = "In Progress",
         yoffset: int = 0,
@@ -1203,7 +1285,6 @@ class ProgressBar(object):
         workspace_chars: Optional[Sequence[int]] = None,
     ) -> None:
         self.display = display
-        self.queue = queue
         self.callback = callback
         self.text = text
         self.yoffset = yoffset
@@ -1220,6 +1301,7 @@ class ProgressBar(object):
         """Create the curses window and panel."""
         self.stdscr = self.display.stdscr
         self.fraction = 0.0
+        self.progress = None  # type: Optional[Tuple[int, int, int]]
         self._done = False
 
         maxy, maxx = self.stdscr.getmaxyx()
@@ -1255,21 +1337,15 @@ class ProgressBar(object):
         """
         Render the current progress state.
 
-        If the queue contains a progress tuple, it is consumed and used to
-        update the bar; otherwise the bar is redrawn with the current fraction.
+        If `progress` is set it is used to update the bar; otherwise the bar
+        is redrawn with the current fraction.
         """
         # Use the actual window width for formatting/drawing
         _, w = self.win.getmaxyx()
 
-        # Pull latest progress update if available
         try:
-            if not self.queue.empty():
-                ok, err, total = self.queue.get_nowait()  # type: ignore[misc]
-                try:
-                    self.queue.task_done()  # type: ignore[attr-defined]
-                except Exception:
-                    pass
-
+            if self.progress is not None:
+                ok, err, total = self.progress
                 done = ok + err
                 if total and total > 0:
                     self.fraction = float(done) / float(total)
@@ -1286,7 +1362,7 @@ class ProgressBar(object):
             else:
                 label = self.text
         except Exception:
-            # If the queue isn't the shape you expect, keep drawing safely.
+            # If progress isn't the shape you expect, keep drawing safely.
             label = self.text
 
         filled_width = int(self.fraction * w)
@@ -1304,9 +1380,6 @@ class ProgressBar(object):
         except curses.error:
             pass
 
-        curses.panel.update_panels()
-        curses.doupdate()
-
         # Fire completion callback once
         if not self._done and self.fraction >= 1.0 and self.callback is not None:
             self._done = True
@@ -1321,8 +1394,6 @@ class ProgressBar(object):
             pass
 
         self.panel.hide()
-        curses.panel.update_panels()
-        curses.doupdate()
 
 class FilterPanel(object):
     """
@@ -1351,7 +1422,7 @@ class FilterPanel(object):
         color_filter: int = 12288
     ) -> None:
         self.display = display
-        self.storage = list(storage)
+        self.storage = storage
         self.current_filter = current_filter
         self.validator = validator
         self.callback = callback
@@ -1364,6 +1435,10 @@ class FilterPanel(object):
         self.color_err = color_err
         self.color_filter = color_filter
 
+        # Precomputed attributes used on every help redraw.
+        self._help_attr = self.color_text | curses.A_DIM
+        self._enter_attr = self.color_text | curses.A_REVERSE
+
         self.cur_filter_label = "Current Filter: "
         self.new_filter_label = "    New Filter: "
 
@@ -1388,6 +1463,11 @@ class FilterPanel(object):
         self.maxy, self.maxx = self.win.getmaxyx()
         self.err = ""
 
+        # Regions needing an addstr pass on the next draw.
+        self._help_dirty = True
+        self._err_dirty = True
+        self._cf_dirty = True
+
         # Current Filter Window
         cf_y = self.cf_y = min(len(self.storage) + 3, nlines - 5)
         cf_x = self.cf_x = len(self.cur_filter_label) + 1
@@ -1405,6 +1485,14 @@ class FilterPanel(object):
 
     def draw(self) -> None:
         """Redraw the full panel."""
+        self.draw_static()
+        self.draw_dynamic()
+
+    def draw_static(self) -> None:
+        """Draw the parts that do not change while the panel is up."""
+        if not self._help_dirty:
+            return
+
         try:
             self.win.attron(self.color_border)
             self.win.box()
@@ -1413,9 +1501,18 @@ class FilterPanel(object):
             pass
 
         self.draw_help()
-        self.draw_error()
-        self.draw_current_filter()
         self.draw_new_filter()
+        self._help_dirty = False
+
+    def draw_dynamic(self) -> None:
+        """Draw the error line and current filter if changed, then refresh."""
+        if self._err_dirty:
+            self.draw_error()
+            self._err_dirty = False
+
+        if self._cf_dirty:
+            self.draw_current_filter()
+            self._cf_dirty = False
 
         self.win.noutrefresh()
         self.cfwin.noutrefresh()
@@ -1426,15 +1523,14 @@ class FilterPanel(object):
         """Draw the help text (storage) and the ENTER hint."""
         for r, line in enumerate(self.storage, 1):
             try:
-                self.win.addstr(r, 1, line, self.color_text | curses.A_DIM)
+                self.win.addstr(r, 1, line, self._help_attr)
             except curses.error:
                 pass
 
         ypos = self.maxy - 2
         xpos = self.maxx // 2 - 4
-        color = self.color_text | curses.A_REVERSE
         try:
-            self.win.addstr(ypos, xpos, " ENTER ", color)
+            self.win.addstr(ypos, xpos, " ENTER ", self._enter_attr)
         except curses.error:
             pass
 
@@ -1480,8 +1576,6 @@ class FilterPanel(object):
             pass
 
         self.panel.hide()
-        curses.panel.update_panels()
-        curses.doupdate()
 
     def handle_char(self) -> Optional[int]:
         """
@@ -1497,13 +1591,21 @@ class FilterPanel(object):
         except curses.error:
             pass
 
+        # Block in getch() while the panel is up instead of polling.
+        self.stdscr.nodelay(False)
+        try:
+            return self._input_loop()
+        finally:
+            self.stdscr.nodelay(True)
+
+    def _input_loop(self) -> Optional[int]:
+        """Read and dispatch keys until submit or cancel."""
         self.draw()
 
         while True:
             char = self.stdscr.getch()
 
             if char == curses.ERR:
-                time.sleep(0.1)
                 continue
 
             # ESC to cancel
@@ -1528,13 +1630,15 @@ class FilterPanel(object):
                 if self.validator is not None:
                     err = self.validator(result)
                     if err:
-                        self.err = err
+                        if err != self.err:
+                            self.err = err
+                            self._err_dirty = True
                         self.tbwin.move(saved_y, saved_x)
                         try:
                             curses.curs_set(1)
                         except curses.error:
                             pass
-                        self.draw()
+                        self.draw_dynamic()
                         continue
 
                 if self.callback is not None:
@@ -1550,8 +1654,10 @@ class FilterPanel(object):
                 char = curses.ascii.EOT
 
             try:
+                # Only the textbox changed; help and labels are static.
                 self.textbox.do_command(char)
-                self.draw()
+                self.tbwin.noutrefresh()
+                curses.doupdate()
             except curses.error:
                 # Ignore curses drawing/editing errors on edge conditions
                 pass
@@ -1636,6 +1742,15 @@ class Workspace(object):
         body_w = self.maxx - 2 # 2 for border
         self.bodywin = self.win.derwin(body_h, body_w, self.header_height, 1)
 
+        # Cells last drawn on each body row, see draw_bodywin.
+        self._body_rows = {}  # type: Dict[int, Tuple[int, List[Tuple[int, str, int]]]]
+
+        # Dim state the frame and header were last drawn with, None if stale.
+        self._chrome_dim = None  # type: Optional[bool]
+
+        # Text/object panels kept for reuse, keyed by kind.
+        self.panel_pool: Dict[str, Any] = {}
+
         self.button_map: Dict[int, Any] = {}
         for button in self.buttons:
             self.button_map[button.char_int] = button
@@ -1648,10 +1763,14 @@ class Workspace(object):
         self.draw()
 
     def draw(self, dim: bool=False) -> None:
-        """Redraw frame, header, body, and menubar."""
+        """Redraw body and menubar, and the frame and header if stale."""
         self.draw_bodywin(dim)
-        self.draw_box(dim)
-        self.draw_headerwin(dim)
+        # The frame and header only change with the dim state, so they are
+        # not redrawn on every poll, just after erase_bodywin or a dim flip.
+        if self._chrome_dim != dim:
+            self.draw_box(dim)
+            self.draw_headerwin(dim)
+            self._chrome_dim = dim
         self.menubar.draw()
 
     def _layout_iter(self, obj: Optional[Any] = None) -> Iterable[Any]:
@@ -1715,19 +1834,26 @@ class Workspace(object):
             except curses.error:
                 pass
 
-        self.headerwin.refresh()
+        self.headerwin.noutrefresh()
+
+    def erase_bodywin(self) -> None:
+        """Erase the body and forget the rows and frame drawn on it."""
+        try:
+            self.bodywin.erase()
+        except curses.error:
+            pass
+        self._body_rows.clear()
+        self._chrome_dim = None
 
     def draw_bodywin(self, dim: bool=False, xoffset: int=1) -> None:
         """Draw visible rows from storage. The xoffset compensates for
            the left border and is subtracted from xpos.
+
+           The cells of each row are compared with those drawn on that row
+           the last time and only rows that changed are cleared and redrawn.
         """
         if self.panel.hidden():
            return
- 
-        try:
-            self.bodywin.erase()
-        except curses.error:
-            pass
 
         body_h, _ = self.bodywin.getmaxyx()
         n = len(self.storage)
@@ -1750,6 +1876,7 @@ class Workspace(object):
         colorb = self.color_border | curses.A_DIM if dim else self.color_border
 
         for row, obj in enumerate(visible):
+            cells = []  # type: List[Tuple[int, str, int]]
             for cell in self._layout_iter(obj):
                 try:
                     _, xpos, text, color = cell
@@ -1761,18 +1888,67 @@ class Workspace(object):
                     
                 xpos = max(0, xpos - xoffset)
                 color = color | curses.A_DIM if dim else color
+                cells.append((xpos, text, color))
+
+            prev = self._body_rows.get(row)
+            if prev == (colorb, cells):
+                continue
+            self._body_rows[row] = (colorb, cells)
+
+            if (
+                prev is not None
+                and prev[0] == colorb
+                and self._same_grid(prev[1], cells)
+            ):
+                # Same cell grid as before, overwrite only the changed cells.
+                cells = [c for p, c in zip(prev[1], cells) if p != c]
+            else:
+                try:
+                    self.bodywin.move(row, 0)
+                    self.bodywin.clrtoeol()
+                except curses.error:
+                    pass
 
+            for xpos, text, color in cells:
                 try:
                     self.bodywin.addstr(row, xpos, text, color)
                     self.bodywin.addstr(row, xpos + len(text), u"│", colorb)
                 except curses.error:
                     pass
 
+        # Clear rows left over from a longer storage.
+        for row in [r for r in self._body_rows if r >= len(visible)]:
+            del self._body_rows[row]
+            try:
+                self.bodywin.move(row, 0)
+                self.bodywin.clrtoeol()
+            except curses.error:
+                pass
+
         if not self.panel.hidden():
             self.bodywin.noutrefresh()
             #self.draw_box(dim)
         self.menubar.draw()
 
+    @staticmethod
+    def _same_grid(
+        prev: List[Tuple[int, str, int]],
+        cells: List[Tuple[int, str, int]],
+    ) -> bool:
+        """Return True if cells can be drawn over prev one by one.
+
+        That is the case when both rows place equally long texts at the same
+        positions and no cell, with its trailing border, overlaps the next.
+        """
+        if len(prev) != len(cells):
+            return False
+        for p, c in zip(prev, cells):
+            if p[0] != c[0] or len(p[1]) != len(c[1]):
+                return False
+        return all(
+            a[0] + len(a[1]) < b[0] for a, b in zip(cells, cells[1:])
+        )
+
     def cursor_handler(self, char: int) -> None:
         """Update cursor/scroll state and control autoscroll."""
         body_h, _ = self.bodywin.getmaxyx()
@@ -1885,11 +2061,8 @@ class Workspace(object):
 
             aws = self.display.active_workspace
             if aws:
-                try:
-                    aws.bodywin.erase()
-                except curses.error:
-                    pass
-
+                # Its windows kept their contents while hidden, draw() only
+                # touches rows whose cells changed since.
                 aws.draw()
                 aws.panel.top()
                 aws.panel.show()
@@ -1919,48 +2092,14 @@ class Workspace(object):
 
 ############################## END WORKSPACE ##################################
 
-if __name__ == "__main__":       
+if __name__ == "__main__":
+    from demo import (
+        load_demo_bgws, load_demo_gws, load_demo_pcaps, load_demo_rtps
+    )
+
     def setup_dummy():
         global BGWs, GWs, RTPs, PCAPs
-        bgw1 = BGW(**{'bgw_ip': '10.10.48.58', 'proto': 'ptls', 'polling_secs': 10, 'gw_name': 'AvayaG450A', 'gw_number': '001', 'polls': 1, 'avg_poll_secs': 10, 'active_session_ids': set(), 'last_seen': datetime(2025, 12, 16, 14, 33, 39), 'last_session_id': '', 'show_announcements_files': '\r\n ID      File               Description    Size (Bytes)      Date\r\n---- ------------------ ------------------ ------------ -------------------\r\n101   moh.wav            announcement file      239798    2022-08-23,8:45:26  \r\n102   emergency.wav      announcement file       26618    2023-03-24,11:36:10 \r\n103   public_announceme  announcement file      201914    2024-10-24,7:37:52  \r\n104   mohtest.wav        announcement file     9648106    2025-07-15,14:50:16 \r\n\r\nNv-Ram:\r\nTotal bytes used             : 10119680  \r\nTotal bytes free             : 12672000  \r\nTotal bytes capacity (fixed) : 22791680', 'show_capture': '\r\n\r\nCapture service is enabled and active\r\nCapture start time 09/12/2025-09:25:13\r\nCapture stop time not-stopped\r\nCurrent buffer size is 1024 KB\r\nBuffer mode is non-cyclic\r\nMaximum number of bytes captured from each frame: 4096\r\nCapture list 501 on all interfaces\r\nCapture IPSec decrypted\r\nNumber of captured frames in file: 604 (out of 145200 total captured frames)\r\nMemory buffer occupancy: 4.62% (including overheads)', 'show_faults': '\r\n\r\nCURRENTLY ACTIVE FAULTS\r\n--------------------------------------------------------------------------\r\n\r\n-- Media Module Faults --\r\n\t+ Insertion failure, mmid = v5, 11/24-07:37:04.00\r\n\r\nCurrent Alarm Indications, ALM LED is off\r\n--------------------------------------------------------------------------\r\nNone', 'show_lldp_config': '\r\n\r\nLldp Configuration \r\n-------------------\r\nApplication status: enable \r\nTx interval: 30 seconds\r\nTx hold multiplier: 4 seconds\r\nTx delay: 2 seconds\r\nReinit delay: 2 seconds', 'show_mg_list': '\r\nSLOT   TYPE         CODE        SUFFIX  HW VINTAGE  FW VINTAGE \r\n----   --------     ----------  ------  ----------  -----------\r\nv1     S8300        ICC         E       1           255\r\nv2     -- Not Installed --\r\nv3     E1T1         MM710       B       16          52\r\nv4     -- Not Installed --\r\nv5     -- Initializing --\r\nv6     Analog       MM714       B       23          94\r\nv7     -- Not Installed --\r\nv8     -- Not Installed --\r\nv10    Mainboard    G450        B       2           42.36.0(A)', 'show_port': '\r\nPort   Name             Status    Vlan Level  Neg     Dup. Spd. Type\r\n------ ---------------- --------- ---- ------ ------- ---- ---- ----------------\r\n10/5   NO NAME          connected 1     0     enable  half 1G   Avaya Inc., G450 Media Gateway 10/100/1000BaseTx Port 10/5\r\n\r\n10/6   NO NAME          no link   1     0     enable  full 1G   Avaya Inc., G450 Media Gateway 10/100/1000BaseTx Port 10/6', 'show_rtp_stat_summary': '', 'show_running_config': '\r\n\r\n! version 42.36.0\r\nConfig info release 42.36.0 time "13:33:51 16 DEC 2025 " serial_number 10IS41452851\r\n !\r\nencrypted-username +ikJzwEP/t+XkAlH3l+zsw== password G6uSyomIZMSDb0NnT4RwvSb4IrSGUtuQ9ypCGFikR4w= access-type fe/kaDE5GWBC9Nfj6bNkgA==\r\n!\r\nencrypted-username mJ6sF5BOZeIUWsyCb3C1bw== password 8tMk4PMmywAU0cVXzSERF/aaj9WF0EAq4dB4c0qOLbU= access-type gf0PKwZMZRJ4zRba06ZC3w==\r\nhostname "AvayaG450A"\r\nset system location "Ontario Lab" \r\nno ip telnet \r\nip tftp-server file-system-size 2288\r\nset port mirror source-port 10/5 mirror-port 10/6 sampling always direction both\r\n!\r\nip capture-list 501\r\n name "udp"\r\n!\r\n ip-rule 1\r\n  ip-protocol udp\r\n exit\r\n ip-rule default\r\n  composite-operation "No-Capture"\r\n exit\r\n!\r\nexit\r\n!\r\nds-mode t1\r\n!\r\ninterface Vlan 1\r\n icc-vlan\r\n server-blade-vlan 5\r\n ip address 10.10.48.58     255.255.255.0  \r\n pmi\r\n exit\r\n!\r\ninterface FastEthernet 10/3\r\n exit\r\n!\r\ninterface FastEthernet 10/4\r\n exit\r\n!\r\ninterface Console\r\n speed 9600\r\n exit\r\n!\r\ninterface USB-Modem\r\n description "Default Modem Setup"\r\n timeout absolute 10\r\n ppp authentication ras\r\n no shutdown\r\n ip address 10.3.248.253    255.255.255.252\r\n exit\r\n!\r\ncapture max-frame-size 4096\r\ncapture buffer-mode non-cyclic\r\ncapture filter-group 501\r\nlogin authentication min-password-length 8\r\n!\r\nlogin authentication lockout 0 attempt 0\r\n! Avaya Login Confirmation Received.\r\nEASGManage enableEASG\r\nproduct-id 8c2ae2eead3e6cca800be892bb6e3411\r\n!\r\nset logging file enable \r\nset logging file condition all Error \r\nset logging file condition BOOT Debug \r\n!\r\nno snmp-server community \r\nencrypted-snmp-server user JSXE8Ccs0N0TnuoQek8jwLmaP391mjHjbt9glvbZ2M0= gAAa6QMAG08/c+A= v3ReadISO v3 auth sha 1FCIRMijXV+77fer97/S9O3FlfqIPrTOC5uTFcklYM8=  priv aes128 yyv5YmpCoEn5xZ24B7MR4Y03gnnqwygOY3eQTGRZZB0= \r\nencrypted-snmp-server user 0Ce9aP8Q25tEoXTe0YGwKmt2qLFQJ+UOpG6SMzseQdg= gAAa6QMAG08/c+A= v3TrapISO v3 auth sha TgX0mUpViHn56rSWounTurOYUdreS7rWWY7KssAnYj4=  priv aes128 p5Rdzsia/+4+Uc7f9oeJOj38gI6qX+2Fy1WDL5PTkh8= \r\nsnmp-server group v3ReadISO v3 priv read iso  \r\nsnmp-server group v3TrapISO v3 priv notify iso  \r\nsnmp-server host 10.10.48.92 traps v3 priv bbysnmpv3trap \r\n!\r\nip default-gateway 10.10.48.254    1 low  \r\n!\r\nset sync interface primary v3\r\nset sync source primary\r\nrtp-stat-service\r\nrtp-stat fault\r\nanalog-test\r\nexit\r\n!\r\nset sla-monitor enable\r\nset sla-server-ip-address 10.10.48.198\r\nudp keepalive 10\r\nset mgc list 10.10.48.240\r\nset mediaserver 10.10.48.240 10.10.48.240 23 telnet\r\nset mediaserver 10.10.48.240 10.10.48.240 5023 sat\r\n!#\r\n!# End of configuration file. Press Enter to continue.', 'show_sla_monitor': '\r\n\r\nSLA Monitor:                  Enabled\r\nRegistered Server IP Address: 192.111.111.111\r\nRegistered Server IP Port:    0\r\nConfigured Server IP Address: 10.10.48.198\r\nConfigured Server IP Port:    50011\r\nCapture Mode:                 None\r\nVersion:                      2.7.0', 'show_system': '\r\nSystem Name             : AvayaG450A\r\nSystem Location         : Ontario Lab\r\nSystem Contact          : \r\nUptime (d,h:m:s)        : 422,06:00:13\r\nCall Controller Time    : 13:33:56 16 DEC 2025 \r\nSerial No               : 13TG01116522\r\nModel                   : G430v3\r\nChassis HW Vintage      : 3\r\nChassis HW Suffix       : A\r\nMainboard HW Vintage    : 2\r\nMainboard HW Suffix     : B\r\nMainboard HW CS         : 2.1.7\r\nMainboard FW Vintage    : 42.36.0\r\nLAN MAC Address         : 00:1b:4f:3f:73:e0\r\nWAN1 MAC Address        : 00:1b:4f:3f:73:e1\r\nWAN2 MAC Address        : 00:1b:4f:3f:73:e2\r\nSERVICES MAC address    : 00:1b:4f:3f:73:e3\r\nMemory #1               : 256MB\r\nMemory #2               : Not present\r\nCompact Flash Memory    : 1GB Compact Flash card is installed\r\nPSU #1                  : AC 400W\r\nPSU #2                  : Not present\r\nMedia Socket #1         : MP160 VoIP DSP Module\r\nMedia Socket #2         : Not present\r\nMedia Socket #3         : Not present\r\nMedia Socket #4         : Not present\r\nFAN Tray                : Present', 'show_temp': '\r\nAmbient\r\n-------\r\nTemperature : -5C (23F)\r\nHigh Warning: 42C (108F)\r\nLow Warning : -5C (23F)', 'show_utilization': '\r\n\r\nMod   CPU      CPU     RAM      RAM\r\n      5sec     60sec   used(%)  Total(Kb)\r\n---   ------   -----  -------  ----------\r\n10    Appl. Disabled    48%     190838 Kb', 'show_voip_dsp': '\r\nDSP #1 PARAMETERS\r\n--------------------------------------------------------------\r\nBoard type     : MP160\r\nHw Vintage     : 0 B\r\nFw Vintage     : 182\r\n\r\nDSP#1 CURRENT STATE\r\n--------------------------------------------------------------\r\nIn Use         : 0 of 160 channels, 0 of 4800 points (0.0% used)\r\nState          : Idle\r\nAdmin State    : Release\r\n\r\nCore# Channels Admin     State\r\n      In Use   State\r\n----- -------- --------- -------\r\n    1  0 of 40   Release Idle\r\n    2  0 of 40   Release Idle\r\n    3  0 of 40   Release Idle\r\n    4  0 of 40   Release Idle\r\n\r\n\r\nDSP #2 Not Present\r\n\r\n\r\nDSP #3 Not Present\r\n\r\n\r\nDSP #4 Not Present', 'queue': Queue(), '_active_session': None, '_announcements': None, '_capture_service': None, '_chassis_hw': None, '_comp_flash': None, '_cpu_util': None, '_dsp': None, '_faults': None, '_fw': None, '_hw': None, '_inuse_dsp': None, '_last_seen_time': None, '_lldp': None, '_location': None, '_mac': None, '_mainboard_hw': None, '_memory': None, '_mm_groupdict': None, '_mm_v1': None, '_mm_v2': None, '_mm_v3': None, '_mm_v4': None, '_mm_v5': None, '_mm_v6': None, '_mm_v7': None, '_mm_v8': None, '_mm_v10': None, '_model': None, '_port1': None, '_port1_status': None, '_port1_neg': None, '_port1_duplex': None, '_port1_speed': None, '_port2': None, '_port2_status': None, '_port2_neg': None, '_port2_duplex': None, '_port2_speed': None, '_port_redu': None, '_psu1': None, '_psu2': None, '_ram_util': None, '_rtp_stat_service': None, '_serial': None, '_slamon_service': None, '_sla_server': None, '_snmp': None, '_snmp_trap': None, '_temp': None, '_total_session': None, '_uptime': None})
-        bgw2 = BGW(**{'bgw_ip': '10.10.48.59', 'proto': 'ptls', 'polling_secs': 10, 'gw_name': 'AvayaG450B', 'gw_number': '002', 'polls': 1, 'avg_poll_secs': 10, 'active_session_ids': set(), 'last_seen': datetime(2025, 12, 16, 14, 33, 39), 'last_session_id': '', 'show_announcements_files': '\r\n ID      File               Description    Size (Bytes)      Date\r\n---- ------------------ ------------------ ------------ -------------------\r\n101   moh.wav            announcement file      239798    2022-08-23,8:45:26  \r\n102   emergency.wav      announcement file       26618    2023-03-24,11:36:10 \r\n103   public_announceme  announcement file      201914    2024-10-24,7:37:52  \r\n104   mohtest.wav        announcement file     9648106    2025-07-15,14:50:16 \r\n\r\nNv-Ram:\r\nTotal bytes used             : 10119680  \r\nTotal bytes free             : 12672000  \r\nTotal bytes capacity (fixed) : 22791680', 'show_capture': '\r\n\r\nCapture service is enabled and active\r\nCapture start time 09/12/2025-09:25:13\r\nCapture stop time not-stopped\r\nCurrent buffer size is 1024 KB\r\nBuffer mode is non-cyclic\r\nMaximum number of bytes captured from each frame: 4096\r\nCapture list 501 on all interfaces\r\nCapture IPSec decrypted\r\nNumber of captured frames in file: 604 (out of 145200 total captured frames)\r\nMemory buffer occupancy: 4.62% (including overheads)', 'show_faults': '\r\n\r\nCURRENTLY ACTIVE FAULTS\r\n--------------------------------------------------------------------------\r\n\r\n-- Media Module Faults --\r\n\t+ Insertion failure, mmid = v5, 11/24-07:37:04.00\r\n\r\nCurrent Alarm Indications, ALM LED is off\r\n--------------------------------------------------------------------------\r\nNone', 'show_lldp_config': '\r\n\r\nLldp Configuration \r\n-------------------\r\nApplication status: disable \r\nTx interval: 30 seconds\r\nTx hold multiplier: 4 seconds\r\nTx delay: 2 seconds\r\nReinit delay: 2 seconds', 'show_mg_list': '\r\nSLOT   TYPE         CODE        SUFFIX  HW VINTAGE  FW VINTAGE \r\n----   --------     ----------  ------  ----------  -----------\r\nv1     -- Not Installed --\r\nv2     -- Not Installed --\r\nv3     E1T1         MM710       B       16          52\r\nv4     -- Not Installed --\r\nv5     -- Initializing --\r\nv6     Analog       MM714       B       23          94\r\nv7     -- Not Installed --\r\nv8     -- Not Installed --\r\nv10    Mainboard    G450        B       2           42.36.0(A)', 'show_port': '\r\nPort   Name             Status    Vlan Level  Neg     Dup. Spd. Type\r\n------ ---------------- --------- ---- ------ ------- ---- ---- ----------------\r\n10/5   NO NAME          connected 1     0     enable  full 1G   Avaya Inc., G450 Media Gateway 10/100/1000BaseTx Port 10/5\r\n\r\n10/6   NO NAME          connected   1     0     enable  half 10M   Avaya Inc., G450 Media Gateway 10/100/1000BaseTx Port 10/6', 'show_rtp_stat_summary': '', 'show_running_config': '\r\n\r\n! version 42.36.0\r\nConfig info release 42.36.0 time "13:33:51 16 DEC 2025 " serial_number 10IS41452851\r\n !\r\nencrypted-username +ikJzwEP/t+XkAlH3l+zsw== password G6uSyomIZMSDb0NnT4RwvSb4IrSGUtuQ9ypCGFikR4w= access-type fe/kaDE5GWBC9Nfj6bNkgA==\r\n!\r\nencrypted-username mJ6sF5BOZeIUWsyCb3C1bw== password 8tMk4PMmywAU0cVXzSERF/aaj9WF0EAq4dB4c0qOLbU= access-type gf0PKwZMZRJ4zRba06ZC3w==\r\nhostname "AvayaG450A"\r\nset system location "Calgary" \r\nno ip telnet \r\nip tftp-server file-system-size 2288\r\nset port mirror source-port 10/5 mirror-port 10/6 sampling always direction both\r\n!\r\nip capture-list 501\r\n name "udp"\r\n!\r\n ip-rule 1\r\n  ip-protocol udp\r\n exit\r\n ip-rule default\r\n  composite-operation "No-Capture"\r\n exit\r\n!\r\nexit\r\n!\r\nds-mode t1\r\n!\r\ninterface Vlan 1\r\n icc-vlan\r\n server-blade-vlan 5\r\n ip address 10.10.48.59     255.255.255.0  \r\n pmi\r\n exit\r\n!\r\ninterface FastEthernet 10/3\r\n exit\r\n!\r\ninterface FastEthernet 10/4\r\n exit\r\n!\r\ninterface Console\r\n speed 9600\r\n exit\r\n!\r\ninterface USB-Modem\r\n description "Default Modem Setup"\r\n timeout absolute 10\r\n ppp authentication ras\r\n no shutdown\r\n ip address 10.3.248.253    255.255.255.252\r\n exit\r\n!\r\ncapture max-frame-size 4096\r\ncapture buffer-mode non-cyclic\r\ncapture filter-group 501\r\nlogin authentication min-password-length 8\r\n!\r\nlogin authentication lockout 0 attempt 0\r\n! Avaya Login Confirmation Received.\r\nEASGManage enableEASG\r\nproduct-id 8c2ae2eead3e6cca800be892bb6e3411\r\n!\r\nset logging file enable \r\nset logging file condition all Error \r\nset logging file condition BOOT Debug \r\n!\r\nno snmp-server community \r\nencrypted-snmp-server user JSXE8Ccs0N0TnuoQek8jwLmaP391mjHjbt9glvbZ2M0= gAAa6QMAG08/c+A= v3ReadISO v3 auth sha 1FCIRMijXV+77fer97/S9O3FlfqIPrTOC5uTFcklYM8=  priv aes128 yyv5YmpCoEn5xZ24B7MR4Y03gnnqwygOY3eQTGRZZB0= \r\nencrypted-snmp-server user 0Ce9aP8Q25tEoXTe0YGwKmt2qLFQJ+UOpG6SMzseQdg= gAAa6QMAG08/c+A= v3TrapISO v3 auth sha TgX0mUpViHn56rSWounTurOYUdreS7rWWY7KssAnYj4=  priv aes128 p5Rdzsia/+4+Uc7f9oeJOj38gI6qX+2Fy1WDL5PTkh8= \r\nsnmp-server group v3ReadISO v3 priv read iso  \r\nsnmp-server group v3TrapISO v3 priv notify iso  \r\nsnmp-server host 10.10.48.92 traps v3 priv bbysnmpv3trap \r\n!\r\nip default-gateway 10.10.48.254    1 low  \r\n!\r\nset sync interface primary v3\r\nset sync source primary\r\nrtp-stat-service\r\nrtp-stat fault\r\nanalog-test\r\nexit\r\n!\r\nset sla-monitor enable\r\nset sla-server-ip-address 10.10.48.198\r\nudp keepalive 10\r\nset mgc list 10.10.48.240\r\nset mediaserver 10.10.48.240 10.10.48.240 23 telnet\r\nset mediaserver 10.10.48.240 10.10.48.240 5023 sat\r\n!#\r\n!# End of configuration file. Press Enter to continue.', 'show_sla_monitor': '\r\n\r\nSLA Monitor:                  Enabled\r\nRegistered Server IP Address: 0.0.0.0\r\nRegistered Server IP Port:    0\r\nConfigured Server IP Address: 10.10.48.198\r\nConfigured Server IP Port:    50011\r\nCapture Mode:                 None\r\nVersion:                      2.7.0', 'show_system': '\r\nSystem Name             : AvayaG450B\r\nSystem Location         : Calgary\r\nSystem Contact          : \r\nUptime (d,h:m:s)        : 22,06:00:13\r\nCall Controller Time    : 13:33:56 16 DEC 2025 \r\nSerial No               : 13TG01116522\r\nModel                   : G450\r\nChassis HW Vintage      : 1\r\nChassis HW Suffix       : A\r\nMainboard HW Vintage    : 2\r\nMainboard HW Suffix     : B\r\nMainboard HW CS         : 2.1.7\r\nMainboard FW Vintage    : 42.36.0\r\nLAN MAC Address         : 00:1b:4f:3f:73:e8\r\nWAN1 MAC Address        : 00:1b:4f:3f:73:e1\r\nWAN2 MAC Address        : 00:1b:4f:3f:73:e2\r\nSERVICES MAC address    : 00:1b:4f:3f:73:e3\r\nMemory #1               : 256MB\r\nMemory #2               : Not present\r\nCompact Flash Memory    : No CompactFlash card is installed\r\nPSU #1                  : AC 400W\r\nPSU #2                  : AC 400W\r\nMedia Socket #1         : MP160 VoIP DSP Module\r\nMedia Socket #2         : Not present\r\nMedia Socket #3         : Not present\r\nMedia Socket #4         : Not present\r\nFAN Tray                : Present', 'show_temp': '\r\nAmbient\r\n-------\r\nTemperature : 42C (108F)\r\nHigh Warning: 42C (108F)\r\nLow Warning : -5C (23F)', 'show_utilization': '\r\n\r\nMod   CPU      CPU     RAM      RAM\r\n      5sec     60sec   used(%)  Total(Kb)\r\n---   ------   -----  -------  ----------\r\n10    Appl. Disabled    48%     190838 Kb', 'show_voip_dsp': '\r\nDSP #1 PARAMETERS\r\n--------------------------------------------------------------\r\nBoard type     : MP160\r\nHw Vintage     : 0 B\r\nFw Vintage     : 182\r\n\r\nDSP#1 CURRENT STATE\r\n--------------------------------------------------------------\r\nIn Use         : 0 of 160 channels, 0 of 4800 points (0.0% used)\r\nState          : Idle\r\nAdmin State    : Release\r\n\r\nCore# Channels Admin     State\r\n      In Use   State\r\n----- -------- --------- -------\r\n    1  0 of 40   Release Idle\r\n    2  0 of 40   Release Idle\r\n    3  0 of 40   Release Idle\r\n    4  0 of 40   Release Idle\r\n\r\n\r\nDSP #2 Not Present\r\n\r\n\r\nDSP #3 Not Present\r\n\r\n\r\nDSP #4 Not Present', 'queue': Queue(), '_active_session': None, '_announcements': None, '_capture_service': None, '_chassis_hw': None, '_comp_flash': None, '_cpu_util': None, '_dsp': None, '_faults': None, '_fw': None, '_hw': None, '_inuse_dsp': None, '_last_seen_time': None, '_lldp': None, '_location': None, '_mac': None, '_mainboard_hw': None, '_memory': None, '_mm_groupdict': None, '_mm_v1': None, '_mm_v2': None, '_mm_v3': None, '_mm_v4': None, '_mm_v5': None, '_mm_v6': None, '_mm_v7': None, '_mm_v8': None, '_mm_v10': None, '_model': None, '_port1': None, '_port1_status': None, '_port1_neg': None, '_port1_duplex': None, '_port1_speed': None, '_port2': None, '_port2_status': None, '_port2_neg': None, '_port2_duplex': None, '_port2_speed': None, '_port_redu': None, '_psu1': None, '_psu2': None, '_ram_util': None, '_rtp_stat_service': None, '_serial': None, '_slamon_service': None, '_sla_server': None, '_snmp': None, '_snmp_trap': None, '_temp': None, '_total_session': None, '_uptime': None})
-        bgw3 = BGW(**{'bgw_ip': '192.168.110.111', 'proto': 'ptls', 'polling_secs': 10, 'gw_name': 'AvayaG450C', 'gw_number': '003', 'polls': 1, 'avg_poll_secs': 10, 'active_session_ids': set(), 'last_seen': datetime(2025, 12, 16, 14, 33, 39), 'last_session_id': '', 'show_announcements_files': '\r\n ID      File               Description    Size (Bytes)      Date\r\n---- ------------------ ------------------ ------------ -------------------\r\n101   moh.wav            announcement file      239798    2022-08-23,8:45:26  \r\n102   emergency.wav      announcement file       26618    2023-03-24,11:36:10 \r\n103   public_announceme  announcement file      201914    2024-10-24,7:37:52  \r\n104   mohtest.wav        announcement file     9648106    2025-07-15,14:50:16 \r\n\r\nNv-Ram:\r\nTotal bytes used             : 10119680  \r\nTotal bytes free             : 12672000  \r\nTotal bytes capacity (fixed) : 22791680', 'show_capture': '\r\n\r\nCapture service is enabled and active\r\nCapture start time 09/12/2025-09:25:13\r\nCapture stop time not-stopped\r\nCurrent buffer size is 1024 KB\r\nBuffer mode is non-cyclic\r\nMaximum number of bytes captured from each frame: 4096\r\nCapture list 501 on all interfaces\r\nCapture IPSec decrypted\r\nNumber of captured frames in file: 604 (out of 145200 total captured frames)\r\nMemory buffer occupancy: 4.62% (including overheads)', 'show_faults': '\r\n\r\nNo Fault Messages\r\n--------------------------------------------------------------------------\r\nNone', 'show_lldp_config': '\r\n\r\nLldp Configuration \r\n-------------------\r\nApplication status: disable \r\nTx interval: 30 seconds\r\nTx hold multiplier: 4 seconds\r\nTx delay: 2 seconds\r\nReinit delay: 2 seconds', 'show_mg_list': '\r\nSLOT   TYPE         CODE        SUFFIX  HW VINTAGE  FW VINTAGE \r\n----   --------     ----------  ------  ----------  -----------\r\nv1     -- Not Installed --\r\nv2     -- Not Installed --\r\nv3     E1T1         MM710       B       16          52\r\nv4     -- Not Installed --\r\nv5     -- Initializing --\r\nv6     Analog       MM714       B       23          104\r\nv7     Analog       MM714       A       23          114\r\nv8     -- Not Installed --\r\nv10    Mainboard    G450        B       2           42.36.0(A)', 'show_port': '\r\nPort   Name             Status    Vlan Level  Neg     Dup. Spd. Type\r\n------ ---------------- --------- ---- ------ ------- ---- ---- ----------------\r\n10/5   NO NAME          connected 1     0     enable  full 1G   Avaya Inc., G450 Media Gateway 10/100/1000BaseTx Port 10/5\r\n\r\n10/6   NO NAME          no link   1     0     enable  full 1G   Avaya Inc., G450 Media Gateway 10/100/1000BaseTx Port 10/6', 'show_rtp_stat_summary': '', 'show_running_config': '\r\n\r\n! version 42.36.0\r\nConfig info release 42.36.0 time "13:33:51 16 DEC 2025 " serial_number 10IS41452851\r\n !\r\nencrypted-username +ikJzwEP/t+XkAlH3l+zsw== password G6uSyomIZMSDb0NnT4RwvSb4IrSGUtuQ9ypCGFikR4w= access-type fe/kaDE5GWBC9Nfj6bNkgA==\r\n!\r\nencrypted-username mJ6sF5BOZeIUWsyCb3C1bw== password 8tMk4PMmywAU0cVXzSERF/aaj9WF0EAq4dB4c0qOLbU= access-type gf0PKwZMZRJ4zRba06ZC3w==\r\nhostname "AvayaG450A"\r\nset system location "Calgary" \r\nno ip telnet \r\nip tftp-server file-system-size 2288\r\nset port mirror source-port 10/5 mirror-port 10/6 sampling always direction both\r\n!\r\nip capture-list 501\r\n name "udp"\r\n!\r\n ip-rule 1\r\n  ip-protocol udp\r\n exit\r\n ip-rule default\r\n  composite-operation "No-Capture"\r\n exit\r\n!\r\nexit\r\n!\r\nds-mode t1\r\n!\r\ninterface Vlan 1\r\n icc-vlan\r\n server-blade-vlan 5\r\n ip address 192.168.110.111     255.255.255.0  \r\n pmi\r\n exit\r\n!\r\ninterface FastEthernet 10/3\r\n exit\r\n!\r\ninterface FastEthernet 10/4\r\n exit\r\n!\r\ninterface Console\r\n speed 9600\r\n exit\r\n!\r\ninterface USB-Modem\r\n description "Default Modem Setup"\r\n timeout absolute 10\r\n ppp authentication ras\r\n no shutdown\r\n ip address 10.3.248.253    255.255.255.252\r\n exit\r\n!\r\ncapture max-frame-size 4096\r\ncapture buffer-mode non-cyclic\r\ncapture filter-group 501\r\nlogin authentication min-password-length 8\r\n!\r\nlogin authentication lockout 0 attempt 0\r\n! Avaya Login Confirmation Received.\r\nEASGManage enableEASG\r\nproduct-id 8c2ae2eead3e6cca800be892bb6e3411\r\n!\r\nset logging file enable \r\nset logging file condition all Error \r\nset logging file condition BOOT Debug \r\n!\r\nno snmp-server community \r\nencrypted-snmp-server user JSXE8Ccs0N0TnuoQek8jwLmaP391mjHjbt9glvbZ2M0= gAAa6QMAG08/c+A= v3ReadISO v3 auth sha 1FCIRMijXV+77fer97/S9O3FlfqIPrTOC5uTFcklYM8=  priv aes128 yyv5YmpCoEn5xZ24B7MR4Y03gnnqwygOY3eQTGRZZB0= \r\nencrypted-snmp-server user 0Ce9aP8Q25tEoXTe0YGwKmt2qLFQJ+UOpG6SMzseQdg= gAAa6QMAG08/c+A= v3TrapISO v3 auth sha TgX0mUpViHn56rSWounTurOYUdreS7rWWY7KssAnYj4=  priv aes128 p5Rdzsia/+4+Uc7f9oeJOj38gI6qX+2Fy1WDL5PTkh8= \r\nsnmp-server group v3ReadISO v3 priv read iso  \r\nsnmp-server group v3TrapISO v3 priv notify iso  \r\nsnmp-server host 10.10.48.92 traps v3 priv bbysnmpv3trap \r\n!\r\nip default-gateway 10.10.48.254    1 low  \r\n!\r\nset sync interface primary v3\r\nset sync source primary\r\nrtp-stat-service\r\nrtp-stat fault\r\nanalog-test\r\nexit\r\n!\r\nset sla-monitor enable\r\nset sla-server-ip-address 10.10.48.198\r\nudp keepalive 10\r\nset mgc list 10.10.48.240\r\nset mediaserver 10.10.48.240 10.10.48.240 23 telnet\r\nset mediaserver 10.10.48.240 10.10.48.240 5023 sat\r\n!#\r\n!# End of configuration file. Press Enter to continue.', 'show_sla_monitor': '\r\n\r\nSLA Monitor:                 Disabled\r\nRegistered Server IP Address: 0.0.0.0\r\nRegistered Server IP Port:    0\r\nConfigured Server IP Address: 10.10.48.198\r\nConfigured Server IP Port:    50011\r\nCapture Mode:                 None\r\nVersion:                      2.7.0', 'show_system': '\r\nSystem Name             : AvayaG450C\r\nSystem Location         : Calgary\r\nSystem Contact          : \r\nUptime (d,h:m:s)        : 22,06:00:13\r\nCall Controller Time    : 13:33:56 16 DEC 2025 \r\nSerial No               : 13TG01116522\r\nModel                   : G450\r\nChassis HW Vintage      : 1\r\nChassis HW Suffix       : A\r\nMainboard HW Vintage    : 2\r\nMainboard HW Suffix     : B\r\nMainboard HW CS         : 2.1.7\r\nMainboard FW Vintage    : 42.36.0\r\nLAN MAC Address         : 00:1b:4f:3f:73:e4\r\nWAN1 MAC Address        : 00:1b:4f:3f:73:e1\r\nWAN2 MAC Address        : 00:1b:4f:3f:73:e2\r\nSERVICES MAC address    : 00:1b:4f:3f:73:e4\r\nMemory #1               : 256MB\r\nMemory #2               : Not present\r\nCompact Flash Memory    : No CompactFlash card is installed\r\nPSU #1                  : AC 400W\r\nPSU #2                  : Not present\r\nMedia Socket #1         : MP160 VoIP DSP Module\r\nMedia Socket #2         : Not present\r\nMedia Socket #3         : Not present\r\nMedia Socket #4         : Not present\r\nFAN Tray                : Present', 'show_temp': '\r\nAmbient\r\n-------\r\nTemperature : 36C (97F)\r\nHigh Warning: 42C (108F)\r\nLow Warning : -5C (23F)', 'show_utilization': '\r\n\r\nMod   CPU      CPU     RAM      RAM\r\n      5sec     60sec   used(%)  Total(Kb)\r\n---   ------   -----  -------  ----------\r\n10    Appl. Disabled    48%     190838 Kb', 'show_voip_dsp': '\r\nDSP #1 PARAMETERS\r\n--------------------------------------------------------------\r\nBoard type     : MP160\r\nHw Vintage     : 0 B\r\nFw Vintage     : 182\r\n\r\nDSP#1 CURRENT STATE\r\n--------------------------------------------------------------\r\nIn Use         : 0 of 160 channels, 0 of 4800 points (0.0% used)\r\nState          : Idle\r\nAdmin State    : Release\r\n\r\nCore# Channels Admin     State\r\n      In Use   State\r\n----- -------- --------- -------\r\n    1  0 of 40   Release Idle\r\n    2  0 of 40   Release Idle\r\n    3  0 of 40   Release Idle\r\n    4  0 of 40   Release Idle\r\n\r\n\r\nDSP #2 Not Present\r\n\r\n\r\nDSP #3 Not Present\r\n\r\n\r\nDSP #4 Not Present', 'queue': Queue(), '_active_session': None, '_announcements': None, '_capture_service': None, '_chassis_hw': None, '_comp_flash': None, '_cpu_util': None, '_dsp': None, '_faults': None, '_fw': None, '_hw': None, '_inuse_dsp': None, '_last_seen_time': None, '_lldp': None, '_location': None, '_mac': None, '_mainboard_hw': None, '_memory': None, '_mm_groupdict': None, '_mm_v1': None, '_mm_v2': None, '_mm_v3': None, '_mm_v4': None, '_mm_v5': None, '_mm_v6': None, '_mm_v7': None, '_mm_v8': None, '_mm_v10': None, '_model': None, '_port1': None, '_port1_status': None, '_port1_neg': None, '_port1_duplex': None, '_port1_speed': None, '_port2': None, '_port2_status': None, '_port2_neg': None, '_port2_duplex': None, '_port2_speed': None, '_port_redu': None, '_psu1': None, '_psu2': None, '_ram_util': None, '_rtp_stat_service': None, '_serial': None, '_slamon_service': None, '_sla_server': None, '_snmp': None, '_snmp_trap': None, '_temp': None, '_total_session': None, '_uptime': None})
-        BGWs = MemoryStorage({'001': bgw1, '002': bgw2, '003': bgw3})
-        GWs = {'10.10.48.58': "001", "10.10.48.59": "002", "192.168.110.111": "003", "10.44.244.51": "004", "10.188.244.1": "005", "10.10.48.69": "006"}
-
-        RTPs = MemoryStorage()
-        d = {
-            "2024-11-04,10:06:07,001,00001": "\r\nshow rtp-stat detailed 00001\r\n\r\nSession-ID: 21\r\nStatus: Terminated, QOS: Faulted, EngineId: 10\r\nStart-Time: 2024-11-04,10:06:07, End-Time: 2024-11-04,10:07:07\r\nDuration: 00:02:00\r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.111:2052 SSRC 1653399062\r\nRemote-Address: 10.10.48.192:35000 SSRC 2704961869 (0)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG729A 200B 20mS srtpAesCm128HmacSha180, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 4.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 0.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 1243, Loss 0.3% #0, Avg-Loss 0.3%, RTT 0mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 0, Seq-Fall 1, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 0, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 1.0% #0, Avg-Loss 0.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2025-12-11,10:07:27,002,00002": "\r\nshow rtp-stat detailed 00002\r\n\r\nSession-ID: 11\r\nStatus: Active, QOS: Ok, EngineId: 10\r\nStart-Time: 2025-12-14,10:07:27, End-Time: -\r\nDuration: - \r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.112:2052 SSRC 1653399062\r\nRemote-Address: 10.10.48.192:35000 SSRC 2704961869 (2)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG711U 200B 20mS srtpAesCm128HmacSha180, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 334.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 0.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 123, Loss 0.3% #0, Avg-Loss 0.3%, RTT 200mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 2, Seq-Fall 0, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 46, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 2.0% #0, Avg-Loss 1.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2025-12-11,10:08:07,003,00001": "\r\nshow rtp-stat detailed 00001\r\n\r\nSession-ID: 1\r\nStatus: Active, QOS: Ok, EngineId: 10\r\nStart-Time: 2025-12-14,10:08:07, End-Time: 2025-12-14,10:08:22\r\nDuration: 00:12:20\r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.113:2056 SSRC 1653399062\r\nRemote-Address: 192.168.110.111:35001 SSRC 2704961869 (0)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG711U 230B 30mS Off, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 334.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 1.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 0, Loss 0.3% #0, Avg-Loss 0.3%, RTT 0mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 0, Seq-Fall 0, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 46, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 0.0% #0, Avg-Loss 0.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2024-11-01,10:06:07,001,00001": "\r\nshow rtp-stat detailed 00001\r\n\r\nSession-ID: 21\r\nStatus: Terminated, QOS: Faulted, EngineId: 10\r\nStart-Time: 2024-11-04,10:06:07, End-Time: 2024-11-04,10:07:07\r\nDuration: 00:02:00\r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.111:2052 SSRC 1653399062\r\nRemote-Address: 10.10.48.192:35000 SSRC 2704961869 (0)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG729A 200B 20mS srtpAesCm128HmacSha180, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 4.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 0.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 1243, Loss 0.3% #0, Avg-Loss 0.3%, RTT 0mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 0, Seq-Fall 1, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 0, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 1.0% #0, Avg-Loss 0.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2025-12-11,10:07:27,002,00002": "\r\nshow rtp-stat detailed 00002\r\n\r\nSession-ID: 11\r\nStatus: Active, QOS: Ok, EngineId: 10\r\nStart-Time: 2025-12-14,10:07:27, End-Time: -\r\nDuration: - \r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.112:2052 SSRC 1653399062\r\nRemote-Address: 10.10.48.192:35000 SSRC 2704961869 (2)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG711U 200B 20mS srtpAesCm128HmacSha180, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 334.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 0.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 123, Loss 0.3% #0, Avg-Loss 0.3%, RTT 200mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 2, Seq-Fall 0, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 46, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 2.0% #0, Avg-Loss 1.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2025-12-12,10:08:07,003,00001": "\r\nshow rtp-stat detailed 00001\r\n\r\nSession-ID: 1\r\nStatus: Active, QOS: Ok, EngineId: 10\r\nStart-Time: 2025-12-14,10:08:07, End-Time: 2025-12-14,10:08:22\r\nDuration: 00:12:20\r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.113:2056 SSRC 1653399062\r\nRemote-Address: 192.168.110.111:35001 SSRC 2704961869 (0)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG711U 230B 30mS Off, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 334.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 1.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 0, Loss 0.3% #0, Avg-Loss 0.3%, RTT 0mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 0, Seq-Fall 0, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 46, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 0.0% #0, Avg-Loss 0.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2024-11-12,10:06:07,001,00001": "\r\nshow rtp-stat detailed 00001\r\n\r\nSession-ID: 21\r\nStatus: Terminated, QOS: Faulted, EngineId: 10\r\nStart-Time: 2024-11-04,10:06:07, End-Time: 2024-11-04,10:07:07\r\nDuration: 00:02:00\r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.111:2052 SSRC 1653399062\r\nRemote-Address: 10.10.48.192:35000 SSRC 2704961869 (0)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG729A 200B 20mS srtpAesCm128HmacSha180, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 4.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 0.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 1243, Loss 0.3% #0, Avg-Loss 0.3%, RTT 0mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 0, Seq-Fall 1, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 0, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 1.0% #0, Avg-Loss 0.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2025-12-12,10:07:27,002,00002": "\r\nshow rtp-stat detailed 00002\r\n\r\nSession-ID: 11\r\nStatus: Active, QOS: Ok, EngineId: 10\r\nStart-Time: 2025-12-14,10:07:27, End-Time: -\r\nDuration: - \r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.112:2052 SSRC 1653399062\r\nRemote-Address: 10.10.48.192:35000 SSRC 2704961869 (2)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG711U 200B 20mS srtpAesCm128HmacSha180, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 334.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 0.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 123, Loss 0.3% #0, Avg-Loss 0.3%, RTT 200mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 2, Seq-Fall 0, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 46, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 2.0% #0, Avg-Loss 1.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2025-12-21,10:08:07,003,00001": "\r\nshow rtp-stat detailed 00001\r\n\r\nSession-ID: 1\r\nStatus: Active, QOS: Ok, EngineId: 10\r\nStart-Time: 2025-12-14,10:08:07, End-Time: 2025-12-14,10:08:22\r\nDuration: 00:12:20\r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.113:2056 SSRC 1653399062\r\nRemote-Address: 192.168.110.111:35001 SSRC 2704961869 (0)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG711U 230B 30mS Off, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 334.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 1.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 0, Loss 0.3% #0, Avg-Loss 0.3%, RTT 0mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 0, Seq-Fall 0, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 46, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 0.0% #0, Avg-Loss 0.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2024-11-13,10:06:07,001,00001": "\r\nshow rtp-stat detailed 00001\r\n\r\nSession-ID: 21\r\nStatus: Terminated, QOS: Faulted, EngineId: 10\r\nStart-Time: 2024-11-04,10:06:07, End-Time: 2024-11-04,10:07:07\r\nDuration: 00:02:00\r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.111:2052 SSRC 1653399062\r\nRemote-Address: 10.10.48.192:35000 SSRC 2704961869 (0)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG729A 200B 20mS srtpAesCm128HmacSha180, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 4.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 0.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 1243, Loss 0.3% #0, Avg-Loss 0.3%, RTT 0mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 0, Seq-Fall 1, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 0, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 1.0% #0, Avg-Loss 0.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2025-12-13,10:07:27,002,00002": "\r\nshow rtp-stat detailed 00002\r\n\r\nSession-ID: 11\r\nStatus: Active, QOS: Ok, EngineId: 10\r\nStart-Time: 2025-12-14,10:07:27, End-Time: -\r\nDuration: - \r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.112:2052 SSRC 1653399062\r\nRemote-Address: 10.10.48.192:35000 SSRC 2704961869 (2)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG711U 200B 20mS srtpAesCm128HmacSha180, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 334.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 0.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 123, Loss 0.3% #0, Avg-Loss 0.3%, RTT 200mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 2, Seq-Fall 0, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 46, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 2.0% #0, Avg-Loss 1.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2025-12-13,10:08:07,003,00001": "\r\nshow rtp-stat detailed 00001\r\n\r\nSession-ID: 1\r\nStatus: Active, QOS: Ok, EngineId: 10\r\nStart-Time: 2025-12-14,10:08:07, End-Time: 2025-12-14,10:08:22\r\nDuration: 00:12:20\r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.113:2056 SSRC 1653399062\r\nRemote-Address: 192.168.110.111:35001 SSRC 2704961869 (0)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG711U 230B 30mS Off, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 334.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 1.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 0, Loss 0.3% #0, Avg-Loss 0.3%, RTT 0mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 0, Seq-Fall 0, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 46, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 0.0% #0, Avg-Loss 0.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2024-11-13,10:06:07,001,00001": "\r\nshow rtp-stat detailed 00001\r\n\r\nSession-ID: 21\r\nStatus: Terminated, QOS: Faulted, EngineId: 10\r\nStart-Time: 2024-11-04,10:06:07, End-Time: 2024-11-04,10:07:07\r\nDuration: 00:02:00\r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.111:2052 SSRC 1653399062\r\nRemote-Address: 10.10.48.192:35000 SSRC 2704961869 (0)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG729A 200B 20mS srtpAesCm128HmacSha180, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 4.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 0.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 1243, Loss 0.3% #0, Avg-Loss 0.3%, RTT 0mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 0, Seq-Fall 1, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 0, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 1.0% #0, Avg-Loss 0.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2025-12-15,10:07:27,002,00002": "\r\nshow rtp-stat detailed 00002\r\n\r\nSession-ID: 11\r\nStatus: Active, QOS: Ok, EngineId: 10\r\nStart-Time: 2025-12-14,10:07:27, End-Time: -\r\nDuration: - \r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.112:2052 SSRC 1653399062\r\nRemote-Address: 10.10.48.192:35000 SSRC 2704961869 (2)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG711U 200B 20mS srtpAesCm128HmacSha180, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 334.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 0.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 123, Loss 0.3% #0, Avg-Loss 0.3%, RTT 200mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 2, Seq-Fall 0, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 46, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 2.0% #0, Avg-Loss 1.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2025-12-15,10:08:07,003,00001": "\r\nshow rtp-stat detailed 00001\r\n\r\nSession-ID: 1\r\nStatus: Active, QOS: Ok, EngineId: 10\r\nStart-Time: 2025-12-14,10:08:07, End-Time: 2025-12-14,10:08:22\r\nDuration: 00:12:20\r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.113:2056 SSRC 1653399062\r\nRemote-Address: 192.168.110.111:35001 SSRC 2704961869 (0)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG711U 230B 30mS Off, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 334.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 1.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 0, Loss 0.3% #0, Avg-Loss 0.3%, RTT 0mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 0, Seq-Fall 0, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 46, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 0.0% #0, Avg-Loss 0.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2024-11-15,10:06:07,001,00001": "\r\nshow rtp-stat detailed 00001\r\n\r\nSession-ID: 21\r\nStatus: Terminated, QOS: Faulted, EngineId: 10\r\nStart-Time: 2024-11-04,10:06:07, End-Time: 2024-11-04,10:07:07\r\nDuration: 00:02:00\r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.111:2052 SSRC 1653399062\r\nRemote-Address: 10.10.48.192:35000 SSRC 2704961869 (0)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG729A 200B 20mS srtpAesCm128HmacSha180, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 4.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 0.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 1243, Loss 0.3% #0, Avg-Loss 0.3%, RTT 0mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 0, Seq-Fall 1, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 0, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 1.0% #0, Avg-Loss 0.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2025-12-30,10:07:27,002,00002": "\r\nshow rtp-stat detailed 00002\r\n\r\nSession-ID: 11\r\nStatus: Active, QOS: Ok, EngineId: 10\r\nStart-Time: 2025-12-14,10:07:27, End-Time: -\r\nDuration: - \r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.112:2052 SSRC 1653399062\r\nRemote-Address: 10.10.48.192:35000 SSRC 2704961869 (2)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG711U 200B 20mS srtpAesCm128HmacSha180, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 334.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 0.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 123, Loss 0.3% #0, Avg-Loss 0.3%, RTT 200mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 2, Seq-Fall 0, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 46, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 2.0% #0, Avg-Loss 1.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2025-12-29,16:08:07,003,00001": "\r\nshow rtp-stat detailed 00001\r\n\r\nSession-ID: 1\r\nStatus: Active, QOS: Ok, EngineId: 10\r\nStart-Time: 2025-12-14,10:08:07, End-Time: 2025-12-14,10:08:22\r\nDuration: 00:12:20\r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.113:2056 SSRC 1653399062\r\nRemote-Address: 192.168.110.111:35001 SSRC 2704961869 (0)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG711U 230B 30mS Off, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 334.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 1.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 0, Loss 0.3% #0, Avg-Loss 0.3%, RTT 0mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 0, Seq-Fall 0, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 46, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 0.0% #0, Avg-Loss 0.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2024-11-29,07:06:07,005,00221": "\r\nshow rtp-stat detailed 00221\r\n\r\nSession-ID: 21\r\nStatus: Terminated, QOS: Faulted, EngineId: 10\r\nStart-Time: 2024-11-04,10:06:07, End-Time: 2024-11-04,10:07:07\r\nDuration: 00:02:00\r\nCName: gwp@10.10.48.58\r\nPhone: \r\nLocal-Address: 192.168.110.111:2052 SSRC 1653399062\r\nRemote-Address: 10.10.48.192:35000 SSRC 2704961869 (0)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG729A 200B 20mS srtpAesCm128HmacSha180, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 4.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 0.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 1243, Loss 0.3% #0, Avg-Loss 0.3%, RTT 0mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 0, Seq-Fall 1, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 0, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 1.0% #0, Avg-Loss 0.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-            "2025-12-30,10:07:27,006,02332": "\r\nshow rtp-stat detailed 02332\r\n\r\nSession-ID: 11\r\nStatus: Active, QOS: Ok, EngineId: 10\r\nStart-Time: 2025-12-30,10:07:27, End-Time: 2025-12-30,10:07:37\r\nDuration: 00:00:10 \r\nCName: gwp@10.10.48.69\r\nPhone: \r\nLocal-Address: 192.168.110.112:2052 SSRC 1653399062\r\nRemote-Address: 10.10.48.192:35000 SSRC 2704961869 (2)\r\nSamples: 0 (5 sec)\r\n\r\nCodec:\r\nG711U 200B 20mS srtpAesCm128HmacSha180, Silence-suppression(Tx/Rx) Disabled/Disabled, Play-Time 334.720sec, Loss 0.8% #0, Avg-Loss 0.8%, RTT 0mS #0, Avg-RTT 0mS, JBuf-under/overruns 0.0%/0.0%, Jbuf-Delay 22mS, Max-Jbuf-Delay 22mS\r\n\r\nReceived-RTP:\r\nPackets 123, Loss 0.3% #0, Avg-Loss 0.3%, RTT 200mS #0, Avg-RTT 0mS, Jitter 2mS #0, Avg-Jitter 2mS, TTL(last/min/max) 56/56/56, Duplicates 2, Seq-Fall 0, DSCP 0, L2Pri 0, RTCP 0, Flow-Label 2\r\n\r\nTransmitted-RTP:\r\nVLAN 0, DSCP 46, L2Pri 0, RTCP 10, Flow-Label 0\r\n\r\nRemote-Statistics:\r\nLoss 2.0% #0, Avg-Loss 1.0%, Jitter 0mS #0, Avg-Jitter 0mS\r\n\r\nEcho-Cancellation:\r\nLoss 0dB #2, Len 0mS\r\n\r\nRSVP:\r\nStatus Unused, Failures 0\n",
-
-        }
-        
-        for global_id, value in d.items():
-                rtpdetailed = parse_rtpstat(global_id, value)
-                RTPs.put({global_id: rtpdetailed})
-
-        PCAPs = MemoryStorage({
-            '2025_12_19@22_05_45_002':
-            Capture(remote_ip='10.44.244.51', filename='2025_12_19@22_05_45_002', file_size=6539, received_timestamp=datetime(2025, 12, 20, 11, 9, 19, 550802), capinfos='File name:           uploads/2025_12_19@22_05_45_002\nFile type:           Wireshark/tcpdump/... - pcap\nFile encapsulation:  Ethernet\nFile timestamp precision:  microseconds (6)\nPacket size limit:   file hdr: 4096 bytes\nNumber of packets:   4,565\nFile size:           1,048 kB\nData size:           975 kB\nCapture duration:    22.065001 seconds\nFirst packet time:   2025-11-27 08:52:08.265000\nLast packet time:    2025-11-27 08:52:30.330001\nData byte rate:      44 kBps\nData bit rate:       353 kbps\nAverage packet size: 213.69 bytes\nAverage packet rate: 206 packets/s\nSHA256:              41f4feebdc3012525069ee9cf471d93e980779cfb700269dccf9568b7b8cc598\nRIPEMD160:           365e85e95f27a660e8fc616c917b59b1d7e13544\nSHA1:                21a9247795c835ed5c62aaa9cde95bffc2031908\nStrict time order:   False\nNumber of interfaces in file: 1\nInterface #0 info:\n                     Encapsulation = Ethernet (1 - ether)\n                     Capture length = 4096\n                     Time precision = microseconds (6)\n                     Time ticks per second = 1000000\n                     Number of stat entries = 0\n                     Number of packets = 4565', rtpinfos='========================= RTP Streams ========================\n    Src IP addr  Port    Dest IP addr  Port       SSRC          Payload  Pkts         Lost   Max Delta(ms)  Max Jitter(ms) Mean Jitter(ms) Problems?\n   10.188.244.1  2070    10.10.48.192 37184 0xCDE34A07 ITU-T G.711 PCMU  1103     0 (0.0%)           25.00            2.11            0.59 \n   10.10.48.192 37184    10.188.244.1  2070 0x65F27A72 ITU-T G.711 PCMU  1104     0 (0.0%)           25.00            3.65            1.98 \n  10.188.244.38  2048    10.188.244.1  2060 0xA1F5310D ITU-T G.711 PCMU  1104     0 (0.0%)           30.00            1.32            0.15 \n   10.188.244.1  2060   10.188.244.38  2048 0xEFC73AE0 ITU-T G.711 PCMU  1104     0 (0.0%)           25.00            2.08            0.63 \n==============================================================', gw_number='004'),
-            '2025_12_20@13_12_33_003':
-            Capture(remote_ip='10.10.48.58', filename='2025_12_20@13_12_33_003', file_size=6539, received_timestamp=datetime(2025, 12, 20, 11, 9, 19, 319314), capinfos='File name:           uploads/2025_12_20@13_12_33_003\nFile type:           Wireshark/... - pcapng\nFile encapsulation:  Ethernet\nFile timestamp precision:  nanoseconds (9)\nPacket size limit:   file hdr: (not set)\nNumber of packets:   27 k\nFile size:           7,103 kB\nData size:           6,174 kB\nCapture duration:    199.353739380 second\nFirst packet time:   2025-11-26 11:24:14.684518725\nLast packet time:    2025-11-26 11:27:34.038258105\nData byte rate:      30 kBps\nData bit rate:       247 kbps\nAverage packet size: 225.95 bytes\nAverage packet rate: 137 packets/s\nSHA256:              0e7ff09bcbe5654e3c4eac48daae5d4bc3bc76350e9550fb89e4970ee4c4d4a8\nRIPEMD160:           4e7a1d5f0ada9bcfbc9208438aea108f656ece5d\nSHA1:                f9d5aed405f9702d4d8c16fb0546a6df7fb7e357\nStrict time order:   False\nCapture oper-sys:    64-bit Windows 11 (25H2), build 26200\nCapture application: Mergecap (Wireshark) 4.6.1 (v4.6.1-0-g291c718be4fe)\nCapture comment:     File created by merging:  File1: dc1voipsbc1_03439_20251126112414  File2: dc1voipsbc1_03440_20251126112449  File3: dc1voipsbc1_03441_20251126112520  File4: dc1voipsbc1_03442_20251126112554  File5: dc1voipsbc1_03443_20251126112630  File6: dc1voipsbc1_03444_20251126112703  \nNumber of interfaces in file: 2\nInterface #0 info:\n                     Name = A1\n                     Encapsulation = Ethernet (1 - ether)\n                     Capture length = 262144\n                     Time precision = nanoseconds (9)\n                     Time ticks per second = 1000000000\n                     Time resolution = 0x09\n                     Operating system = Linux 4.18.0-553.81.1.el8_10.x86_64\n                     Number of stat entries = 0\n                     Number of packets = 13403\nInterface #1 info:\n                     Name = B2\n                     Encapsulation = Ethernet (1 - ether)\n                     Capture length = 262144\n                     Time precision = nanoseconds (9)\n                     Time ticks per second = 1000000000\n                     Time resolution = 0x09\n                     Filter string = udp portrange 10000-40000 or port 5060\n                     BPF filter length = 0\n                     Operating system = Linux 4.18.0-553.81.1.el8_10.x86_64\n                     Number of stat entries = 0\n                     Number of packets = 13922', rtpinfos='========================= RTP Streams ========================\n    Src IP addr  Port    Dest IP addr  Port       SSRC          Payload  Pkts         Lost   Max Delta(ms)  Max Jitter(ms) Mean Jitter(ms) Problems?\n   10.234.255.5 36368      10.32.34.3 46750 0x2DC9D34B ITU-T G.711 PCMU  6618     0 (0.0%)          219.75            2.56            2.01 X\n     10.32.34.3 46750    10.234.255.5 36368 0x55063698 ITU-T G.711 PCMU  6624     0 (0.0%)          219.97            6.30            0.07 X\n162.248.168.235 49360     10.234.33.5 14344 0x2DC9D34B ITU-T G.711 PCMU  6620     0 (0.0%)           38.99            2.56            2.01 X\n    10.234.33.5 14344 162.248.168.235 49360 0x55063698 ITU-T G.711 PCMU  6624     0 (0.0%)           23.86            6.30            0.07 X\n     10.32.34.3 46750    10.234.255.5 38068 0x55063698 ITU-T G.711 PCMU    65     0 (0.0%)           20.26            0.09            0.06 \n    10.234.33.5 14344 162.248.168.235 46168 0x55063698 ITU-T G.711 PCMU    65     0 (0.0%)           20.26            0.09            0.06 \n   10.234.255.5 38068      10.32.34.3 46750 0x59A25729 ITU-T G.711 PCMU    68     0 (0.0%)           23.51            2.03            1.95 \n162.248.168.235 46168     10.234.33.5 14344 0x59A25729 ITU-T G.711 PCMU    68     0 (0.0%)           23.51            2.03            1.95 \n==============================================================', gw_number='001')
-            
-        })
\ No newline at end of file
+        BGWs = MemoryStorage(load_demo_bgws())
+        GWs = load_demo_gws()
+        RTPs = MemoryStorage(load_demo_rtps())
+        PCAPs = MemoryStorage(load_demo_pcaps())